@@ -21,6 +21,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.config import get_settings
+from src.generation.model_routing import route_model
 from src.database.mongodb_manager import get_db_manager
 from rich.console import Console
 from rich.table import Table
@@ -153,7 +154,7 @@ Important:
             # Try modern client first
             if _openai_client and hasattr(_openai_client, 'chat'):
                 response = _openai_client.chat.completions.create(
-                    model=settings.openai_model_full,
+                    model=route_model("data.cantons"),
                     messages=messages,
                     temperature=settings.ai_temperature_factual,
                     max_tokens=4000
@@ -163,7 +164,7 @@ Important:
                 # Fallback to legacy client
                 import openai
                 response = openai.ChatCompletion.create(
-                    model=settings.openai_model_full,
+                    model=route_model("data.cantons"),
                     messages=messages,
                     temperature=settings.ai_temperature_factual,
                     max_tokens=4000
@@ -342,7 +343,7 @@ def main():
         
         # Generate canton data
         console.print("[cyan]Generating canton data with OpenAI...[/cyan]")
-        console.print(f"[dim]Using model: {settings.openai_model_full}[/dim]")
+        console.print(f"[dim]Using model: {route_model('data.cantons')}[/dim]")
         console.print(f"[dim]Temperature: {settings.ai_temperature_factual}[/dim]")
         console.print(f"[dim]Max retries: {settings.ai_max_retries}[/dim]")
         console.print()
@@ -20,6 +20,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.config import get_settings
+from src.generation.model_routing import route_model
 from src.database.mongodb_manager import get_db_manager
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
 from rich.console import Console
@@ -113,7 +114,7 @@ Only return valid JSON, no markdown, no explanation."""
         # Try modern client first
         if _openai_client and hasattr(_openai_client, 'chat'):
             response = _openai_client.chat.completions.create(
-                model=settings.openai_model_mini,
+                model=route_model("data.last_names"),
                 messages=messages,
                 temperature=settings.ai_temperature_creative,
                 max_tokens=2000
@@ -123,7 +124,7 @@ Only return valid JSON, no markdown, no explanation."""
             # Fallback to legacy client
             import openai
             response = openai.ChatCompletion.create(
-                model=settings.openai_model_mini,
+                model=route_model("data.last_names"),
                 messages=messages,
                 temperature=settings.ai_temperature_creative,
                 max_tokens=2000
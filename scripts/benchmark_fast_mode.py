@@ -0,0 +1,94 @@
+"""
+Benchmark fast mode: throughput and distribution correctness.
+
+This script:
+1. Loads (or builds) the reference snapshot
+2. Generates N CVs with FastCVEngine and measures CVs/second
+3. Compares the sampled age group, gender, industry and canton shares with
+   the target weights of the snapshot (total variation distance)
+
+Run: python scripts/benchmark_fast_mode.py --count 100000
+"""
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from src.generation.fast_mode import FastCVEngine, ReferenceSnapshot, load_reference_snapshot
+
+console = Console()
+
+TARGET_CVS_PER_SECOND = 1000
+MAX_DISTANCE = 0.02
+
+
+def _normalize(weights: Dict[str, float]) -> Dict[str, float]:
+    total = sum(weights.values()) or 1
+    return {key: value / total for key, value in weights.items()}
+
+
+def total_variation(observed: Counter, target: Dict[str, float]) -> float:
+    """Total variation distance between observed counts and target weights."""
+    total = sum(observed.values()) or 1
+    target = _normalize(target)
+    keys = set(observed) | set(target)
+    return 0.5 * sum(abs(observed.get(key, 0) / total - target.get(key, 0.0)) for key in keys)
+
+
+@click.command()
+@click.option('--count', '-n', default=50_000, type=int, help='CVs to generate')
+@click.option('--snapshot', default=None, type=click.Path(), help='Reference snapshot file')
+@click.option('--from-files', is_flag=True, help='Build the snapshot from data/ instead of loading it')
+@click.option('--seed', default=42, type=int, help='Random seed')
+def main(count, snapshot, from_files, seed):
+    """Benchmark the fast mode engine."""
+    console.print("[bold blue]=" * 60)
+    console.print("[bold blue]Fast Mode Benchmark[/bold blue]")
+    console.print("[bold blue]=" * 60)
+    console.print()
+
+    reference = ReferenceSnapshot.from_files() if from_files else load_reference_snapshot(snapshot)
+    engine = FastCVEngine(reference, seed=seed)
+
+    observed = {name: Counter() for name in ("age_group", "gender", "industry", "canton")}
+    start = time.perf_counter()
+    for record in engine.generate(count):
+        personal, professional = record["personal"], record["professional"]
+        age = personal["age"]
+        observed["age_group"]["18-25" if age <= 25 else ("26-40" if age <= 40 else "41-65")] += 1
+        observed["gender"][personal["gender"]] += 1
+        observed["industry"][professional["industry"]] += 1
+        observed["canton"][personal["canton"]] += 1
+    elapsed = time.perf_counter() - start
+    rate = count / max(elapsed, 1e-9)
+
+    targets = {
+        "age_group": {group: data.get("weight", 0) for group, data in reference.age_groups.items()},
+        "gender": reference.gender_distribution,
+        "industry": reference.industry_weights,
+        "canton": {canton["code"]: canton["population"] for canton in reference.cantons},
+    }
+
+    table = Table(title=f"Fast Mode ({reference.source} snapshot)")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="green", justify="right")
+    table.add_column("Status", justify="center")
+    table.add_row("CVs", str(count), "")
+    table.add_row("CVs/second", f"{rate:,.0f}", "✅" if rate >= TARGET_CVS_PER_SECOND else "❌")
+    for name, counts in observed.items():
+        distance = total_variation(counts, targets[name])
+        table.add_row(f"TV distance ({name})", f"{distance:.4f}", "✅" if distance <= MAX_DISTANCE else "❌")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
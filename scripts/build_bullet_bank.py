@@ -0,0 +1,178 @@
+"""
+Build the precomputed bullet bank (occupation × career level × language).
+
+This script:
+1. Loads occupations (job_id, title, taetigkeiten) from the source DB
+2. Asks the LLM once per (job_id, career_level, language) for a pool of bullets
+3. Keeps bullets with exactly one metric inside the level's METRIC_RANGES
+4. Stores them as templates ("{value}" placeholder) in a SQLite file
+
+generate_job_history() then draws bullets from the bank and re-randomises
+the metric values, so the LLM is only needed for occupations not in the bank.
+
+Run: python scripts/build_bullet_bank.py --levels junior,mid --languages de --limit 50
+"""
+import sys
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import click
+from rich.console import Console
+from rich.table import Table
+from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
+
+from src.config import get_settings
+from src.database.mongodb_manager import get_db_manager
+from src.generation.openai_client import call_openai_json
+from src.generation.llm_schemas import bullets_schema
+from src.generation.cv_activities_transformer import filter_activities_by_career_level
+from src.generation.bullet_bank import (
+    CAREER_LEVELS,
+    LANGUAGES,
+    BulletBank,
+    build_bank_prompt,
+    bullet_to_entry,
+    reset_bullet_bank,
+    resolve_bank_path
+)
+
+console = Console()
+settings = get_settings()
+
+
+def load_occupations(limit: int, job_id: str) -> List[Dict[str, Any]]:
+    """Load occupations with their activities from the source collection."""
+    db_manager = get_db_manager()
+    db_manager.connect()
+    try:
+        source_col = db_manager.get_source_collection(settings.mongodb_collection_occupations)
+        query = {"job_id": job_id} if job_id else {"taetigkeiten.kategorien": {"$exists": True}}
+        cursor = source_col.find(query, {"job_id": 1, "title": 1, "taetigkeiten": 1})
+        if limit:
+            cursor = cursor.limit(limit)
+        occupations = []
+        for doc in cursor:
+            kategorien = doc.get("taetigkeiten", {}).get("kategorien", {})
+            if isinstance(kategorien, dict):
+                activities = [a for items in kategorien.values() if isinstance(items, list) for a in items]
+            else:
+                activities = list(kategorien or [])
+            if doc.get("job_id") and activities:
+                occupations.append({
+                    "job_id": str(doc["job_id"]),
+                    "title": doc.get("title", ""),
+                    "activities": activities
+                })
+        return occupations
+    finally:
+        db_manager.close()
+
+
+def build_key(
+    bank: BulletBank,
+    occupation: Dict[str, Any],
+    career_level: str,
+    language: str,
+    per_key: int
+) -> Tuple[int, int]:
+    """
+    Generate and store the bullets of one bank key.
+
+    Returns:
+        Tuple of (generated bullets, stored templates).
+    """
+    activities = filter_activities_by_career_level(occupation["activities"], career_level) or occupation["activities"]
+    prompt = build_bank_prompt(occupation["title"], activities, career_level, language, per_key)
+    data = call_openai_json(
+        "Du bist ein Experte für Schweizer Lebensläufe.",
+        prompt,
+        max_tokens=90 * per_key,
+        temperature=0.9,
+        call_site="bullet_bank.build",
+        schema=bullets_schema(per_key)
+    )
+    bullets = [b.strip() for b in data.get("bullets", []) if isinstance(b, str) and b.strip()[:1].isupper()]
+    entries = [entry for entry in (bullet_to_entry(b, career_level) for b in bullets) if entry]
+    return len(bullets), bank.add(occupation["job_id"], career_level, language, entries)
+
+
+@click.command()
+@click.option('--output', '-o', default=None, type=click.Path(), help='Bank file (default: BULLET_BANK_PATH)')
+@click.option('--levels', default=','.join(CAREER_LEVELS), help='Comma-separated career levels')
+@click.option('--languages', default=','.join(LANGUAGES), help='Comma-separated languages')
+@click.option('--per-key', default=12, type=int, help='Bullets requested per (occupation, level, language)')
+@click.option('--limit', default=0, type=int, help='Max occupations (0 = all)')
+@click.option('--job-id', default=None, help='Only build this occupation')
+@click.option('--workers', '-w', default=4, type=int, help='Concurrent LLM requests')
+@click.option('--resume/--no-resume', default=True, help='Skip keys already in the bank')
+def main(output, levels, languages, per_key, limit, job_id, workers, resume):
+    """Build the bullet bank."""
+    console.print("[bold blue]=" * 60)
+    console.print("[bold blue]Build Bullet Bank[/bold blue]")
+    console.print("[bold blue]=" * 60)
+    console.print()
+
+    level_list = [l.strip() for l in levels.split(',') if l.strip() in CAREER_LEVELS]
+    language_list = [l.strip() for l in languages.split(',') if l.strip() in LANGUAGES]
+    bank_path = resolve_bank_path(output)
+    bank = BulletBank(bank_path, writable=True)
+
+    console.print("[cyan]Loading occupations...[/cyan]")
+    occupations = load_occupations(limit, job_id)
+    console.print(f"[green]✅ Loaded {len(occupations)} occupations[/green]")
+
+    keys = [
+        (occupation, level, language)
+        for occupation in occupations
+        for level in level_list
+        for language in language_list
+        if not (resume and bank.has(occupation["job_id"], level, language))
+    ]
+    console.print(f"[cyan]Building {len(keys)} keys → {bank_path}[/cyan]")
+
+    generated = stored = failed = 0
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("{task.completed}/{task.total}"),
+        TimeElapsedColumn(),
+        console=console
+    ) as progress:
+        task = progress.add_task("Generating bullets", total=len(keys))
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {executor.submit(build_key, bank, *key, per_key): key for key in keys}
+            for future in as_completed(futures):
+                occupation, level, language = futures[future]
+                try:
+                    key_generated, key_stored = future.result()
+                    generated += key_generated
+                    stored += key_stored
+                except Exception as e:
+                    failed += 1
+                    console.print(f"[yellow]⚠️  {occupation['job_id']}/{level}/{language}: {e}[/yellow]")
+                progress.advance(task)
+
+    bank_stats = bank.stats()
+    bank.close()
+    reset_bullet_bank()
+
+    table = Table(title="Bullet Bank")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="green", justify="right")
+    table.add_row("Keys built", str(len(keys) - failed))
+    table.add_row("Keys failed", str(failed))
+    table.add_row("Bullets generated", str(generated))
+    table.add_row("Templates stored", str(stored))
+    table.add_row("Keys in bank", str(bank_stats["keys"]))
+    table.add_row("Templates in bank", str(bank_stats["templates"]))
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Build the summary/hobby template bank.
+
+This script:
+1. Iterates (language, industry, career_level, occupation_type)
+2. Asks the LLM once per key for summary templates with slots
+   ({years}, {skills}, {canton}, {occupation}) and a hobby pool
+3. Drops invalid and near-duplicate templates (diversity guarantee)
+4. Writes the bank as JSON (SECTION_BANK_PATH)
+
+generate_varied_summary() and the hobby section then fill templates from the
+bank and only call the LLM on a miss or for the premium quality tier.
+
+Run: python scripts/build_section_bank.py --languages de --levels mid,senior
+"""
+import sys
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import click
+from rich.console import Console
+from rich.table import Table
+from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
+
+from src.generation.openai_client import call_openai_json
+from src.generation.llm_schemas import section_bank_schema
+from src.generation.section_bank import (
+    CAREER_LEVELS,
+    INDUSTRIES,
+    LANGUAGES,
+    MIN_HOBBIES,
+    MIN_SUMMARY_TEMPLATES,
+    OCCUPATION_TYPES,
+    SectionBank,
+    build_section_bank_prompt,
+    clean_hobbies,
+    clean_summary_templates,
+    reset_section_bank,
+    resolve_section_bank_path
+)
+
+console = Console()
+
+
+def build_key(key: Tuple[str, str, str, str], summaries: int, hobbies: int) -> Tuple[List[str], List[str]]:
+    """Generate and clean the templates and hobbies of one bank key."""
+    data = call_openai_json(
+        "You are a professional CV writer. Write reusable templates, not finished texts.",
+        build_section_bank_prompt(*key, summaries, hobbies),
+        max_tokens=120 * summaries + 10 * hobbies,
+        temperature=0.9,
+        call_site="section_bank.build",
+        schema=section_bank_schema(summaries, hobbies)
+    )
+    return clean_summary_templates(data.get("summaries", [])), clean_hobbies(data.get("hobbies", []))
+
+
+def _split(value: str, allowed: Tuple[str, ...]) -> List[str]:
+    return [v.strip() for v in value.split(',') if v.strip() in allowed]
+
+
+@click.command()
+@click.option('--output', '-o', default=None, type=click.Path(), help='Bank file (default: SECTION_BANK_PATH)')
+@click.option('--languages', default=','.join(LANGUAGES), help='Comma-separated languages')
+@click.option('--industries', default=','.join(INDUSTRIES), help='Comma-separated industries')
+@click.option('--levels', default=','.join(CAREER_LEVELS), help='Comma-separated career levels')
+@click.option('--occupation-types', default=','.join(OCCUPATION_TYPES), help='Comma-separated occupation types')
+@click.option('--summaries', default=8, type=int, help='Summary templates requested per key')
+@click.option('--hobbies', default=12, type=int, help='Hobbies requested per key')
+@click.option('--workers', '-w', default=4, type=int, help='Concurrent LLM requests')
+@click.option('--resume/--no-resume', default=True, help='Keep keys already in the bank')
+def main(output, languages, industries, levels, occupation_types, summaries, hobbies, workers, resume):
+    """Build the section bank."""
+    console.print("[bold blue]=" * 60)
+    console.print("[bold blue]Build Section Bank[/bold blue]")
+    console.print("[bold blue]=" * 60)
+    console.print()
+
+    bank_path = resolve_section_bank_path(output)
+    bank = SectionBank.load(bank_path) if resume and bank_path.exists() else SectionBank()
+
+    keys = [
+        (language, industry, level, occupation_type)
+        for language in _split(languages, LANGUAGES)
+        for industry in _split(industries, INDUSTRIES)
+        for level in _split(levels, CAREER_LEVELS)
+        for occupation_type in _split(occupation_types, OCCUPATION_TYPES)
+        if not (resume and SectionBank.key(language, industry, level, occupation_type) in bank.entries)
+    ]
+    console.print(f"[cyan]Building {len(keys)} keys → {bank_path}[/cyan]")
+
+    built = thin = failed = 0
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("{task.completed}/{task.total}"),
+        TimeElapsedColumn(),
+        console=console
+    ) as progress:
+        task = progress.add_task("Generating templates", total=len(keys))
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {executor.submit(build_key, key, summaries, hobbies): key for key in keys}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    key_summaries, key_hobbies = future.result()
+                    bank.set(*key, key_summaries, key_hobbies)
+                    built += 1
+                    if len(key_summaries) < MIN_SUMMARY_TEMPLATES or len(key_hobbies) < MIN_HOBBIES:
+                        thin += 1
+                except Exception as e:
+                    failed += 1
+                    console.print(f"[yellow]⚠️  {'/'.join(key)}: {e}[/yellow]")
+                progress.advance(task)
+
+    bank.save(bank_path)
+    reset_section_bank()
+
+    bank_stats = bank.stats()
+    table = Table(title="Section Bank")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="green", justify="right")
+    table.add_row("Keys built", str(built))
+    table.add_row("Keys below diversity minimum", str(thin))
+    table.add_row("Keys failed", str(failed))
+    table.add_row("Keys in bank", str(bank_stats["keys"]))
+    table.add_row("Summary templates", str(bank_stats["summaries"]))
+    table.add_row("Hobbies", str(bank_stats["hobbies"]))
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,7 @@ sys.path.insert(0, str(project_root))
 
 from src.database.mongodb_manager import get_db_manager
 from src.config import get_settings
+from src.generation.model_routing import route_model
 from src.data.models import Industry
 from rich.console import Console
 from rich.table import Table
@@ -374,7 +375,7 @@ Only return valid JSON, no markdown, no explanation."""
         # Try modern client first
         if _openai_client and hasattr(_openai_client, 'chat'):
             response = _openai_client.chat.completions.create(
-                model=settings.openai_model_mini,
+                model=route_model("data.companies"),
                 messages=messages,
                 temperature=settings.ai_temperature_creative,
                 max_tokens=1000
@@ -384,7 +385,7 @@ Only return valid JSON, no markdown, no explanation."""
             # Fallback to legacy client
             import openai
             response = openai.ChatCompletion.create(
-                model=settings.openai_model_mini,
+                model=route_model("data.companies"),
                 messages=messages,
                 temperature=settings.ai_temperature_creative,
                 max_tokens=1000
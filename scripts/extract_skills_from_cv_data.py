@@ -24,6 +24,7 @@ sys.path.insert(0, str(project_root))
 
 from src.database.mongodb_manager import get_db_manager
 from src.config import get_settings
+from src.generation.model_routing import route_model
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
@@ -235,7 +236,7 @@ Return only valid JSON, no markdown, no explanation."""
         # Try modern client first
         if _openai_client and hasattr(_openai_client, 'chat'):
             response = _openai_client.chat.completions.create(
-                model=settings.openai_model_mini,
+                model=route_model("data.skills"),
                 messages=messages,
                 temperature=settings.ai_temperature_factual,
                 max_tokens=2000
@@ -245,7 +246,7 @@ Return only valid JSON, no markdown, no explanation."""
             # Fallback to legacy client
             import openai
             response = openai.ChatCompletion.create(
-                model=settings.openai_model_mini,
+                model=route_model("data.skills"),
                 messages=messages,
                 temperature=settings.ai_temperature_factual,
                 max_tokens=2000
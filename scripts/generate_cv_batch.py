@@ -15,6 +15,7 @@ import sys
 import os
 import json
 import time
+import random
 import pickle
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -36,11 +37,15 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.generation.sampling import SamplingEngine
-from src.generation.cv_assembler import generate_complete_cv, CVDocument, validate_persona_before_assembly
+from src.generation.cv_assembler import generate_cv_with_section_retries, CVDocument, validate_persona_before_assembly
 from src.generation.cv_timeline_validator import validate_cv_timeline
 from src.generation.cv_quality_validator import validate_complete_cv, save_validation_report
-from src.cli.main import export_cv_pdf, export_cv_docx, export_cv_json, filter_persona, get_age_group
+from src.cli.main import export_cv_pdf, export_cv_docx, filter_persona, get_age_group
 from src.database.queries import get_occupation_by_id
+from src.generation.llm_metrics import LLMMetrics, cv_metrics_scope, USD_TO_CHF
+from src.generation.model_routing import ModelQualityReport, get_model_router
+from src.config import get_settings
+from src.export.sinks import SINK_KINDS, DEFAULT_SHARD_SIZE, MANIFEST_FILE, open_sink
 
 console = Console()
 
@@ -53,7 +58,9 @@ class GenerationStats:
     total_failed: int = 0
     total_pre_validation_failed: int = 0
     total_post_validation_failed: int = 0
+    total_skeleton_rejected: int = 0  # attempts rejected before any LLM call (incl. retried)
     total_retried: int = 0
+    total_section_retries: int = 0  # targeted retries that regenerated only failing sections
     total_filtered: int = 0
     start_time: Optional[float] = None
     end_time: Optional[float] = None
@@ -78,6 +85,10 @@ class GenerationStats:
     generation_times: List[float] = field(default_factory=list)
     ai_api_calls: int = 0
     estimated_cost: float = 0.0
+    llm_metrics: Dict[str, Any] = field(default_factory=dict)  # LLMMetrics.to_dict() for the whole run
+    llm_per_cv: List[Dict[str, float]] = field(default_factory=list)  # per accepted CV: calls, tokens, cost
+    quality_by_model: Dict[str, Any] = field(default_factory=dict)  # ModelQualityReport.to_dict()
+    llm_downgrade: Optional[str] = None  # run budget that triggered the model downgrade
     
     # Career level by age group
     career_by_age: Dict[str, Dict[str, int]] = field(default_factory=lambda: defaultdict(lambda: defaultdict(int)))
@@ -100,7 +111,9 @@ class GenerationStats:
                 "total_failed": self.total_failed,
                 "total_pre_validation_failed": self.total_pre_validation_failed,
                 "total_post_validation_failed": self.total_post_validation_failed,
+                "total_skeleton_rejected": self.total_skeleton_rejected,
                 "total_retried": self.total_retried,
+                "total_section_retries": self.total_section_retries,
                 "total_filtered": self.total_filtered,
                 "success_rate": success_rate,
                 "start_time": self.start_time,
@@ -131,7 +144,13 @@ class GenerationStats:
                 "avg_generation_time": sum(self.generation_times) / len(self.generation_times) if self.generation_times else 0,
                 "total_generation_time": sum(self.generation_times),
                 "ai_api_calls": self.ai_api_calls,
-                "estimated_cost": self.estimated_cost
+                "estimated_cost": self.estimated_cost,
+                "llm": {
+                    "run": self.llm_metrics,
+                    "per_cv": self._get_llm_per_cv_summary(),
+                    "quality_by_model": self.quality_by_model,
+                    "downgrade": self.llm_downgrade
+                }
             },
             "files": {
                 "total_size_bytes": self.total_file_size,
@@ -142,6 +161,20 @@ class GenerationStats:
             }
         }
     
+    def _get_llm_per_cv_summary(self) -> Dict[str, Any]:
+        """Average and max LLM usage per accepted CV."""
+        summary: Dict[str, Any] = {
+            "cv_count": len(self.llm_per_cv),
+            # CVs with at least one section served by a fallback while the circuit breaker was open
+            "degraded_cvs": sum(1 for entry in self.llm_per_cv if entry.get("short_circuits", 0) > 0)
+        }
+        for key in ("calls", "retries", "fallbacks", "short_circuits", "prompt_tokens",
+                    "completion_tokens", "cost_usd", "cost_chf"):
+            values = [entry.get(key, 0) for entry in self.llm_per_cv]
+            summary[f"avg_{key}"] = sum(values) / len(values) if values else 0
+            summary[f"max_{key}"] = max(values) if values else 0
+        return summary
+    
     def _get_score_distribution(self) -> Dict[str, int]:
         """Get score distribution by ranges."""
         distribution = {
@@ -190,16 +223,58 @@ def get_quality_tier(score: float) -> str:
 
 def generate_single_cv_with_validation(
     args: Tuple[Dict[str, Any], int]
-) -> Tuple[Optional[Dict[str, Any]], Optional[str], float, Optional[Dict[str, Any]]]:
+) -> Tuple[Optional[Dict[str, Any]], Optional[str], float, Optional[Dict[str, Any]], Dict[str, Any]]:
     """
     Generate a single CV with pre and post validation.
     
+    LLM metrics of the attempt are returned for every attempt (also filtered
+    or rejected ones, so they are costed too) and attached as "llm_metrics"
+    to cv_data on success.
+    
     Args:
         args: Tuple of (config_dict, attempt_number).
     
     Returns:
-        Tuple of (cv_data_dict, error_message, generation_time, failure_info).
+        Tuple of (cv_data_dict, error_message, generation_time, failure_info, llm_metrics).
     """
+    with cv_metrics_scope() as attempt_metrics:
+        cv_data, error, generation_time, failure_info = _generate_single_cv_attempt(args)
+    
+    llm_metrics = attempt_metrics.to_dict()
+    if cv_data is not None:
+        cv_data["llm_metrics"] = llm_metrics
+    return cv_data, error, generation_time, failure_info, llm_metrics
+
+
+def _generate_with_section_retries(
+    persona: Dict[str, Any],
+    min_score: float,
+    max_retries: int
+) -> Tuple[Optional[CVDocument], Optional[Dict[str, Any]], Optional[Any], int]:
+    """
+    Generate and validate a CV, retrying only the sections validation complained about.
+    
+    Sections are memoized per CV (see generate_cv_with_section_retries), so
+    a retry with the same persona regenerates e.g. just the summary instead
+    of a whole CV. The CV is scored and validated in one pass.
+    
+    Returns:
+        Tuple of (cv_doc, quality_report, validation_report, section_retries).
+        cv_doc is None if generation failed; validation_report is None then.
+    """
+    cv_doc, quality_report = generate_cv_with_section_retries(
+        persona, min_validation_score=min_score, max_retries=max_retries
+    )
+    validation_report = quality_report.pop("validation_report", None)
+    if cv_doc is None:
+        validation_report = None
+    return cv_doc, quality_report, validation_report, quality_report["section_retries"]
+
+
+def _generate_single_cv_attempt(
+    args: Tuple[Dict[str, Any], int]
+) -> Tuple[Optional[Dict[str, Any]], Optional[str], float, Optional[Dict[str, Any]]]:
+    """Run one generation attempt for generate_single_cv_with_validation."""
     config, attempt = args
     start_time = time.time()
     failure_info = None
@@ -212,7 +287,7 @@ def generate_single_cv_with_validation(
         sys.path.insert(0, str(project_root))
         
         from src.generation.sampling import SamplingEngine
-        from src.generation.cv_assembler import generate_complete_cv, validate_persona_before_assembly
+        from src.generation.cv_assembler import validate_persona_before_assembly
         from src.generation.cv_timeline_validator import validate_cv_timeline
         from src.generation.cv_quality_validator import validate_complete_cv
         from src.cli.main import filter_persona
@@ -220,6 +295,9 @@ def generate_single_cv_with_validation(
         
         engine = SamplingEngine()
         
+        # The parent process downgrades models once a run budget is at risk
+        get_model_router().force_downgrade(config.get("llm_downgrade"))
+        
         # ========================================================================
         # STEP 1: Sample persona with demographics
         # ========================================================================
@@ -266,37 +344,48 @@ def generate_single_cv_with_validation(
         # ========================================================================
         # STEP 3: Generate CV components
         # ========================================================================
-        # Generate complete CV (includes education, job history, additional education, assembly)
-        cv_doc, quality_report = generate_complete_cv(persona)
+        # Generate complete CV (includes education, job history, additional education, assembly).
+        # Skeletons that cannot reach min_score are rejected before any LLM call;
+        # failed validations regenerate only the affected sections (STEP 4).
+        min_score = config.get("min_quality_score", 75.0)
+        cv_doc, quality_report, validation_report, section_retries = _generate_with_section_retries(
+            persona, min_score, config.get("max_retries", 3)
+        )
         
         # Check if CV generation failed due to quality
         if cv_doc is None:
+            stage = "skeleton" if quality_report and quality_report.get("stage") == "skeleton" else "generation"
             failure_info = {
-                "stage": "generation",
-                "reason": "quality_check_failed",
-                "quality_report": quality_report
+                "stage": stage,
+                "reason": "skeleton_gate_failed" if stage == "skeleton" else "quality_check_failed",
+                "quality_report": quality_report,
+                "section_retries": section_retries
             }
             if attempt < config.get("max_retries", 3):
-                return None, "generation_failed_retry", time.time() - start_time, failure_info
+                return None, f"{stage}_failed_retry", time.time() - start_time, failure_info
             else:
-                return None, "generation_failed", time.time() - start_time, failure_info
+                return None, f"{stage}_failed", time.time() - start_time, failure_info
         
         # ========================================================================
-        # STEP 4: Post-validate complete CV (quality score)
+        # STEP 4: Post-validate complete CV (quality score, no critical issues)
         # ========================================================================
-        min_score = config.get("min_quality_score", 75.0)
-        validation_report = validate_complete_cv(cv_doc, persona, min_score, auto_fix=True)
-        
         quality_score = validation_report.score.overall
         
-        if quality_score < min_score:
+        if not validation_report.passed:
             failure_info = {
                 "stage": "post_validation",
-                "reason": "quality_score_below_threshold",
+                "reason": "quality_score_below_threshold" if quality_score < min_score else "critical_issues",
                 "score": quality_score,
                 "min_score": min_score,
-                "issues": [issue.message for issue in validation_report.issues[:5]]
+                "issues": [issue.message for issue in validation_report.issues[:5]],
+                "early_exit": validation_report.early_exit,
+                "section_retries": section_retries
             }
+            # Validation stopped early; keep a full report for a sample of rejects
+            if random.random() < get_settings().validation_report_sample_rate:
+                failure_info["validation_report"] = validate_complete_cv(
+                    cv_doc, persona, min_score, auto_fix=False
+                ).to_dict()
             if attempt < config.get("max_retries", 3):
                 return None, "post_validation_failed_retry", time.time() - start_time, failure_info
             else:
@@ -310,6 +399,7 @@ def generate_single_cv_with_validation(
         if not config.get("with_portrait", True):
             cv_doc.portrait_path = None
             cv_doc.portrait_base64 = None
+            cv_doc.portrait_asset_id = None
         
         generation_time = time.time() - start_time
         
@@ -319,7 +409,8 @@ def generate_single_cv_with_validation(
             "persona": persona,
             "quality_score": quality_score,
             "quality_tier": get_quality_tier(quality_score),
-            "validation_report": validation_report.to_dict()
+            "validation_report": validation_report.to_dict(),
+            "section_retries": section_retries
         }
         
         return cv_data, None, generation_time, None
@@ -458,6 +549,8 @@ def save_failed_cvs(failed_cvs: List[Dict[str, Any]], output_path: Path) -> Path
 @click.option('--resume', is_flag=True, help='Resume from checkpoint')
 @click.option('--industry', default=None, help='Filter by industry')
 @click.option('--language', default='de', type=click.Choice(['de', 'fr', 'it']), help='Language')
+@click.option('--sink', 'sink_kind', default='files', type=click.Choice(list(SINK_KINDS)), help='Output sink: files, sharded tar/zip archives or JSON lines')
+@click.option('--shard-size', default=DEFAULT_SHARD_SIZE, type=int, help='Files per tar/zip shard')
 def generate_batch(
     count: int,
     parallel: int,
@@ -469,7 +562,9 @@ def generate_batch(
     output_dir: str,
     resume: bool,
     industry: Optional[str],
-    language: str
+    language: str,
+    sink_kind: str,
+    shard_size: int
 ):
     """
     Generate large batch of CVs with comprehensive validation and quality tiers.
@@ -487,6 +582,10 @@ def generate_batch(
     \b
         # Resume from checkpoint
         python scripts/generate_cv_batch.py --count 1000 --resume
+    
+    \b
+        # Store CVs in zip archives instead of single files
+        python scripts/generate_cv_batch.py --count 10000 --sink zip
     """
     console.print(Panel.fit("[bold green]🇨🇭 Swiss CV Generator - Batch Mode[/bold green]", border_style="green"))
     
@@ -521,14 +620,13 @@ def generate_batch(
     else:
         base_industry_dir = language_dir / "all"
     
-    # Create tier directories
+    # Tier directories (member prefixes in archive sinks)
     tier_dirs = {
         "A": base_industry_dir / "tier_A_premium",
         "B": base_industry_dir / "tier_B_good",
         "C": base_industry_dir / "tier_C_acceptable"
     }
-    for tier_dir in tier_dirs.values():
-        tier_dir.mkdir(parents=True, exist_ok=True)
+    sink = open_sink(sink_kind, base_industry_dir, shard_size)
     
     # Configuration for workers
     config = {
@@ -548,6 +646,11 @@ def generate_batch(
     # Failed CVs tracking
     failed_cvs: List[Dict[str, Any]] = []
     
+    # LLM metrics for the whole run (merged from worker results)
+    run_llm_metrics = LLMMetrics()
+    run_llm_metrics.merge(stats.llm_metrics)
+    model_quality = ModelQualityReport()
+    
     # Progress tracking
     remaining = count - start_count
     total_attempts = 0
@@ -572,6 +675,12 @@ def generate_batch(
         
         try:
             while stats.total_passed < count and total_attempts < max_total_attempts:
+                # Downgrade models in the workers once a run budget is at risk
+                budget_reason = get_model_router().check_budgets(run_llm_metrics)
+                if budget_reason and not config.get("llm_downgrade"):
+                    config["llm_downgrade"] = stats.llm_downgrade = budget_reason
+                    console.print(f"[yellow]⚠️  LLM {budget_reason} budget at risk - routing all calls to {get_model_router().mini_model}[/yellow]")
+                
                 # Prepare batch of tasks
                 batch_size = min(parallel * 2, count - stats.total_passed)
                 tasks = [(config, 0) for _ in range(batch_size)]
@@ -585,11 +694,19 @@ def generate_batch(
                     console.print(traceback.format_exc())
                     break
                 
-                for cv_data, error, gen_time, failure_info in results:
+                for cv_data, error, gen_time, failure_info, llm_metrics in results:
                     total_attempts += 1
                     stats.total_attempted += 1
                     
+                    run_llm_metrics.merge(llm_metrics)
+                    if cv_data:
+                        model_quality.add(llm_metrics, cv_data.get("validation_report"))
+                    stats.total_section_retries += (cv_data or failure_info or {}).get("section_retries", 0)
+                    
                     if error:
+                        if error.startswith("skeleton"):
+                            stats.total_skeleton_rejected += 1
+                        
                         if error == "filtered":
                             stats.total_filtered += 1
                         elif error.endswith("_retry"):
@@ -601,7 +718,7 @@ def generate_batch(
                             # Categorize failure
                             if error.startswith("pre_validation"):
                                 stats.total_pre_validation_failed += 1
-                            elif error.startswith("post_validation") or error.startswith("generation"):
+                            elif error.startswith(("post_validation", "generation", "skeleton")):
                                 stats.total_post_validation_failed += 1
                             
                             # Track failure reason
@@ -620,38 +737,7 @@ def generate_batch(
                     
                     if cv_data:
                         # Reconstruct CVDocument from dict
-                        cv_doc_dict = cv_data["cv_doc_dict"]
-                        personal = cv_doc_dict.get("personal", {})
-                        professional = cv_doc_dict.get("professional", {})
-                        content = cv_doc_dict.get("content", {})
-                        metadata = cv_doc_dict.get("metadata", {})
-                        
-                        cv_doc = CVDocument(
-                            first_name=personal.get("first_name", ""),
-                            last_name=personal.get("last_name", ""),
-                            full_name=personal.get("full_name", ""),
-                            age=personal.get("age", 0),
-                            gender=personal.get("gender", ""),
-                            canton=personal.get("canton", ""),
-                            city=personal.get("city"),
-                            email=personal.get("email", ""),
-                            phone=personal.get("phone", ""),
-                            address=personal.get("address"),
-                            portrait_path=personal.get("portrait_path"),
-                            portrait_base64=personal.get("portrait_base64"),
-                            current_title=professional.get("current_title", ""),
-                            industry=professional.get("industry", ""),
-                            career_level=professional.get("career_level", ""),
-                            years_experience=professional.get("years_experience", 0),
-                            summary=content.get("summary", ""),
-                            education=content.get("education", []),
-                            jobs=content.get("jobs", []),
-                            skills=content.get("skills", {}),
-                            additional_education=content.get("additional_education", []),
-                            hobbies=content.get("hobbies", []),
-                            language=metadata.get("language", "de"),
-                            created_at=metadata.get("created_at", "")
-                        )
+                        cv_doc = CVDocument.from_dict(cv_data["cv_doc_dict"])
                         
                         # Generate filename
                         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
@@ -679,13 +765,11 @@ def generate_batch(
                         file_size = 0
                         
                         # Export JSON (always)
-                        json_path = tier_dir / f"{filename_base}.json"
+                        name_base = f"{tier_dir.name}/{filename_base}"
                         try:
-                            export_cv_json(cv_doc, json_path)
+                            file_size += sink.write_cv_json(f"{name_base}.json", cv_doc)
                             export_success = True
                             stats.json_count += 1
-                            if json_path.exists():
-                                file_size += json_path.stat().st_size
                         except Exception as json_error:
                             stats.total_failed += 1
                             failed_cvs.append({
@@ -697,29 +781,29 @@ def generate_batch(
                         
                         # Export PDF (optional)
                         if export_success and output_format in ('pdf', 'both'):
-                            pdf_path = tier_dir / f"{filename_base}.pdf"
                             try:
-                                export_cv_pdf(cv_doc, pdf_path)
+                                file_size += sink.export(f"{name_base}.pdf", lambda path: export_cv_pdf(cv_doc, path))
                                 stats.pdf_count += 1
-                                if pdf_path.exists():
-                                    file_size += pdf_path.stat().st_size
                             except Exception:
                                 pass  # PDF failed, but JSON succeeded
                         
                         # Export DOCX (optional)
                         if export_success and output_format in ('docx', 'both'):
-                            docx_path = tier_dir / f"{filename_base}.docx"
                             try:
-                                export_cv_docx(cv_doc, docx_path)
+                                file_size += sink.export(f"{name_base}.docx", lambda path: export_cv_docx(cv_doc, path))
                                 stats.docx_count += 1
-                                if docx_path.exists():
-                                    file_size += docx_path.stat().st_size
                             except Exception:
                                 pass  # DOCX failed, but JSON succeeded
                         
                         if export_success:
                             # Update stats
                             update_stats(stats, cv_data, gen_time)
+                            cv_llm_totals = cv_data.get("llm_metrics", {}).get("totals", {})
+                            stats.llm_per_cv.append({
+                                key: cv_llm_totals.get(key, 0)
+                                for key in ("calls", "retries", "fallbacks", "short_circuits", "prompt_tokens",
+                                            "completion_tokens", "cost_usd", "cost_chf")
+                            })
                             stats.total_file_size += file_size
                             
                             # Update progress with real-time info
@@ -746,6 +830,7 @@ def generate_batch(
                             
                             # Save checkpoint
                             if stats.total_passed % checkpoint_every == 0:
+                                stats.llm_metrics = run_llm_metrics.to_dict()
                                 checkpoint = Checkpoint(
                                     count=stats.total_passed,
                                     stats=stats,
@@ -757,9 +842,17 @@ def generate_batch(
         finally:
             pool.close()
             pool.join()
+            sink.close()
     
     stats.end_time = time.time()
     
+    # LLM usage and cost from recorded metrics (all attempts, including rejected ones)
+    stats.llm_metrics = run_llm_metrics.to_dict()
+    stats.quality_by_model = model_quality.to_dict()
+    llm_totals = run_llm_metrics.totals()
+    stats.ai_api_calls = llm_totals.calls
+    stats.estimated_cost = llm_totals.cost_usd
+    
     # Save failed CVs
     if failed_cvs:
         failed_path = save_failed_cvs(failed_cvs, output_path)
@@ -787,7 +880,9 @@ def generate_batch(
     table.add_row("Success Rate", f"{success_rate:.1f}%")
     table.add_row("Pre-Validation Failed", str(stats.total_pre_validation_failed))
     table.add_row("Post-Validation Failed", str(stats.total_post_validation_failed))
+    table.add_row("Skeleton Rejected (no LLM spend)", str(stats.total_skeleton_rejected))
     table.add_row("Total Retried", str(stats.total_retried))
+    table.add_row("Section Retries", str(stats.total_section_retries))
     table.add_row("Total Filtered", str(stats.total_filtered))
     table.add_row("Duration", f"{duration:.1f}s ({duration/60:.1f}m)")
     table.add_row("Speed", f"{cvs_per_minute:.1f} CVs/minute")
@@ -895,26 +990,78 @@ def generate_batch(
     
     console.print(file_table)
     
-    # AI Cost estimate
-    # Estimate: ~$0.01 per CV (summary, hobbies, activities transformation)
-    estimated_cost = stats.total_attempted * 0.01
-    stats.estimated_cost = estimated_cost
+    # AI Cost estimate (from recorded token usage)
+    estimated_cost = stats.estimated_cost
     
     cost_table = Table(title="AI Cost Estimate", show_header=True)
     cost_table.add_column("Metric", style="cyan")
     cost_table.add_column("Value", style="green")
     
     cost_table.add_row("Total Attempts", str(stats.total_attempted))
-    cost_table.add_row("Estimated Cost", f"${estimated_cost:.2f}")
-    cost_table.add_row("Cost per CV", f"${estimated_cost / stats.total_attempted:.4f}" if stats.total_attempted > 0 else "$0.00")
+    cost_table.add_row("API Calls", str(stats.ai_api_calls))
+    cost_table.add_row("Tokens (prompt/completion)", f"{llm_totals.prompt_tokens} / {llm_totals.completion_tokens}")
+    cost_table.add_row("Estimated Cost", f"${estimated_cost:.2f} (CHF {estimated_cost * USD_TO_CHF:.2f})")
+    cost_table.add_row("Cost per CV", f"${estimated_cost / stats.total_passed:.4f}" if stats.total_passed > 0 else "$0.00")
+    if llm_totals.short_circuits:
+        degraded_cvs = stats._get_llm_per_cv_summary()["degraded_cvs"]
+        cost_table.add_row("Degraded CVs (circuit open)", f"{degraded_cvs} ({llm_totals.short_circuits} calls skipped)")
     
     console.print(cost_table)
     
+    # Per call site breakdown
+    call_sites = stats.llm_metrics.get("call_sites", {})
+    if call_sites:
+        site_table = Table(title="LLM Call Sites", show_header=True)
+        site_table.add_column("Call Site", style="cyan")
+        site_table.add_column("Calls", style="green")
+        site_table.add_column("p50 / p95", style="yellow")
+        site_table.add_column("Tokens", style="green")
+        site_table.add_column("Cost (USD)", style="green")
+        site_table.add_column("Retries", style="yellow")
+        site_table.add_column("Truncated", style="yellow")
+        site_table.add_column("Fallback Rate", style="red")
+        
+        for site_name, site in call_sites.items():
+            latency = site.get("latency", {})
+            site_table.add_row(
+                site_name,
+                str(site.get("calls", 0)),
+                f"{latency.get('p50_seconds', 0):.2f}s / {latency.get('p95_seconds', 0):.2f}s",
+                str(site.get("prompt_tokens", 0) + site.get("completion_tokens", 0)),
+                f"${site.get('cost_usd', 0):.4f}",
+                str(site.get("retries", 0)),
+                str(site.get("truncations", 0)),
+                f"{site.get('fallback_rate', 0) * 100:.1f}%"
+            )
+        
+        console.print(site_table)
+    
+    # Quality per model and section (where does the bigger model pay off?)
+    if stats.quality_by_model:
+        model_table = Table(title="Quality by Model and Section", show_header=True)
+        model_table.add_column("Section", style="cyan")
+        model_table.add_column("Model", style="magenta")
+        model_table.add_column("CVs", style="green")
+        model_table.add_column("Avg Quality", style="green")
+        model_table.add_column("Avg Section Penalty", style="red")
+        
+        for section, models in stats.quality_by_model.items():
+            for model, entry in models.items():
+                model_table.add_row(
+                    section,
+                    model,
+                    str(entry["cvs"]),
+                    f"{entry['avg_quality']:.1f}",
+                    f"{entry['avg_section_penalty']:.1f}"
+                )
+        
+        console.print(model_table)
+    
     console.print(f"\n[green]✅ Comprehensive report saved to: {report_path}[/green]")
-    console.print(f"[green]✅ CVs organized by quality tier in: {base_industry_dir}[/green]")
-    console.print(f"[green]  - Tier A (Premium, 90-100): {tier_dirs['A']}[/green]")
-    console.print(f"[green]  - Tier B (Good, 80-89): {tier_dirs['B']}[/green]")
-    console.print(f"[green]  - Tier C (Acceptable, 75-79): {tier_dirs['C']}[/green]")
+    console.print(f"[green]✅ CVs organized by quality tier in: {base_industry_dir} ({sink_kind} sink, index: {MANIFEST_FILE})[/green]")
+    console.print(f"[green]  - Tier A (Premium, 90-100): {tier_dirs['A'].name}[/green]")
+    console.print(f"[green]  - Tier B (Good, 80-89): {tier_dirs['B'].name}[/green]")
+    console.print(f"[green]  - Tier C (Acceptable, 75-79): {tier_dirs['C'].name}[/green]")
     
     console.print(f"\n[bold green]✅ Batch generation complete![/bold green]")
 
@@ -23,9 +23,9 @@ import queue
 import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import click
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn, TimeRemainingColumn, MofNCompleteColumn
@@ -37,6 +37,11 @@ from rich.live import Live
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.generation.llm_metrics import LLMMetrics, USD_TO_CHF
+from src.generation.cv_assembler import CVDocument
+from src.export.render_farm import RenderFarm, RENDER_ERRORS_FILE
+from src.export.sinks import SINK_KINDS, DEFAULT_SHARD_SIZE, MANIFEST_FILE, OutputSink, open_sink
+
 console = Console()
 
 
@@ -50,6 +55,8 @@ class Stats:
     quality_scores: List[float] = field(default_factory=list)
     industries: Dict[str, int] = field(default_factory=dict)
     career_levels: Dict[str, int] = field(default_factory=dict)
+    llm_metrics: LLMMetrics = field(default_factory=LLMMetrics)
+    degraded: int = 0  # CVs generated with at least one LLM call short-circuited
     
     @property
     def avg_time(self) -> float:
@@ -72,17 +79,63 @@ def init_worker():
     from src.generation.cv_quality_validator import validate_complete_cv
 
 
-def generate_single_cv(args: Tuple[int, str, str, str, Optional[str], Optional[str], str]) -> Dict[str, Any]:
+def sample_filtered_persona(engine: Any, industry_filter: Optional[str], career_filter: Optional[str]) -> Dict[str, Any]:
+    """Sample a persona, resampling up to 5 times per filter."""
+    persona = engine.sample_persona()
+    
+    if industry_filter and persona.get("industry") != industry_filter:
+        for _ in range(5):
+            persona = engine.sample_persona()
+            if persona.get("industry") == industry_filter:
+                break
+    
+    if career_filter and persona.get("career_level") != career_filter:
+        for _ in range(5):
+            persona = engine.sample_persona()
+            if persona.get("career_level") == career_filter:
+                break
+    return persona
+
+
+def cv_filename(persona: Dict[str, Any], idx: int) -> str:
+    """Base filename of a CV (without extension)."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    last_name = persona.get("last_name", "Unknown")
+    first_name = persona.get("first_name", "Unknown")
+    job_id = persona.get("job_id", "0")
+    return f"{last_name}_{first_name}_{job_id}_{timestamp}_{idx}"
+
+
+def export_cv(sink: OutputSink, render_farm: Optional[RenderFarm], cv_doc: Any, filename: str,
+              output_format: str, template: str) -> str:
+    """
+    Export a CV as JSON to the output sink and queue its PDF on the render
+    farm (if requested); returns the JSON name within the sink.
+    
+    Runs in the main process: worker processes return the CV as a dict.
+    """
+    if isinstance(cv_doc, dict):
+        cv_doc = CVDocument.from_dict(cv_doc)
+    
+    json_name = f"{filename}.json"
+    sink.write_cv_json(json_name, cv_doc)
+    if render_farm and output_format in ["pdf", "both"]:
+        render_farm.submit(cv_doc, f"{filename}.pdf", template)
+    return json_name
+
+
+def generate_single_cv(args: Tuple[int, Optional[str], Optional[str]]) -> Dict[str, Any]:
     """
-    Generate a single CV (runs in worker process/thread).
+    Generate a single CV (runs in worker process).
     
     Args:
-        args: Tuple of (index, language, output_format, output_dir, industry_filter, career_filter, template)
+        args: Tuple of (index, industry_filter, career_filter)
     
     Returns:
-        Dict with status, time, quality_score, etc.
+        Dict with status, time, quality_score, etc.; successful CVs carry
+        the CV (to_dict() layout) and its filename for export.
     """
-    idx, language, output_format, output_dir, industry_filter, career_filter, template = args
+    idx, industry_filter, career_filter = args
     
     start_time = time.time()
     result = {
@@ -93,40 +146,29 @@ def generate_single_cv(args: Tuple[int, str, str, str, Optional[str], Optional[s
         "error": None,
         "file_path": None,
         "industry": None,
-        "career_level": None
+        "career_level": None,
+        "llm_metrics": None,
+        "cv": None,
+        "filename": None
     }
     
     try:
         # Import here to ensure each worker has its own instances
         from src.generation.sampling import SamplingEngine
         from src.generation.cv_assembler import generate_complete_cv
-        from src.database.queries import get_occupation_by_id
-        from src.cli.main import export_cv_pdf, export_cv_json
-        from src.generation.cv_quality_validator import validate_complete_cv
         
         # Sample persona
         engine = SamplingEngine()
-        persona = engine.sample_persona()
-        
-        # Apply filters
-        if industry_filter and persona.get("industry") != industry_filter:
-            # Resample up to 5 times
-            for _ in range(5):
-                persona = engine.sample_persona()
-                if persona.get("industry") == industry_filter:
-                    break
-        
-        if career_filter and persona.get("career_level") != career_filter:
-            for _ in range(5):
-                persona = engine.sample_persona()
-                if persona.get("career_level") == career_filter:
-                    break
+        persona = sample_filtered_persona(engine, industry_filter, career_filter)
         
         result["industry"] = persona.get("industry", "other")
         result["career_level"] = persona.get("career_level", "mid")
         
         # Generate CV
         cv_doc, validation_report = generate_complete_cv(persona)
+        if validation_report:
+            result["llm_metrics"] = validation_report.get("llm_metrics")
+            result["llm_degraded"] = validation_report.get("llm_degraded", False)
         
         if cv_doc is None:
             result["error"] = "CV generation failed"
@@ -136,34 +178,13 @@ def generate_single_cv(args: Tuple[int, str, str, str, Optional[str], Optional[s
         # Get quality score
         quality_score = 0.0
         if validation_report:
-            quality_score = validation_report.get("overall_score", 0.0)
+            quality_score = validation_report.get("scores", {}).get("overall", 0.0)
         result["quality_score"] = quality_score
         
-        # Export
-        output_path = Path(output_dir) / language / "all"
-        output_path.mkdir(parents=True, exist_ok=True)
-        
-        # Build filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        last_name = persona.get("last_name", "Unknown")
-        first_name = persona.get("first_name", "Unknown")
-        job_id = persona.get("job_id", "0")
-        base_filename = f"{last_name}_{first_name}_{job_id}_{timestamp}_{idx}"
-        
-        # Export JSON
-        json_path = output_path / f"{base_filename}.json"
-        export_cv_json(cv_doc, json_path)  # Pass Path object
-        
-        # Export PDF if requested
-        if output_format in ["pdf", "both"]:
-            pdf_path = output_path / f"{base_filename}.pdf"
-            try:
-                export_cv_pdf(cv_doc, pdf_path, template)  # Pass Path object and template
-            except Exception as e:
-                pass  # PDF export optional
-        
+        # Exported by the main process (output sink, render farm)
+        result["cv"] = cv_doc.to_dict()
+        result["filename"] = cv_filename(persona, idx)
         result["success"] = True
-        result["file_path"] = str(json_path)
         result["time"] = time.time() - start_time
         
     except Exception as e:
@@ -173,6 +194,54 @@ def generate_single_cv(args: Tuple[int, str, str, str, Optional[str], Optional[s
     return result
 
 
+def run_in_processes(work_items: List[Tuple], workers: int) -> Iterator[Dict[str, Any]]:
+    """Generate CVs one per task in a process pool (results in completion order)."""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(generate_single_cv, item) for item in work_items]
+        for future in as_completed(futures):
+            try:
+                yield future.result(timeout=120)  # 2 min timeout per CV
+            except Exception as e:
+                yield {"success": False, "error": str(e), "llm_metrics": None}
+
+
+def run_on_batch_engine(work_items: List[Tuple], workers: int) -> Iterator[Dict[str, Any]]:
+    """
+    Generate CVs with generate_complete_cv_batch (threads, results in completion order).
+    
+    Personas are sampled lazily in this thread, `workers` CVs are generated
+    concurrently and each CV is yielded for export as soon as it is finished.
+    """
+    from src.generation.sampling import SamplingEngine
+    from src.generation.cv_assembler import generate_complete_cv_batch
+    
+    engine = SamplingEngine()
+    started: Dict[int, Tuple[int, float]] = {}
+    
+    def personas() -> Iterator[Dict[str, Any]]:
+        for idx, industry_filter, career_filter in work_items:
+            persona = sample_filtered_persona(engine, industry_filter, career_filter)
+            started[id(persona)] = (idx, time.time())
+            yield persona
+    
+    for persona, cv_doc, report in generate_complete_cv_batch(personas(), workers=workers):
+        idx, start_time = started.pop(id(persona))
+        result = {
+            "index": idx,
+            "success": cv_doc is not None,
+            "error": None if cv_doc is not None else "CV generation failed",
+            "quality_score": report.get("scores", {}).get("overall", 0.0),
+            "industry": persona.get("industry", "other"),
+            "career_level": persona.get("career_level", "mid"),
+            "llm_metrics": report.get("llm_metrics"),
+            "llm_degraded": report.get("llm_degraded", False),
+            "cv": cv_doc,
+            "filename": cv_filename(persona, idx),
+            "time": time.time() - start_time
+        }
+        yield result
+
+
 @click.command()
 @click.option("--count", "-n", default=10, help="Number of CVs to generate")
 @click.option("--workers", "-w", default=4, help="Number of parallel workers")
@@ -184,9 +253,13 @@ def generate_single_cv(args: Tuple[int, str, str, str, Optional[str], Optional[s
 @click.option("--template", "-t", default="random", 
               type=click.Choice(["random", "classic", "modern", "minimal", "timeline"]),
               help="PDF template: random (mix), classic, modern, minimal, timeline")
-@click.option("--use-threads", is_flag=True, help="Use threads instead of processes (for debugging)")
+@click.option("--use-threads", is_flag=True, help="Generate on the shared batch engine (threads) instead of processes")
+@click.option("--sink", "sink_kind", default="files", type=click.Choice(list(SINK_KINDS)),
+              help="Output sink: files, sharded tar/zip archives or JSON lines")
+@click.option("--shard-size", default=DEFAULT_SHARD_SIZE, help="Files per tar/zip shard")
 def main(count: int, workers: int, language: str, output_format: str, output_dir: str,
-         industry: Optional[str], career_level: Optional[str], template: str, use_threads: bool):
+         industry: Optional[str], career_level: Optional[str], template: str, use_threads: bool,
+         sink_kind: str, shard_size: int):
     """Generate CVs in parallel using multiple workers."""
     
     console.print(Panel.fit("🚀 [bold cyan]High-Performance Parallel CV Generator[/bold cyan]"))
@@ -211,7 +284,7 @@ def main(count: int, workers: int, language: str, output_format: str, output_dir
     console.print(f"  Workers: [cyan]{workers}[/cyan]")
     console.print(f"  Language: [cyan]{language}[/cyan]")
     console.print(f"  Template: [cyan]{template_names.get(template, template)}[/cyan]")
-    console.print(f"  Output: [cyan]{output_dir}[/cyan]")
+    console.print(f"  Output: [cyan]{output_dir}[/cyan] ({sink_kind})")
     console.print()
     console.print(f"[bold]Time Estimates:[/bold]")
     console.print(f"  Sequential (1 worker): [yellow]{sequential_time/60:.1f} min[/yellow]")
@@ -220,20 +293,27 @@ def main(count: int, workers: int, language: str, output_format: str, output_dir
     console.print()
     
     # Prepare work items
-    work_items = [
-        (i, language, output_format, output_dir, industry, career_level, template)
-        for i in range(count)
-    ]
+    work_items = [(i, industry, career_level) for i in range(count)]
     
     # Statistics
     stats = Stats()
     start_time = time.time()
     
     # Choose executor
-    ExecutorClass = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
-    executor_name = "Threads" if use_threads else "Processes"
+    run_workers = run_on_batch_engine if use_threads else run_in_processes
+    executor_name = "Threads (batch engine)" if use_threads else "Processes"
+    
+    # Files are written by this process to the output sink; PDFs are rendered by a
+    # separate process pool, so generation and rendering scale independently
+    sink_dir = Path(output_dir) / language / "all"
+    sink = open_sink(sink_kind, sink_dir, shard_size)
+    render_farm = None
+    if output_format in ["pdf", "both"]:
+        render_farm = RenderFarm(errors_path=sink_dir / RENDER_ERRORS_FILE, sink=sink)
     
     console.print(f"[dim]Using {executor_name} with {workers} workers...[/dim]")
+    if render_farm:
+        console.print(f"[dim]Rendering PDFs on {render_farm.workers} processes...[/dim]")
     console.print()
     
     # Progress tracking
@@ -250,37 +330,39 @@ def main(count: int, workers: int, language: str, output_format: str, output_dir
     ) as progress:
         task = progress.add_task(f"[cyan]Generating CVs...", total=count)
         
-        with ExecutorClass(max_workers=workers) as executor:
-            # Submit all jobs
-            futures = {executor.submit(generate_single_cv, item): item for item in work_items}
-            
-            # Process results as they complete
-            for future in as_completed(futures):
+        # Process results as they complete
+        for result in run_workers(work_items, workers):
+            stats.total += 1
+            stats.llm_metrics.merge(result.get("llm_metrics"))
+            cv_doc = result.pop("cv", None)
+            if cv_doc is not None:
                 try:
-                    result = future.result(timeout=120)  # 2 min timeout per CV
-                    
-                    stats.total += 1
-                    
-                    if result["success"]:
-                        stats.success += 1
-                        stats.total_time += result["time"]
-                        stats.quality_scores.append(result["quality_score"])
-                        
-                        # Track demographics
-                        ind = result.get("industry", "other")
-                        stats.industries[ind] = stats.industries.get(ind, 0) + 1
-                        
-                        level = result.get("career_level", "mid")
-                        stats.career_levels[level] = stats.career_levels.get(level, 0) + 1
-                    else:
-                        stats.failed += 1
-                    
-                    progress.update(task, advance=1)
-                    
+                    result["file_path"] = export_cv(sink, render_farm, cv_doc, result["filename"], output_format, template)
                 except Exception as e:
-                    stats.total += 1
-                    stats.failed += 1
-                    progress.update(task, advance=1)
+                    result["success"] = False
+                    result["error"] = str(e)
+            
+            if result["success"]:
+                stats.success += 1
+                stats.total_time += result["time"]
+                stats.degraded += int(result.get("llm_degraded", False))
+                stats.quality_scores.append(result["quality_score"])
+                
+                # Track demographics
+                ind = result.get("industry", "other")
+                stats.industries[ind] = stats.industries.get(ind, 0) + 1
+                
+                level = result.get("career_level", "mid")
+                stats.career_levels[level] = stats.career_levels.get(level, 0) + 1
+            else:
+                stats.failed += 1
+            
+            progress.update(task, advance=1)
+    
+    if render_farm:
+        with console.status("[cyan]Rendering remaining PDFs..."):
+            render_farm.close()
+    sink.close()
     
     # Final statistics
     total_elapsed = time.time() - start_time
@@ -302,6 +384,15 @@ def main(count: int, workers: int, language: str, output_format: str, output_dir
     table.add_row("Effective Speedup", f"{(count*9)/total_elapsed:.1f}x")
     if stats.quality_scores:
         table.add_row("Avg Quality Score", f"{stats.avg_quality:.1f}/100")
+    if render_farm:
+        table.add_row("PDFs Rendered", f"{render_farm.stats['rendered']} ({render_farm.stats['failed']} failed)")
+    llm_totals = stats.llm_metrics.totals()
+    if llm_totals.calls or llm_totals.fallbacks:
+        table.add_row("LLM Calls", f"{llm_totals.calls} ({llm_totals.retries} retries, {llm_totals.fallback_rate*100:.1f}% fallback)")
+        table.add_row("LLM Tokens", f"{llm_totals.prompt_tokens} prompt / {llm_totals.completion_tokens} completion")
+        table.add_row("LLM Cost", f"${llm_totals.cost_usd:.4f} (CHF {llm_totals.cost_usd * USD_TO_CHF:.4f})")
+    if llm_totals.short_circuits:
+        table.add_row("Degraded CVs (circuit open)", f"{stats.degraded} ({llm_totals.short_circuits} calls skipped)")
     
     console.print(table)
     
@@ -326,7 +417,7 @@ def main(count: int, workers: int, language: str, output_format: str, output_dir
         console.print(level_table)
     
     console.print()
-    console.print(f"[green]✅ CVs saved to: {output_dir}/{language}/all[/green]")
+    console.print(f"[green]✅ CVs saved to: {sink_dir} ({sink.files} files, index: {MANIFEST_FILE})[/green]")
     
     # Performance comparison
     console.print()
@@ -10,7 +10,6 @@ Provides command-line interface for generating CVs with full integration:
 """
 import os
 import sys
-import json
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
@@ -25,10 +24,15 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.generation.sampling import SamplingEngine
-from src.generation.cv_assembler import generate_complete_cv, CVDocument
+from src.generation.cv_assembler import generate_complete_cv_batch, CVDocument
+from src.generation.cv_stream import persona_matches
 from src.generation.cv_timeline_validator import validate_cv_timeline, get_timeline_summary
+from src.generation.portrait_store import get_portrait_store
+from src.export.cv_json import write_cv_json, get_fast_encoder
+from src.export.render_farm import RenderFarm, RENDER_ERRORS_FILE, SKIP_MODES, render_corpus
+from src.export.sinks import SINK_KINDS, DEFAULT_SHARD_SIZE, MANIFEST_FILE, open_sink
 from src.generation.cv_quality_validator import validate_cv_quality, save_validation_report
-from src.database.queries import get_occupation_by_id
+from src.config import get_settings
 
 console = Console()
 
@@ -86,7 +90,6 @@ def export_cv_pdf(cv_doc: CVDocument, output_path: Path, template_name: Optional
         from reportlab.lib.units import mm
         from reportlab.lib.enums import TA_LEFT, TA_CENTER
         from io import BytesIO
-        import base64
         
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -125,10 +128,10 @@ def export_cv_pdf(cv_doc: CVDocument, output_path: Path, template_name: Optional
         elems = []
         
         # Header with portrait if available
-        if cv_doc.portrait_base64:
+        if cv_doc.portrait_asset_id or cv_doc.portrait_base64:
             try:
-                # Decode base64 image
-                img_data = base64.b64decode(cv_doc.portrait_base64.split(',')[1] if ',' in cv_doc.portrait_base64 else cv_doc.portrait_base64)
+                # PNG bytes from the portrait store (decoded only if not from the store)
+                img_data = get_portrait_store().resolve_png(cv_doc.portrait_asset_id or cv_doc.portrait_base64)
                 img = Image(BytesIO(img_data), width=50*mm, height=50*mm)
                 # Position portrait on the right
                 elems.append(img)
@@ -385,24 +388,38 @@ def export_cv_docx(cv_doc: CVDocument, output_path: Path) -> Path:
         return json_path
 
 
-def export_cv_json(cv_doc: CVDocument, output_path: Path) -> Path:
+def export_cv_json(
+    cv_doc: CVDocument,
+    output_path: Path,
+    inline_portrait: bool = False,
+    minify: bool = False
+) -> Path:
     """
     Export CV metadata to JSON.
     
+    The portrait is referenced by asset id (personal.portrait_asset_id);
+    base64 is only embedded if the document carries it or on request.
+    The JSON is streamed from the document (see src/export/cv_json.py).
+    
     Args:
         cv_doc: Complete CV document.
         output_path: Output file path.
+        inline_portrait: Embed the portrait as base64 (default: False).
+        minify: Write minified JSON with the fast encoder (default: indent=2).
     
     Returns:
         Path to generated JSON.
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    data = cv_doc.to_dict()
-    data["metadata"]["exported_at"] = datetime.now().isoformat()
-    
     with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        write_cv_json(
+            cv_doc, f,
+            indent=None if minify else 2,
+            metadata={"exported_at": datetime.now().isoformat()},
+            encoder=get_fast_encoder() if minify else None,
+            inline_portrait=inline_portrait
+        )
     
     return output_path
 
@@ -427,25 +444,12 @@ def filter_persona(
     Returns:
         True if persona matches all filters.
     """
-    if industry and persona.get("industry") != industry:
-        return False
-    
-    if career_level and persona.get("career_level") != career_level:
-        return False
-    
-    if age_group:
-        age = persona.get("age", 0)
-        if age_group == "18-25" and not (18 <= age <= 25):
-            return False
-        elif age_group == "26-40" and not (26 <= age <= 40):
-            return False
-        elif age_group == "41-65" and not (41 <= age <= 65):
-            return False
-    
-    if language and persona.get("language") != language:
-        return False
-    
-    return True
+    return persona_matches(persona, {
+        "industry": industry,
+        "career_level": career_level,
+        "age_group": age_group,
+        "language": language
+    })
 
 
 def get_age_group(age: int) -> str:
@@ -466,6 +470,61 @@ def cli():
     pass
 
 
+def generate_fast(
+    count: int,
+    industry: Optional[str],
+    career_level: Optional[str],
+    age_group: Optional[str],
+    output_dir: str,
+    snapshot_path: Optional[str],
+    seed: Optional[int]
+) -> Path:
+    """
+    Generate CVs in fast mode and write them as one JSONL file.
+    
+    All CV languages are generated according to the canton distribution;
+    the industry, career level and age group filters are applied to the
+    sampled personas.
+    
+    Returns:
+        Path to the JSONL file.
+    """
+    import time
+    from src.generation.fast_mode import FastCVEngine, load_reference_snapshot, write_jsonl
+    
+    snapshot = load_reference_snapshot(snapshot_path)
+    engine = FastCVEngine(snapshot, seed=seed)
+    
+    output_file = Path(output_dir) / "fast" / f"cvs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+    filters = {"industry": industry, "career_level": career_level, "age_group": age_group}
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TimeElapsedColumn()
+    ) as progress:
+        task = progress.add_task("[cyan]Generating CVs (fast mode)...", total=count)
+        
+        def tracked():
+            for record in engine.generate(count, filters=filters):
+                progress.advance(task)
+                yield record
+        
+        start = time.perf_counter()
+        try:
+            written = write_jsonl(tracked(), output_file)
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            sys.exit(1)
+        elapsed = time.perf_counter() - start
+    
+    console.print(f"[green]✅ {written} CVs → {output_file}[/green]")
+    console.print(f"[cyan]Throughput: {written / max(elapsed, 1e-9):.0f} CVs/s (snapshot: {snapshot.source})[/cyan]")
+    return output_file
+
+
 @cli.command()
 @click.option('--count', '-n', default=1, type=int, help='Number of CVs to generate')
 @click.option('--industry', '-i', default=None, type=click.Choice(['technology', 'finance', 'healthcare', 'construction', 'manufacturing', 'education', 'retail', 'hospitality', 'other']), help='Filter by industry')
@@ -479,8 +538,13 @@ def cli():
 @click.option('--validate-quality', default=True, is_flag=True, help='Validate CV quality (default: true)')
 @click.option('--min-quality-score', default=80.0, type=float, help='Minimum quality score to export (default: 80.0)')
 @click.option('--strict', default=False, is_flag=True, help='Strict validation (raise errors on issues)')
-@click.option('--retry-failed', default=True, is_flag=True, help='Retry failed validations up to 3x (default: true)')
+@click.option('--retry-failed', default=True, is_flag=True, help='Retry failed validations up to 3x, regenerating only the failing sections (default: true)')
 @click.option('--verbose', '-v', is_flag=True, help='Verbose output')
+@click.option('--mode', default='full', type=click.Choice(['full', 'fast']), help='full: LLM + PDF/DOCX; fast: offline JSONL (default: full)')
+@click.option('--snapshot', default=None, type=click.Path(), help='Reference snapshot for fast mode (default: data/processed/reference_snapshot.json)')
+@click.option('--seed', default=None, type=int, help='Random seed for fast mode')
+@click.option('--sink', 'sink_kind', default='files', type=click.Choice(list(SINK_KINDS)), help='Output sink: files, sharded tar/zip archives or JSON lines (default: files)')
+@click.option('--shard-size', default=DEFAULT_SHARD_SIZE, type=int, help=f'Files per tar/zip shard (default: {DEFAULT_SHARD_SIZE})')
 def generate(
     count: int,
     industry: Optional[str],
@@ -495,7 +559,12 @@ def generate(
     min_quality_score: float,
     strict: bool,
     retry_failed: bool,
-    verbose: bool
+    verbose: bool,
+    mode: str,
+    snapshot: Optional[str],
+    seed: Optional[int],
+    sink_kind: str,
+    shard_size: int
 ):
     """
     Generate Swiss CVs with full demographic integration.
@@ -513,9 +582,21 @@ def generate(
     \b
         # Generate CVs for age group 26-40 in French
         python -m src.cli.main generate --count 50 --age-group 26-40 --language fr
+    
+    \b
+        # Generate 100'000 CVs offline as JSONL (no LLM, no database, no PDF)
+        python -m src.cli.main generate --count 100000 --mode fast
+    
+    \b
+        # Store 10'000 CVs in tar archives of 1000 files (+ manifest.jsonl)
+        python -m src.cli.main generate --count 10000 --format both --sink tar
     """
     console.print(Panel.fit("[bold green]🇨🇭 Swiss CV Generator[/bold green]", border_style="green"))
     
+    if mode == "fast":
+        generate_fast(count, industry, career_level, age_group, output_dir, snapshot, seed)
+        return
+    
     # Initialize sampling engine
     try:
         engine = SamplingEngine()
@@ -547,6 +628,12 @@ def generate(
         "by_age_group": {}
     }
     
+    # Files go to the output sink; PDFs are rendered by worker processes while the next CVs are generated
+    sink = open_sink(sink_kind, industry_dir, shard_size)
+    render_farm = None
+    if format in ('pdf', 'both'):
+        render_farm = RenderFarm(errors_path=industry_dir / RENDER_ERRORS_FILE, sink=sink)
+    
     # Progress bar
     with Progress(
         SpinnerColumn(),
@@ -558,35 +645,42 @@ def generate(
         task = progress.add_task(f"[cyan]Generating CVs...", total=count)
         
         generated = 0
-        attempts = 0
         max_attempts = count * 3  # Allow up to 3x attempts for filtering
+        min_quality = max(75.0, min_quality_score)
         
-        while generated < count and attempts < max_attempts:
-            attempts += 1
-            
-            try:
-                # Sample persona (with industry filter if specified)
-                persona = engine.sample_persona(
-                    preferred_canton=None,
-                    preferred_industry=industry
-                )
+        def sample_personas():
+            """Personas passing the filters (industry is already filtered in sample_persona)."""
+            for _ in range(max_attempts):
+                try:
+                    persona = engine.sample_persona(
+                        preferred_canton=None,
+                        preferred_industry=industry
+                    )
+                except Exception as e:
+                    console.print(f"[red]Error sampling persona: {e}[/red]")
+                    continue
                 
                 # Apply additional filters (career_level, age_group, language)
-                # Note: industry is already filtered in sample_persona
                 if not filter_persona(persona, None, career_level, age_group, language):
                     stats["total_filtered"] += 1
                     continue
-                
-                # Update progress
+                yield persona
+        
+        # CVs are generated concurrently (weak skeletons are rejected before any LLM call);
+        # failed CVs retry only the sections validation complained about (up to 3x)
+        results = generate_complete_cv_batch(
+            sample_personas(),
+            min_quality=min_quality,
+            max_retries=3 if retry_failed else 0,
+            workers=min(count, get_settings().cv_batch_workers)
+        )
+        
+        for persona, cv_doc, quality_report in results:
+            try:
                 current_name = f"{persona.get('first_name', '')} {persona.get('last_name', '')}"
-                progress.update(task, description=f"[cyan]Generating: {current_name}...")
-                
-                # Load occupation document
+                progress.update(task, description=f"[cyan]Generated: {current_name}")
                 job_id = persona.get("job_id")
-                occupation_doc = get_occupation_by_id(job_id) if job_id else None
-                
-                # Generate complete CV (with quality check)
-                cv_doc, quality_report = generate_complete_cv(persona)
+                stats["total_retried"] += quality_report.get("section_retries", 0)
                 
                 # Check if CV generation failed due to quality
                 if cv_doc is None:
@@ -607,6 +701,7 @@ def generate(
                 if not with_portrait:
                     cv_doc.portrait_path = None
                     cv_doc.portrait_base64 = None
+                    cv_doc.portrait_asset_id = None
                 
                 # Validate timeline
                 if validate_timeline:
@@ -640,7 +735,7 @@ def generate(
                             if verbose:
                                 console.print(f"[yellow]Timeline validation warning for {current_name}: {e}[/yellow]")
                 
-                # Check quality score threshold (already validated in generate_complete_cv, but check min_score)
+                # Check quality score threshold (already checked during generation, but check min_score)
                 quality_passed = quality_score >= min_quality_score
                 
                 if not quality_passed:
@@ -656,24 +751,21 @@ def generate(
                 
                 # Export formats
                 if format in ('pdf', 'both'):
-                    pdf_path = industry_dir / f"{filename_base}.pdf"
                     # Use random template for variety
                     from src.export.pdf_templates import get_random_template
                     chosen_template = get_random_template()
-                    export_cv_pdf(cv_doc, pdf_path, template_name=chosen_template)
+                    render_farm.submit(cv_doc, f"{filename_base}.pdf", chosen_template)
                     if verbose:
-                        console.print(f"[green]✓ PDF ({chosen_template}): {pdf_path}[/green]")
+                        console.print(f"[green]✓ PDF queued ({chosen_template}): {filename_base}.pdf[/green]")
 
                 if format in ('docx', 'both'):
-                    docx_path = industry_dir / f"{filename_base}.docx"
-                    export_cv_docx(cv_doc, docx_path)
+                    sink.export(f"{filename_base}.docx", lambda path: export_cv_docx(cv_doc, path))
                     if verbose:
-                        console.print(f"[green]✓ DOCX: {docx_path}[/green]")
+                        console.print(f"[green]✓ DOCX: {filename_base}.docx[/green]")
 
                 # Export metadata JSON only if requested
                 if format == 'both':
-                    json_path = industry_dir / f"{filename_base}.json"
-                    export_cv_json(cv_doc, json_path)
+                    sink.write_cv_json(f"{filename_base}.json", cv_doc)
                 
                 # Update statistics
                 stats["total_generated"] += 1
@@ -692,6 +784,16 @@ def generate(
                     import traceback
                     console.print(traceback.format_exc())
                 continue
+            
+            if generated >= count:
+                # Cancels CVs that have not started yet
+                results.close()
+                break
+    
+    if render_farm:
+        with console.status("[cyan]Rendering remaining PDFs..."):
+            render_farm.close()
+    sink.close()
     
     # Print summary
     console.print()
@@ -708,6 +810,10 @@ def generate(
     table.add_row("Retried", str(stats["total_retried"]))
     table.add_row("Validation Errors", str(stats["validation_errors"]))
     table.add_row("Validation Warnings", str(stats["validation_warnings"]))
+    if render_farm:
+        table.add_row("PDFs Rendered", str(render_farm.stats["rendered"]))
+        if render_farm.stats["failed"]:
+            table.add_row("PDFs Failed", f"{render_farm.stats['failed']} (see {render_farm.errors_path})")
     
     if stats["quality_scores"]:
         avg_score = sum(stats["quality_scores"]) / len(stats["quality_scores"])
@@ -744,7 +850,67 @@ def generate(
             age_table.add_row(age_grp, str(cnt))
         console.print(age_table)
     
-    console.print(f"\n[bold green]✅ CVs saved to: {industry_dir}[/bold green]")
+    console.print(f"\n[bold green]✅ CVs saved to: {industry_dir} ({sink_kind} sink, {sink.files} files, index: {industry_dir / MANIFEST_FILE})[/bold green]")
+
+
+@cli.command()
+@click.argument('source', type=click.Path(exists=True))
+@click.option('--output-dir', '-o', default=None, type=click.Path(), help='Output directory (default: next to the JSON files)')
+@click.option('--template', '-t', default='random', type=click.Choice(['random', 'classic', 'modern', 'minimal', 'timeline']), help='PDF template (default: random)')
+@click.option('--workers', '-w', default=None, type=int, help='Render processes (default: PDF_RENDER_WORKERS, one per CPU core)')
+@click.option('--skip', default='mtime', type=click.Choice(list(SKIP_MODES)), help='Skip up-to-date PDFs: mtime (PDF newer than JSON), hash (same JSON and template), none (default: mtime)')
+def render(source: str, output_dir: Optional[str], template: str, workers: Optional[int], skip: str):
+    """
+    Render PDFs from exported CV JSON files (no LLM calls).
+    
+    SOURCE is a directory (searched recursively for *.json, except the
+    batch reports generation_report.json and failed_cvs.json) or a
+    manifest listing one JSON path per line.
+    
+    Examples:
+    
+    \b
+        # Re-render all CVs with the modern template, next to their JSON
+        python -m src.cli.main render output/cvs --template modern --skip hash
+    
+    \b
+        # Render a manifest into another directory on 8 processes
+        python -m src.cli.main render cvs.txt --output-dir output/pdf --workers 8
+    """
+    console.print(Panel.fit("[bold green]🇨🇭 Swiss CV Renderer[/bold green]", border_style="green"))
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TimeElapsedColumn()
+    ) as progress:
+        task = progress.add_task("[cyan]Rendering PDFs...", total=None)
+        stats = render_corpus(
+            source,
+            output_dir=output_dir,
+            template=template,
+            skip=skip,
+            workers=workers,
+            on_progress=lambda: progress.advance(task)
+        )
+        progress.update(task, total=stats["found"], completed=stats["found"])
+    
+    table = Table(title="Render Statistics", show_header=True, header_style="bold magenta")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="green")
+    table.add_row("CV Files", str(stats["found"]))
+    table.add_row("Skipped (up to date)", str(stats["skipped"]))
+    table.add_row("Rendered", str(stats["rendered"]))
+    table.add_row("Failed", str(stats["failed"]))
+    table.add_row("Pages", str(stats["pages"]))
+    table.add_row("Time", f"{stats['seconds']:.1f}s")
+    table.add_row("Pages/sec", f"{stats['pages_per_sec']:.1f}")
+    console.print(table)
+    
+    if stats["failed"]:
+        console.print(f"[yellow]Failed renders: see {stats['errors_path']}[/yellow]")
 
 
 if __name__ == '__main__':
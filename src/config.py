@@ -38,6 +38,64 @@ try:
         ai_temperature_creative: float = 0.8
         ai_temperature_factual: float = 0.3
         
+        # LLM Backend Configuration ("openai" or "stub")
+        llm_backend: str = "openai"
+        llm_stub_seed: int = 42
+        llm_stub_latency: str = "none"  # none, fixed, uniform, lognormal
+        llm_stub_latency_ms: float = 0.0
+        llm_stub_latency_jitter: float = 0.5
+        llm_stub_error_rate_429: float = 0.0
+        llm_stub_error_rate_timeout: float = 0.0
+        
+        # LLM Circuit Breaker (trips on failures or slow p95 latency in a sliding window)
+        llm_request_timeout: float = 30.0
+        llm_breaker_failure_threshold: int = 5
+        llm_breaker_window: int = 20
+        llm_breaker_p95_latency_seconds: float = 20.0
+        llm_breaker_reset_seconds: float = 30.0
+        
+        # Stream multi-job bullet generation (parse/validate per job, cancel early)
+        llm_stream_bullets: bool = False
+        
+        # Precomputed bullet bank (scripts/build_bullet_bank.py)
+        use_bullet_bank: bool = True
+        bullet_bank_path: str = "data/processed/bullet_bank.sqlite"
+        
+        # Summary/hobby template bank (scripts/build_section_bank.py)
+        use_section_bank: bool = True
+        section_bank_path: str = "data/processed/section_bank.json"
+        # "standard" uses the banks, "premium" always asks the LLM
+        cv_quality_tier: str = "standard"
+        
+        # Adaptive max_tokens from observed completion lengths (token_budget.py; empty path = in-memory only)
+        adaptive_max_tokens: bool = True
+        max_tokens_percentile: float = 99.0
+        max_tokens_margin: float = 0.15
+        max_tokens_min_samples: int = 20
+        token_budget_path: str = ""
+        
+        # Model routing per call site (model_routing.py) and run budgets (0 = unlimited)
+        llm_model_routing: str = ""
+        llm_run_token_budget: int = 0
+        llm_run_cost_budget_usd: float = 0.0
+        llm_latency_slo_seconds: float = 0.0
+        llm_budget_downgrade_at: float = 0.8
+        
+        # Share of rejected CVs that get a full validation report (fast-fail validation)
+        validation_report_sample_rate: float = 0.05
+        
+        # CVs reference portraits by asset id; base64 is inlined only at render time or on request
+        portrait_by_reference: bool = True
+        
+        # Threads for independent CV sections (summary, bullets, hobbies, ...); 1 = sequential
+        cv_section_workers: int = 3
+        
+        # CVs generated concurrently by generate_complete_cv_batch (CLI, batch scripts)
+        cv_batch_workers: int = 4
+        
+        # Processes of the PDF render farm; 0 = one per CPU core
+        pdf_render_workers: int = 0
+        
         model_config = SettingsConfigDict(
             env_file=".env",
             env_file_encoding="utf-8",
@@ -77,6 +135,64 @@ except ImportError:
             ai_temperature_creative: float = 0.8
             ai_temperature_factual: float = 0.3
             
+            # LLM Backend Configuration ("openai" or "stub")
+            llm_backend: str = "openai"
+            llm_stub_seed: int = 42
+            llm_stub_latency: str = "none"  # none, fixed, uniform, lognormal
+            llm_stub_latency_ms: float = 0.0
+            llm_stub_latency_jitter: float = 0.5
+            llm_stub_error_rate_429: float = 0.0
+            llm_stub_error_rate_timeout: float = 0.0
+            
+            # LLM Circuit Breaker (trips on failures or slow p95 latency in a sliding window)
+            llm_request_timeout: float = 30.0
+            llm_breaker_failure_threshold: int = 5
+            llm_breaker_window: int = 20
+            llm_breaker_p95_latency_seconds: float = 20.0
+            llm_breaker_reset_seconds: float = 30.0
+            
+            # Stream multi-job bullet generation (parse/validate per job, cancel early)
+            llm_stream_bullets: bool = False
+            
+            # Precomputed bullet bank (scripts/build_bullet_bank.py)
+            use_bullet_bank: bool = True
+            bullet_bank_path: str = "data/processed/bullet_bank.sqlite"
+            
+            # Summary/hobby template bank (scripts/build_section_bank.py)
+            use_section_bank: bool = True
+            section_bank_path: str = "data/processed/section_bank.json"
+            # "standard" uses the banks, "premium" always asks the LLM
+            cv_quality_tier: str = "standard"
+            
+            # Adaptive max_tokens from observed completion lengths (token_budget.py; empty path = in-memory only)
+            adaptive_max_tokens: bool = True
+            max_tokens_percentile: float = 99.0
+            max_tokens_margin: float = 0.15
+            max_tokens_min_samples: int = 20
+            token_budget_path: str = ""
+            
+            # Model routing per call site (model_routing.py) and run budgets (0 = unlimited)
+            llm_model_routing: str = ""
+            llm_run_token_budget: int = 0
+            llm_run_cost_budget_usd: float = 0.0
+            llm_latency_slo_seconds: float = 0.0
+            llm_budget_downgrade_at: float = 0.8
+            
+            # Share of rejected CVs that get a full validation report (fast-fail validation)
+            validation_report_sample_rate: float = 0.05
+            
+            # CVs reference portraits by asset id; base64 is inlined only at render time or on request
+            portrait_by_reference: bool = True
+            
+            # Threads for independent CV sections (summary, bullets, hobbies, ...); 1 = sequential
+            cv_section_workers: int = 3
+            
+            # CVs generated concurrently by generate_complete_cv_batch (CLI, batch scripts)
+            cv_batch_workers: int = 4
+            
+            # Processes of the PDF render farm; 0 = one per CPU core
+            pdf_render_workers: int = 0
+            
             class Config:
                 env_file = ".env"
                 env_file_encoding = "utf-8"
@@ -114,6 +230,64 @@ except ImportError:
                 self.ai_rate_limit_delay: float = float(os.getenv("AI_RATE_LIMIT_DELAY", "1.0"))
                 self.ai_temperature_creative: float = float(os.getenv("AI_TEMPERATURE_CREATIVE", "0.8"))
                 self.ai_temperature_factual: float = float(os.getenv("AI_TEMPERATURE_FACTUAL", "0.3"))
+                
+                # LLM Backend Configuration ("openai" or "stub")
+                self.llm_backend: str = os.getenv("LLM_BACKEND", "openai")
+                self.llm_stub_seed: int = int(os.getenv("LLM_STUB_SEED", "42"))
+                self.llm_stub_latency: str = os.getenv("LLM_STUB_LATENCY", "none")
+                self.llm_stub_latency_ms: float = float(os.getenv("LLM_STUB_LATENCY_MS", "0.0"))
+                self.llm_stub_latency_jitter: float = float(os.getenv("LLM_STUB_LATENCY_JITTER", "0.5"))
+                self.llm_stub_error_rate_429: float = float(os.getenv("LLM_STUB_ERROR_RATE_429", "0.0"))
+                self.llm_stub_error_rate_timeout: float = float(os.getenv("LLM_STUB_ERROR_RATE_TIMEOUT", "0.0"))
+                
+                # LLM Circuit Breaker (trips on failures or slow p95 latency in a sliding window)
+                self.llm_request_timeout: float = float(os.getenv("LLM_REQUEST_TIMEOUT", "30.0"))
+                self.llm_breaker_failure_threshold: int = int(os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", "5"))
+                self.llm_breaker_window: int = int(os.getenv("LLM_BREAKER_WINDOW", "20"))
+                self.llm_breaker_p95_latency_seconds: float = float(os.getenv("LLM_BREAKER_P95_LATENCY_SECONDS", "20.0"))
+                self.llm_breaker_reset_seconds: float = float(os.getenv("LLM_BREAKER_RESET_SECONDS", "30.0"))
+                
+                # Stream multi-job bullet generation (parse/validate per job, cancel early)
+                self.llm_stream_bullets: bool = os.getenv("LLM_STREAM_BULLETS", "false").lower() in ("1", "true", "yes")
+                
+                # Precomputed bullet bank (scripts/build_bullet_bank.py)
+                self.use_bullet_bank: bool = os.getenv("USE_BULLET_BANK", "true").lower() in ("1", "true", "yes")
+                self.bullet_bank_path: str = os.getenv("BULLET_BANK_PATH", "data/processed/bullet_bank.sqlite")
+                
+                # Summary/hobby template bank (scripts/build_section_bank.py)
+                self.use_section_bank: bool = os.getenv("USE_SECTION_BANK", "true").lower() in ("1", "true", "yes")
+                self.section_bank_path: str = os.getenv("SECTION_BANK_PATH", "data/processed/section_bank.json")
+                # "standard" uses the banks, "premium" always asks the LLM
+                self.cv_quality_tier: str = os.getenv("CV_QUALITY_TIER", "standard")
+                
+                # Adaptive max_tokens from observed completion lengths (token_budget.py; empty path = in-memory only)
+                self.adaptive_max_tokens: bool = os.getenv("ADAPTIVE_MAX_TOKENS", "true").lower() in ("1", "true", "yes")
+                self.max_tokens_percentile: float = float(os.getenv("MAX_TOKENS_PERCENTILE", "99.0"))
+                self.max_tokens_margin: float = float(os.getenv("MAX_TOKENS_MARGIN", "0.15"))
+                self.max_tokens_min_samples: int = int(os.getenv("MAX_TOKENS_MIN_SAMPLES", "20"))
+                self.token_budget_path: str = os.getenv("TOKEN_BUDGET_PATH", "")
+                
+                # Model routing per call site (model_routing.py) and run budgets (0 = unlimited)
+                self.llm_model_routing: str = os.getenv("LLM_MODEL_ROUTING", "")
+                self.llm_run_token_budget: int = int(os.getenv("LLM_RUN_TOKEN_BUDGET", "0"))
+                self.llm_run_cost_budget_usd: float = float(os.getenv("LLM_RUN_COST_BUDGET_USD", "0.0"))
+                self.llm_latency_slo_seconds: float = float(os.getenv("LLM_LATENCY_SLO_SECONDS", "0.0"))
+                self.llm_budget_downgrade_at: float = float(os.getenv("LLM_BUDGET_DOWNGRADE_AT", "0.8"))
+                
+                # Share of rejected CVs that get a full validation report (fast-fail validation)
+                self.validation_report_sample_rate: float = float(os.getenv("VALIDATION_REPORT_SAMPLE_RATE", "0.05"))
+                
+                # CVs reference portraits by asset id; base64 is inlined only at render time or on request
+                self.portrait_by_reference: bool = os.getenv("PORTRAIT_BY_REFERENCE", "true").lower() in ("1", "true", "yes")
+                
+                # Threads for independent CV sections (summary, bullets, hobbies, ...); 1 = sequential
+                self.cv_section_workers: int = int(os.getenv("CV_SECTION_WORKERS", "3"))
+                
+                # CVs generated concurrently by generate_complete_cv_batch (CLI, batch scripts)
+                self.cv_batch_workers: int = int(os.getenv("CV_BATCH_WORKERS", "4"))
+                
+                # Processes of the PDF render farm; 0 = one per CPU core
+                self.pdf_render_workers: int = int(os.getenv("PDF_RENDER_WORKERS", "0"))
 
 
 # Singleton settings instance
@@ -157,6 +157,17 @@ def get_occupation_by_id(job_id: str) -> Optional[Dict[str, Any]]:
     return collection.find_one({"job_id": job_id})
 
 
+def get_occupations_by_ids(job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Get several occupations in one query (job_id -> occupation, missing ids are left out)."""
+    job_ids = sorted({job_id for job_id in job_ids if job_id})
+    if not job_ids:
+        return {}
+    db_manager = get_db_manager()
+    db_manager.connect()
+    collection = db_manager.get_source_collection(settings.mongodb_collection_occupations)
+    return {doc["job_id"]: doc for doc in collection.find({"job_id": {"$in": job_ids}})}
+
+
 # Bildungstyp hierarchy for career levels
 BILDUNGSTYP_HIERARCHY = {
     "Grundbildung (Lehre)": 0,  # Junior
@@ -272,7 +283,7 @@ def get_career_progression_title(
     
     # For CURRENT job (the most recent), always use base title
     if is_current_job:
-        title = _add_career_prefix(base_title, target_career_level)
+        title = add_career_prefix(base_title, target_career_level)
         return title, base_job_id
     
     # For PREVIOUS jobs (older), try to find related occupation in SAME Berufsfeld
@@ -307,16 +318,16 @@ def get_career_progression_title(
     if available:
         # Pick a random related occupation from same Berufsfeld
         chosen = random.choice(available)
-        title = _add_career_prefix(chosen.get("title", base_title), target_career_level)
+        title = add_career_prefix(chosen.get("title", base_title), target_career_level)
         return title, chosen.get("job_id")
     
     # Fallback: use base title with prefix (stay in same field)
-    title = _add_career_prefix(base_title, target_career_level)
+    title = add_career_prefix(base_title, target_career_level)
     return title, base_job_id
 
 
-def _add_career_prefix(title: str, career_level: str) -> str:
-    """Add career level prefix to title if appropriate."""
+def add_career_prefix(title: str, career_level: str, rng: Optional[random.Random] = None) -> str:
+    """Add career level prefix to title if appropriate (rng defaults to the module-level random)."""
     title_lower = title.lower()
     
     # Don't add prefix if already present
@@ -334,7 +345,7 @@ def _add_career_prefix(title: str, career_level: str) -> str:
     elif career_level == "lead":
         # Vary between Lead/Leiter/Chef
         prefixes = ["Leiter/in", "Lead", "Chef/in"]
-        return f"{random.choice(prefixes)} {title}"
+        return f"{(rng or random).choice(prefixes)} {title}"
     
     return title
 
@@ -694,41 +705,53 @@ def sample_industry_weighted() -> str:
     Returns:
         Industry enum value
     """
-    percentages = _load_industry_percentages()
+    weights = get_industry_weights()
     
-    # Map NOGA branches to industries
-    branch_to_industry = {
-        "Informatik": "technology",
-        "Wirtschaft, Verwaltung, Tourismus": "finance",
-        "Gesundheit": "healthcare",
-        "Bau": "construction",
-        "Metall, Maschinen, Uhren": "manufacturing",
-        "Bildung, Soziales": "education",
-        "Verkauf, Einkauf": "retail",
-        "Gastgewerbe, Hotellerie": "hospitality",
-    }
-    
-    industries = []
-    weights = []
-    
-    for branch, percentage in percentages.items():
-        if branch in branch_to_industry:
-            industry = branch_to_industry[branch]
-            industries.append(industry)
-            weights.append(percentage)
-    
-    if not industries:
+    if not weights:
         # Fallback: equal probability
         return random.choice([
             "technology", "finance", "healthcare", "construction",
             "manufacturing", "education", "retail", "hospitality", "other"
         ])
     
+    return random.choices(list(weights), weights=list(weights.values()), k=1)[0]
+
+
+# Map NOGA branches to industries
+BRANCH_TO_INDUSTRY = {
+    "Informatik": "technology",
+    "Wirtschaft, Verwaltung, Tourismus": "finance",
+    "Gesundheit": "healthcare",
+    "Bau": "construction",
+    "Metall, Maschinen, Uhren": "manufacturing",
+    "Bildung, Soziales": "education",
+    "Verkauf, Einkauf": "retail",
+    "Gastgewerbe, Hotellerie": "hospitality",
+}
+
+
+def get_industry_weights() -> Dict[str, float]:
+    """
+    Get industry sampling weights from real employment data.
+    
+    Returns:
+        Dictionary industry -> employment percentage, with "other" holding
+        the remainder up to 100% (empty if no branch data is available).
+    """
+    percentages = _load_industry_percentages()
+    
+    weights: Dict[str, float] = {}
+    for branch, percentage in percentages.items():
+        if branch in BRANCH_TO_INDUSTRY:
+            weights[BRANCH_TO_INDUSTRY[branch]] = percentage
+    
+    if not weights:
+        return {}
+    
     # Add "other" with remaining percentage
-    total_weight = sum(weights)
+    total_weight = sum(weights.values())
     if total_weight < 100.0:
-        industries.append("other")
-        weights.append(100.0 - total_weight)
+        weights["other"] = 100.0 - total_weight
     
-    return random.choices(industries, weights=weights, k=1)[0]
+    return weights
 
@@ -0,0 +1,83 @@
+"""
+Streaming JSON serialization of CVDocuments.
+
+write_cv_json() writes the CVDocument.to_dict() layout straight from the
+document: no nested dict is built, values are encoded one field at a time.
+
+- indent=None writes minified JSON with a pluggable encoder (get_fast_encoder()
+  uses orjson if installed, else the standard library).
+- indent=N writes the same text as json.dump(cv_doc.to_dict(), indent=N,
+  ensure_ascii=False).
+"""
+
+import io
+import json
+from typing import Any, Callable, Dict, IO, Optional
+
+# Encodes one JSON value (e.g. a job list) to a string
+Encoder = Callable[[Any], str]
+
+
+def compact_encoder(value: Any) -> str:
+    """Minified JSON via the standard library."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def get_fast_encoder() -> Encoder:
+    """orjson encoder if installed (optional dependency), else compact_encoder."""
+    try:
+        import orjson
+    except ImportError:
+        return compact_encoder
+
+    def encode(value: Any) -> str:
+        return orjson.dumps(value).decode("utf-8")
+
+    return encode
+
+
+def write_cv_json(
+    cv_doc: Any,
+    fp: IO[str],
+    indent: Optional[int] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    encoder: Optional[Encoder] = None,
+    inline_portrait: bool = False
+) -> None:
+    """
+    Write a CVDocument as JSON (to_dict() layout) without building the dict.
+
+    Args:
+        cv_doc: CVDocument.
+        fp: Text file to write to.
+        indent: Pretty-print with this indent; None writes minified JSON.
+        metadata: Extra keys for the "metadata" section (e.g. exported_at).
+        encoder: Value encoder for minified output (default: compact_encoder).
+        inline_portrait: Embed the base64 portrait (see CVDocument.to_dict).
+    """
+    if indent is None:
+        encode = encoder or compact_encoder
+        newline, pad, pad2, colon = "", "", "", ":"
+    else:
+        encode = lambda value: json.dumps(value, ensure_ascii=False, indent=indent)  # noqa: E731
+        newline, pad, pad2, colon = "\n", " " * indent, " " * (2 * indent), ": "
+
+    fp.write("{")
+    for i, (section, items) in enumerate(cv_doc.iter_sections(inline_portrait)):
+        if section == "metadata" and metadata:
+            items = {**dict(items), **metadata}.items()
+        fp.write(f"{',' if i else ''}{newline}{pad}{encode(section)}{colon}{{")
+        for j, (key, value) in enumerate(items):
+            encoded = encode(value)
+            if newline:
+                encoded = encoded.replace("\n", "\n" + pad2)
+            fp.write(f"{',' if j else ''}{newline}{pad2}{encode(key)}{colon}{encoded}")
+        fp.write(f"{newline}{pad}}}")
+    fp.write(f"{newline}}}")
+
+
+def cv_to_json(cv_doc: Any, **kwargs: Any) -> str:
+    """write_cv_json() into a string (same arguments)."""
+    buffer = io.StringIO()
+    write_cv_json(cv_doc, buffer, **kwargs)
+    return buffer.getvalue()
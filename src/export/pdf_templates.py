@@ -12,7 +12,7 @@ Run: python scripts/generate_cv_parallel.py --template random
 
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib import colors
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Frame, PageTemplate, FrameBreak,
@@ -20,12 +20,14 @@ from reportlab.platypus import (
 )
 from reportlab.pdfbase import ttfonts, pdfmetrics
 from reportlab.lib.colors import HexColor
-from typing import Any, Optional, Dict
+from reportlab.lib.utils import ImageReader
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
 import datetime
 import os
-import base64
-import tempfile
+import io
 import random
+import functools
 
 # Font configuration
 FONT_DIR = os.path.join(os.getcwd(), "assets", "fonts")
@@ -93,62 +95,73 @@ def _format_end_date(end_date: Any) -> str:
     return str(end_date)
 
 
-def _labels_for_lang(lang: str) -> Dict[str, str]:
-    """Get localized labels."""
-    mapping = {
-        "de": {
-            "profile": "Profil",
-            "experience": "Berufserfahrung",
-            "education": "Ausbildung",
-            "skills": "Kompetenzen",
-            "languages": "Sprachen",
-            "contact": "Kontakt",
-            "hobbies": "Interessen",
-        },
-        "fr": {
-            "profile": "Profil",
-            "experience": "Expérience",
-            "education": "Formation",
-            "skills": "Compétences",
-            "languages": "Langues",
-            "contact": "Contact",
-            "hobbies": "Loisirs",
-        },
-        "it": {
-            "profile": "Profilo",
-            "experience": "Esperienza",
-            "education": "Formazione",
-            "skills": "Competenze",
-            "languages": "Lingue",
-            "contact": "Contatto",
-            "hobbies": "Hobby",
-        },
-    }
-    return mapping.get((lang or "de").lower()[:2], mapping["de"])
-
-
-def _save_portrait_temp(portrait_base64: str) -> Optional[str]:
-    """Save portrait to temp file, return path or None."""
-    if not portrait_base64:
+# Localized section labels (read-only, shared by all renders)
+_LABELS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "de": MappingProxyType({
+        "profile": "Profil",
+        "experience": "Berufserfahrung",
+        "education": "Ausbildung",
+        "skills": "Kompetenzen",
+        "languages": "Sprachen",
+        "contact": "Kontakt",
+        "hobbies": "Interessen",
+    }),
+    "fr": MappingProxyType({
+        "profile": "Profil",
+        "experience": "Expérience",
+        "education": "Formation",
+        "skills": "Compétences",
+        "languages": "Langues",
+        "contact": "Contact",
+        "hobbies": "Loisirs",
+    }),
+    "it": MappingProxyType({
+        "profile": "Profilo",
+        "experience": "Esperienza",
+        "education": "Formazione",
+        "skills": "Competenze",
+        "languages": "Lingue",
+        "contact": "Contatto",
+        "hobbies": "Hobby",
+    }),
+})
+
+
+def _lang_key(lang: Optional[str]) -> str:
+    """Language code with labels ("de" for unknown languages)."""
+    lang = (lang or "de").lower()[:2]
+    return lang if lang in _LABELS else "de"
+
+
+def _portrait_ref(cv_doc: Any) -> Optional[str]:
+    """Portrait asset id of a CV, or its inlined base64 portrait."""
+    return _get(cv_doc, "portrait_asset_id") or _get(cv_doc, "portrait_base64") or None
+
+
+@functools.lru_cache(maxsize=64)
+def _portrait_reader(portrait_ref: Optional[str]) -> Optional[ImageReader]:
+    """
+    In-memory ImageReader of a portrait asset id or base64 portrait, or None.
+    
+    Readers are shared by all CVs with the same portrait, so the PNG is
+    decoded once per process; portraits from the portrait store are not
+    base64-decoded at all.
+    """
+    if not portrait_ref:
         return None
     try:
-        if "," in portrait_base64:
-            portrait_base64 = portrait_base64.split(",")[1]
-        img_data = base64.b64decode(portrait_base64)
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            tmp.write(img_data)
-            return tmp.name
-    except:
+        from src.generation.portrait_store import get_portrait_store
+        png = get_portrait_store().resolve_png(portrait_ref)
+        return ImageReader(io.BytesIO(png)) if png else None
+    except Exception:
         return None
 
 
-def _cleanup_temp(path: Optional[str]):
-    """Clean up temp file."""
-    if path and os.path.exists(path):
-        try:
-            os.unlink(path)
-        except:
-            pass
+class PortraitImage(Image):
+    """Image flowable drawn from a shared ImageReader (no temp file)."""
+    def __init__(self, reader: ImageReader, width=None, height=None):
+        self._img = reader
+        Image.__init__(self, reader.fp, width=width, height=height)
 
 
 class ThinDivider(Flowable):
@@ -200,19 +213,10 @@ class TimelineDot(Flowable):
 
 
 # =============================================================================
-# TEMPLATE 1: CLASSIC (Two-Column) - Table-based to keep columns together
+# TEMPLATE STYLES - compiled once per template and language
 # =============================================================================
-def render_classic(cv_doc: Any, out_path: str):
-    """Classic two-column layout with right sidebar using Table layout."""
-    accent = "#0050A4"
-    
-    PAGE_WIDTH, PAGE_HEIGHT = A4
-    MARGIN = 18 * mm
-    RIGHT_COL_WIDTH = 56 * mm
-    GUTTER = 6 * mm
-    LEFT_COL_WIDTH = PAGE_WIDTH - 2 * MARGIN - RIGHT_COL_WIDTH - GUTTER
-    
-    base = getSampleStyleSheet()
+def _classic_styles(base: StyleSheet1) -> Tuple[Dict[str, ParagraphStyle], Dict[str, TableStyle]]:
+    accent = TEMPLATES["classic"]["accent"]
     styles = {
         "name": ParagraphStyle("Name", parent=base["Heading1"], fontName=FONT_BOLD, 
                                fontSize=22, leading=26, textColor=HexColor(accent), spaceAfter=2),
@@ -235,9 +239,170 @@ def render_classic(cv_doc: Any, out_path: str):
         "company": ParagraphStyle("Company", parent=base["Normal"], fontName=FONT_REGULAR, 
                                   fontSize=8, leading=11, textColor=HexColor(accent), spaceAfter=3),
     }
+    # Contact card header (white on accent)
+    styles["contact_header"] = ParagraphStyle("CH", parent=styles["h_right"], textColor=colors.white,
+                                              spaceBefore=0, spaceAfter=0)
+    table_styles = {
+        "contact": TableStyle([
+            ("BACKGROUND", (0, 0), (-1, 0), HexColor(accent)),
+            ("BACKGROUND", (0, 1), (-1, -1), HexColor("#E8F0F8")),
+            ("LEFTPADDING", (0, 0), (-1, -1), 6),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+            ("TOPPADDING", (0, 0), (-1, -1), 5),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+        ]),
+    }
+    return styles, table_styles
+
+
+def _modern_styles(base: StyleSheet1) -> Tuple[Dict[str, ParagraphStyle], Dict[str, TableStyle]]:
+    accent = TEMPLATES["modern"]["accent"]
+    styles = {
+        # Sidebar styles (white text)
+        "name_w": ParagraphStyle("NameW", parent=base["Heading1"], fontName=FONT_BOLD, 
+                                 fontSize=20, leading=24, textColor=colors.white, spaceAfter=4),
+        "title_w": ParagraphStyle("TitleW", parent=base["Normal"], fontName=FONT_REGULAR, 
+                                  fontSize=10, leading=13, textColor=HexColor("#9CA3AF"), spaceAfter=16),
+        "h_w": ParagraphStyle("HW", parent=base["Heading3"], fontName=FONT_BOLD, 
+                              fontSize=10, leading=13, textColor=HexColor(accent), spaceBefore=16, spaceAfter=8),
+        "normal_w": ParagraphStyle("BodyW", parent=base["Normal"], fontName=FONT_REGULAR, 
+                                   fontSize=9, leading=12, textColor=colors.white, spaceAfter=3),
+        "bullet_w": ParagraphStyle("BulletW", parent=base["Normal"], fontName=FONT_REGULAR, 
+                                   fontSize=8, leading=11, textColor=HexColor("#D1D5DB"), leftIndent=6, spaceAfter=2),
+        # Content styles
+        "h": ParagraphStyle("H", parent=base["Heading3"], fontName=FONT_BOLD, 
+                            fontSize=12, leading=15, textColor=HexColor("#1F2937"), spaceBefore=16, spaceAfter=10),
+        "normal": ParagraphStyle("Body", parent=base["Normal"], fontName=FONT_REGULAR, 
+                                 fontSize=10, leading=14, textColor=HexColor("#374151"), spaceAfter=4),
+        "bullet": ParagraphStyle("Bullet", parent=base["Normal"], fontName=FONT_REGULAR, 
+                                 fontSize=9, leading=12, leftIndent=8, textColor=HexColor("#4B5563"), spaceAfter=2),
+        "job_title": ParagraphStyle("JobTitle", parent=base["Normal"], fontName=FONT_BOLD, 
+                                    fontSize=10, leading=13, textColor=HexColor("#1F2937"), spaceAfter=1),
+        "company": ParagraphStyle("Company", parent=base["Normal"], fontName=FONT_REGULAR, 
+                                  fontSize=9, leading=12, textColor=HexColor(accent), spaceAfter=4),
+    }
+    return styles, {}
+
+
+def _minimal_styles(base: StyleSheet1) -> Tuple[Dict[str, ParagraphStyle], Dict[str, TableStyle]]:
+    accent = TEMPLATES["minimal"]["accent"]
+    styles = {
+        "name": ParagraphStyle("Name", parent=base["Heading1"], fontName=FONT_BOLD, 
+                               fontSize=26, leading=30, textColor=HexColor("#111827"), spaceAfter=2),
+        "title": ParagraphStyle("Title", parent=base["Normal"], fontName=FONT_REGULAR, 
+                                fontSize=12, leading=15, textColor=HexColor(accent), spaceAfter=6),
+        "contact": ParagraphStyle("Contact", parent=base["Normal"], fontName=FONT_REGULAR, 
+                                  fontSize=9, leading=12, textColor=HexColor("#6B7280"), spaceAfter=16),
+        "h": ParagraphStyle("H", parent=base["Heading3"], fontName=FONT_BOLD, 
+                            fontSize=10, leading=13, textColor=HexColor("#111827"), 
+                            spaceBefore=18, spaceAfter=10),
+        "normal": ParagraphStyle("Body", parent=base["Normal"], fontName=FONT_REGULAR, 
+                                 fontSize=10, leading=14, textColor=HexColor("#374151"), spaceAfter=4),
+        "bullet": ParagraphStyle("Bullet", parent=base["Normal"], fontName=FONT_REGULAR, 
+                                 fontSize=9, leading=13, leftIndent=10, textColor=HexColor("#4B5563"), spaceAfter=2),
+        "job_header": ParagraphStyle("JobH", parent=base["Normal"], fontName=FONT_BOLD, 
+                                     fontSize=10, leading=13, textColor=HexColor("#111827"), spaceAfter=1),
+        "job_meta": ParagraphStyle("JobM", parent=base["Normal"], fontName=FONT_REGULAR, 
+                                   fontSize=9, leading=12, textColor=HexColor(accent), spaceAfter=4),
+    }
+    table_styles = {
+        "header": TableStyle([("VALIGN", (0, 0), (-1, -1), "TOP")]),
+    }
+    return styles, table_styles
+
+
+def _timeline_styles(base: StyleSheet1) -> Tuple[Dict[str, ParagraphStyle], Dict[str, TableStyle]]:
+    accent = TEMPLATES["timeline"]["accent"]
+    styles = {
+        "name": ParagraphStyle("Name", parent=base["Heading1"], fontName=FONT_BOLD, 
+                               fontSize=24, leading=28, textColor=HexColor(accent), spaceAfter=2),
+        "title": ParagraphStyle("Title", parent=base["Normal"], fontName=FONT_REGULAR, 
+                                fontSize=11, leading=14, textColor=HexColor("#6B7280"), spaceAfter=6),
+        "contact": ParagraphStyle("Contact", parent=base["Normal"], fontName=FONT_REGULAR, 
+                                  fontSize=9, leading=12, textColor=HexColor("#9CA3AF"), spaceAfter=14),
+        "h": ParagraphStyle("H", parent=base["Heading3"], fontName=FONT_BOLD, 
+                            fontSize=12, leading=15, textColor=HexColor(accent), spaceBefore=16, spaceAfter=10),
+        "normal": ParagraphStyle("Body", parent=base["Normal"], fontName=FONT_REGULAR, 
+                                 fontSize=10, leading=14, textColor=HexColor("#374151"), spaceAfter=4),
+        "bullet": ParagraphStyle("Bullet", parent=base["Normal"], fontName=FONT_REGULAR, 
+                                 fontSize=9, leading=12, textColor=HexColor("#4B5563"), spaceAfter=2),
+        "date": ParagraphStyle("Date", parent=base["Normal"], fontName=FONT_BOLD, 
+                               fontSize=8, leading=10, textColor=HexColor(accent)),
+        "job_title": ParagraphStyle("JobTitle", parent=base["Normal"], fontName=FONT_BOLD, 
+                                    fontSize=10, leading=13, textColor=HexColor("#1F2937"), spaceAfter=1),
+        "company": ParagraphStyle("Company", parent=base["Normal"], fontName=FONT_REGULAR, 
+                                  fontSize=9, leading=12, textColor=HexColor("#6B7280"), spaceAfter=4),
+    }
+    table_styles = {
+        "header": TableStyle([("VALIGN", (0, 0), (-1, -1), "MIDDLE")]),
+        "row": TableStyle([
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("LEFTPADDING", (0, 0), (-1, -1), 0),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+        ]),
+    }
+    return styles, table_styles
+
+
+_STYLE_FACTORIES = {
+    "classic": _classic_styles,
+    "modern": _modern_styles,
+    "minimal": _minimal_styles,
+    "timeline": _timeline_styles,
+}
+
+
+class TemplateStyle(NamedTuple):
+    """Compiled styles and labels of a template in one language."""
+    styles: Mapping[str, ParagraphStyle]
+    table_styles: Mapping[str, TableStyle]
+    labels: Mapping[str, str]
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_styles(template: str) -> Tuple[Mapping[str, ParagraphStyle], Mapping[str, TableStyle]]:
+    styles, table_styles = _STYLE_FACTORIES[template](getSampleStyleSheet())
+    return MappingProxyType(styles), MappingProxyType(table_styles)
+
+
+@functools.lru_cache(maxsize=None)
+def _template_style(template: str, lang: str) -> TemplateStyle:
+    styles, table_styles = _compile_styles(template)
+    return TemplateStyle(styles, table_styles, _LABELS[lang])
+
+
+def get_template_style(template: str, language: Optional[str] = "de") -> TemplateStyle:
+    """
+    Styles and labels of a template, compiled once per process.
+
+    Bundles are shared by all renders (also across threads of a render
+    pool); ReportLab only reads styles, so callers must not modify them.
+    """
+    return _template_style(template, _lang_key(language))
+
+
+def warm_template_styles() -> int:
+    """Compile the styles of all templates and languages (e.g. in a new render worker)."""
+    return len([get_template_style(template, lang) for template in _STYLE_FACTORIES for lang in _LABELS])
+
+
+# =============================================================================
+# TEMPLATE 1: CLASSIC (Two-Column) - Table-based to keep columns together
+# =============================================================================
+def render_classic(cv_doc: Any, out_path: str) -> int:
+    """Classic two-column layout with right sidebar using Table layout."""
+    accent = "#0050A4"
+    
+    PAGE_WIDTH, PAGE_HEIGHT = A4
+    MARGIN = 18 * mm
+    RIGHT_COL_WIDTH = 56 * mm
+    GUTTER = 6 * mm
+    LEFT_COL_WIDTH = PAGE_WIDTH - 2 * MARGIN - RIGHT_COL_WIDTH - GUTTER
     
     language = _get(cv_doc, "language") or "de"
-    labels = _labels_for_lang(language)
+    compiled = get_template_style("classic", language)
+    styles, labels = compiled.styles, compiled.labels
+    
     
     # Build LEFT column content
     left_content = []
@@ -305,9 +470,9 @@ def render_classic(cv_doc: Any, out_path: str):
     right_content = []
     
     # Portrait
-    temp_portrait = _save_portrait_temp(_get(cv_doc, "portrait_base64"))
-    if temp_portrait:
-        right_content.append(Image(temp_portrait, width=RIGHT_COL_WIDTH - 4, height=RIGHT_COL_WIDTH - 4))
+    portrait = _portrait_reader(_portrait_ref(cv_doc))
+    if portrait:
+        right_content.append(PortraitImage(portrait, width=RIGHT_COL_WIDTH - 4, height=RIGHT_COL_WIDTH - 4))
         right_content.append(Spacer(1, 8))
     
     # Contact Card
@@ -316,8 +481,7 @@ def render_classic(cv_doc: Any, out_path: str):
     city = _get(cv_doc, "city")
     canton = _get(cv_doc, "canton")
     
-    contact_rows = [[Paragraph(f"<b>{labels['contact']}</b>", 
-                    ParagraphStyle("CH", parent=styles["h_right"], textColor=colors.white, spaceBefore=0, spaceAfter=0))]]
+    contact_rows = [[Paragraph(f"<b>{labels['contact']}</b>", styles["contact_header"])]]
     if email:
         contact_rows.append([Paragraph(email, styles["small"])])
     if phone:
@@ -327,14 +491,7 @@ def render_classic(cv_doc: Any, out_path: str):
         contact_rows.append([Paragraph(loc, styles["small"])])
     
     contact_tbl = Table(contact_rows, colWidths=[RIGHT_COL_WIDTH - 4])
-    contact_tbl.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), HexColor(accent)),
-        ("BACKGROUND", (0, 1), (-1, -1), HexColor("#E8F0F8")),
-        ("LEFTPADDING", (0, 0), (-1, -1), 6),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-        ("TOPPADDING", (0, 0), (-1, -1), 5),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
-    ]))
+    contact_tbl.setStyle(compiled.table_styles["contact"])
     right_content.append(contact_tbl)
     right_content.append(Spacer(1, 10))
     
@@ -384,13 +541,13 @@ def render_classic(cv_doc: Any, out_path: str):
     doc = SimpleDocTemplate(out_path, pagesize=A4, leftMargin=MARGIN, rightMargin=MARGIN, 
                            topMargin=MARGIN, bottomMargin=MARGIN)
     doc.build([main_table])
-    _cleanup_temp(temp_portrait)
+    return doc.page
 
 
 # =============================================================================
 # TEMPLATE 2: MODERN (Dark Sidebar)
 # =============================================================================
-def render_modern(cv_doc: Any, out_path: str):
+def render_modern(cv_doc: Any, out_path: str) -> int:
     """Modern design with dark left sidebar."""
     accent = "#10B981"
     sidebar_bg = "#1F2937"
@@ -400,31 +557,9 @@ def render_modern(cv_doc: Any, out_path: str):
     CONTENT_WIDTH = PAGE_WIDTH - SIDEBAR_WIDTH
     MARGIN = 12 * mm
     
-    base = getSampleStyleSheet()
-    styles = {
-        # Sidebar styles (white text)
-        "name_w": ParagraphStyle("NameW", parent=base["Heading1"], fontName=FONT_BOLD, 
-                                 fontSize=20, leading=24, textColor=colors.white, spaceAfter=4),
-        "title_w": ParagraphStyle("TitleW", parent=base["Normal"], fontName=FONT_REGULAR, 
-                                  fontSize=10, leading=13, textColor=HexColor("#9CA3AF"), spaceAfter=16),
-        "h_w": ParagraphStyle("HW", parent=base["Heading3"], fontName=FONT_BOLD, 
-                              fontSize=10, leading=13, textColor=HexColor(accent), spaceBefore=16, spaceAfter=8),
-        "normal_w": ParagraphStyle("BodyW", parent=base["Normal"], fontName=FONT_REGULAR, 
-                                   fontSize=9, leading=12, textColor=colors.white, spaceAfter=3),
-        "bullet_w": ParagraphStyle("BulletW", parent=base["Normal"], fontName=FONT_REGULAR, 
-                                   fontSize=8, leading=11, textColor=HexColor("#D1D5DB"), leftIndent=6, spaceAfter=2),
-        # Content styles
-        "h": ParagraphStyle("H", parent=base["Heading3"], fontName=FONT_BOLD, 
-                            fontSize=12, leading=15, textColor=HexColor("#1F2937"), spaceBefore=16, spaceAfter=10),
-        "normal": ParagraphStyle("Body", parent=base["Normal"], fontName=FONT_REGULAR, 
-                                 fontSize=10, leading=14, textColor=HexColor("#374151"), spaceAfter=4),
-        "bullet": ParagraphStyle("Bullet", parent=base["Normal"], fontName=FONT_REGULAR, 
-                                 fontSize=9, leading=12, leftIndent=8, textColor=HexColor("#4B5563"), spaceAfter=2),
-        "job_title": ParagraphStyle("JobTitle", parent=base["Normal"], fontName=FONT_BOLD, 
-                                    fontSize=10, leading=13, textColor=HexColor("#1F2937"), spaceAfter=1),
-        "company": ParagraphStyle("Company", parent=base["Normal"], fontName=FONT_REGULAR, 
-                                  fontSize=9, leading=12, textColor=HexColor(accent), spaceAfter=4),
-    }
+    language = _get(cv_doc, "language") or "de"
+    compiled = get_template_style("modern", language)
+    styles, labels = compiled.styles, compiled.labels
     
     def draw_sidebar(canvas, doc):
         canvas.saveState()
@@ -442,14 +577,12 @@ def render_modern(cv_doc: Any, out_path: str):
     doc.addPageTemplates([PageTemplate(id="Modern", frames=[sidebar_frame, content_frame], onPage=draw_sidebar)])
     
     flow = []
-    language = _get(cv_doc, "language") or "de"
-    labels = _labels_for_lang(language)
     
     # === SIDEBAR ===
     # Portrait
-    temp_portrait = _save_portrait_temp(_get(cv_doc, "portrait_base64"))
-    if temp_portrait:
-        flow.append(Image(temp_portrait, width=SIDEBAR_WIDTH - 3*MARGIN, height=SIDEBAR_WIDTH - 3*MARGIN))
+    portrait = _portrait_reader(_portrait_ref(cv_doc))
+    if portrait:
+        flow.append(PortraitImage(portrait, width=SIDEBAR_WIDTH - 3*MARGIN, height=SIDEBAR_WIDTH - 3*MARGIN))
         flow.append(Spacer(1, 12))
     
     # Name
@@ -546,13 +679,13 @@ def render_modern(cv_doc: Any, out_path: str):
             flow.append(Spacer(1, 4))
     
     doc.build(flow)
-    _cleanup_temp(temp_portrait)
+    return doc.page
 
 
 # =============================================================================
 # TEMPLATE 3: MINIMAL (Single Column)
 # =============================================================================
-def render_minimal(cv_doc: Any, out_path: str):
+def render_minimal(cv_doc: Any, out_path: str) -> int:
     """Clean minimal single-column layout."""
     accent = "#6366F1"
     
@@ -560,38 +693,19 @@ def render_minimal(cv_doc: Any, out_path: str):
     MARGIN = 25 * mm
     CONTENT_WIDTH = PAGE_WIDTH - 2 * MARGIN
     
-    base = getSampleStyleSheet()
-    styles = {
-        "name": ParagraphStyle("Name", parent=base["Heading1"], fontName=FONT_BOLD, 
-                               fontSize=26, leading=30, textColor=HexColor("#111827"), spaceAfter=2),
-        "title": ParagraphStyle("Title", parent=base["Normal"], fontName=FONT_REGULAR, 
-                                fontSize=12, leading=15, textColor=HexColor(accent), spaceAfter=6),
-        "contact": ParagraphStyle("Contact", parent=base["Normal"], fontName=FONT_REGULAR, 
-                                  fontSize=9, leading=12, textColor=HexColor("#6B7280"), spaceAfter=16),
-        "h": ParagraphStyle("H", parent=base["Heading3"], fontName=FONT_BOLD, 
-                            fontSize=10, leading=13, textColor=HexColor("#111827"), 
-                            spaceBefore=18, spaceAfter=10),
-        "normal": ParagraphStyle("Body", parent=base["Normal"], fontName=FONT_REGULAR, 
-                                 fontSize=10, leading=14, textColor=HexColor("#374151"), spaceAfter=4),
-        "bullet": ParagraphStyle("Bullet", parent=base["Normal"], fontName=FONT_REGULAR, 
-                                 fontSize=9, leading=13, leftIndent=10, textColor=HexColor("#4B5563"), spaceAfter=2),
-        "job_header": ParagraphStyle("JobH", parent=base["Normal"], fontName=FONT_BOLD, 
-                                     fontSize=10, leading=13, textColor=HexColor("#111827"), spaceAfter=1),
-        "job_meta": ParagraphStyle("JobM", parent=base["Normal"], fontName=FONT_REGULAR, 
-                                   fontSize=9, leading=12, textColor=HexColor(accent), spaceAfter=4),
-    }
+    language = _get(cv_doc, "language") or "de"
+    compiled = get_template_style("minimal", language)
+    styles, labels = compiled.styles, compiled.labels
     
     doc = SimpleDocTemplate(out_path, pagesize=A4, leftMargin=MARGIN, rightMargin=MARGIN, 
                            topMargin=MARGIN, bottomMargin=MARGIN)
     flow = []
-    language = _get(cv_doc, "language") or "de"
-    labels = _labels_for_lang(language)
     
     # Header
     name = _get(cv_doc, "full_name") or f"{_get(cv_doc, 'first_name')} {_get(cv_doc, 'last_name')}"
-    temp_portrait = _save_portrait_temp(_get(cv_doc, "portrait_base64"))
+    portrait = _portrait_reader(_portrait_ref(cv_doc))
     
-    if temp_portrait:
+    if portrait:
         # Header with portrait on right
         title_content = [Paragraph(name, styles["name"])]
         current_title = _get(cv_doc, "current_title")
@@ -605,9 +719,9 @@ def render_minimal(cv_doc: Any, out_path: str):
         contact_parts = [x for x in [email, phone, f"{city}, {canton}" if city else canton] if x]
         title_content.append(Paragraph(" • ".join(contact_parts), styles["contact"]))
         
-        header_data = [[title_content, Image(temp_portrait, width=32*mm, height=32*mm)]]
+        header_data = [[title_content, PortraitImage(portrait, width=32*mm, height=32*mm)]]
         header = Table(header_data, colWidths=[CONTENT_WIDTH - 38*mm, 38*mm])
-        header.setStyle(TableStyle([("VALIGN", (0, 0), (-1, -1), "TOP")]))
+        header.setStyle(compiled.table_styles["header"])
         flow.append(header)
     else:
         flow.append(Paragraph(name, styles["name"]))
@@ -692,13 +806,13 @@ def render_minimal(cv_doc: Any, out_path: str):
         flow.append(skill_table)
     
     doc.build(flow)
-    _cleanup_temp(temp_portrait)
+    return doc.page
 
 
 # =============================================================================
 # TEMPLATE 4: TIMELINE
 # =============================================================================
-def render_timeline(cv_doc: Any, out_path: str):
+def render_timeline(cv_doc: Any, out_path: str) -> int:
     """Visual timeline for career progression."""
     accent = "#EC4899"
     
@@ -707,39 +821,19 @@ def render_timeline(cv_doc: Any, out_path: str):
     CONTENT_WIDTH = PAGE_WIDTH - 2 * MARGIN
     DATE_COL = 28 * mm
     
-    base = getSampleStyleSheet()
-    styles = {
-        "name": ParagraphStyle("Name", parent=base["Heading1"], fontName=FONT_BOLD, 
-                               fontSize=24, leading=28, textColor=HexColor(accent), spaceAfter=2),
-        "title": ParagraphStyle("Title", parent=base["Normal"], fontName=FONT_REGULAR, 
-                                fontSize=11, leading=14, textColor=HexColor("#6B7280"), spaceAfter=6),
-        "contact": ParagraphStyle("Contact", parent=base["Normal"], fontName=FONT_REGULAR, 
-                                  fontSize=9, leading=12, textColor=HexColor("#9CA3AF"), spaceAfter=14),
-        "h": ParagraphStyle("H", parent=base["Heading3"], fontName=FONT_BOLD, 
-                            fontSize=12, leading=15, textColor=HexColor(accent), spaceBefore=16, spaceAfter=10),
-        "normal": ParagraphStyle("Body", parent=base["Normal"], fontName=FONT_REGULAR, 
-                                 fontSize=10, leading=14, textColor=HexColor("#374151"), spaceAfter=4),
-        "bullet": ParagraphStyle("Bullet", parent=base["Normal"], fontName=FONT_REGULAR, 
-                                 fontSize=9, leading=12, textColor=HexColor("#4B5563"), spaceAfter=2),
-        "date": ParagraphStyle("Date", parent=base["Normal"], fontName=FONT_BOLD, 
-                               fontSize=8, leading=10, textColor=HexColor(accent)),
-        "job_title": ParagraphStyle("JobTitle", parent=base["Normal"], fontName=FONT_BOLD, 
-                                    fontSize=10, leading=13, textColor=HexColor("#1F2937"), spaceAfter=1),
-        "company": ParagraphStyle("Company", parent=base["Normal"], fontName=FONT_REGULAR, 
-                                  fontSize=9, leading=12, textColor=HexColor("#6B7280"), spaceAfter=4),
-    }
+    language = _get(cv_doc, "language") or "de"
+    compiled = get_template_style("timeline", language)
+    styles, labels = compiled.styles, compiled.labels
     
     doc = SimpleDocTemplate(out_path, pagesize=A4, leftMargin=MARGIN, rightMargin=MARGIN, 
                            topMargin=MARGIN, bottomMargin=MARGIN)
     flow = []
-    language = _get(cv_doc, "language") or "de"
-    labels = _labels_for_lang(language)
     
     # Header
-    temp_portrait = _save_portrait_temp(_get(cv_doc, "portrait_base64"))
+    portrait = _portrait_reader(_portrait_ref(cv_doc))
     name = _get(cv_doc, "full_name") or f"{_get(cv_doc, 'first_name')} {_get(cv_doc, 'last_name')}"
     
-    if temp_portrait:
+    if portrait:
         title_content = [Paragraph(name, styles["name"])]
         current_title = _get(cv_doc, "current_title")
         if current_title:
@@ -749,9 +843,9 @@ def render_timeline(cv_doc: Any, out_path: str):
         phone = _get(cv_doc, "phone")
         title_content.append(Paragraph(f"{email} • {phone}", styles["contact"]))
         
-        header_data = [[Image(temp_portrait, width=28*mm, height=28*mm), title_content]]
+        header_data = [[PortraitImage(portrait, width=28*mm, height=28*mm), title_content]]
         header = Table(header_data, colWidths=[32*mm, CONTENT_WIDTH - 32*mm])
-        header.setStyle(TableStyle([("VALIGN", (0, 0), (-1, -1), "MIDDLE")]))
+        header.setStyle(compiled.table_styles["header"])
         flow.append(header)
     else:
         flow.append(Paragraph(name, styles["name"]))
@@ -802,11 +896,7 @@ def render_timeline(cv_doc: Any, out_path: str):
             
             timeline_data = [[date_content, job_content]]
             timeline_row = Table(timeline_data, colWidths=[DATE_COL, CONTENT_WIDTH - DATE_COL])
-            timeline_row.setStyle(TableStyle([
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-            ]))
+            timeline_row.setStyle(compiled.table_styles["row"])
             flow.append(timeline_row)
             flow.append(Spacer(1, 12))
     
@@ -835,7 +925,7 @@ def render_timeline(cv_doc: Any, out_path: str):
         flow.append(Paragraph(" • ".join(all_skills[:10]), styles["normal"]))
     
     doc.build(flow)
-    _cleanup_temp(temp_portrait)
+    return doc.page
 
 
 # =============================================================================
@@ -849,7 +939,7 @@ RENDER_FUNCTIONS = {
 }
 
 
-def render_cv_with_template(cv_doc: Any, out_path: str, template_name: str = "classic"):
+def render_cv_with_template(cv_doc: Any, out_path: str, template_name: str = "classic") -> int:
     """
     Render CV with specified template.
     
@@ -857,12 +947,15 @@ def render_cv_with_template(cv_doc: Any, out_path: str, template_name: str = "cl
         cv_doc: CVDocument object
         out_path: Output file path
         template_name: Template name or "random"
+    
+    Returns:
+        Number of pages rendered
     """
     if template_name == "random":
         template_name = random.choice(list(RENDER_FUNCTIONS.keys()))
     
     render_func = RENDER_FUNCTIONS.get(template_name, render_classic)
-    render_func(cv_doc, out_path)
+    return render_func(cv_doc, out_path)
 
 
 def get_available_templates() -> Dict[str, str]:
@@ -0,0 +1,373 @@
+# src/export/render_farm.py
+"""
+PDF render farm: a process pool turning serialized CVs into PDFs.
+
+PDF rendering with ReportLab is CPU-bound while CV generation mostly waits
+on the LLM, so the two stages run separately: generation submits each
+finished CV (its CVDocument.to_dict() layout) and moves on, and worker
+processes (one per CPU core by default) render the PDFs.
+
+- Bounded queue: at most `max_pending` CVs are submitted but not rendered
+  yet; submit() blocks while the queue is full, so a fast generator cannot
+  pile up CVs in memory.
+- Each worker registers the fonts and compiles all template styles once
+  when it starts; portraits are cached per worker by the portrait store.
+- Failed renders do not raise: each one is appended as a JSON line to the
+  error sidecar file and counted in stats.
+- With an output sink (see sinks.py), PDFs are named within the sink:
+  workers write them directly if the sink has a local path for them,
+  otherwise they return the PDF bytes and the sink stores them.
+
+render_corpus() re-renders an existing corpus of exported CV JSON files
+(e.g. with another template) on the farm without any LLM call.
+"""
+
+import io
+import sys
+import json
+import os
+import time
+import hashlib
+import threading
+import traceback
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import get_settings
+
+# Default name of the error sidecar file (next to the rendered PDFs)
+RENDER_ERRORS_FILE = "render_errors.jsonl"
+
+# Content hashes of rendered JSON files (render_corpus with skip="hash")
+RENDER_HASHES_FILE = ".render_hashes.json"
+
+# Reports written next to the CVs (scripts/generate_cv_batch.py), not CV exports
+NON_CV_FILES = {"generation_report.json", "failed_cvs.json"}
+
+# Up-to-date checks of render_corpus: PDF newer than its JSON, same JSON
+# content and template as the last render, or always render
+SKIP_MODES = ("mtime", "hash", "none")
+
+
+def _init_render_worker() -> None:
+    """Register fonts and compile template styles once per worker process."""
+    from src.export.pdf_templates import warm_template_styles
+    warm_template_styles()
+
+
+def render_cv_data(cv_data: Dict[str, Any], out_path: Optional[str], template: str = "classic") -> Dict[str, Any]:
+    """
+    Render one serialized CV to PDF (runs in a worker process).
+
+    Args:
+        cv_data: CVDocument.to_dict() layout.
+        out_path: Output PDF path; None returns the PDF as "data" bytes.
+        template: Template name or "random"; unknown names fall back to classic.
+
+    Returns:
+        Dict with output, template, pages and error (None on success,
+        otherwise with the worker traceback).
+    """
+    from src.export.pdf_templates import RENDER_FUNCTIONS, get_random_template, render_cv_with_template
+    from src.generation.cv_assembler import CVDocument
+
+    if template == "random":
+        template = get_random_template()
+    elif template not in RENDER_FUNCTIONS:
+        template = "classic"
+
+    result = {"output": out_path, "template": template, "pages": 0, "error": None}
+    try:
+        cv_doc = CVDocument.from_dict(cv_data)
+        if out_path is None:
+            buffer = io.BytesIO()
+            result["pages"] = render_cv_with_template(cv_doc, buffer, template)
+            result["data"] = buffer.getvalue()
+        else:
+            Path(out_path).parent.mkdir(parents=True, exist_ok=True)
+            result["pages"] = render_cv_with_template(cv_doc, out_path, template)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["traceback"] = traceback.format_exc()
+    return result
+
+
+def render_cv_file(json_path: str, out_path: str, template: str = "classic") -> Dict[str, Any]:
+    """
+    Render an exported CV JSON file (runs in a worker process).
+
+    Args:
+        json_path: CV JSON file (export_cv_json / CVDocument.to_dict() layout).
+        out_path: Output PDF path.
+        template: Template name or "random".
+
+    Returns:
+        render_cv_data() result with the source path.
+    """
+    try:
+        with open(json_path, encoding="utf-8") as f:
+            cv_data = json.load(f)
+        if not isinstance(cv_data, dict) or "personal" not in cv_data:
+            raise ValueError("not a CV JSON export")
+    except (OSError, ValueError) as e:
+        result = {"output": out_path, "template": template, "pages": 0, "error": f"{type(e).__name__}: {e}"}
+    else:
+        result = render_cv_data(cv_data, out_path, template)
+    result["source"] = json_path
+    return result
+
+
+class RenderFarm:
+    """
+    Process pool rendering CV PDFs in the background.
+
+    Usage:
+        with RenderFarm(errors_path=out_dir / RENDER_ERRORS_FILE) as farm:
+            for cv_doc in cvs:
+                farm.submit(cv_doc, out_dir / f"{cv_doc.last_name}.pdf", "random")
+        print(farm.stats)
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        errors_path: Optional[Union[str, Path]] = None,
+        sink: Optional[Any] = None
+    ):
+        """
+        Start the render farm (worker processes start with the first CVs).
+
+        Args:
+            workers: Worker processes (default: settings.pdf_render_workers,
+                0 = one per CPU core).
+            max_pending: Submitted but unrendered CVs at most (default: 4 x workers).
+            errors_path: Error sidecar file (JSON lines); None disables it.
+            sink: OutputSink storing the PDFs; out_path is then the name
+                within the sink.
+        """
+        self.workers = max(1, workers or get_settings().pdf_render_workers or os.cpu_count() or 1)
+        self.max_pending = max(1, max_pending or 4 * self.workers)
+        self.errors_path = Path(errors_path) if errors_path else None
+        self.sink = sink
+        self.stats = {"submitted": 0, "rendered": 0, "failed": 0, "pages": 0}
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        # Spawned workers do not inherit locks held by the caller's generation threads
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_render_worker
+        )
+
+    def submit(self, cv_doc: Any, out_path: Union[str, Path], template: str = "classic") -> Future:
+        """
+        Queue a CV for rendering; blocks while max_pending CVs are queued.
+
+        Args:
+            cv_doc: CVDocument or its to_dict() layout.
+            out_path: Output PDF path (name within the sink, if any).
+            template: Template name or "random".
+
+        Returns:
+            Future of the render_cv_data() result.
+        """
+        cv_data = cv_doc if isinstance(cv_doc, dict) else cv_doc.to_dict()
+        return self._submit(render_cv_data, cv_data, str(out_path), template)
+
+    def submit_file(self, json_path: Union[str, Path], out_path: Union[str, Path], template: str = "classic") -> Future:
+        """Queue an exported CV JSON file for rendering (read by the worker); see submit()."""
+        return self._submit(render_cv_file, str(json_path), str(out_path), template)
+
+    def _submit(self, render: Callable[..., Dict[str, Any]], source: Any, out_path: str, template: str) -> Future:
+        """Submit a render job once a queue slot is free."""
+        target = out_path
+        if self.sink is not None:
+            local_path = self.sink.local_path(out_path)
+            target = str(local_path) if local_path is not None else None
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(render, source, target, template)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self.stats["submitted"] += 1
+        future.add_done_callback(partial(self._on_done, out_path, template))
+        return future
+
+    def _on_done(self, out_path: str, template: str, future: Future) -> None:
+        """Free the queue slot, count the result and record failures."""
+        self._slots.release()
+        try:
+            result = future.result()
+        except Exception as e:  # Worker died or the render was cancelled
+            result = {"output": out_path, "template": template, "error": f"{type(e).__name__}: {e}"}
+
+        if result["error"] is None and self.sink is not None:
+            result["output"] = out_path
+            try:
+                data = result.pop("data", None)
+                if data is None:
+                    self.sink.record(out_path)
+                else:
+                    self.sink.write(out_path, data)
+            except Exception as e:
+                result["error"] = f"{type(e).__name__}: {e}"
+
+        with self._lock:
+            if result["error"] is None:
+                self.stats["rendered"] += 1
+                self.stats["pages"] += result.get("pages", 0)
+                return
+            self.stats["failed"] += 1
+            if self.errors_path:
+                self.errors_path.parent.mkdir(parents=True, exist_ok=True)
+                record = dict(result, time=datetime.now().isoformat(timespec="seconds"))
+                with open(self.errors_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def close(self, wait: bool = True) -> None:
+        """Stop accepting CVs; with wait=True, return when all queued CVs are rendered."""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def __enter__(self) -> "RenderFarm":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def find_cv_files(source: Union[str, Path]) -> List[Tuple[Path, Path]]:
+    """
+    CV JSON files of a directory or manifest.
+
+    Args:
+        source: Directory (searched recursively for *.json; hidden files
+            and the batch reports in NON_CV_FILES excluded) or manifest file: one JSON path per line, or JSON lines
+            with a "path" key (e.g. the manifest.jsonl of a files sink; other
+            files and archive/JSON-lines entries are ignored); relative paths
+            are relative to the manifest.
+
+    Returns:
+        Sorted (json_path, relative_path) pairs; relative_path places the
+        output below the output directory.
+    """
+    source = Path(source)
+    if source.is_dir():
+        return sorted(
+            (path, path.relative_to(source))
+            for path in source.rglob("*.json")
+            if not path.name.startswith(".") and path.name not in NON_CV_FILES
+        )
+
+    files = []
+    with open(source, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("{"):
+                record = json.loads(line)
+                if "member" in record or "line" in record or not record["path"].endswith(".json"):
+                    continue
+                line = record["path"]
+            entry = Path(line)
+            path = entry if entry.is_absolute() else source.parent / entry
+            relative = entry if not entry.is_absolute() else Path(entry.name)
+            files.append((path, relative))
+    return sorted(files)
+
+
+def content_hash(json_path: Path, template: str) -> str:
+    """SHA-256 of a CV JSON file and the template it is rendered with."""
+    digest = hashlib.sha256(json_path.read_bytes())
+    digest.update(template.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def render_corpus(
+    source: Union[str, Path],
+    output_dir: Optional[Union[str, Path]] = None,
+    template: str = "random",
+    skip: str = "mtime",
+    workers: Optional[int] = None,
+    on_progress: Optional[Callable[[], None]] = None
+) -> Dict[str, Any]:
+    """
+    Render the CV JSON files of a directory or manifest to PDF.
+
+    PDFs mirror the source layout (a.json -> a.pdf) below output_dir;
+    failed renders go to the error sidecar in output_dir.
+
+    Args:
+        source: Directory or manifest (see find_cv_files).
+        output_dir: Output root (default: the source directory / the
+            manifest's directory, i.e. PDFs next to their JSON).
+        template: Template name or "random".
+        skip: Up-to-date check (see SKIP_MODES); "mtime" ignores template
+            changes, "hash" re-renders when the JSON or template changes.
+        workers: Render processes (see RenderFarm).
+        on_progress: Called once per file (rendered, failed or skipped).
+
+    Returns:
+        Stats dict: found, skipped, rendered, failed, pages, seconds,
+        pages_per_sec and errors_path.
+    """
+    if skip not in SKIP_MODES:
+        raise ValueError(f"Unknown skip mode: {skip} (expected one of {', '.join(SKIP_MODES)})")
+
+    source = Path(source)
+    files = find_cv_files(source)
+    root = Path(output_dir) if output_dir else (source if source.is_dir() else source.parent)
+    hashes_path = root / RENDER_HASHES_FILE
+    hashes: Dict[str, str] = {}
+    if skip == "hash" and hashes_path.exists():
+        hashes = json.loads(hashes_path.read_text(encoding="utf-8"))
+
+    def finished(key: Optional[str], digest: Optional[str], future: Future) -> None:
+        if digest and not future.cancelled() and future.exception() is None and future.result()["error"] is None:
+            hashes[key] = digest
+        if on_progress:
+            on_progress()
+
+    skipped = 0
+    start = time.perf_counter()
+    with RenderFarm(workers=workers, errors_path=root / RENDER_ERRORS_FILE) as farm:
+        for json_path, relative in files:
+            pdf_path = root / relative.with_suffix(".pdf")
+            key = relative.with_suffix(".pdf").as_posix()
+            digest = content_hash(json_path, template) if skip == "hash" else None
+            if pdf_path.exists() and (
+                (skip == "mtime" and pdf_path.stat().st_mtime >= json_path.stat().st_mtime)
+                or (skip == "hash" and hashes.get(key) == digest)
+            ):
+                skipped += 1
+                if on_progress:
+                    on_progress()
+                continue
+            farm.submit_file(json_path, pdf_path, template).add_done_callback(partial(finished, key, digest))
+    elapsed = time.perf_counter() - start
+
+    if skip == "hash":
+        root.mkdir(parents=True, exist_ok=True)
+        hashes_path.write_text(json.dumps(hashes, indent=2, sort_keys=True), encoding="utf-8")
+
+    return {
+        "found": len(files),
+        "skipped": skipped,
+        "rendered": farm.stats["rendered"],
+        "failed": farm.stats["failed"],
+        "pages": farm.stats["pages"],
+        "seconds": elapsed,
+        "pages_per_sec": farm.stats["pages"] / max(elapsed, 1e-9),
+        "errors_path": str(farm.errors_path)
+    }
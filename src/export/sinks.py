@@ -0,0 +1,237 @@
+# src/export/sinks.py
+"""
+Output sinks: where exported CV files (JSON, PDF, DOCX) are stored.
+
+Writing every CV as separate small files hurts filesystem metadata
+performance, rsync and object-store uploads at 100k+ CVs. A sink stores
+named files (e.g. "tier_A_premium/Meier_Anna_123.json") below its output
+directory:
+
+- files:    one file per name (the classic layout, default)
+- tar, zip: sharded archives of `shard_size` files each
+            (cvs_<timestamp>_00000.tar, ...); zips store PDFs uncompressed
+- jsonl, jsonl.gz: CV JSON as one line per CV in a single (gzip) JSON-lines
+            file; other files (PDF, DOCX) are written as single files
+
+Every stored file gets an entry in manifest.jsonl in the output directory:
+{"name", "path", "bytes"} plus "member" (archive member) or "line" (JSON
+lines index), so single CVs are found without scanning shards. Sinks are
+thread-safe but must be written from one process.
+"""
+
+import io
+import sys
+import gzip
+import json
+import time
+import tarfile
+import zipfile
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.export.cv_json import compact_encoder, cv_to_json, get_fast_encoder
+
+SINK_KINDS = ("files", "tar", "zip", "jsonl", "jsonl.gz")
+MANIFEST_FILE = "manifest.jsonl"
+DEFAULT_SHARD_SIZE = 1000  # files per archive shard
+
+
+class OutputSink(ABC):
+    """Base class: stores named files below `root` and indexes them in the manifest."""
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.files = 0
+        self.bytes = 0
+        self._stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._lock = threading.Lock()
+        self._manifest = open(self.root / MANIFEST_FILE, "a", encoding="utf-8")
+
+    def write(self, name: str, data: bytes) -> int:
+        """Store a file; returns its size in bytes."""
+        with self._lock:
+            self._index(name, len(data), self._store(name, data))
+        return len(data)
+
+    def write_cv_json(self, name: str, cv_doc: Any) -> int:
+        """Store a CV as JSON (same layout as export_cv_json)."""
+        text = cv_to_json(cv_doc, indent=2, metadata={"exported_at": datetime.now().isoformat()})
+        return self.write(name, text.encode("utf-8"))
+
+    def export(self, name: str, export: Callable[[Path], Any]) -> int:
+        """
+        Store a file created by an exporter writing to a path
+        (e.g. lambda path: export_cv_docx(cv_doc, path)); returns its size.
+        """
+        path = self.local_path(name)
+        if path is not None:
+            export(path)
+            return self.record(name)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / Path(name).name
+            export(path)
+            return self.write(name, path.read_bytes()) if path.exists() else 0
+
+    def local_path(self, name: str) -> Optional[Path]:
+        """Path to write `name` to directly (then call record()), or None if the sink needs the bytes."""
+        return None
+
+    def record(self, name: str) -> int:
+        """Index a file written to local_path(name); returns its size (0 if it was not written)."""
+        path = self.root / name
+        if not path.exists():
+            return 0
+        size = path.stat().st_size
+        with self._lock:
+            self._index(name, size, {"path": name})
+        return size
+
+    @abstractmethod
+    def _store(self, name: str, data: bytes) -> Dict[str, Any]:
+        """Store the data; returns the manifest location (path, member/line)."""
+
+    def _index(self, name: str, size: int, location: Dict[str, Any]) -> None:
+        self.files += 1
+        self.bytes += size
+        self._manifest.write(json.dumps({"name": name, **location, "bytes": size}, ensure_ascii=False) + "\n")
+
+    def _close(self) -> None:
+        """Flush and close sink-specific outputs."""
+
+    def close(self) -> None:
+        """Close open archives and the manifest."""
+        with self._lock:
+            self._close()
+            self._manifest.close()
+
+    def __enter__(self) -> "OutputSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class FilesSink(OutputSink):
+    """One file per name."""
+
+    def local_path(self, name: str) -> Optional[Path]:
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def _store(self, name: str, data: bytes) -> Dict[str, Any]:
+        self.local_path(name).write_bytes(data)
+        return {"path": name}
+
+
+class ArchiveSink(OutputSink):
+    """Sharded tar or zip archives with shard_size files each."""
+
+    def __init__(self, root: Union[str, Path], kind: str = "tar", shard_size: int = DEFAULT_SHARD_SIZE):
+        super().__init__(root)
+        self.kind = kind
+        self.shard_size = max(1, shard_size)
+        self.shards = 0
+        self._archive = None
+        self._shard_name = ""
+        self._shard_files = 0
+
+    def _store(self, name: str, data: bytes) -> Dict[str, Any]:
+        if self._archive is None or self._shard_files >= self.shard_size:
+            self._open_shard()
+
+        if self.kind == "tar":
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            self._archive.addfile(info, io.BytesIO(data))
+        else:
+            info = zipfile.ZipInfo(name, time.localtime()[:6])
+            info.external_attr = 0o644 << 16
+            # PDFs are compressed already
+            compress = zipfile.ZIP_STORED if name.endswith(".pdf") else zipfile.ZIP_DEFLATED
+            self._archive.writestr(info, data, compress_type=compress)
+
+        self._shard_files += 1
+        return {"path": self._shard_name, "member": name}
+
+    def _open_shard(self) -> None:
+        self._close()
+        self._shard_name = f"cvs_{self._stamp}_{self.shards:05d}.{self.kind}"
+        path = self.root / self._shard_name
+        self._archive = tarfile.open(path, "w") if self.kind == "tar" else zipfile.ZipFile(path, "w")
+        self.shards += 1
+        self._shard_files = 0
+
+    def _close(self) -> None:
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+
+class JsonlSink(OutputSink):
+    """CV JSON as JSON lines (optionally gzip); other files are written as single files."""
+
+    def __init__(self, root: Union[str, Path], compress: bool = False):
+        super().__init__(root)
+        self.path_name = f"cvs_{self._stamp}.jsonl" + (".gz" if compress else "")
+        path = self.root / self.path_name
+        self._out = gzip.open(path, "wt", encoding="utf-8") if compress else open(path, "w", encoding="utf-8")
+        self._lines = 0
+
+    def write_cv_json(self, name: str, cv_doc: Any) -> int:
+        line = cv_to_json(cv_doc, metadata={"exported_at": datetime.now().isoformat()}, encoder=get_fast_encoder())
+        return self.write(name, line.encode("utf-8"))
+
+    def local_path(self, name: str) -> Optional[Path]:
+        if name.endswith(".json"):
+            return None
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def _store(self, name: str, data: bytes) -> Dict[str, Any]:
+        path = self.local_path(name)
+        if path is not None:
+            path.write_bytes(data)
+            return {"path": name}
+
+        text = data.decode("utf-8")
+        if "\n" in text:  # Pretty-printed JSON: one line per CV
+            text = compact_encoder(json.loads(text))
+        self._out.write(text + "\n")
+        self._lines += 1
+        return {"path": self.path_name, "line": self._lines - 1}
+
+    def _close(self) -> None:
+        self._out.close()
+
+
+def open_sink(kind: str, root: Union[str, Path], shard_size: int = DEFAULT_SHARD_SIZE) -> OutputSink:
+    """
+    Create an output sink.
+
+    Args:
+        kind: One of SINK_KINDS.
+        root: Output directory.
+        shard_size: Files per archive (tar, zip).
+
+    Returns:
+        OutputSink.
+    """
+    if kind == "files":
+        return FilesSink(root)
+    if kind in ("tar", "zip"):
+        return ArchiveSink(root, kind, shard_size)
+    if kind in ("jsonl", "jsonl.gz"):
+        return JsonlSink(root, compress=kind.endswith(".gz"))
+    raise ValueError(f"Unknown sink: {kind} (expected one of {', '.join(SINK_KINDS)})")
@@ -14,18 +14,39 @@ This package provides all CV generation functionality:
 - company_validator: Company-occupation matching
 - metrics_validator: Metric validation and ranges
 - openai_client: Centralized OpenAI client
+- llm_backends: Pluggable LLM backends (OpenAI, deterministic local stub)
+- model_routing: Model per call site with run budgets and automatic downgrade
+- bullet_bank: Precomputed bullet bank (occupation × career level × language)
+- section_bank: Summary/hobby template bank (language × industry × career level × occupation type)
+- fast_mode: Offline high-throughput generation (reference snapshot, JSONL output)
+- section_memo: Section-level memoization so retries only regenerate failing sections
+- portrait_store: Portraits resized, cropped and encoded once per process
+- section_graph: Independent CV sections generated concurrently (dependency graph)
+- cv_stream: iter_cvs() streams finished CVs with bounded in-flight work
 """
 
 from src.generation.sampling import SamplingEngine
-from src.generation.cv_assembler import generate_complete_cv, CVDocument
+from src.generation.cv_assembler import generate_complete_cv, generate_complete_cv_batch, CVDocument
 from src.generation.cv_timeline_validator import validate_cv_timeline
 from src.generation.cv_quality_validator import validate_cv_quality
 from src.generation.openai_client import (
     call_openai_chat,
     call_openai_json,
+    stream_openai_chat,
     is_openai_available,
-    get_openai_client
+    get_openai_client,
+    get_llm_backend_name,
+    is_llm_degraded,
+    CircuitOpenError
 )
+from src.generation.model_routing import ModelRouter, route_model
+from src.generation.bullet_bank import BulletBank, get_bullet_bank
+from src.generation.section_bank import SectionBank, get_section_bank
+from src.generation.fast_mode import FastCVEngine, ReferenceSnapshot
+from src.generation.section_memo import SectionMemo, section_memo_scope
+from src.generation.portrait_store import PortraitStore, get_portrait_store
+from src.generation.section_graph import SectionNode, run_section_graph
+from src.generation.cv_stream import iter_cvs
 
 __all__ = [
     # Main classes
@@ -34,12 +55,42 @@ __all__ = [
     
     # Main functions
     "generate_complete_cv",
+    "generate_complete_cv_batch",
+    "iter_cvs",
     "validate_cv_timeline",
     "validate_cv_quality",
     
     # OpenAI utilities
     "call_openai_chat",
     "call_openai_json",
+    "stream_openai_chat",
     "is_openai_available",
     "get_openai_client",
+    "get_llm_backend_name",
+    "is_llm_degraded",
+    "CircuitOpenError",
+    "ModelRouter",
+    "route_model",
+    
+    # Precomputed banks
+    "BulletBank",
+    "get_bullet_bank",
+    "SectionBank",
+    "get_section_bank",
+    
+    # Fast mode
+    "FastCVEngine",
+    "ReferenceSnapshot",
+    
+    # Retries
+    "SectionMemo",
+    "section_memo_scope",
+    
+    # Portraits
+    "PortraitStore",
+    "get_portrait_store",
+    
+    # Concurrent sections
+    "SectionNode",
+    "run_section_graph",
 ]
@@ -0,0 +1,293 @@
+# src/generation/bullet_bank.py
+"""
+Precomputed bullet bank per (job_id, career_level, language).
+
+The bank is built offline (scripts/build_bullet_bank.py) and stored in a
+single SQLite file with a clustered primary key on (job_id, career_level,
+language), so a lookup reads only that key's rows. Bullets are stored as
+templates where the metric value is replaced by "{value}" together with its
+metric type; when a CV draws bullets the value is re-randomised within the
+METRIC_RANGES bounds of the career level (the same ranges that
+get_metric_range_prompt() gives the LLM), so CVs sharing an occupation do
+not repeat the same numbers.
+
+generate_job_history() draws from the bank first and only calls the LLM
+for jobs the bank cannot serve.
+"""
+
+import sys
+import re
+import random
+import sqlite3
+import threading
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import get_settings
+from src.generation.metrics_validator import (
+    METRIC_RANGES,
+    ExtractedMetric,
+    MetricType,
+    validate_metric,
+    get_metric_range_prompt
+)
+
+CAREER_LEVELS = ("junior", "mid", "senior", "lead")
+LANGUAGES = ("de", "fr", "it")
+VALUE_PLACEHOLDER = "{value}"
+
+# Metric patterns (de/fr/it); group 1 is the span replaced by the placeholder
+_METRIC_PATTERNS: List[Tuple[MetricType, "re.Pattern[str]"]] = [
+    (MetricType.FINANCIAL, re.compile(r"CHF\s+(\d+(?:[.,]\d+)?\s*(?:K|Mio\.?|Millionen|millions?|milioni)(?![\w]))", re.IGNORECASE)),
+    (MetricType.PERCENTAGE, re.compile(r"(\d+(?:[.,]\d+)?)\s*(?:%|Prozent|pour\s?cent|per\s?cento)", re.IGNORECASE)),
+    (MetricType.TEAM_SIZE, re.compile(
+        r"(\d+)(?:-köpfig|\s*(?:Personen|Mitarbeitende[n]?|Mitarbeiter[n]?|Fachkräfte[n]?|Kollegen|"
+        r"personnes|collaborateurs|collaboratrices|persone|collaboratori|dipendenti))", re.IGNORECASE)),
+    (MetricType.PROJECTS, re.compile(r"(\d+)\s*(?:\w+\s)?(?:Projekte[n]?|Bauprojekte[n]?|projets|progetti)", re.IGNORECASE)),
+    (MetricType.CUSTOMERS, re.compile(r"(\d+)\s*(?:\w+\s)?(?:Kunden|Kundinnen|clients|clientes|clienti)", re.IGNORECASE)),
+]
+
+
+@dataclass
+class BankEntry:
+    """One bullet template of the bank."""
+    template: str
+    metric_type: str
+
+
+def parse_metric_value(text: str) -> float:
+    """Parse a metric span like "12", "250K" or "1.5 Mio" into a number."""
+    number = float(re.match(r"\d+(?:[.,]\d+)?", text).group(0).replace(",", "."))
+    suffix = text[len(re.match(r"\d+(?:[.,]\d+)?\s*", text).group(0)):].lower()
+    if suffix.startswith("k"):
+        number *= 1_000
+    elif suffix:
+        number *= 1_000_000
+    return number
+
+
+def format_metric_value(metric_type: MetricType, value: float) -> str:
+    """Format a metric value for insertion into a template."""
+    if metric_type == MetricType.FINANCIAL:
+        if value >= 1_000_000:
+            return f"{value / 1_000_000:.1f} Mio"
+        return f"{value / 1_000:.0f}K"
+    return str(int(round(value)))
+
+
+def bullet_to_entry(bullet: str, career_level: str) -> Optional[BankEntry]:
+    """
+    Turn a generated bullet into a template if its metric is valid for the level.
+
+    Args:
+        bullet: Bullet text with exactly one metric.
+        career_level: Career level the bullet was generated for.
+
+    Returns:
+        BankEntry, or None if the bullet has no single supported metric or it is out of range.
+    """
+    if len(re.findall(r"\d+(?:[.,']\d+)*", bullet)) != 1:
+        return None
+    for metric_type, pattern in _METRIC_PATTERNS:
+        match = pattern.search(bullet)
+        if not match:
+            continue
+        value = parse_metric_value(match.group(1))
+        metric = ExtractedMetric(value=value, metric_type=metric_type, unit="", text=bullet, position=match.start(1))
+        is_valid, _ = validate_metric(metric, career_level)
+        level_range = METRIC_RANGES[metric_type].get(career_level)
+        if not is_valid or not level_range or level_range.max_val <= 0:
+            return None
+        template = bullet[:match.start(1)] + VALUE_PLACEHOLDER + bullet[match.end(1):]
+        return BankEntry(template=template, metric_type=metric_type.value)
+    return None
+
+
+def render_entry(entry: BankEntry, career_level: str, rng: Optional[random.Random] = None) -> Optional[str]:
+    """Fill a template with a metric value drawn from the career level's range."""
+    rng = rng or random
+    metric_type = MetricType(entry.metric_type)
+    level_range = METRIC_RANGES.get(metric_type, {}).get(career_level)
+    if not level_range or level_range.max_val <= 0:
+        return None
+    value = rng.uniform(level_range.min_val, level_range.max_val)
+    return entry.template.replace(VALUE_PLACEHOLDER, format_metric_value(metric_type, value))
+
+
+class BulletBank:
+    """
+    SQLite-backed bullet bank.
+
+    Args:
+        path: Path of the bank file (created when writable=True).
+        writable: Open for building (creates the schema).
+    """
+
+    def __init__(self, path: Path, writable: bool = False):
+        self.path = Path(path)
+        if writable:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS bullets ("
+                " job_id TEXT NOT NULL, career_level TEXT NOT NULL, language TEXT NOT NULL,"
+                " template TEXT NOT NULL, metric_type TEXT NOT NULL,"
+                " PRIMARY KEY (job_id, career_level, language, template)"
+                ") WITHOUT ROWID"
+            )
+            self._conn.commit()
+        else:
+            self._conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._cache: Dict[Tuple[str, str, str], List[BankEntry]] = {}
+
+    def entries(self, job_id: str, career_level: str, language: str) -> List[BankEntry]:
+        """All templates stored for one key (cached per process)."""
+        key = (str(job_id), career_level, language)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                rows = self._conn.execute(
+                    "SELECT template, metric_type FROM bullets"
+                    " WHERE job_id = ? AND career_level = ? AND language = ?", key
+                ).fetchall()
+                cached = self._cache[key] = [BankEntry(template, metric_type) for template, metric_type in rows]
+        return cached
+
+    def draw(
+        self,
+        job_id: Optional[str],
+        career_level: str,
+        language: str,
+        count: int,
+        rng: Optional[random.Random] = None
+    ) -> List[str]:
+        """
+        Draw `count` distinct bullets with re-randomised metric values.
+
+        Bullets with different leading verbs are preferred.
+
+        Returns:
+            List of `count` bullets, or an empty list if the bank cannot serve the key.
+        """
+        if not job_id or count <= 0:
+            return []
+        rng = rng or random
+        pool = list(self.entries(job_id, career_level, language))
+        if len(pool) < count:
+            return []
+        rng.shuffle(pool)
+
+        chosen: List[BankEntry] = []
+        used_verbs = set()
+        for entry in pool:
+            verb = entry.template.split()[0].lower()
+            if verb not in used_verbs:
+                chosen.append(entry)
+                used_verbs.add(verb)
+            if len(chosen) == count:
+                break
+        chosen += [entry for entry in pool if entry not in chosen][:count - len(chosen)]
+
+        bullets = [render_entry(entry, career_level, rng) for entry in chosen]
+        return bullets if all(bullets) else []
+
+    def has(self, job_id: str, career_level: str, language: str) -> bool:
+        return bool(self.entries(job_id, career_level, language))
+
+    def add(self, job_id: str, career_level: str, language: str, entries: Iterable[BankEntry]) -> int:
+        """Store templates for one key; returns the number of new rows."""
+        rows = [(str(job_id), career_level, language, e.template, e.metric_type) for e in entries]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany("INSERT OR IGNORE INTO bullets VALUES (?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+            self._cache.pop((str(job_id), career_level, language), None)
+            return self._conn.total_changes - before
+
+    def stats(self) -> Dict[str, int]:
+        """Number of keys and templates in the bank."""
+        with self._lock:
+            keys, templates = self._conn.execute(
+                "SELECT COUNT(DISTINCT job_id || '|' || career_level || '|' || language), COUNT(*) FROM bullets"
+            ).fetchone()
+        return {"keys": keys, "templates": templates}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_bullet_bank: Optional[BulletBank] = None
+_bullet_bank_loaded = False
+_bullet_bank_lock = threading.Lock()
+
+
+def resolve_bank_path(path: Optional[str] = None) -> Path:
+    """Bank path from the argument or settings (relative paths are relative to the project root)."""
+    bank_path = Path(path or get_settings().bullet_bank_path)
+    return bank_path if bank_path.is_absolute() else project_root / bank_path
+
+
+def get_bullet_bank() -> Optional[BulletBank]:
+    """
+    Get the process-wide bullet bank (read-only).
+
+    Returns:
+        BulletBank, or None if disabled (USE_BULLET_BANK=false) or not built yet.
+    """
+    global _bullet_bank, _bullet_bank_loaded
+    with _bullet_bank_lock:
+        if not _bullet_bank_loaded:
+            _bullet_bank_loaded = True
+            settings = get_settings()
+            bank_path = resolve_bank_path()
+            if settings.use_bullet_bank and bank_path.exists():
+                _bullet_bank = BulletBank(bank_path)
+    return _bullet_bank
+
+
+def reset_bullet_bank() -> None:
+    """Drop the cached bank so the next call re-opens it (e.g. after a rebuild)."""
+    global _bullet_bank, _bullet_bank_loaded
+    with _bullet_bank_lock:
+        if _bullet_bank is not None:
+            _bullet_bank.close()
+        _bullet_bank = None
+        _bullet_bank_loaded = False
+
+
+def build_bank_prompt(
+    occupation_title: str,
+    activities: List[str],
+    career_level: str,
+    language: str,
+    count: int
+) -> str:
+    """Prompt asking for a diverse pool of bullets for one bank key."""
+    language_names = {"de": "Schweizer Hochdeutsch", "fr": "Französisch (Schweiz)", "it": "Italienisch (Schweiz)"}
+    activities_text = "\n".join(f"- {a}" for a in activities[:12])
+    return f"""Du bist ein erfahrener Schweizer Lebenslauf-Autor.
+
+BERUF: {occupation_title}
+KARRIERESTUFE: {career_level}
+TÄTIGKEITEN AUS DER PRAXIS:
+{activities_text}
+
+Schreibe {count} VERSCHIEDENE Lebenslauf-Bullets für diesen Beruf und diese Karrierestufe.
+
+REGELN:
+1. Jeder Bullet beginnt mit einem anderen Aktionsverb
+2. GENAU EINE Zahl pro Bullet, und zwar eine dieser Arten: Anzahl Projekte, Anzahl Kunden,
+   Team-Grösse (Personen), Budget (CHF ...K / CHF ... Mio) oder Prozent
+3. {get_metric_range_prompt(career_level)}
+4. Verwende konkrete Tätigkeiten aus der Liste, keine generischen Business-Phrasen
+5. Max 18 Wörter pro Bullet
+6. Sprache: {language_names.get(language, language_names["de"])}
+
+Gib die Bullets als Liste im Feld "bullets" zurück (ohne Nummerierung)."""
@@ -265,71 +265,62 @@ def validate_company_for_occupation(
     return False, f"FLEXIBLE mapping violation: Occupation allows {allowed_industries}, but company is {company_industry}"
 
 
-def generate_fallback_company(
-    occupation_doc: Dict[str, Any],
-    canton: str,
-    occupation_title: Optional[str] = None
-) -> Dict[str, Any]:
+# Realistic Swiss company name patterns by industry
+FALLBACK_COMPANY_PATTERNS = {
+    "technology": [
+        "SwissTech", "DigitalHelvetic", "AlpineSoft", "SmartBit", "DataPeak",
+        "CodeCraft", "NetAlpin", "TechFlow", "BitMountain", "SwissCode"
+    ],
+    "healthcare": [
+        "MediCare", "HealthPlus", "VitaClinic", "SanaMed", "CarePlus",
+        "MedCenter", "HealthFirst", "VitaCare", "SwissMed", "SanaLife"
+    ],
+    "finance": [
+        "FinancePartner", "WealthAdvisor", "CapitalTrust", "InvestSwiss", "BankPartner",
+        "AssetPro", "FinanzPro", "TreuhandService", "CapitalPlus", "WealthGuard"
+    ],
+    "construction": [
+        "BauProfi", "ConstructPlus", "BuilderPro", "Baumann", "Bauwerk",
+        "SolidBau", "SwissBuild", "ArchiBau", "SteinProfi", "BauMeister"
+    ],
+    "manufacturing": [
+        "TechnikPlus", "PräzisionsTech", "IndustryPro", "MechaTech", "MetallWerk",
+        "SwissPrecision", "TechnikWerk", "ProduktionstTech", "IndustriePro", "MaschinenTech"
+    ],
+    "retail": [
+        "HandelPlus", "RetailPro", "KaufhausCenter", "ShopMeister", "MarktPlus",
+        "VerkaufsPro", "DetailHandel", "SwissRetail", "MarktPartner", "HandelService"
+    ],
+    "hospitality": [
+        "GastroPlus", "HotelPartner", "RestaurantPro", "CateringService", "GastService",
+        "SwissGastro", "HospitalityPro", "GastMeister", "HotelService", "KulinarikPlus"
+    ],
+    "education": [
+        "BildungsPlus", "LernCenter", "AkademiePro", "SchulService", "BildungsMeister",
+        "SwissEdu", "LernPartner", "AkademieSwiss", "TrainingPro", "WissenPlus"
+    ],
+    "other": [
+        "ServicePlus", "ProfiPartner", "SwissService", "QualityPro", "ExpertService",
+        "MeisterService", "PremiumPro", "SwissExpert", "ProfiService", "QualitätPlus"
+    ]
+}
+
+
+def fallback_company_name(industry: str, canton: str, rng: Optional[random.Random] = None) -> str:
     """
-    Generate realistic fallback company name if no matching company found.
-    
-    Uses realistic Swiss company naming patterns instead of generic "Services XX".
+    Generate a realistic Swiss company name for an industry and canton.
     
     Args:
-        occupation_doc: Occupation document.
-        canton: Canton code.
-        occupation_title: Optional occupation title.
+        industry: Industry (patterns fall back to "other").
+        canton: Canton code (selects the regional legal forms).
+        rng: Optional random generator (defaults to the module-level random).
     
     Returns:
-        Generated company dictionary with company_source="fallback".
+        Company name, e.g. "SwissTech ZH AG".
     """
-    # Realistic Swiss company name patterns by industry
-    COMPANY_PATTERNS = {
-        "technology": [
-            "SwissTech", "DigitalHelvetic", "AlpineSoft", "SmartBit", "DataPeak",
-            "CodeCraft", "NetAlpin", "TechFlow", "BitMountain", "SwissCode"
-        ],
-        "healthcare": [
-            "MediCare", "HealthPlus", "VitaClinic", "SanaMed", "CarePlus",
-            "MedCenter", "HealthFirst", "VitaCare", "SwissMed", "SanaLife"
-        ],
-        "finance": [
-            "FinancePartner", "WealthAdvisor", "CapitalTrust", "InvestSwiss", "BankPartner",
-            "AssetPro", "FinanzPro", "TreuhandService", "CapitalPlus", "WealthGuard"
-        ],
-        "construction": [
-            "BauProfi", "ConstructPlus", "BuilderPro", "Baumann", "Bauwerk",
-            "SolidBau", "SwissBuild", "ArchiBau", "SteinProfi", "BauMeister"
-        ],
-        "manufacturing": [
-            "TechnikPlus", "PräzisionsTech", "IndustryPro", "MechaTech", "MetallWerk",
-            "SwissPrecision", "TechnikWerk", "ProduktionstTech", "IndustriePro", "MaschinenTech"
-        ],
-        "retail": [
-            "HandelPlus", "RetailPro", "KaufhausCenter", "ShopMeister", "MarktPlus",
-            "VerkaufsPro", "DetailHandel", "SwissRetail", "MarktPartner", "HandelService"
-        ],
-        "hospitality": [
-            "GastroPlus", "HotelPartner", "RestaurantPro", "CateringService", "GastService",
-            "SwissGastro", "HospitalityPro", "GastMeister", "HotelService", "KulinarikPlus"
-        ],
-        "education": [
-            "BildungsPlus", "LernCenter", "AkademiePro", "SchulService", "BildungsMeister",
-            "SwissEdu", "LernPartner", "AkademieSwiss", "TrainingPro", "WissenPlus"
-        ],
-        "other": [
-            "ServicePlus", "ProfiPartner", "SwissService", "QualityPro", "ExpertService",
-            "MeisterService", "PremiumPro", "SwissExpert", "ProfiService", "QualitätPlus"
-        ]
-    }
-    
-    # Get industry from occupation mapping
-    allowed_industries, _ = get_occupation_industry_mapping(occupation_doc, occupation_title)
-    industry = list(allowed_industries)[0] if allowed_industries else "other"
-    
-    # Get appropriate patterns for industry
-    patterns = COMPANY_PATTERNS.get(industry, COMPANY_PATTERNS["other"])
-    base_name = random.choice(patterns)
+    rng = rng or random
+    patterns = FALLBACK_COMPANY_PATTERNS.get(industry, FALLBACK_COMPANY_PATTERNS["other"])
+    base_name = rng.choice(patterns)
     
     # Legal forms based on region
     if canton in ["GE", "VD", "NE", "JU", "FR"]:  # French-speaking
@@ -339,7 +330,7 @@ def generate_fallback_company(
     else:  # German-speaking
         legal_forms = ["AG", "GmbH"]
     
-    legal_form = random.choice(legal_forms)
+    legal_form = rng.choice(legal_forms)
     
     # Generate company name with variation
     name_patterns = [
@@ -347,7 +338,32 @@ def generate_fallback_company(
         f"{base_name} Schweiz {legal_form}",
         f"{base_name} {canton} {legal_form}",
     ]
-    company_name = random.choice(name_patterns)
+    return rng.choice(name_patterns)
+
+
+def generate_fallback_company(
+    occupation_doc: Dict[str, Any],
+    canton: str,
+    occupation_title: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Generate realistic fallback company name if no matching company found.
+    
+    Uses realistic Swiss company naming patterns instead of generic "Services XX".
+    
+    Args:
+        occupation_doc: Occupation document.
+        canton: Canton code.
+        occupation_title: Optional occupation title.
+    
+    Returns:
+        Generated company dictionary with company_source="fallback".
+    """
+    # Get industry from occupation mapping
+    allowed_industries, _ = get_occupation_industry_mapping(occupation_doc, occupation_title)
+    industry = list(allowed_industries)[0] if allowed_industries else "other"
+    
+    company_name = fallback_company_name(industry, canton)
     
     return {
         "name": company_name,
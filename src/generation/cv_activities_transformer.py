@@ -7,10 +7,11 @@ achievement-focused CV responsibility bullets with metrics and impact.
 Run: Used by persona generation pipeline
 """
 import sys
+import json
 import random
 import re
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
 from datetime import datetime
 
 # Add project root to path
@@ -26,28 +27,170 @@ from src.generation.metrics_validator import (
 )
 from src.config import get_settings
 from src.generation.openai_client import (
-    get_openai_client,
     is_openai_available,
-    call_openai_chat
+    call_openai_json,
+    stream_openai_chat,
+    build_json_system_prompt
+)
+from src.generation.llm_metrics import record_llm_fallback
+from src.generation.llm_schemas import (
+    BULLET_SCHEMA,
+    MIN_BULLET_LENGTH,
+    bullets_schema,
+    job_bullets_schema,
+    sub_schema
 )
 
 settings = get_settings()
 
 # Use centralized OpenAI client
 OPENAI_AVAILABLE = is_openai_available()
-_openai_client = get_openai_client()
+
+
+def _clean_bullet(text: str) -> Optional[str]:
+    """Strip numbering/bullet marks from a generated bullet; None if too short."""
+    bullet = re.sub(r'^\d+[\.\)]\s*', '', str(text).strip())
+    bullet = bullet.strip().strip('-').strip('•').strip()
+    if not bullet or len(bullet) < MIN_BULLET_LENGTH:
+        return None
+    # Ensure capital letter
+    return bullet[0].upper() + bullet[1:] if len(bullet) > 1 else bullet.upper()
+
+
+def _iter_json_list_items(chunks: Iterable[str]) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Incrementally parse streamed JSON of the form {"key": ["item", ...], ...}.
+    
+    Yields (key, item) as soon as each string item is complete and
+    (key, None) when the key's array closes.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    key = None
+    in_array = False
+    for chunk in chunks:
+        buffer += chunk
+        pos = 0
+        while pos < len(buffer):
+            char = buffer[pos]
+            if char == '"':
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    break  # String not complete yet - wait for more chunks
+                pos = end
+                if in_array:
+                    yield key, value
+                else:
+                    key = value
+            elif char == "[":
+                in_array = True
+                pos += 1
+            elif char == "]":
+                if in_array:
+                    in_array = False
+                    yield key, None
+                pos += 1
+            else:
+                pos += 1
+        buffer = buffer[pos:]
+
+
+def _finalize_streamed_job(accepted: List[str], rejected: List[str], career_level: str, num_bullets: int) -> List[str]:
+    """
+    Clean one job's streamed bullets once its block has closed.
+    
+    Bullets that passed validate_bullet_metrics come first; rejected ones only
+    top up the list if too few valid bullets arrived (same count as the
+    non-streaming path would have returned).
+    """
+    bullets = accepted[:num_bullets]
+    if len(bullets) < num_bullets:
+        bullets += rejected[:num_bullets - len(bullets)]
+    cleaned, _ = validate_and_clean_bullets(bullets, career_level, max_attempts=3)
+    return cleaned
+
+
+def _stream_all_jobs_bullets(
+    chunks: Iterable[str],
+    jobs_data: List[Dict[str, Any]]
+) -> Dict[int, List[str]]:
+    """
+    Parse a streamed job_bullets_schema response incrementally.
+    
+    Each bullet is checked with validate_bullet_metrics as soon as its JSON
+    string is complete. A job is finalized (validate_and_clean_bullets) when
+    its array closes or it has enough valid bullets; once every job is
+    complete the stream is closed, so over-generated output is never paid for.
+    
+    Args:
+        chunks: Text chunks (e.g. from stream_openai_chat).
+        jobs_data: Job dictionaries as passed to generate_all_jobs_bullets_batch.
+    
+    Returns:
+        Dict mapping 0-indexed job number to list of bullet points.
+    """
+    accepted: Dict[int, List[str]] = {}
+    rejected: Dict[int, List[str]] = {}
+    bullets_by_job: Dict[int, List[str]] = {}
+    
+    def _close(job: int) -> None:
+        if job in bullets_by_job or not (accepted.get(job) or rejected.get(job)):
+            return
+        bullets_by_job[job] = _finalize_streamed_job(
+            accepted.get(job, []), rejected.get(job, []),
+            jobs_data[job]["career_level"], jobs_data[job]["num_bullets"]
+        )
+    
+    items = _iter_json_list_items(chunks)
+    try:
+        for key, item in items:
+            match = re.fullmatch(r"job_(\d+)", key or "")
+            if not match or not 0 < int(match.group(1)) <= len(jobs_data):
+                continue
+            current_job = int(match.group(1)) - 1
+            if item is None:
+                _close(current_job)
+                continue
+            bullet = _clean_bullet(item)
+            if current_job in bullets_by_job or not bullet:
+                continue
+            
+            job = jobs_data[current_job]
+            is_valid, _, _ = validate_bullet_metrics(bullet, job["career_level"])
+            (accepted if is_valid else rejected).setdefault(current_job, []).append(bullet)
+            if len(accepted.get(current_job, [])) >= job["num_bullets"]:
+                _close(current_job)
+                if len(bullets_by_job) == len(jobs_data):
+                    break  # All jobs complete - cancel the rest of the stream
+    finally:
+        # Closing the chunk generator closes the underlying HTTP stream
+        items.close()
+        if hasattr(chunks, "close"):
+            chunks.close()
+    
+    for job in range(len(jobs_data)):
+        _close(job)
+    return bullets_by_job
 
 
 def generate_all_jobs_bullets_batch(
     jobs_data: List[Dict[str, Any]],
     occupation_title: str,
-    language: str = "de"
+    language: str = "de",
+    stream: Optional[bool] = None
 ) -> Dict[int, List[str]]:
     """
     Generate ALL bullets for ALL jobs in ONE API call.
     
     This is the fastest approach - reduces 4-16 API calls to just 1!
     
+    The response is a JSON object with one field per job (job_bullets_schema);
+    incomplete jobs are re-requested once. In streaming mode
+    (LLM_STREAM_BULLETS=true or stream=True) bullets are parsed and validated
+    per job while tokens arrive, and the request is cancelled as soon as
+    every job has enough valid bullets.
+    
     Args:
         jobs_data: List of job dictionaries with keys:
             - job_index: int
@@ -58,11 +201,15 @@ def generate_all_jobs_bullets_batch(
             - num_bullets: int
         occupation_title: The base occupation title.
         language: Language (de, fr, it).
+        stream: Stream and parse incrementally (default: settings.llm_stream_bullets).
     
     Returns:
         Dict mapping job_index to list of bullet points.
     """
-    if not jobs_data or not OPENAI_AVAILABLE or not _openai_client:
+    if not jobs_data:
+        return {}
+    if not OPENAI_AVAILABLE:
+        record_llm_fallback("bullets.all_jobs")
         return {}
     
     # Build combined prompt for all jobs
@@ -96,66 +243,78 @@ REGELN:
 6. Schweizer Deutsch
 
 AUSGABEFORMAT (WICHTIG - genau so!):
-JOB 1:
-1. [Bullet]
-2. [Bullet]
-...
-
-JOB 2:
-1. [Bullet]
-...
-
-usw."""
+JSON-Objekt mit einem Feld pro Stelle: "job_1", "job_2", ... - jeweils eine Liste
+mit genau der angegebenen Anzahl Bullets (ohne Nummerierung)."""
     
     try:
-        # Calculate needed tokens: ~30 tokens per bullet, plus overhead
-        total_bullets = sum(job['num_bullets'] for job in jobs_data)
+        # Default budget until enough completions were observed (token_budget.py)
         needed_tokens = max(1200, total_bullets * 50 + 200)
+        system_prompt = "Du schreibst professionelle CV-Bullets. Antworte NUR mit den Bullets, formatiert genau wie angegeben."
+        schema = job_bullets_schema([job['num_bullets'] for job in jobs_data])
         
-        if hasattr(_openai_client, 'chat'):
-            response = _openai_client.chat.completions.create(
-                model=settings.openai_model_mini,
-                messages=[
-                    {"role": "system", "content": "Du schreibst professionelle CV-Bullets. Antworte NUR mit den nummerierten Bullets, formatiert genau wie angegeben."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=needed_tokens
+        if stream is None:
+            stream = settings.llm_stream_bullets
+        if stream:
+            bullets_by_job = _stream_all_jobs_bullets(
+                stream_openai_chat(
+                    system_prompt=build_json_system_prompt(system_prompt, schema),
+                    user_prompt=prompt,
+                    max_tokens=needed_tokens,
+                    temperature=0.7,
+                    call_site="bullets.all_jobs",
+                    response_format={"type": "json_object"},
+                    language=language,
+                    units=total_bullets
+                ),
+                jobs_data
             )
-            result = response.choices[0].message.content.strip()
-        else:
-            return {}
+            # Repair: re-ask only for jobs that did not arrive complete
+            missing = [f"job_{i + 1}" for i, job in enumerate(jobs_data)
+                       if len(bullets_by_job.get(i, [])) < job['num_bullets']]
+            if missing:
+                try:
+                    repaired = call_openai_json(
+                        system_prompt=system_prompt,
+                        user_prompt=prompt,
+                        max_tokens=needed_tokens,
+                        temperature=0.7,
+                        call_site="bullets.all_jobs.repair",
+                        schema=sub_schema(schema, missing),
+                        language=language,
+                        units=sum(jobs_data[int(name[4:]) - 1]['num_bullets'] for name in missing),
+                        max_repairs=0
+                    )
+                    for name in missing:
+                        bullets = [b for b in (_clean_bullet(item) for item in repaired[name]) if b]
+                        if bullets:
+                            bullets_by_job[int(name[4:]) - 1] = bullets
+                except Exception as e:
+                    import warnings
+                    warnings.warn(f"Ultra-batch repair failed: {e}")
+            return bullets_by_job
         
-        # Parse response into job buckets
-        bullets_by_job = {}
-        current_job = None
+        data = call_openai_json(
+            system_prompt=system_prompt,
+            user_prompt=prompt,
+            max_tokens=needed_tokens,
+            temperature=0.7,
+            call_site="bullets.all_jobs",
+            schema=schema,
+            language=language,
+            units=total_bullets
+        )
         
-        for line in result.split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Check for job header
-            if line.upper().startswith("JOB "):
-                try:
-                    job_num = int(line.split(":")[0].replace("JOB", "").strip())
-                    current_job = job_num - 1  # Convert to 0-indexed
-                    bullets_by_job[current_job] = []
-                except:
-                    continue
-            elif current_job is not None and re.match(r'^\d+[\.\)]', line):
-                # This is a bullet
-                bullet = re.sub(r'^\d+[\.\)]\s*', '', line).strip()
-                if bullet and len(bullet) > 10:
-                    # Ensure capital letter
-                    bullet = bullet[0].upper() + bullet[1:] if len(bullet) > 1 else bullet.upper()
-                    bullets_by_job[current_job].append(bullet)
+        # Map "job_n" fields to 0-indexed job buckets
+        bullets_by_job = {}
+        for i in range(len(jobs_data)):
+            bullets_by_job[i] = [b for b in (_clean_bullet(item) for item in data[f"job_{i + 1}"]) if b]
         
         return bullets_by_job
         
     except Exception as e:
         import warnings
         warnings.warn(f"Ultra-batch generation failed: {e}")
+        record_llm_fallback("bullets.all_jobs")
         return {}
 
 
@@ -421,6 +580,8 @@ def transform_activity_to_bullet(
     
     # If AI not available or disabled, use enhanced transformation
     if not use_ai or not OPENAI_AVAILABLE:
+        if use_ai:
+            record_llm_fallback("bullets.single")
         return enhanced_transform_activity(
             activity_text, career_level, industry, used_verbs
         )
@@ -487,41 +648,20 @@ GOOD: 'Definierte Technologie-Roadmap für Abteilung (45 Mitarbeiter), Kostenred
 
 Language: {language}
 
-Return only the bullet point text, no markdown, no explanation, no quotes."""
+Return only the bullet point text in the field "bullet", no markdown, no explanation, no quotes."""
         
         # Enhance prompt with metric range guidance from metrics_validator
         prompt = enhance_achievement_prompt(base_prompt, career_level)
 
-        messages = [
-            {
-                "role": "system",
-                "content": "You are a professional CV writer specializing in achievement-focused bullet points with quantifiable metrics. Always start with varied action verbs, include metrics, and show impact."
-            },
-            {
-                "role": "user",
-                "content": prompt
-            }
-        ]
-        
-        # Try modern OpenAI client
-        if hasattr(_openai_client, 'chat') and callable(getattr(_openai_client, 'chat', None)):
-            response = _openai_client.chat.completions.create(
-                model=settings.openai_model_mini,
-                messages=messages,
-                temperature=settings.ai_temperature_creative,
-                max_tokens=200
-            )
-            bullet = response.choices[0].message.content.strip()
-        else:
-            # Fallback to legacy client
-            import openai
-            response = openai.ChatCompletion.create(
-                model=settings.openai_model_mini,
-                messages=messages,
-                temperature=settings.ai_temperature_creative,
-                max_tokens=200
-            )
-            bullet = response.choices[0].message.content.strip()
+        bullet = call_openai_json(
+            system_prompt="You are a professional CV writer specializing in achievement-focused bullet points with quantifiable metrics. Always start with varied action verbs, include metrics, and show impact.",
+            user_prompt=prompt,
+            max_tokens=200,
+            temperature=settings.ai_temperature_creative,
+            call_site="bullets.single",
+            schema=BULLET_SCHEMA,
+            language=language
+        )["bullet"].strip()
         
         # Clean up bullet (remove markdown, quotes, ensure proper format)
         bullet = bullet.replace("*", "").replace("-", "").strip()
@@ -538,6 +678,7 @@ Return only the bullet point text, no markdown, no explanation, no quotes."""
         
     except Exception as e:
         # Fallback to enhanced transformation
+        record_llm_fallback("bullets.single")
         return enhanced_transform_activity(
             activity_text, career_level, industry, used_verbs
         )
@@ -571,7 +712,10 @@ def generate_bullets_batch(
     Returns:
         List of bullet points, or empty list if failed.
     """
-    if not activities or not OPENAI_AVAILABLE or not _openai_client:
+    if not activities:
+        return []
+    if not OPENAI_AVAILABLE:
+        record_llm_fallback("bullets.batch")
         return []
     
     # Build batch prompt
@@ -618,45 +762,27 @@ BEISPIELE für {career_level}-Level:
 {examples}
 
 AUSGABEFORMAT:
-Genau {num_bullets} Bullets, nummeriert 1-{num_bullets}. Nur die Bullets, keine Erklärung."""
+Genau {num_bullets} Bullets als Liste im Feld "bullets" (ohne Nummerierung). Nur die Bullets, keine Erklärung."""
 
     try:
-        messages = [
-            {"role": "system", "content": "You are a professional CV writer. Generate varied, metric-focused bullet points. Return ONLY the numbered bullets, nothing else."},
-            {"role": "user", "content": prompt}
-        ]
-        
-        if hasattr(_openai_client, 'chat'):
-            response = _openai_client.chat.completions.create(
-                model=settings.openai_model_mini,
-                messages=messages,
-                temperature=settings.ai_temperature_creative,
-                max_tokens=500
-            )
-            result = response.choices[0].message.content.strip()
-        else:
-            return []
-        
-        # Parse bullets from response
-        bullets = []
-        for line in result.split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-            # Remove numbering (1., 2., etc.)
-            import re
-            cleaned = re.sub(r'^[\d]+[\.\)]\s*', '', line)
-            cleaned = cleaned.strip().strip('-').strip('•').strip()
-            if cleaned and len(cleaned) > 10:
-                # Ensure capital letter
-                cleaned = cleaned[0].upper() + cleaned[1:] if len(cleaned) > 1 else cleaned.upper()
-                bullets.append(cleaned)
+        data = call_openai_json(
+            system_prompt="You are a professional CV writer. Generate varied, metric-focused bullet points. Return ONLY the bullets, nothing else.",
+            user_prompt=prompt,
+            max_tokens=500,
+            temperature=settings.ai_temperature_creative,
+            call_site="bullets.batch",
+            schema=bullets_schema(num_bullets),
+            language=language,
+            units=num_bullets
+        )
         
+        bullets = [b for b in (_clean_bullet(item) for item in data["bullets"]) if b]
         return bullets[:num_bullets]
         
     except Exception as e:
         import warnings
         warnings.warn(f"Batch bullet generation failed: {e}")
+        record_llm_fallback("bullets.batch")
         return []
 
 
@@ -933,7 +1059,7 @@ def generate_responsibilities_from_activities(
     used_verbs = []
     
     # Try BATCH generation first (1 API call instead of N)
-    if OPENAI_AVAILABLE and _openai_client and len(selected_activities) > 1:
+    if OPENAI_AVAILABLE and len(selected_activities) > 1:
         batch_bullets = generate_bullets_batch(
             selected_activities,
             career_level,
@@ -1018,7 +1144,8 @@ def generate_generic_responsibilities(
     num_bullets: int,
     language: str = "de",
     industry: str = "other",
-    occupation_title: str = ""
+    occupation_title: str = "",
+    rng: Optional[random.Random] = None
 ) -> List[str]:
     """
     Generate responsibilities with metrics when no activities available.
@@ -1030,14 +1157,16 @@ def generate_generic_responsibilities(
         language: Language.
         industry: Industry type.
         occupation_title: The occupation title for context.
+        rng: Optional random generator (defaults to the module-level random).
     
     Returns:
-        List of responsibility bullets with metrics.
+        List of responsibility bullets with metrics (fewer than num_bullets
+        if the templates cannot produce enough distinct bullets).
     """
     # Generate bullets using the improved function
     bullets = []
     for _ in range(num_bullets):
-        bullet = generate_generic_responsibility(career_level, language, industry, occupation_title)
+        bullet = generate_generic_responsibility(career_level, language, industry, occupation_title, rng)
         bullets.append(bullet)
     
     # Ensure variety - no duplicate starting verbs
@@ -1049,14 +1178,17 @@ def generate_generic_responsibilities(
             unique_bullets.append(bullet)
             used_starts.add(start)
     
-    # Fill up if needed
-    while len(unique_bullets) < num_bullets:
-        bullet = generate_generic_responsibility(career_level, language, industry, occupation_title)
+    # Fill up if needed (some levels have fewer distinct starts than bullets);
+    # capped, since some levels have fewer distinct bullets than requested
+    attempts = 0
+    while len(unique_bullets) < num_bullets and attempts < 40 * num_bullets:
+        bullet = generate_generic_responsibility(career_level, language, industry, occupation_title, rng)
         start = bullet.split()[0].lower() if bullet.split() else ""
-        if start not in used_starts:
+        attempts += 1
+        if start not in used_starts or (attempts > 20 * num_bullets and bullet not in unique_bullets):
             unique_bullets.append(bullet)
             used_starts.add(start)
-    
+
     return unique_bullets[:num_bullets]
 
 
@@ -1064,7 +1196,8 @@ def generate_generic_responsibility(
     career_level: str,
     language: str = "de",
     industry: str = "other",
-    occupation_title: str = ""
+    occupation_title: str = "",
+    rng: Optional[random.Random] = None
 ) -> str:
     """
     Generate a single responsibility with metrics, tailored to industry.
@@ -1074,10 +1207,12 @@ def generate_generic_responsibility(
         language: Language.
         industry: Industry type.
         occupation_title: The occupation title for context.
+        rng: Optional random generator (defaults to the module-level random).
     
     Returns:
         Responsibility bullet with metrics.
     """
+    rng = rng or random
     # Industry-specific templates
     industry_templates = {
         "construction": {
@@ -1111,22 +1246,22 @@ def generate_generic_responsibility(
     templates = templates_by_level.get(career_level, templates_by_level["mid"])
     
     # Select random template
-    template = random.choice(templates)
+    template = rng.choice(templates)
     
     # Generate realistic numbers based on career level
     level_scales = {"junior": (5, 15), "mid": (10, 25), "senior": (15, 40), "lead": (25, 60)}
     min_scale, max_scale = level_scales.get(career_level, (10, 25))
     
-    num = random.randint(min_scale, max_scale)
-    team = random.randint(3, 15) if career_level in ["senior", "lead"] else random.randint(2, 5)
-    chf = random.choice([50000, 100000, 250000, 500000, 1000000, 2500000])
+    num = rng.randint(min_scale, max_scale)
+    team = rng.randint(3, 15) if career_level in ["senior", "lead"] else rng.randint(2, 5)
+    chf = rng.choice([50000, 100000, 250000, 500000, 1000000, 2500000])
     
     # Fill template
     bullet = template.format(num=num, team=team, chf=f"{chf:,}".replace(",", "'"))
     
     # Add action verb
     verbs = ACTION_VERBS.get(career_level, ACTION_VERBS["mid"])
-    verb = random.choice(verbs)
+    verb = rng.choice(verbs)
     
     # Only add verb if template doesn't already start with one
     if not any(bullet.lower().startswith(v.lower()) for v in ["leitung", "führung", "verantwortung", "koordination"]):
@@ -17,13 +17,13 @@ Run: Used by persona generation pipeline
 import sys
 import random
 import re
+import contextvars
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
-from PIL import Image
-import io
-import base64
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -31,31 +31,56 @@ sys.path.insert(0, str(project_root))
 
 from src.database.queries import (
     get_occupation_by_id,
+    get_occupations_by_ids,
     get_canton_by_code,
     sample_portrait_path,
     get_skills_by_occupation
 )
 from src.generation.cv_education_generator import generate_education_history
-from src.generation.cv_job_history_generator import generate_job_history
+from src.generation.cv_job_history_generator import build_job_history_skeleton, fill_job_bullets
 from src.generation.cv_continuing_education import generate_additional_education
 from src.generation.cv_activities_transformer import generate_responsibilities_from_activities
 from src.config import get_settings
 from src.generation.openai_client import (
-    get_openai_client,
     is_openai_available,
-    call_openai_chat
+    call_openai_json
 )
+from src.generation.llm_metrics import cv_metrics_scope, record_llm_fallback
+from src.generation.llm_schemas import SUMMARY_SCHEMA, HOBBIES_SCHEMA
+from src.generation.section_bank import get_section_bank, is_premium_tier
+from src.generation.section_memo import (
+    SKELETON_SECTIONS, memoize_section, new_cv_seed, section_memo_scope, sections_for_issues
+)
+from src.generation.cv_facts import CVFacts, IMPACT_KEYWORDS
+from src.generation.portrait_store import get_portrait_store, make_asset_id
+from src.generation.section_graph import SectionNode, run_section_graph
 
 settings = get_settings()
 
 # Use centralized OpenAI client
 OPENAI_AVAILABLE = is_openai_available()
-_openai_client = get_openai_client()
 
 
-@dataclass
+# CVDocument.to_dict() layout: section -> field names
+CV_LAYOUT: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("personal", (
+        "first_name", "last_name", "full_name", "age", "gender", "canton", "city", "email",
+        "phone", "address", "portrait_path", "portrait_base64", "portrait_asset_id"
+    )),
+    ("professional", ("current_title", "industry", "career_level", "years_experience")),
+    ("content", ("summary", "education", "jobs", "skills", "additional_education", "hobbies")),
+    ("metadata", ("language", "created_at")),
+)
+
+
+@dataclass(slots=True)
 class CVDocument:
-    """Complete CV document structure."""
+    """
+    Complete CV document structure.
+    
+    Slotted (no per-instance __dict__) so large batches stay compact in
+    memory; see src/export/cv_json.py to serialize without to_dict().
+    """
     # Personal
     first_name: str
     last_name: str
@@ -68,7 +93,8 @@ class CVDocument:
     phone: str = ""
     address: Optional[str] = None
     portrait_path: Optional[str] = None
-    portrait_base64: Optional[str] = None
+    portrait_base64: Optional[str] = None  # inlined PNG (only if not by reference)
+    portrait_asset_id: Optional[str] = None  # see portrait_store.make_asset_id
     
     # Professional
     current_title: str = ""
@@ -88,48 +114,56 @@ class CVDocument:
     language: str = "de"
     created_at: str = ""
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for template rendering."""
-        return {
-            "personal": {
-                "first_name": self.first_name,
-                "last_name": self.last_name,
-                "full_name": self.full_name,
-                "age": self.age,
-                "gender": self.gender,
-                "canton": self.canton,
-                "city": self.city,
-                "email": self.email,
-                "phone": self.phone,
-                "address": self.address,
-                "portrait_path": self.portrait_path,
-                "portrait_base64": self.portrait_base64
-            },
-            "professional": {
-                "current_title": self.current_title,
-                "industry": self.industry,
-                "career_level": self.career_level,
-                "years_experience": self.years_experience
-            },
-            "content": {
-                "summary": self.summary,
-                "education": self.education,
-                "jobs": self.jobs,
-                "skills": self.skills,
-                "additional_education": self.additional_education,
-                "hobbies": self.hobbies
-            },
-            "metadata": {
-                "language": self.language,
-                "created_at": self.created_at
-            }
-        }
+    def portrait_data_uri(self) -> Optional[str]:
+        """Inlined portrait, resolved from the asset id if not embedded."""
+        return self.portrait_base64 or get_portrait_store().resolve_data_uri(self.portrait_asset_id)
+    
+    def iter_sections(self, inline_portrait: bool = False) -> Iterator[Tuple[str, Iterator[Tuple[str, Any]]]]:
+        """
+        Walk the to_dict() layout without building it.
+        
+        Yields:
+            (section, iterator of (key, value)); values are the document's own
+            objects, not copies.
+        """
+        for section, fields in CV_LAYOUT:
+            yield section, self._iter_fields(fields, inline_portrait)
+    
+    def _iter_fields(self, fields: Tuple[str, ...], inline_portrait: bool) -> Iterator[Tuple[str, Any]]:
+        for name in fields:
+            if name == "portrait_base64" and inline_portrait:
+                yield name, self.portrait_data_uri()
+            else:
+                yield name, getattr(self, name)
+    
+    def to_dict(self, inline_portrait: bool = False) -> Dict[str, Any]:
+        """
+        Convert to dictionary for template rendering.
+        
+        Args:
+            inline_portrait: Embed the base64 portrait even if the document
+                only references it by asset id.
+        """
+        return {section: dict(items) for section, items in self.iter_sections(inline_portrait)}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CVDocument":
+        """Rebuild a document from its to_dict() layout (unknown keys are ignored)."""
+        kwargs = {}
+        for section, fields in CV_LAYOUT:
+            values = data.get(section) or {}
+            kwargs.update((name, values[name]) for name in fields if name in values)
+        for name, default in (("first_name", ""), ("last_name", ""), ("full_name", ""), ("age", 0), ("gender", ""), ("canton", "")):
+            kwargs.setdefault(name, default)
+        return cls(**kwargs)
 
 
 def load_portrait_image(portrait_path: Optional[str], resize: Tuple[int, int] = (150, 150), circular: bool = False) -> Optional[str]:
     """
     Load and process portrait image.
     
+    Variants are processed and encoded once per process (see portrait_store.py).
+    
     Args:
         portrait_path: Relative path to portrait image.
         resize: Target size (width, height).
@@ -138,50 +172,7 @@ def load_portrait_image(portrait_path: Optional[str], resize: Tuple[int, int] =
     Returns:
         Base64-encoded image string or None.
     """
-    if not portrait_path:
-        return None
-    
-    full_path = project_root / "data" / "portraits" / portrait_path
-    
-    if not full_path.exists():
-        return None
-    
-    try:
-        from PIL import Image
-        
-        # Load image
-        img = Image.open(full_path)
-        
-        # Convert to RGB if necessary
-        if img.mode != "RGB":
-            img = img.convert("RGB")
-        
-        # Resize
-        img = img.resize(resize, Image.Resampling.LANCZOS)
-        
-        # Circular crop if requested
-        if circular:
-            # Create circular mask
-            mask = Image.new("L", resize, 0)
-            from PIL import ImageDraw
-            draw = ImageDraw.Draw(mask)
-            draw.ellipse([0, 0, resize[0], resize[1]], fill=255)
-            
-            # Apply mask
-            output = Image.new("RGB", resize, (255, 255, 255))
-            output.paste(img, (0, 0), mask)
-            img = output
-        
-        # Convert to base64
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        img_base64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
-        
-        return f"data:image/png;base64,{img_base64}"
-        
-    except Exception as e:
-        print(f"Warning: Could not load portrait: {e}")
-        return None
+    return get_portrait_store().get_data_uri(portrait_path, resize, circular)
 
 
 def get_age_group(age: int) -> str:
@@ -451,7 +442,8 @@ def generate_personalized_hobbies(
     canton: str,
     language: str,
     age_group: str,
-    occupation_type: str = "general"
+    occupation_type: str = "general",
+    rng: Optional[random.Random] = None
 ) -> List[str]:
     """
     Generate personalized hobbies based on region, age, and occupation.
@@ -461,10 +453,12 @@ def generate_personalized_hobbies(
         language: Language (de, fr, it).
         age_group: Age group (18-25, 26-40, 41-65).
         occupation_type: Occupation type (technical, creative, social, general).
+        rng: Optional random generator (defaults to the module-level random).
     
     Returns:
         List of hobby strings (4-6 items).
     """
+    rng = rng or random
     hobbies = []
     
     # Regional base hobbies
@@ -476,7 +470,7 @@ def generate_personalized_hobbies(
     
     # Add 2 common regional hobbies
     lang_hobbies = regional_hobbies.get(language, regional_hobbies["de"])
-    hobbies.extend(random.sample(lang_hobbies, min(2, len(lang_hobbies))))
+    hobbies.extend(rng.sample(lang_hobbies, min(2, len(lang_hobbies))))
     
     # Age-specific hobbies
     age_hobbies = {
@@ -486,7 +480,7 @@ def generate_personalized_hobbies(
     }
     
     age_list = age_hobbies.get(age_group, age_hobbies["26-40"])
-    hobbies.extend(random.sample(age_list, min(2, len(age_list))))
+    hobbies.extend(rng.sample(age_list, min(2, len(age_list))))
     
     # Occupation-specific hobbies
     occupation_hobbies = {
@@ -497,18 +491,39 @@ def generate_personalized_hobbies(
     
     if occupation_type in occupation_hobbies:
         occ_list = occupation_hobbies[occupation_type]
-        hobbies.extend(random.sample(occ_list, min(1, len(occ_list))))
+        hobbies.extend(rng.sample(occ_list, min(1, len(occ_list))))
     
     # Ensure 4-6 hobbies, no duplicates
     unique_hobbies = list(set(hobbies))
     if len(unique_hobbies) < 4:
         # Add more from age list
         remaining = [h for h in age_list if h not in unique_hobbies]
-        unique_hobbies.extend(random.sample(remaining, min(4 - len(unique_hobbies), len(remaining))))
+        unique_hobbies.extend(rng.sample(remaining, min(4 - len(unique_hobbies), len(remaining))))
     
     return unique_hobbies[:6]
 
 
+def get_occupation_type(occupation_doc: Optional[Dict[str, Any]]) -> str:
+    """
+    Determine the occupation type from the occupation's Berufsfelder.
+    
+    Args:
+        occupation_doc: Occupation document.
+    
+    Returns:
+        Occupation type (technical, creative, social, general).
+    """
+    if occupation_doc:
+        berufsfelder = occupation_doc.get("categories", {}).get("berufsfelder", [])
+        if any("informatik" in bf.lower() or "technik" in bf.lower() for bf in berufsfelder):
+            return "technical"
+        elif any("kunst" in bf.lower() or "design" in bf.lower() for bf in berufsfelder):
+            return "creative"
+        elif any("sozial" in bf.lower() or "pflege" in bf.lower() for bf in berufsfelder):
+            return "social"
+    return "general"
+
+
 def generate_varied_summary(
     persona: Dict[str, Any],
     occupation_doc: Optional[Dict[str, Any]] = None,
@@ -517,6 +532,9 @@ def generate_varied_summary(
     """
     Generate varied summary with specific details, avoiding templates.
     
+    Draws from the precomputed section bank first; the LLM is only called
+    on a bank miss or for the premium quality tier.
+    
     Args:
         persona: Persona dictionary.
         occupation_doc: Occupation document.
@@ -525,9 +543,6 @@ def generate_varied_summary(
     Returns:
         Varied summary text (2-3 sentences).
     """
-    if not OPENAI_AVAILABLE or not settings.openai_api_key:
-        return generate_fallback_summary(persona, language)
-    
     name = f"{persona.get('first_name')} {persona.get('last_name')}"
     age = persona.get("age", 25)
     years_exp = persona.get("years_experience", 0)
@@ -540,6 +555,25 @@ def generate_varied_summary(
     skills_docs = get_skills_by_occupation(job_id) if job_id else []
     actual_skills = [s.get("skill_name_de", "") for s in skills_docs[:3] if s.get("skill_name_de")]
     
+    # Precomputed template bank (no API call)
+    bank = get_section_bank()
+    if bank and not is_premium_tier(persona):
+        summary = bank.draw_summary(
+            language, industry, career_level, get_occupation_type(occupation_doc),
+            {
+                "years": years_exp,
+                "skills": " und ".join(actual_skills[:2]) if language == "de" else ", ".join(actual_skills[:2]),
+                "canton": generate_city_for_canton(persona.get("canton", "ZH")),
+                "occupation": occupation_title
+            }
+        )
+        if summary:
+            return summary
+    
+    if not OPENAI_AVAILABLE:
+        record_llm_fallback("summary.varied")
+        return generate_fallback_summary(persona, language)
+    
     # Vary tone
     tone_variants = {
         "de": ["erfahrener", "versierter", "kompetenter", "erfolgreicher"],
@@ -576,7 +610,7 @@ KRITISCHE ANFORDERUNGEN:
 - 2-3 Sätze, max 200 Wörter
 - Schweizer CV-Stil
 
-Nur den Text zurückgeben, keine Markdown, keine Erklärung.""",
+Den Text im Feld "summary" zurückgeben, keine Markdown, keine Erklärung.""",
         "fr": f"""Créez un texte de résumé professionnel de CV (2-3 phrases) pour:
 
 Nom: {name}
@@ -598,7 +632,7 @@ EXIGENCES:
 - Détails concrets
 - 2-3 phrases, max 200 mots
 
-Retournez uniquement le texte.""",
+Retournez uniquement le texte dans le champ "summary".""",
         "it": f"""Crea un testo di riepilogo professionale (2-3 frasi) per:
 
 Nome: {name}
@@ -619,52 +653,48 @@ REQUISITI:
 - Dettagli concreti
 - 2-3 frasi, max 200 parole
 
-Restituisci solo il testo."""
+Restituisci solo il testo nel campo "summary"."""
     }
     
     prompt = prompts.get(language, prompts["de"])
     
     try:
-        messages = [
-            {
-                "role": "system",
-                "content": "You are a professional CV writer. Create varied, specific summaries with concrete details, avoiding generic templates and AI buzzwords."
-            },
-            {
-                "role": "user",
-                "content": prompt
-            }
-        ]
-        
-        if _openai_client and hasattr(_openai_client, 'chat'):
-            response = _openai_client.chat.completions.create(
-                model=settings.openai_model_mini,
-                messages=messages,
-                temperature=settings.ai_temperature_creative,
-                max_tokens=250
-            )
-            summary = response.choices[0].message.content.strip()
-        else:
-            summary = generate_fallback_summary(persona, language)
+        summary = call_openai_json(
+            system_prompt="You are a professional CV writer. Create varied, specific summaries with concrete details, avoiding generic templates and AI buzzwords.",
+            user_prompt=prompt,
+            max_tokens=250,
+            temperature=settings.ai_temperature_creative,
+            call_site="summary.varied",
+            language=language,
+            schema=SUMMARY_SCHEMA
+        )["summary"].strip()
         
         # Clean up
         summary = summary.replace("**", "").replace("*", "").strip()
         return summary
         
     except Exception as e:
+        record_llm_fallback("summary.varied")
         return generate_fallback_summary(persona, language)
 
 
-def score_cv_quality(cv_doc: CVDocument) -> Dict[str, Any]:
+def score_cv_quality(cv_doc: CVDocument, skeleton: bool = False, facts: Optional[CVFacts] = None) -> Dict[str, Any]:
     """
     Score CV quality across multiple dimensions.
     
     Args:
         cv_doc: CVDocument to score.
+        skeleton: Score a skeleton without LLM-written text (summary,
+            responsibilities). That text is assumed to be flawless, so the
+            score is the best the finished CV can reach.
+        facts: Parsed CV (built if None; validate_complete_cv passes its own).
     
     Returns:
         Dictionary with scores and report.
     """
+    if facts is None:
+        facts = CVFacts.from_cv(cv_doc)
+    
     scores = {
         "completeness": 0,
         "realism": 0,
@@ -680,7 +710,7 @@ def score_cv_quality(cv_doc: CVDocument) -> Dict[str, Any]:
     completeness_issues = []
     
     # Check required sections
-    if not cv_doc.summary:
+    if not cv_doc.summary and not skeleton:
         completeness_score -= 20
         completeness_issues.append("Missing summary")
     if not cv_doc.education:
@@ -697,11 +727,10 @@ def score_cv_quality(cv_doc: CVDocument) -> Dict[str, Any]:
         completeness_issues.append("Missing languages")
     
     # Check minimum content
-    if cv_doc.jobs:
-        current_job = next((j for j in cv_doc.jobs if j.get("is_current")), None)
+    if cv_doc.jobs and not skeleton:
+        current_job = facts.current_job
         if current_job:
-            responsibilities = current_job.get("responsibilities", [])
-            if len(responsibilities) < 3:
+            if len(current_job.responsibilities) < 3:
                 completeness_score -= 10
                 completeness_issues.append("Insufficient responsibilities in current job")
     
@@ -734,9 +763,8 @@ def score_cv_quality(cv_doc: CVDocument) -> Dict[str, Any]:
         realism_issues.append("Senior level too young")
     
     # Check job progression
-    if len(cv_doc.jobs) > 1:
-        job_levels = [j.get("position", "").lower() for j in cv_doc.jobs]
-        if "senior" in job_levels[0] and "junior" in job_levels[-1]:
+    if len(facts.jobs) > 1:
+        if "senior" in facts.jobs[0].position and "junior" in facts.jobs[-1].position:
             realism_score -= 15
             realism_issues.append("Illogical career progression")
     
@@ -749,10 +777,7 @@ def score_cv_quality(cv_doc: CVDocument) -> Dict[str, Any]:
     language_issues = []
     
     # Check for duplicates
-    all_text = cv_doc.summary.lower()
-    for job in cv_doc.jobs:
-        all_text += " " + " ".join(job.get("responsibilities", [])).lower()
-    
+    all_text = facts.all_text_lower
     words = all_text.split()
     if len(words) > 0:
         unique_ratio = len(set(words)) / len(words)
@@ -775,25 +800,15 @@ def score_cv_quality(cv_doc: CVDocument) -> Dict[str, Any]:
     achievement_issues = []
     
     # Check for metrics in responsibilities
-    has_metrics = False
-    for job in cv_doc.jobs:
-        responsibilities = job.get("responsibilities", [])
-        for resp in responsibilities:
-            # Check for numbers (metrics)
-            if re.search(r'\d+', resp):
-                has_metrics = True
-                break
-        if has_metrics:
-            break
+    has_metrics = facts.bullets_with_metrics > 0
     
-    if not has_metrics:
+    if not has_metrics and not skeleton:
         achievement_score -= 30
         achievement_issues.append("No metrics in responsibilities")
     
     # Check for impact language
-    impact_keywords = ["reduzierte", "steigerte", "optimierte", "verbesserte", "erhöhte"]
-    has_impact = any(kw in all_text for kw in impact_keywords)
-    if not has_impact:
+    has_impact = any(kw in all_text for kw in IMPACT_KEYWORDS)
+    if not has_impact and not skeleton:
         achievement_score -= 20
         achievement_issues.append("Missing impact language")
     
@@ -832,7 +847,8 @@ def generate_summary(
     Returns:
         Generated summary text (2-3 sentences).
     """
-    if not OPENAI_AVAILABLE or not settings.openai_api_key:
+    if not OPENAI_AVAILABLE:
+        record_llm_fallback("summary.basic")
         return generate_fallback_summary(persona, language)
     
     # Extract relevant information
@@ -872,7 +888,7 @@ Anforderungen:
 - 2-3 Sätze, max 200 Wörter
 - Schweizer CV-Stil
 
-Nur den Text zurückgeben, keine Markdown, keine Erklärung.""",
+Den Text im Feld "summary" zurückgeben, keine Markdown, keine Erklärung.""",
         "fr": f"""Créez un texte de résumé professionnel de CV (2-3 phrases) pour:
 
 Nom: {name}
@@ -890,7 +906,7 @@ Exigences:
 - 2-3 phrases, max 200 mots
 - Style CV suisse
 
-Retournez uniquement le texte, pas de markdown, pas d'explication.""",
+Retournez uniquement le texte dans le champ "summary", pas de markdown, pas d'explication.""",
         "it": f"""Crea un testo di riepilogo professionale del CV (2-3 frasi) per:
 
 Nome: {name}
@@ -908,35 +924,21 @@ Requisiti:
 - 2-3 frasi, max 200 parole
 - Stile CV svizzero
 
-Restituisci solo il testo, nessun markdown, nessuna spiegazione."""
+Restituisci solo il testo nel campo "summary", nessun markdown, nessuna spiegazione."""
     }
     
     prompt = prompts.get(language, prompts["de"])
     
     try:
-        messages = [
-            {
-                "role": "system",
-                "content": "You are a professional CV writer specializing in Swiss CV formats."
-            },
-            {
-                "role": "user",
-                "content": prompt
-            }
-        ]
-        
-        # Try modern OpenAI client
-        if _openai_client and hasattr(_openai_client, 'chat'):
-            response = _openai_client.chat.completions.create(
-                model=settings.openai_model_mini,
-                messages=messages,
-                temperature=settings.ai_temperature_creative,
-                max_tokens=200
-            )
-            summary = response.choices[0].message.content.strip()
-        else:
-            # Fallback: use simple summary
-            summary = generate_fallback_summary(persona, language)
+        summary = call_openai_json(
+            system_prompt="You are a professional CV writer specializing in Swiss CV formats.",
+            user_prompt=prompt,
+            max_tokens=200,
+            temperature=settings.ai_temperature_creative,
+            call_site="summary.basic",
+            language=language,
+            schema=SUMMARY_SCHEMA
+        )["summary"].strip()
         
         # Clean up
         summary = summary.replace("**", "").replace("*", "").strip()
@@ -945,6 +947,7 @@ Restituisci solo il testo, nessun markdown, nessuna spiegazione."""
         
     except Exception as e:
         print(f"Warning: AI summary generation failed: {e}")
+        record_llm_fallback("summary.basic")
         return generate_fallback_summary(persona, language)
 
 
@@ -964,17 +967,35 @@ def generate_fallback_summary(persona: Dict[str, Any], language: str = "de") ->
     return summaries.get(language, summaries["de"])
 
 
-def generate_hobbies(language: str = "de", use_ai: bool = True) -> List[str]:
+def generate_hobbies(
+    language: str = "de",
+    use_ai: bool = True,
+    persona: Optional[Dict[str, Any]] = None,
+    occupation_type: str = "general"
+) -> List[str]:
     """
     Generate realistic Swiss hobbies.
     
+    With a persona, hobbies are drawn from the precomputed section bank
+    first; the LLM is only called on a bank miss or for the premium tier.
+    
     Args:
         language: Language (de, fr, it).
         use_ai: Whether to use AI generation.
+        persona: Persona dictionary (industry, career_level, quality_tier).
+        occupation_type: Occupation type (technical, creative, social, general).
     
     Returns:
         List of hobby strings (3-5 items).
     """
+    bank = get_section_bank()
+    if persona and bank and not is_premium_tier(persona):
+        hobbies = bank.draw_hobbies(
+            language, persona.get("industry", ""), persona.get("career_level", "mid"), occupation_type
+        )
+        if hobbies:
+            return hobbies
+    
     # Common Swiss hobbies
     swiss_hobbies = {
         "de": [
@@ -1018,35 +1039,28 @@ def generate_hobbies(language: str = "de", use_ai: bool = True) -> List[str]:
     if use_ai and OPENAI_AVAILABLE:
         try:
             prompts = {
-                "de": "Generiere 4-5 realistische Schweizer Hobbys für einen CV. Rücke nur eine kommagetrennte Liste zurück, keine Erklärung.",
-                "fr": "Génère 4-5 loisirs suisses réalistes pour un CV. Retourne uniquement une liste séparée par des virgules, pas d'explication.",
-                "it": "Genera 4-5 hobby svizzeri realistici per un CV. Restituisci solo un elenco separato da virgole, nessuna spiegazione."
+                "de": "Generiere 4-5 realistische Schweizer Hobbys für einen CV. Gib nur die Liste im Feld \"hobbies\" zurück, keine Erklärung.",
+                "fr": "Génère 4-5 loisirs suisses réalistes pour un CV. Retourne uniquement la liste dans le champ \"hobbies\", pas d'explication.",
+                "it": "Genera 4-5 hobby svizzeri realistici per un CV. Restituisci solo l'elenco nel campo \"hobbies\", nessuna spiegazione."
             }
             
-            messages = [
-                {"role": "system", "content": "You are a professional CV writer."},
-                {"role": "user", "content": prompts.get(language, prompts["de"])}
-            ]
-            
-            if _openai_client and hasattr(_openai_client, 'chat'):
-                response = _openai_client.chat.completions.create(
-                    model=settings.openai_model_mini,
-                    messages=messages,
-                    temperature=settings.ai_temperature_creative,
-                    max_tokens=100
-                )
-                hobbies_text = response.choices[0].message.content.strip()
-            else:
-                # Fallback: use predefined hobbies
-                hobbies_text = ""
-            
-            # Parse hobbies
-            hobbies = [h.strip() for h in hobbies_text.split(",") if h.strip()]
-            return hobbies[:5] if hobbies else swiss_hobbies.get(language, swiss_hobbies["de"])[:5]
+            hobbies = call_openai_json(
+                system_prompt="You are a professional CV writer.",
+                user_prompt=prompts.get(language, prompts["de"]),
+                max_tokens=100,
+                temperature=settings.ai_temperature_creative,
+                call_site="hobbies",
+                language=language,
+                schema=HOBBIES_SCHEMA
+            )["hobbies"]
+            return [h.strip() for h in hobbies if h.strip()][:5]
             
         except Exception:
             pass
     
+    if use_ai:
+        record_llm_fallback("hobbies")
+    
     # Fallback to predefined hobbies
     hobbies_list = swiss_hobbies.get(language, swiss_hobbies["de"])
     return random.sample(hobbies_list, min(5, len(hobbies_list)))
@@ -1090,17 +1104,19 @@ def categorize_skills(skills: List[Dict[str, Any]]) -> Dict[str, List[str]]:
     return categorized
 
 
-def get_languages_for_cv(canton: str, primary_language: str) -> List[str]:
+def get_languages_for_cv(canton: str, primary_language: str, rng: Optional[random.Random] = None) -> List[str]:
     """
     Get languages for CV based on canton and primary language.
     
     Args:
         canton: Canton code.
         primary_language: Primary language (de, fr, it).
+        rng: Optional random generator (defaults to the module-level random).
     
     Returns:
         List of language strings with proficiency levels.
     """
+    rng = rng or random
     languages = []
     
     # Primary language (native or fluent)
@@ -1125,12 +1141,12 @@ def get_languages_for_cv(canton: str, primary_language: str) -> List[str]:
         other_langs = multilingual_cantons[canton]
         for lang in other_langs:
             if lang != primary_language:
-                proficiency = random.choice(["Fließend", "Gut", "Grundkenntnisse"])
+                proficiency = rng.choice(["Fließend", "Gut", "Grundkenntnisse"])
                 languages.append(f"{lang_names.get(lang, lang)} ({proficiency})")
     
     # Most Swiss people speak English
-    if random.random() < 0.8:  # 80% chance
-        english_level = random.choice(["Fließend", "Gut", "Grundkenntnisse"])
+    if rng.random() < 0.8:  # 80% chance
+        english_level = rng.choice(["Fließend", "Gut", "Grundkenntnisse"])
         languages.append(f"Englisch ({english_level})")
     
     return languages
@@ -1163,23 +1179,206 @@ def format_date_swiss(date_str: Optional[str], language: str = "de") -> str:
     return date_str
 
 
-def generate_complete_cv(persona: Dict[str, Any]) -> Tuple[Optional[CVDocument], Optional[Dict[str, Any]]]:
+def generate_complete_cv(
+    persona: Dict[str, Any],
+    min_quality: float = 75.0,
+    min_validation_score: Optional[float] = None,
+    occupation_doc: Optional[Dict[str, Any]] = None
+) -> Tuple[Optional[CVDocument], Optional[Dict[str, Any]]]:
     """
     Generate complete CV document from persona with validation and quality scoring.
     
+    The CV is built cheap-first: the deterministic skeleton (personal info,
+    education, job timeline and companies, skills, additional education) is
+    scored before any LLM call. Only skeletons that can still reach the
+    thresholds get their summary, responsibilities and hobbies; the others
+    are rejected with "stage": "skeleton" in the report.
+    
+    LLM usage of this CV (per call site) is attached to the report under
+    "llm_metrics"; "llm_degraded" is True if any LLM call was skipped
+    because the circuit breaker was open (the section used its fallback).
+    
+    Inside section_memo_scope() the sections are memoized; a rejected CV's
+    report then lists the sections to regenerate under "sections", and a
+    retry with the same persona only recomputes those (see section_memo.py).
+    
     Args:
         persona: Persona dictionary from sampling.
+        min_quality: Minimum score_cv_quality score (default: 75.0).
+        min_validation_score: Minimum validate_complete_cv score; if set,
+            the skeleton must be able to reach it, and the finished CV is
+            validated (auto-fix, fast-fail) in the same pass that scores it.
+            The ValidationReport is returned under "validation_report".
+        occupation_doc: Occupation of persona["job_id"] if already loaded
+            (e.g. prefetched for a batch); looked up otherwise.
     
     Returns:
-        Tuple of (CVDocument if quality >= 75, quality_report).
-        Returns (None, quality_report) if quality < 75.
+        Tuple of (CVDocument if quality >= min_quality, quality_report).
+        Returns (None, quality_report) if quality < min_quality.
     """
+    with cv_metrics_scope() as cv_metrics:
+        cv_doc, quality_report = _assemble_cv(persona, min_quality, min_validation_score, occupation_doc)
+    
+    if quality_report is not None:
+        quality_report["llm_metrics"] = cv_metrics.to_dict()
+        quality_report["llm_degraded"] = cv_metrics.totals().short_circuits > 0
+    return cv_doc, quality_report
+
+
+def generate_cv_with_section_retries(
+    persona: Dict[str, Any],
+    min_quality: float = 75.0,
+    min_validation_score: Optional[float] = None,
+    max_retries: int = 0,
+    occupation_doc: Optional[Dict[str, Any]] = None
+) -> Tuple[Optional[CVDocument], Dict[str, Any]]:
+    """
+    generate_complete_cv, retrying only the sections validation complained about.
+    
+    Sections are memoized per CV (see section_memo.py), so a retry with the
+    same persona regenerates e.g. just the summary instead of a whole CV.
+    A CV returned with a failed "validation_report" (min_validation_score)
+    is retried as well, and so is a rejected skeleton (its education and
+    job timeline, or the skeleton sections the issues point at).
+    
+    Args:
+        persona: Persona dictionary from sampling.
+        min_quality: See generate_complete_cv.
+        min_validation_score: See generate_complete_cv.
+        max_retries: Section retries after the first attempt.
+        occupation_doc: See generate_complete_cv.
+    
+    Returns:
+        Tuple of (cv_doc or None, report of the last attempt). The report
+        adds "section_retries"; its "llm_metrics" cover all attempts.
+    """
+    cv_seed = new_cv_seed()
+    retries = 0
+    with cv_metrics_scope() as cv_metrics, section_memo_scope(cv_seed) as memo:
+        while True:
+            cv_doc, quality_report = generate_complete_cv(
+                persona, min_quality, min_validation_score, occupation_doc=occupation_doc
+            )
+            validation_report = quality_report.get("validation_report")
+            if cv_doc is None:
+                sections = quality_report.get("sections", [])
+            elif validation_report is None or validation_report.passed:
+                break
+            else:
+                sections = sections_for_issues(validation_report.issues)
+            
+            if not sections or retries >= max_retries:
+                break
+            memo.invalidate(cv_seed, sections)
+            retries += 1
+    
+    quality_report["section_retries"] = retries
+    quality_report["llm_metrics"] = cv_metrics.to_dict()
+    quality_report["llm_degraded"] = cv_metrics.totals().short_circuits > 0
+    return cv_doc, quality_report
+
+
+def generate_complete_cv_batch(
+    personas: Iterable[Dict[str, Any]],
+    min_quality: float = 75.0,
+    min_validation_score: Optional[float] = None,
+    max_retries: int = 0,
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None
+) -> Iterator[Tuple[Dict[str, Any], Optional[CVDocument], Dict[str, Any]]]:
+    """
+    Generate CVs for many personas, yielding each as soon as it is finished.
+    
+    One engine for the CLI and the batch/parallel scripts:
+    - personas are read lazily; at most max_in_flight CVs are in flight
+    - reference data is prefetched per chunk of personas (occupations in
+      one query, portraits warmed in the PortraitStore if they are inlined)
+    - CVs run concurrently on a thread pool, so the LLM calls of different
+      CVs overlap instead of waiting for each other
+    - each CV gets its own section memo and metrics scope and up to
+      max_retries section retries (generate_cv_with_section_retries)
+    
+    Stopping the iteration cancels CVs that have not started yet.
+    
+    Args:
+        personas: Personas from sampling (any iterable, e.g. a generator).
+        min_quality: See generate_complete_cv.
+        min_validation_score: See generate_complete_cv.
+        max_retries: Section retries per CV.
+        workers: CVs generated concurrently (default: settings.cv_batch_workers).
+        max_in_flight: Unfinished CVs (running or queued) at any time
+            (default: 2 x workers).
+    
+    Yields:
+        Tuples of (persona, cv_doc or None, report) in completion order.
+        A CV that raised is reported with "stage": "error".
+    """
+    workers = max(1, workers or get_settings().cv_batch_workers)
+    max_in_flight = max(1, max_in_flight or 2 * workers)
+    workers = min(workers, max_in_flight)
+    source = iter(personas)
+    occupations: Dict[str, Dict[str, Any]] = {}
+    running: Dict[Future, Dict[str, Any]] = {}
+    
+    def generate(persona: Dict[str, Any]) -> Tuple[Optional[CVDocument], Dict[str, Any]]:
+        try:
+            return generate_cv_with_section_retries(
+                persona, min_quality, min_validation_score, max_retries,
+                occupation_doc=occupations.get(persona.get("job_id"))
+            )
+        except Exception as e:
+            return None, {"scores": {"overall": 0}, "issues": [f"Error: {e}"], "passed": False, "stage": "error"}
+    
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cv-batch")
+    try:
+        exhausted = False
+        while True:
+            # Refill in chunks (one prefetch per chunk), before a thread would idle
+            if not exhausted and (len(running) < workers or len(running) <= max_in_flight - workers):
+                chunk = list(islice(source, max_in_flight - len(running)))
+                exhausted = not chunk
+                _prefetch_batch_data(chunk, occupations)
+                for persona in chunk:
+                    running[executor.submit(contextvars.copy_context().run, generate, persona)] = persona
+            if not running:
+                return
+            
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                persona = running.pop(future)
+                cv_doc, report = future.result()
+                yield persona, cv_doc, report
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _prefetch_batch_data(personas: List[Dict[str, Any]], occupations: Dict[str, Dict[str, Any]]) -> None:
+    """Load reference data of a chunk of personas in bulk (best effort)."""
+    missing = [p.get("job_id") for p in personas if p.get("job_id") and p.get("job_id") not in occupations]
+    if missing:
+        try:
+            occupations.update(get_occupations_by_ids(missing))
+        except Exception as e:
+            print(f"Warning: Could not prefetch occupations: {e}")
+    
+    if not get_settings().portrait_by_reference:
+        get_portrait_store().warm(p["portrait_path"] for p in personas if p.get("portrait_path"))
+
+
+def _assemble_cv(
+    persona: Dict[str, Any],
+    min_quality: float,
+    min_validation_score: Optional[float],
+    occupation_doc: Optional[Dict[str, Any]] = None
+) -> Tuple[Optional[CVDocument], Optional[Dict[str, Any]]]:
+    """Assemble all CV sections for generate_complete_cv."""
     # 0. Pre-assembly validation
     job_id = persona.get("job_id")
-    occupation_doc = get_occupation_by_id(job_id) if job_id else None
+    if occupation_doc is None and job_id:
+        occupation_doc = get_occupation_by_id(job_id)
     
-    is_valid, fixed_persona, validation_issues = validate_persona_before_assembly(
-        persona, occupation_doc
+    is_valid, fixed_persona, validation_issues = memoize_section(
+        "persona", persona, lambda: validate_persona_before_assembly(persona, occupation_doc)
     )
     
     if not is_valid and len([i for i in validation_issues if i.startswith("Error")]) > 0:
@@ -1192,129 +1391,158 @@ def generate_complete_cv(persona: Dict[str, Any]) -> Tuple[Optional[CVDocument],
     
     persona = fixed_persona
     
-    # Generate all sections
+    # 1. Deterministic skeleton (no LLM calls)
+    cv_doc, bullet_requests = _build_cv_skeleton(persona, occupation_doc)
+    
+    # 2. Cheap gate: reject skeletons that cannot reach the thresholds
+    facts = CVFacts.from_cv(cv_doc)
+    skeleton_report = score_cv_quality(cv_doc, skeleton=True, facts=facts)
+    skeleton_passed = skeleton_report["scores"]["overall"] >= min_quality
+    skeleton_sections: Set[str] = set()
+    if skeleton_passed and min_validation_score is not None:
+        from src.generation.cv_quality_validator import validate_cv_skeleton
+        validation_report = validate_cv_skeleton(cv_doc, persona, min_validation_score, facts=facts)
+        skeleton_report["validation_score"] = validation_report.score.overall
+        skeleton_report["issues"].extend(issue.message for issue in validation_report.issues)
+        skeleton_passed = validation_report.passed
+        skeleton_sections = sections_for_issues(validation_report.issues) & SKELETON_SECTIONS
+    
+    if not skeleton_passed:
+        skeleton_report["passed"] = False
+        skeleton_report["stage"] = "skeleton"
+        # Sections a retry has to regenerate (a low score is mostly timeline and education)
+        skeleton_report["sections"] = sorted(skeleton_sections or {"education", "jobs"})
+        return None, skeleton_report
+    
+    # 3. LLM sections
+    _fill_llm_sections(cv_doc, bullet_requests, persona, occupation_doc)
+    
+    # Post-assembly quality scoring
+    from src.generation.cv_quality_validator import validate_complete_cv
+    if min_validation_score is not None:
+        # One pass yields the quick score and the detailed report the caller needs
+        validation_report = validate_complete_cv(cv_doc, persona, min_validation_score, auto_fix=True, fast_fail=True)
+        quality_report = validation_report.quick
+        quality_report["validation_report"] = validation_report
+    else:
+        validation_report = None
+        quality_report = score_cv_quality(cv_doc)
+    quality_report["passed"] = quality_report["scores"]["overall"] >= min_quality
+    
+    # Only return CV if quality >= min_quality
+    if quality_report["passed"]:
+        return cv_doc, quality_report
+    
+    # Sections a retry has to regenerate
+    if validation_report is None:
+        validation_report = validate_complete_cv(cv_doc, persona, min_quality, auto_fix=False, fast_fail=True)
+    quality_report["sections"] = sorted(sections_for_issues(validation_report.issues))
+    return None, quality_report
+
+
+def _build_cv_skeleton(
+    persona: Dict[str, Any],
+    occupation_doc: Optional[Dict[str, Any]]
+) -> Tuple[CVDocument, List[Dict[str, Any]]]:
+    """Build every deterministic section; summary, responsibilities and hobbies stay empty."""
+    job_id = persona.get("job_id")
     language = persona.get("language", "de")
-    age_group = get_age_group(persona.get("age", 25))
     canton = persona.get("canton", "ZH")
     
-    # 1. Personal information (personalized)
     first_name = persona.get("first_name", "")
     last_name = persona.get("last_name", "")
     full_name = persona.get("full_name", f"{first_name} {last_name}")
     
-    personal_info = generate_personal_info(persona, canton)
-    email = personal_info["email"]
-    phone = personal_info["phone"]
-    city = personal_info["city"]
-    address = personal_info["address"]
-    
-    # 2. Portrait (validated)
-    portrait_path = persona.get("portrait_path")
-    portrait_base64 = load_portrait_image(portrait_path, resize=(150, 150), circular=True)
-    
-    # 3. Summary (varied, specific)
-    summary = generate_varied_summary(persona, occupation_doc, language)
-    
-    # 4. Education history
-    education_history = generate_education_history(persona, occupation_doc)
-    
-    # Extract education parameters for FORWARD timeline calculation
-    education_start_year = None
-    education_duration_years = None
-    bildungstyp = ""
-    if education_history:
-        first_edu = education_history[0]
-        education_start_year = first_edu.get("start_year")
-        education_end_year = first_edu.get("end_year")
-        if education_start_year and education_end_year:
-            education_duration_years = education_end_year - education_start_year
-        bildungstyp = first_edu.get("type", "")
-    
-    # 5. Job history (with FORWARD timeline calculation)
-    job_history = generate_job_history(
-        persona,
-        occupation_doc,
-        language=language,
-        education_start_year=education_start_year,
-        education_duration_years=education_duration_years,
-        bildungstyp=bildungstyp
-    )
-    
-    # Note: Responsibilities are already generated in generate_job_history via batch API call
-    # Only generate if missing (fallback)
-    for job in job_history:
-        if job.get("category") == "gap_filler":
-            continue
-        
-        existing_responsibilities = job.get("responsibilities", [])
-        if existing_responsibilities and len(existing_responsibilities) > 0:
-            # Already has responsibilities from batch generation - keep them!
-            continue
+    # 1. Personal information (personalized)
+    def build_personal(_: Dict[str, Any]) -> Dict[str, str]:
+        return memoize_section("personal", persona, lambda: generate_personal_info(persona, canton))
+    
+    # 2. Education history
+    def build_education(_: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return memoize_section(
+            "education", persona, lambda: generate_education_history(persona, occupation_doc)
+        )
+    
+    # 3. Job history (with FORWARD timeline calculation), bullets come later
+    def build_jobs(done: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        # Extract education parameters for FORWARD timeline calculation
+        education_history = done["education"]
+        education_start_year = None
+        education_duration_years = None
+        bildungstyp = ""
+        if education_history:
+            first_edu = education_history[0]
+            education_start_year = first_edu.get("start_year")
+            education_end_year = first_edu.get("end_year")
+            if education_start_year and education_end_year:
+                education_duration_years = education_end_year - education_start_year
+            bildungstyp = first_edu.get("type", "")
         
-        # Fallback: only if no responsibilities exist
-        if job.get("is_current", False):
-            responsibilities = generate_responsibilities_from_activities(
-                job_id,
-                persona.get("career_level", "mid"),
-                job.get("company", ""),
-                language,
-                num_bullets=4,
-                is_current_job=True
+        return memoize_section(
+            "jobs",
+            [persona, education_start_year, education_duration_years, bildungstyp],
+            lambda: build_job_history_skeleton(
+                persona,
+                occupation_doc,
+                language=language,
+                education_start_year=education_start_year,
+                education_duration_years=education_duration_years,
+                bildungstyp=bildungstyp
             )
+        )
+    
+    # 4. Skills (categorized)
+    def build_skills() -> Dict[str, List[str]]:
+        skills_list = persona.get("skills", [])
+        if isinstance(skills_list, list) and skills_list and isinstance(skills_list[0], str):
+            # Skills are already strings
+            from src.database.queries import get_skills_by_occupation
+            skills_docs = get_skills_by_occupation(job_id) if job_id else []
+            categorized_skills = categorize_skills(skills_docs)
         else:
-            previous_level = "mid" if persona.get("career_level") in ["senior", "lead"] else "junior"
-            responsibilities = generate_responsibilities_from_activities(
-                job_id,
-                previous_level,
-                job.get("company", ""),
-                language,
-                num_bullets=2,
-                is_current_job=False
-            )
+            # Skills are dictionaries
+            categorized_skills = categorize_skills(skills_list)
         
-        job["responsibilities"] = responsibilities
-    
-    # 6. Skills (categorized)
-    skills_list = persona.get("skills", [])
-    if isinstance(skills_list, list) and skills_list and isinstance(skills_list[0], str):
-        # Skills are already strings
-        from src.database.queries import get_skills_by_occupation
-        skills_docs = get_skills_by_occupation(job_id) if job_id else []
-        categorized_skills = categorize_skills(skills_docs)
-    else:
-        # Skills are dictionaries
-        categorized_skills = categorize_skills(skills_list)
-    
-    # Add languages to skills (personalized)
-    languages = generate_personalized_languages(canton, language, persona.get("age", 25))
-    categorized_skills["languages"] = languages
-    
-    # 7. Additional education
-    base_education_end = None
-    if education_history:
-        base_education_end = education_history[0].get("end_year")
-    
-    additional_education = generate_additional_education(
-        persona,
-        occupation_doc,
-        base_education_end_year=base_education_end
-    )
-    
-    # 8. Hobbies (personalized)
-    # Determine occupation type
-    occupation_type = "general"
-    if occupation_doc:
-        berufsfelder = occupation_doc.get("categories", {}).get("berufsfelder", [])
-        if any("informatik" in bf.lower() or "technik" in bf.lower() for bf in berufsfelder):
-            occupation_type = "technical"
-        elif any("kunst" in bf.lower() or "design" in bf.lower() for bf in berufsfelder):
-            occupation_type = "creative"
-        elif any("sozial" in bf.lower() or "pflege" in bf.lower() for bf in berufsfelder):
-            occupation_type = "social"
-    
-    hobbies = generate_personalized_hobbies(canton, language, age_group, occupation_type)
+        # Add languages to skills (personalized)
+        languages = generate_personalized_languages(canton, language, persona.get("age", 25))
+        categorized_skills["languages"] = languages
+        return categorized_skills
+    
+    # 5. Additional education
+    def build_additional_education(done: Dict[str, Any]) -> List[Dict[str, Any]]:
+        education_history = done["education"]
+        base_education_end = education_history[0].get("end_year") if education_history else None
+        return memoize_section(
+            "additional_education",
+            [persona, base_education_end],
+            lambda: generate_additional_education(
+                persona,
+                occupation_doc,
+                base_education_end_year=base_education_end
+            )
+        )
+    
+    # personal || education -> (jobs || additional education) || skills
+    sections = run_section_graph([
+        SectionNode("personal", build_personal),
+        SectionNode("education", build_education),
+        SectionNode("jobs", build_jobs, deps=("education",)),
+        SectionNode("skills", lambda _: memoize_section("skills", persona, build_skills)),
+        SectionNode("additional_education", build_additional_education, deps=("education",)),
+    ])
+    personal_info = sections["personal"]
+    education_history = sections["education"]
+    job_history, bullet_requests = sections["jobs"]
+    categorized_skills = sections["skills"]
+    additional_education = sections["additional_education"]
+    
+    # Portrait (validated)
+    portrait_path = persona.get("portrait_path")
+    portrait_asset_id = make_asset_id(portrait_path, (150, 150), circular=True)
+    portrait_base64 = None
+    if not get_settings().portrait_by_reference:
+        portrait_base64 = load_portrait_image(portrait_path, resize=(150, 150), circular=True)
     
-    # Create CVDocument
     cv_doc = CVDocument(
         first_name=first_name,
         last_name=last_name,
@@ -1322,34 +1550,113 @@ def generate_complete_cv(persona: Dict[str, Any]) -> Tuple[Optional[CVDocument],
         age=persona.get("age", 25),
         gender=persona.get("gender", ""),
         canton=canton,
-        city=city,
-        email=email,
-        phone=phone,
-        address=address,
+        city=personal_info["city"],
+        email=personal_info["email"],
+        phone=personal_info["phone"],
+        address=personal_info["address"],
         portrait_path=portrait_path,
         portrait_base64=portrait_base64,
+        portrait_asset_id=portrait_asset_id,
         current_title=persona.get("current_title", persona.get("occupation", "")),
         industry=persona.get("industry", ""),
         career_level=persona.get("career_level", "mid"),
         years_experience=persona.get("years_experience", 0),
-        summary=summary,
+        summary="",
         education=education_history,
         jobs=job_history,
         skills=categorized_skills,
         additional_education=additional_education,
-        hobbies=hobbies,
+        hobbies=[],
         language=language,
         created_at=datetime.now().isoformat()
     )
-    
-    # Post-assembly quality scoring
-    quality_report = score_cv_quality(cv_doc)
-    
-    # Only return CV if quality >= 75
-    if quality_report["passed"]:
-        return cv_doc, quality_report
-    else:
-        return None, quality_report
+    return cv_doc, bullet_requests
+
+
+def _fill_llm_sections(
+    cv_doc: CVDocument,
+    bullet_requests: List[Dict[str, Any]],
+    persona: Dict[str, Any],
+    occupation_doc: Optional[Dict[str, Any]]
+) -> None:
+    """Add summary, responsibilities and hobbies to a skeleton that passed the gate (in place)."""
+    job_id = persona.get("job_id")
+    language = cv_doc.language
+    canton = cv_doc.canton
+    age_group = get_age_group(cv_doc.age)
+    
+    # Summary (varied, specific)
+    def build_summary(_: Dict[str, Any]) -> str:
+        return memoize_section(
+            "summary", [persona, language], lambda: generate_varied_summary(persona, occupation_doc, language)
+        )
+    
+    # Responsibilities: bullet bank, else ONE batch API call
+    def build_bullets() -> List[List[str]]:
+        fill_job_bullets(bullet_requests, persona, occupation_doc)
+        
+        # Only generate if missing (fallback)
+        for job in cv_doc.jobs:
+            if job.get("category") == "gap_filler":
+                continue
+            
+            existing_responsibilities = job.get("responsibilities", [])
+            if existing_responsibilities and len(existing_responsibilities) > 0:
+                # Already has responsibilities from batch generation - keep them!
+                continue
+            
+            # Fallback: only if no responsibilities exist
+            if job.get("is_current", False):
+                responsibilities = generate_responsibilities_from_activities(
+                    job_id,
+                    persona.get("career_level", "mid"),
+                    job.get("company", ""),
+                    language,
+                    num_bullets=4,
+                    is_current_job=True
+                )
+            else:
+                previous_level = "mid" if persona.get("career_level") in ["senior", "lead"] else "junior"
+                responsibilities = generate_responsibilities_from_activities(
+                    job_id,
+                    previous_level,
+                    job.get("company", ""),
+                    language,
+                    num_bullets=2,
+                    is_current_job=False
+                )
+            
+            job["responsibilities"] = responsibilities
+        return [job.get("responsibilities", []) for job in cv_doc.jobs]
+    
+    bullet_inputs = [
+        [{k: v for k, v in request.items() if k != "job"} for request in bullet_requests],
+        [(job.get("start_date"), job.get("category"), job.get("is_current")) for job in cv_doc.jobs]
+    ]
+    
+    # Hobbies (section bank, else personalized)
+    def build_hobbies() -> List[str]:
+        occupation_type = get_occupation_type(occupation_doc)
+        bank = get_section_bank()
+        hobbies = []
+        if bank and not is_premium_tier(persona):
+            hobbies = bank.draw_hobbies(
+                language, persona.get("industry", ""), persona.get("career_level", "mid"), occupation_type
+            )
+        if not hobbies:
+            hobbies = generate_personalized_hobbies(canton, language, age_group, occupation_type)
+        return hobbies
+    
+    # Independent LLM calls: summary || bullets || hobbies (only bullets touch cv_doc.jobs)
+    sections = run_section_graph([
+        SectionNode("summary", build_summary),
+        SectionNode("bullets", lambda _: memoize_section("bullets", bullet_inputs, build_bullets)),
+        SectionNode("hobbies", lambda _: memoize_section("hobbies", persona, build_hobbies)),
+    ])
+    cv_doc.summary = sections["summary"]
+    for job, responsibilities in zip(cv_doc.jobs, sections["bullets"]):
+        job["responsibilities"] = responsibilities
+    cv_doc.hobbies = sections["hobbies"]
 
 
 def generate_city_for_canton(canton: str) -> str:
@@ -0,0 +1,132 @@
+# src/generation/cv_facts.py
+"""
+Parsed view of a CVDocument shared by all validation checks.
+
+score_cv_quality, validate_complete_cv and validate_cv_skeleton used to walk
+the jobs, education and text of a CV separately and re-parse the same date
+strings in every check. CVFacts traverses the document once: dates become
+integers (year and month index = year * 12 + month - 1), text is collected
+and lower-cased once, and counters used by several checks are precomputed.
+
+Facts describe the CV at the time they were built; checks that auto-fix
+text call `refresh_text()` afterwards.
+"""
+
+import sys
+import re
+from pathlib import Path
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+IMPACT_KEYWORDS = ["reduzierte", "steigerte", "optimierte", "verbesserte", "erhöhte"]
+
+METRIC_PATTERN = re.compile(r'\d+')
+
+
+def parse_date(date_str: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Parse a date string ("YYYY-MM" or "YYYY") once.
+
+    Returns:
+        Tuple of (year, month_index); month_index is year * 12 + month - 1
+        (None if the month is invalid), both None if the year is invalid.
+    """
+    if not date_str:
+        return None, None
+    try:
+        parts = str(date_str).split("-")
+        year = int(parts[0])
+    except (ValueError, AttributeError):
+        return None, None
+    try:
+        month = int(parts[1]) if len(parts) > 1 else 1
+    except ValueError:
+        return year, None
+    if month < 1 or month > 12:
+        return year, None
+    return year, year * 12 + month - 1
+
+
+@dataclass
+class JobFacts:
+    """Parsed dates and text of one job entry (`job` is the entry itself)."""
+    job: Dict[str, Any]
+    start_year: Optional[int]
+    end_year: Optional[int]  # current year for the current job
+    start_month: Optional[int]  # month index
+    end_month: Optional[int]  # month index; current month for the current job
+    position: str  # lower-cased
+    is_current: bool
+    is_gap: bool
+    responsibilities: List[str] = field(default_factory=list)
+
+
+@dataclass
+class CVFacts:
+    """Everything the validation checks read from a CVDocument, parsed once."""
+    jobs: List[JobFacts]  # CV order
+    jobs_by_start: List[JobFacts]  # oldest first (by start year, stable)
+    education_end_year: Optional[int]
+    all_text: List[str] = field(default_factory=list)  # summary + responsibilities
+    all_text_lower: str = ""  # summary and responsibilities joined by spaces
+    total_bullets: int = 0
+    bullets_with_metrics: int = 0
+
+    @classmethod
+    def from_cv(cls, cv_doc: Any) -> "CVFacts":
+        """Build the facts of a CVDocument (one pass over jobs and education)."""
+        now = datetime.now()
+        current_year = now.year
+        current_month = now.year * 12 + now.month - 1
+
+        jobs = []
+        for job in cv_doc.jobs or []:
+            start_year, start_month = parse_date(job.get("start_date"))
+            is_current = bool(job.get("is_current"))
+            if is_current:
+                end_year, end_month = current_year, current_month
+            else:
+                end_year, end_month = parse_date(job.get("end_date"))
+            jobs.append(JobFacts(
+                job=job,
+                start_year=start_year,
+                end_year=end_year,
+                start_month=start_month,
+                end_month=end_month,
+                position=job.get("position", "").lower(),
+                is_current=is_current,
+                is_gap=job.get("category") == "gap_filler"
+            ))
+
+        education_end_years = [edu.get("end_year") for edu in cv_doc.education or [] if edu.get("end_year")]
+        facts = cls(
+            jobs=jobs,
+            jobs_by_start=sorted(jobs, key=lambda j: j.start_year or 2000),
+            education_end_year=max(education_end_years) if education_end_years else None
+        )
+        facts.refresh_text(cv_doc)
+        return facts
+
+    def refresh_text(self, cv_doc: Any) -> None:
+        """Re-read summary and responsibilities (after text auto-fixes)."""
+        self.all_text = [cv_doc.summary] if cv_doc.summary else []
+        parts = [(cv_doc.summary or "").lower()]
+        self.total_bullets = 0
+        self.bullets_with_metrics = 0
+        for job_facts in self.jobs:
+            job_facts.responsibilities = job_facts.job.get("responsibilities", [])
+            self.all_text.extend(job_facts.responsibilities)
+            parts.append(" ".join(job_facts.responsibilities).lower())
+            self.total_bullets += len(job_facts.responsibilities)
+            self.bullets_with_metrics += sum(1 for resp in job_facts.responsibilities if METRIC_PATTERN.search(resp))
+        self.all_text_lower = " ".join(parts)
+
+    @property
+    def current_job(self) -> Optional[JobFacts]:
+        """First job marked as current (CV order)."""
+        return next((j for j in self.jobs if j.is_current), None)
@@ -36,12 +36,14 @@ from src.generation.cv_activities_transformer import (
     generate_all_jobs_bullets_batch,
     extract_activities_from_occupation
 )
+from src.generation.bullet_bank import get_bullet_bank
 from src.generation.company_validator import (
     get_valid_company_for_occupation,
     remove_verschiedene_positionen_entries
 )
 from src.generation.cv_timeline_validator import (
-    calculate_timeline_forward
+    calculate_timeline_forward,
+    job_start_key
 )
 from src.config import get_settings
 
@@ -429,10 +431,7 @@ def ensure_logical_progression(
     progression = level_progression.get(career_level, ["mid", "senior"])
     
     # Sort by start_date (oldest first)
-    sorted_jobs = sorted(
-        job_history,
-        key=lambda j: (int(j.get("start_date", "2000-01").split("-")[0]), int(j.get("start_date", "2000-01").split("-")[1]) if "-" in j.get("start_date", "") else 1)
-    )
+    sorted_jobs = sorted(job_history, key=job_start_key)
     
     # Filter to only real jobs (not gap fillers) for progression logic
     real_jobs = [j for j in sorted_jobs if j.get("category") != "gap_filler"]
@@ -516,12 +515,15 @@ def generate_job_entry_fast(
     
     # Get position title
     used_titles = [j for j in used_companies if isinstance(j, str)]
-    position, _ = get_career_progression_title(
+    position, position_job_id = get_career_progression_title(
         occupation_doc, job_career_level,
         job_index=job_index, total_jobs=total_jobs,
         is_current_job=is_current, used_titles=used_titles
     )
     
+    # Store the position's occupation in period for the bullet lookup
+    period["job_id"] = position_job_id or persona.get("job_id")
+    
     # Get technologies
     job_id = persona.get("job_id")
     if is_current:
@@ -810,6 +812,8 @@ def generate_job_history(
     """
     Generate job history for a persona with realistic timeline and quality.
     
+    Same as build_job_history_skeleton() followed by fill_job_bullets().
+    
     Args:
         persona: Persona dictionary with age, years_experience, job_id, company, etc.
         occupation_doc: Optional occupation document from CV_DATA.
@@ -829,6 +833,48 @@ def generate_job_history(
             "company_match_quality": str
         }
     """
+    if not occupation_doc and persona.get("job_id"):
+        occupation_doc = get_occupation_by_id(persona.get("job_id"))
+    
+    job_history, bullet_requests = build_job_history_skeleton(
+        persona,
+        occupation_doc,
+        language=language,
+        education_start_year=education_start_year,
+        education_duration_years=education_duration_years,
+        bildungstyp=bildungstyp
+    )
+    fill_job_bullets(bullet_requests, persona, occupation_doc)
+    return job_history
+
+
+def build_job_history_skeleton(
+    persona: Dict[str, Any],
+    occupation_doc: Optional[Dict[str, Any]] = None,
+    language: str = "de",
+    education_start_year: Optional[int] = None,
+    education_duration_years: Optional[int] = None,
+    bildungstyp: str = ""
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Build the deterministic part of the job history (timeline, companies, positions).
+    
+    No LLM calls: responsibilities stay empty and are described by bullet
+    requests, which fill_job_bullets() turns into bullets once the skeleton
+    has passed validation.
+    
+    Args:
+        persona: Persona dictionary with age, years_experience, job_id, company, etc.
+        occupation_doc: Optional occupation document from CV_DATA.
+        language: Language code (overridden by persona["language"]).
+        education_start_year: Start year of the first education.
+        education_duration_years: Duration of the first education.
+        bildungstyp: Education type of the first education.
+    
+    Returns:
+        Tuple of (job_history most recent first, bullet_requests). Each bullet
+        request references its entry in job_history under "job".
+    """
     persona_age = persona.get("age", 25)
     years_experience = persona.get("years_experience", 0)
     job_id = persona.get("job_id")
@@ -850,7 +896,7 @@ def generate_job_history(
             "responsibilities": [],
             "technologies": [],
             "category": persona.get("industry", "other")
-        }]
+        }], []
     
     # Use FORWARD timeline calculation from cv_timeline_validator
     # If education parameters not provided, calculate approximate values
@@ -940,29 +986,19 @@ def generate_job_history(
                 num_bullets = max(2, 4 - i)
             
             # Collect data for batch bullet generation
+            job_id = period.get("job_id") or persona.get("job_id")
             real_jobs_data.append({
-                "job_index": len(job_history),  # Track position in job_history
+                "job": job_entry,
+                "job_id": job_id,
                 "position": job_entry.get("position", ""),
                 "career_level": period.get("career_level", persona.get("career_level", "mid")),
                 "company": job_entry.get("company", ""),
-                "activities": extract_activities_from_occupation(persona.get("job_id")),
+                "activities": extract_activities_from_occupation(job_id),
                 "num_bullets": num_bullets
             })
         
         job_history.append(job_entry)
     
-    # PHASE 2: Generate ALL bullets in ONE API call (fast!)
-    if real_jobs_data:
-        occupation_title = persona.get("occupation", occupation_doc.get("title", ""))
-        all_bullets = generate_all_jobs_bullets_batch(real_jobs_data, occupation_title, language)
-        
-        # Assign bullets to jobs
-        for job_data in real_jobs_data:
-            job_idx = job_data["job_index"]
-            bullets = all_bullets.get(real_jobs_data.index(job_data), [])
-            if bullets:
-                job_history[job_idx]["responsibilities"] = bullets
-    
     # Ensure logical progression
     job_history = ensure_logical_progression(job_history, persona.get("career_level", "mid"))
     
@@ -970,15 +1006,57 @@ def generate_job_history(
     job_history = remove_verschiedene_positionen_entries(job_history)
     
     # Sort by start_date (most recent first for CV display)
-    job_history.sort(
-        key=lambda x: (
-            int(x.get("start_date", "2000-01").split("-")[0]),
-            int(x.get("start_date", "2000-01").split("-")[1]) if "-" in x.get("start_date", "") else 1
-        ),
-        reverse=True
-    )
+    job_history.sort(key=job_start_key, reverse=True)
     
-    return job_history
+    # Only request bullets for entries that are still in the history
+    kept_ids = {id(job) for job in job_history}
+    bullet_requests = [job_data for job_data in real_jobs_data if id(job_data["job"]) in kept_ids]
+    
+    return job_history, bullet_requests
+
+
+def fill_job_bullets(
+    bullet_requests: List[Dict[str, Any]],
+    persona: Dict[str, Any],
+    occupation_doc: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Fill the responsibilities of a job history skeleton (in place).
+    
+    Bullets come from the precomputed bank (keyed by each job's own
+    occupation, falling back to the persona's) where possible; the rest are
+    generated in ONE LLM call.
+    
+    Args:
+        bullet_requests: Bullet requests from build_job_history_skeleton().
+        persona: Persona dictionary.
+        occupation_doc: Optional occupation document from CV_DATA.
+    """
+    language = persona.get("language", "de")
+    
+    # PHASE 2a: Draw bullets from the precomputed bank (no API call)
+    bank = get_bullet_bank()
+    llm_jobs_data = []
+    for job_data in bullet_requests:
+        job_id = job_data.get("job_id") or persona.get("job_id")
+        bullets = bank.draw(
+            job_id, job_data["career_level"], language, job_data["num_bullets"]
+        ) if bank else []
+        if bullets:
+            job_data["job"]["responsibilities"] = bullets
+        else:
+            llm_jobs_data.append(job_data)
+    
+    # PHASE 2b: Generate remaining bullets in ONE API call (fast!)
+    if llm_jobs_data:
+        occupation_title = persona.get("occupation", (occupation_doc or {}).get("title", ""))
+        all_bullets = generate_all_jobs_bullets_batch(llm_jobs_data, occupation_title, language)
+        
+        # Assign bullets to jobs
+        for i, job_data in enumerate(llm_jobs_data):
+            bullets = all_bullets.get(i, [])
+            if bullets:
+                job_data["job"]["responsibilities"] = bullets
 
 
 def validate_job_history(
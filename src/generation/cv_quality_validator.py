@@ -23,7 +23,9 @@ from dataclasses import dataclass, field, asdict
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.generation.cv_assembler import CVDocument, get_age_group
+from src.generation.cv_assembler import CVDocument, get_age_group, score_cv_quality
+from src.generation.cv_facts import CVFacts, METRIC_PATTERN
+from src.generation.portrait_store import make_asset_id
 from src.generation.metrics_validator import (
     validate_bullet_metrics,
     validate_job_metric_consistency
@@ -82,6 +84,8 @@ class ValidationReport:
     warnings: int = 0
     info: int = 0
     auto_fixes_applied: List[str] = field(default_factory=list)
+    early_exit: Optional[str] = None  # check after which fast_fail validation stopped
+    quick: Optional[Dict[str, Any]] = None  # score_cv_quality report from the same pass (not exported)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON export."""
@@ -102,11 +106,23 @@ class ValidationReport:
                 "warnings": self.warnings,
                 "info": self.info,
                 "total_issues": len(self.issues),
-                "auto_fixes_applied": self.auto_fixes_applied
+                "auto_fixes_applied": self.auto_fixes_applied,
+                "early_exit": self.early_exit
             }
         }
 
 
+# Order of the checks in validate_complete_cv
+CHECK_ORDER = (
+    "timeline", "portrait", "companies", "text", "achievements", "personalization", "completeness"
+)
+
+# fast_fail order: cheap checks that often reject first, database lookups and file access last
+FAST_FAIL_CHECK_ORDER = (
+    "timeline", "completeness", "text", "achievements", "companies", "personalization", "portrait"
+)
+
+
 def parse_date_to_year(date_str: Optional[str]) -> Optional[int]:
     """Parse date string to year."""
     if not date_str:
@@ -124,7 +140,8 @@ def validate_complete_cv(
     cv_doc: CVDocument,
     persona: Optional[Dict[str, Any]] = None,
     min_score: float = 75.0,
-    auto_fix: bool = True
+    auto_fix: bool = True,
+    fast_fail: bool = False
 ) -> ValidationReport:
     """
     Comprehensive CV validation combining all checks.
@@ -134,113 +151,60 @@ def validate_complete_cv(
         persona: Optional persona dictionary (for additional context).
         min_score: Minimum score to pass (default: 75.0).
         auto_fix: Whether to attempt auto-fixes (default: True).
+        fast_fail: Stop as soon as the CV cannot pass (min_score unreachable
+            or a critical issue). Checks then run cheapest and most likely to
+            reject first, and a rejected report only holds the issues found
+            so far (early_exit names the last check).
+    
+    The CV is parsed once (CVFacts) and shared by all checks; the quick
+    score_cv_quality report of the same pass is attached as `quick`, so
+    callers that need both make one traversal.
     
     Returns:
         ValidationReport with pass/fail and detailed issues.
     """
     issues: List[ValidationIssue] = []
     auto_fixes_applied: List[str] = []
+    facts = CVFacts.from_cv(cv_doc)
+    quick = score_cv_quality(cv_doc, facts=facts)
     
     # Generate CV ID
     cv_id = f"{cv_doc.last_name}_{cv_doc.first_name}_{cv_doc.language}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
     
-    # Initialize scores
-    completeness_score = 100.0
-    realism_score = 100.0
-    language_score = 100.0
-    achievement_score = 100.0
-    
-    # ============================================================================
-    # TIMELINE VALIDATION
-    # ============================================================================
-    timeline_issues = _validate_timeline(cv_doc, persona, auto_fix, auto_fixes_applied)
-    issues.extend(timeline_issues)
-    for issue in timeline_issues:
-        if issue.severity == "critical":
-            realism_score -= issue.score_impact
-        elif issue.severity == "warning":
-            realism_score -= issue.score_impact * 0.5
-    
-    # ============================================================================
-    # PORTRAIT VALIDATION
-    # ============================================================================
-    portrait_issues = _validate_portrait(cv_doc, persona, auto_fix, auto_fixes_applied)
-    issues.extend(portrait_issues)
-    for issue in portrait_issues:
-        if issue.severity == "critical":
-            completeness_score -= issue.score_impact
-        elif issue.severity == "warning":
-            completeness_score -= issue.score_impact * 0.5
-    
-    # ============================================================================
-    # COMPANY VALIDATION
-    # ============================================================================
-    company_issues = _validate_companies(cv_doc, persona, auto_fix, auto_fixes_applied)
-    issues.extend(company_issues)
-    for issue in company_issues:
-        if issue.severity == "critical":
-            realism_score -= issue.score_impact
-        elif issue.severity == "warning":
-            realism_score -= issue.score_impact * 0.5
-    
-    # ============================================================================
-    # TEXT QUALITY VALIDATION
-    # ============================================================================
-    text_issues = _validate_text_quality(cv_doc, auto_fix, auto_fixes_applied)
-    issues.extend(text_issues)
-    for issue in text_issues:
-        if issue.severity == "critical":
-            language_score -= issue.score_impact
-        elif issue.severity == "warning":
-            language_score -= issue.score_impact * 0.5
-    
-    # ============================================================================
-    # ACHIEVEMENT QUALITY VALIDATION
-    # ============================================================================
-    achievement_issues = _validate_achievements(cv_doc, persona)
-    issues.extend(achievement_issues)
-    for issue in achievement_issues:
-        if issue.severity == "critical":
-            achievement_score -= issue.score_impact
-        elif issue.severity == "warning":
-            achievement_score -= issue.score_impact * 0.5
-    
-    # ============================================================================
-    # PERSONALIZATION VALIDATION
-    # ============================================================================
-    personalization_issues = _validate_personalization(cv_doc, persona)
-    issues.extend(personalization_issues)
-    for issue in personalization_issues:
-        if issue.severity == "critical":
-            completeness_score -= issue.score_impact
-        elif issue.severity == "warning":
-            completeness_score -= issue.score_impact * 0.5
-    
-    # ============================================================================
-    # COMPLETENESS CHECKS
-    # ============================================================================
-    completeness_issues = _validate_completeness(cv_doc)
-    issues.extend(completeness_issues)
-    for issue in completeness_issues:
-        if issue.severity == "critical":
-            completeness_score -= issue.score_impact
-        elif issue.severity == "warning":
-            completeness_score -= issue.score_impact * 0.5
-    
-    # Calculate final scores (ensure non-negative)
-    completeness_score = max(0.0, completeness_score)
-    realism_score = max(0.0, realism_score)
-    language_score = max(0.0, language_score)
-    achievement_score = max(0.0, achievement_score)
-    
-    # Calculate overall score
-    score = QualityScore(
-        completeness=completeness_score,
-        realism=realism_score,
-        language=language_score,
-        achievement=achievement_score
-    )
-    score.calculate_overall()
+    # Points deducted per score dimension
+    penalties = {"completeness": 0.0, "realism": 0.0, "language": 0.0, "achievement": 0.0}
+    
+    # Check -> (score dimension, run)
+    checks = {
+        "timeline": ("realism", lambda: _validate_timeline(cv_doc, persona, auto_fix, auto_fixes_applied, facts)),
+        "portrait": ("completeness", lambda: _validate_portrait(cv_doc, persona, auto_fix, auto_fixes_applied)),
+        "companies": ("realism", lambda: _validate_companies(cv_doc, persona, auto_fix, auto_fixes_applied)),
+        "text": ("language", lambda: _validate_text_quality(cv_doc, auto_fix, auto_fixes_applied, facts)),
+        "achievements": ("achievement", lambda: _validate_achievements(cv_doc, persona, facts)),
+        "personalization": ("completeness", lambda: _validate_personalization(cv_doc, persona)),
+        "completeness": ("completeness", lambda: _validate_completeness(cv_doc)),
+    }
+    
+    early_exit = None
+    for name in (FAST_FAIL_CHECK_ORDER if fast_fail else CHECK_ORDER):
+        dimension, run = checks[name]
+        check_issues = run()
+        issues.extend(check_issues)
+        for issue in check_issues:
+            if issue.severity == "critical":
+                penalties[dimension] += issue.score_impact
+            elif issue.severity == "warning":
+                penalties[dimension] += issue.score_impact * 0.5
+        
+        # Later checks only deduct points, so the current score is an upper bound
+        if fast_fail and (
+            any(issue.severity == "critical" for issue in check_issues)
+            or _score_from_penalties(penalties).overall < min_score
+        ):
+            early_exit = name
+            break
+    
+    score = _score_from_penalties(penalties)
     
     # Categorize issues
     critical_issues = len([i for i in issues if i.severity == "critical"])
@@ -248,7 +212,7 @@ def validate_complete_cv(
     info_count = len([i for i in issues if i.severity == "info"])
     
     # Determine if passed
-    passed = score.overall >= min_score and critical_issues == 0
+    passed = early_exit is None and score.overall >= min_score and critical_issues == 0
     
     report = ValidationReport(
         cv_id=cv_id,
@@ -259,75 +223,146 @@ def validate_complete_cv(
         critical_issues=critical_issues,
         warnings=warnings,
         info=info_count,
-        auto_fixes_applied=auto_fixes_applied
+        auto_fixes_applied=auto_fixes_applied,
+        early_exit=early_exit,
+        quick=quick
     )
     
     return report
 
 
+def _score_from_penalties(penalties: Dict[str, float]) -> QualityScore:
+    """QualityScore from the points deducted per dimension (ensure non-negative)."""
+    score = QualityScore(
+        completeness=max(0.0, 100.0 - penalties["completeness"]),
+        realism=max(0.0, 100.0 - penalties["realism"]),
+        language=max(0.0, 100.0 - penalties["language"]),
+        achievement=max(0.0, 100.0 - penalties["achievement"])
+    )
+    score.calculate_overall()
+    return score
+
+
+def validate_cv_skeleton(
+    cv_doc: CVDocument,
+    persona: Optional[Dict[str, Any]] = None,
+    min_score: float = 75.0,
+    auto_fix: bool = True,
+    facts: Optional[CVFacts] = None
+) -> ValidationReport:
+    """
+    Validate a CV skeleton before any LLM text is generated.
+    
+    Runs the checks of validate_complete_cv that only depend on deterministic
+    sections (timeline, portrait, companies, personal data, education,
+    skills). Text and achievement quality depend on LLM text only and count
+    as 100, so the score is an upper bound of the final validate_complete_cv
+    score. Critical issues outside the company check (which auto-fixes them)
+    stay in the finished CV. A skeleton that fails here cannot pass later.
+    
+    Args:
+        cv_doc: CV document without summary, responsibilities and hobbies.
+        persona: Optional persona dictionary (for additional context).
+        min_score: Minimum score the finished CV must reach.
+        auto_fix: Whether to attempt auto-fixes (default: True).
+        facts: Parsed skeleton (built if None).
+    
+    Returns:
+        ValidationReport; passed is True if the skeleton can still pass validate_complete_cv.
+    """
+    issues: List[ValidationIssue] = []
+    auto_fixes_applied: List[str] = []
+    cv_id = f"{cv_doc.last_name}_{cv_doc.first_name}_{cv_doc.language}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    
+    penalties = {"completeness": 0.0, "realism": 0.0, "language": 0.0, "achievement": 0.0}
+    checks = [
+        ("realism", _validate_timeline(cv_doc, persona, auto_fix, auto_fixes_applied, facts)),
+        ("completeness", _validate_portrait(cv_doc, persona, auto_fix, auto_fixes_applied)),
+        ("realism", _validate_companies(cv_doc, persona, auto_fix, auto_fixes_applied)),
+        ("completeness", _validate_personalization(cv_doc, persona)),
+        ("completeness", _validate_completeness(cv_doc, skeleton=True)),
+    ]
+    for dimension, check_issues in checks:
+        issues.extend(check_issues)
+        for issue in check_issues:
+            if issue.severity == "critical":
+                penalties[dimension] += issue.score_impact
+            elif issue.severity == "warning":
+                penalties[dimension] += issue.score_impact * 0.5
+    
+    score = _score_from_penalties(penalties)
+    blocking = [i for i in issues if i.severity == "critical" and i.category != "company"]
+    
+    return ValidationReport(
+        cv_id=cv_id,
+        timestamp=datetime.now().isoformat(),
+        passed=score.overall >= min_score and not blocking,
+        score=score,
+        issues=issues,
+        critical_issues=len([i for i in issues if i.severity == "critical"]),
+        warnings=len([i for i in issues if i.severity == "warning"]),
+        info=len([i for i in issues if i.severity == "info"]),
+        auto_fixes_applied=auto_fixes_applied
+    )
+
+
 def _validate_timeline(
     cv_doc: CVDocument,
     persona: Optional[Dict[str, Any]],
     auto_fix: bool,
-    auto_fixes_applied: List[str]
+    auto_fixes_applied: List[str],
+    facts: Optional[CVFacts] = None
 ) -> List[ValidationIssue]:
     """Validate timeline consistency."""
     issues = []
+    facts = facts or CVFacts.from_cv(cv_doc)
     
     age = cv_doc.age
     years_experience = cv_doc.years_experience
+    current_year = datetime.now().year
     
     # Calculate education end year
-    education_end_year = None
-    if cv_doc.education:
-        education_end_year = max(edu.get("end_year", 0) for edu in cv_doc.education if edu.get("end_year"))
-    
+    education_end_year = facts.education_end_year
     if not education_end_year:
-        education_end_year = datetime.now().year - years_experience - age + 18
+        education_end_year = current_year - years_experience - age + 18
     
     # Calculate total job years
     total_job_years = 0
     total_gap_years = 0
+    sorted_jobs = facts.jobs_by_start
     
-    if cv_doc.jobs:
-        sorted_jobs = sorted(
-            cv_doc.jobs,
-            key=lambda j: parse_date_to_year(j.get("start_date", "2000-01")) or 2000
-        )
+    for i, job in enumerate(sorted_jobs):
+        start_year = job.start_year
+        end_year = job.end_year
         
-        for i, job in enumerate(sorted_jobs):
-            start_year = parse_date_to_year(job.get("start_date"))
-            end_year = parse_date_to_year(job.get("end_date")) if not job.get("is_current") else datetime.now().year
+        if start_year and end_year:
+            duration = end_year - start_year
+            if duration > 0:
+                total_job_years += duration
             
-            if start_year and end_year:
-                duration = end_year - start_year
-                if duration > 0:
-                    total_job_years += duration
-                
-                # Check for gaps
-                if i > 0:
-                    prev_job = sorted_jobs[i - 1]
-                    prev_end = parse_date_to_year(prev_job.get("end_date")) if not prev_job.get("is_current") else datetime.now().year
-                    if prev_end and start_year:
-                        gap = start_year - prev_end
-                        if gap > 1:  # Gap > 12 months
-                            if gap > 3:
-                                issues.append(ValidationIssue(
-                                    category="timeline",
-                                    severity="critical",
-                                    section="jobs",
-                                    field=f"gap_{i}",
-                                    message=f"Unexplained gap of {gap} years between jobs",
-                                    suggested_fix="Add gap filler (Elternzeit, Weiterbildung, etc.)",
-                                    score_impact=15.0,
-                                    auto_fixable=False
-                                ))
-                            else:
-                                total_gap_years += gap - 1  # Count gap years
+            # Check for gaps
+            if i > 0:
+                prev_end = sorted_jobs[i - 1].end_year
+                if prev_end and start_year:
+                    gap = start_year - prev_end
+                    if gap > 1:  # Gap > 12 months
+                        if gap > 3:
+                            issues.append(ValidationIssue(
+                                category="timeline",
+                                severity="critical",
+                                section="jobs",
+                                field=f"gap_{i}",
+                                message=f"Unexplained gap of {gap} years between jobs",
+                                suggested_fix="Add gap filler (Elternzeit, Weiterbildung, etc.)",
+                                score_impact=15.0,
+                                auto_fixable=False
+                            ))
+                        else:
+                            total_gap_years += gap - 1  # Count gap years
     
     # Validate: education_end + job_years + gap_years ≈ age - 15
     expected_total = age - 15
-    actual_total = (datetime.now().year - education_end_year) + total_job_years + total_gap_years
+    actual_total = (current_year - education_end_year) + total_job_years + total_gap_years
     discrepancy = abs(actual_total - expected_total)
     
     if discrepancy > 3:
@@ -345,108 +380,91 @@ def _validate_timeline(
         auto_fixes_applied.append(f"Adjusted timeline by {discrepancy} years")
     
     # Check for overlapping periods
-    if cv_doc.jobs and len(cv_doc.jobs) > 1:
-        sorted_jobs = sorted(
-            cv_doc.jobs,
-            key=lambda j: parse_date_to_year(j.get("start_date", "2000-01")) or 2000
-        )
+    for i in range(len(sorted_jobs) - 1):
+        job1 = sorted_jobs[i]
+        job2 = sorted_jobs[i + 1]
+        end1 = job1.end_year
+        start2 = job2.start_year
         
-        for i in range(len(sorted_jobs) - 1):
-            job1 = sorted_jobs[i]
-            job2 = sorted_jobs[i + 1]
-            
-            end1 = parse_date_to_year(job1.get("end_date")) if not job1.get("is_current") else datetime.now().year
-            start2 = parse_date_to_year(job2.get("start_date"))
-            
-            if end1 and start2 and end1 > start2:
-                issues.append(ValidationIssue(
-                    category="timeline",
-                    severity="critical",
-                    section="jobs",
-                    field=f"overlap_{i}",
-                    message=f"Job overlap: {job1.get('company')} ends {end1} but {job2.get('company')} starts {start2}",
-                    suggested_fix="Fix timeline overlaps",
-                    score_impact=20.0,
-                    auto_fixable=True
-                ))
+        if end1 and start2 and end1 > start2:
+            issues.append(ValidationIssue(
+                category="timeline",
+                severity="critical",
+                section="jobs",
+                field=f"overlap_{i}",
+                message=f"Job overlap: {job1.job.get('company')} ends {end1} but {job2.job.get('company')} starts {start2}",
+                suggested_fix="Fix timeline overlaps",
+                score_impact=20.0,
+                auto_fixable=True
+            ))
     
     # Check career progression
-    if cv_doc.jobs and len(cv_doc.jobs) > 1:
-        job_positions = [j.get("position", "").lower() for j in cv_doc.jobs]
-        has_senior = any("senior" in pos or "lead" in pos or "leiter" in pos for pos in job_positions)
-        has_junior = any("junior" in pos for pos in job_positions)
+    if len(facts.jobs) > 1:
+        job_positions = [j.position for j in facts.jobs]
+        senior_indices = [i for i, pos in enumerate(job_positions) if "senior" in pos or "lead" in pos or "leiter" in pos]
+        junior_indices = [i for i, pos in enumerate(job_positions) if "junior" in pos]
         
-        if has_senior and has_junior:
-            # Check if junior comes after senior (regression)
-            senior_indices = [i for i, pos in enumerate(job_positions) if "senior" in pos or "lead" in pos or "leiter" in pos]
-            junior_indices = [i for i, pos in enumerate(job_positions) if "junior" in pos]
+        # Check if junior comes after senior (regression)
+        if junior_indices and senior_indices and max(junior_indices) > min(senior_indices):
+            issues.append(ValidationIssue(
+                category="timeline",
+                severity="critical",
+                section="jobs",
+                field="career_regression",
+                message="Career regression: Junior position after Senior/Lead",
+                suggested_fix="Fix career progression order",
+                score_impact=15.0,
+                auto_fixable=False
+            ))
+    
+    for job in facts.jobs:
+        # Check age at each position
+        if job.start_year:
+            job_age = age - (current_year - job.start_year)
+            position = job.position
             
-            if junior_indices and senior_indices:
-                if max(junior_indices) > min(senior_indices):
+            if "lead" in position or "leiter" in position:
+                if job_age < 30:
+                    issues.append(ValidationIssue(
+                        category="timeline",
+                        severity="warning",
+                        section="jobs",
+                        field=job.job.get("company", ""),
+                        message=f"Age {job_age} too young for Lead position (min: 30)",
+                        suggested_fix="Adjust position or timeline",
+                        score_impact=10.0,
+                        auto_fixable=False
+                    ))
+            elif "senior" in position:
+                if job_age < 25:
+                    issues.append(ValidationIssue(
+                        category="timeline",
+                        severity="warning",
+                        section="jobs",
+                        field=job.job.get("company", ""),
+                        message=f"Age {job_age} too young for Senior position (min: 25)",
+                        suggested_fix="Adjust position or timeline",
+                        score_impact=5.0,
+                        auto_fixable=False
+                    ))
+        
+        # Check Elternzeit ≤2 years
+        if "elternzeit" in job.job.get("company", "").lower() or "elternzeit" in job.position:
+            end_year = None if job.is_current else job.end_year
+            if job.start_year and end_year:
+                duration = end_year - job.start_year
+                if duration > 2:
                     issues.append(ValidationIssue(
                         category="timeline",
                         severity="critical",
                         section="jobs",
-                        field="career_regression",
-                        message="Career regression: Junior position after Senior/Lead",
-                        suggested_fix="Fix career progression order",
+                        field=job.job.get("company", ""),
+                        message=f"Elternzeit duration {duration} years exceeds maximum of 2 years",
+                        suggested_fix="Reduce Elternzeit duration or split into multiple periods",
                         score_impact=15.0,
                         auto_fixable=False
                     ))
     
-    # Check age at each position
-    if cv_doc.jobs:
-        for job in cv_doc.jobs:
-            start_year = parse_date_to_year(job.get("start_date"))
-            if start_year:
-                job_age = age - (datetime.now().year - start_year)
-                position = job.get("position", "").lower()
-                
-                if "lead" in position or "leiter" in position:
-                    if job_age < 30:
-                        issues.append(ValidationIssue(
-                            category="timeline",
-                            severity="warning",
-                            section="jobs",
-                            field=job.get("company", ""),
-                            message=f"Age {job_age} too young for Lead position (min: 30)",
-                            suggested_fix="Adjust position or timeline",
-                            score_impact=10.0,
-                            auto_fixable=False
-                        ))
-                elif "senior" in position:
-                    if job_age < 25:
-                        issues.append(ValidationIssue(
-                            category="timeline",
-                            severity="warning",
-                            section="jobs",
-                            field=job.get("company", ""),
-                            message=f"Age {job_age} too young for Senior position (min: 25)",
-                            suggested_fix="Adjust position or timeline",
-                            score_impact=5.0,
-                            auto_fixable=False
-                        ))
-    
-    # Check Elternzeit ≤2 years
-    if cv_doc.jobs:
-        for job in cv_doc.jobs:
-            if "elternzeit" in job.get("company", "").lower() or "elternzeit" in job.get("position", "").lower():
-                start_year = parse_date_to_year(job.get("start_date"))
-                end_year = parse_date_to_year(job.get("end_date"))
-                if start_year and end_year:
-                    duration = end_year - start_year
-                    if duration > 2:
-                        issues.append(ValidationIssue(
-                            category="timeline",
-                            severity="critical",
-                            section="jobs",
-                            field=job.get("company", ""),
-                            message=f"Elternzeit duration {duration} years exceeds maximum of 2 years",
-                            suggested_fix="Reduce Elternzeit duration or split into multiple periods",
-                            score_impact=15.0,
-                            auto_fixable=False
-                        ))
-    
     return issues
 
 
@@ -501,13 +519,7 @@ def _validate_portrait(
                 gender = persona.get("gender", cv_doc.gender)
                 new_portrait = sample_portrait_path(gender, age_group)
                 if new_portrait:
-                    cv_doc.portrait_path = new_portrait
-                    # Keep base64 in sync with updated path (prevents wrong photo in exports)
-                    try:
-                        from src.generation.cv_assembler import load_portrait_image
-                        cv_doc.portrait_base64 = load_portrait_image(new_portrait, resize=(150, 150), circular=True)
-                    except Exception:
-                        pass
+                    _replace_portrait(cv_doc, new_portrait)
                     auto_fixes_applied.append(f"Resampled portrait to match age_group {age_group}")
     
     # Check portrait gender matches persona gender
@@ -529,18 +541,25 @@ def _validate_portrait(
                 if auto_fix:
                     new_portrait = sample_portrait_path(gender, age_group)
                     if new_portrait:
-                        cv_doc.portrait_path = new_portrait
-                        # Keep base64 in sync with updated path (prevents wrong photo in exports)
-                        try:
-                            from src.generation.cv_assembler import load_portrait_image
-                            cv_doc.portrait_base64 = load_portrait_image(new_portrait, resize=(150, 150), circular=True)
-                        except Exception:
-                            pass
+                        _replace_portrait(cv_doc, new_portrait)
                         auto_fixes_applied.append(f"Resampled portrait to match gender {gender}")
     
     return issues
 
 
+def _replace_portrait(cv_doc: CVDocument, new_portrait: str) -> None:
+    """Point the CV at another portrait, keeping reference and inlined base64 in sync."""
+    cv_doc.portrait_path = new_portrait
+    cv_doc.portrait_asset_id = make_asset_id(new_portrait, (150, 150), circular=True)
+    # Keep base64 in sync with updated path (prevents wrong photo in exports)
+    if cv_doc.portrait_base64:
+        try:
+            from src.generation.cv_assembler import load_portrait_image
+            cv_doc.portrait_base64 = load_portrait_image(new_portrait, resize=(150, 150), circular=True)
+        except Exception:
+            pass
+
+
 def _validate_companies(
     cv_doc: CVDocument,
     persona: Optional[Dict[str, Any]],
@@ -643,23 +662,16 @@ def _validate_companies(
 def _validate_text_quality(
     cv_doc: CVDocument,
     auto_fix: bool,
-    auto_fixes_applied: List[str]
+    auto_fixes_applied: List[str],
+    facts: Optional[CVFacts] = None
 ) -> List[ValidationIssue]:
     """Validate text quality (duplicates, capitalization, verb variety)."""
     issues = []
-    
-    # Collect all text
-    all_text = []
-    if cv_doc.summary:
-        all_text.append(cv_doc.summary)
-    
-    if cv_doc.jobs:
-        for job in cv_doc.jobs:
-            responsibilities = job.get("responsibilities", [])
-            all_text.extend(responsibilities)
+    facts = facts or CVFacts.from_cv(cv_doc)
+    fixes_before = len(auto_fixes_applied)
     
     # Check for duplicate phrases
-    for text in all_text:
+    for text in list(facts.all_text):
         text_lower = text.lower()
         # Check for repeated phrases (e.g., "verantwortung für verantwortung")
         duplicate_pattern = re.search(r'\b(\w+(?:\s+\w+){1,3})\s+\1\b', text_lower)
@@ -687,12 +699,14 @@ def _validate_text_quality(
                             ]
                             auto_fixes_applied.append(f"Removed duplicate phrase from responsibility")
                             break
+    if len(auto_fixes_applied) > fixes_before:
+        facts.refresh_text(cv_doc)
     
     # Check capitalization
     if cv_doc.jobs:
-        for job in cv_doc.jobs:
-            responsibilities = job.get("responsibilities", [])
-            for i, resp in enumerate(responsibilities):
+        for job_facts in facts.jobs:
+            job = job_facts.job
+            for i, resp in enumerate(job_facts.responsibilities):
                 if resp and not resp[0].isupper():
                     issues.append(ValidationIssue(
                         category="text",
@@ -711,9 +725,8 @@ def _validate_text_quality(
     # Check verb variety (≥70% unique)
     if cv_doc.jobs:
         all_verbs = []
-        for job in cv_doc.jobs:
-            responsibilities = job.get("responsibilities", [])
-            for resp in responsibilities:
+        for job_facts in facts.jobs:
+            for resp in job_facts.responsibilities:
                 first_word = resp.split()[0] if resp.split() else ""
                 if first_word:
                     all_verbs.append(first_word.lower())
@@ -734,11 +747,11 @@ def _validate_text_quality(
     
     # Check "Erfolgreich" spam (max 20% of bullets)
     if cv_doc.jobs:
-        total_bullets = sum(len(job.get("responsibilities", [])) for job in cv_doc.jobs)
+        total_bullets = facts.total_bullets
         erfolg_count = sum(
             resp.lower().count("erfolgreich")
-            for job in cv_doc.jobs
-            for resp in job.get("responsibilities", [])
+            for job_facts in facts.jobs
+            for resp in job_facts.responsibilities
         )
         
         if total_bullets > 0:
@@ -755,32 +768,33 @@ def _validate_text_quality(
                     auto_fixable=False
                 ))
     
+    if len(auto_fixes_applied) > fixes_before:
+        facts.refresh_text(cv_doc)
     return issues
 
 
 def _validate_achievements(
     cv_doc: CVDocument,
-    persona: Optional[Dict[str, Any]]
+    persona: Optional[Dict[str, Any]],
+    facts: Optional[CVFacts] = None
 ) -> List[ValidationIssue]:
     """Validate achievement quality (metrics, impact, progression)."""
     issues = []
     
     if not cv_doc.jobs:
         return issues
+    facts = facts or CVFacts.from_cv(cv_doc)
     
     # Check ≥60% of bullets have metrics AND validate metric realism
-    total_bullets = 0
-    bullets_with_metrics = 0
+    total_bullets = facts.total_bullets
+    bullets_with_metrics = facts.bullets_with_metrics
     invalid_metrics_count = 0
     career_level = persona.get("career_level", "mid") if persona else "mid"
     
-    for job in cv_doc.jobs:
-        responsibilities = job.get("responsibilities", [])
-        for resp in responsibilities:
-            total_bullets += 1
+    for job_facts in facts.jobs:
+        for resp in job_facts.responsibilities:
             # Check for numbers (metrics)
-            if re.search(r'\d+', resp):
-                bullets_with_metrics += 1
+            if METRIC_PATTERN.search(resp):
                 # Validate metric realism using metrics_validator
                 is_valid, error_msg, _ = validate_bullet_metrics(resp, career_level)
                 if not is_valid:
@@ -811,8 +825,8 @@ def _validate_achievements(
             ))
     
     # Validate job metric consistency
-    for job in cv_doc.jobs:
-        responsibilities = job.get("responsibilities", [])
+    for job_facts in facts.jobs:
+        responsibilities = job_facts.responsibilities
         if len(responsibilities) > 1:
             is_consistent, consistency_issues, _ = validate_job_metric_consistency(
                 responsibilities, career_level
@@ -831,15 +845,12 @@ def _validate_achievements(
     
     # Check for impact language
     impact_keywords = ["reduzierte", "steigerte", "optimierte", "verbesserte", "erhöhte", "senkte"]
-    has_impact = False
-    for job in cv_doc.jobs:
-        responsibilities = job.get("responsibilities", [])
-        for resp in responsibilities:
-            if any(kw in resp.lower() for kw in impact_keywords):
-                has_impact = True
-                break
-        if has_impact:
-            break
+    has_impact = any(
+        kw in resp.lower()
+        for job_facts in facts.jobs
+        for resp in job_facts.responsibilities
+        for kw in impact_keywords
+    )
     
     if not has_impact and total_bullets > 0:
         issues.append(ValidationIssue(
@@ -856,18 +867,18 @@ def _validate_achievements(
     # Check progression (newer jobs should have more complex achievements)
     if len(cv_doc.jobs) > 1:
         sorted_jobs = sorted(
-            cv_doc.jobs,
-            key=lambda j: parse_date_to_year(j.get("start_date", "2000-01")) or 2000,
+            facts.jobs,
+            key=lambda j: j.start_year or 2000,
             reverse=True  # Most recent first
         )
         
         # Current job should have most responsibilities
         if sorted_jobs:
             current_job = sorted_jobs[0]
-            current_resp_count = len(current_job.get("responsibilities", []))
+            current_resp_count = len(current_job.responsibilities)
             
             for job in sorted_jobs[1:]:
-                resp_count = len(job.get("responsibilities", []))
+                resp_count = len(job.responsibilities)
                 if resp_count > current_resp_count:
                     issues.append(ValidationIssue(
                         category="achievement",
@@ -974,8 +985,8 @@ def _validate_personalization(
     return issues
 
 
-def _validate_completeness(cv_doc: CVDocument) -> List[ValidationIssue]:
-    """Validate completeness of CV sections."""
+def _validate_completeness(cv_doc: CVDocument, skeleton: bool = False) -> List[ValidationIssue]:
+    """Validate completeness of CV sections (skeleton: skip LLM-written summary and responsibilities)."""
     issues = []
     
     # Check required sections
@@ -991,7 +1002,7 @@ def _validate_completeness(cv_doc: CVDocument) -> List[ValidationIssue]:
             auto_fixable=False
         ))
     
-    if not cv_doc.summary or len(cv_doc.summary.strip()) < 50:
+    if not skeleton and (not cv_doc.summary or len(cv_doc.summary.strip()) < 50):
         issues.append(ValidationIssue(
             category="completeness",
             severity="warning",
@@ -1028,7 +1039,7 @@ def _validate_completeness(cv_doc: CVDocument) -> List[ValidationIssue]:
         ))
     
     # Check minimum content per job
-    if cv_doc.jobs:
+    if cv_doc.jobs and not skeleton:
         for i, job in enumerate(cv_doc.jobs):
             if job.get("category") == "gap_filler":
                 continue
@@ -0,0 +1,120 @@
+# src/generation/cv_stream.py
+"""
+CVs as a Python stream, for embedding the generator in other pipelines.
+
+iter_cvs() samples personas and yields finished CVs one by one (no files
+are written). It runs on generate_complete_cv_batch with bounded in-flight
+work: at most `concurrency` CVs are unfinished at any time, personas are
+sampled only when a slot frees up, and CVs are only started for results
+that are still missing, so memory stays flat and no LLM work is thrown
+away. Stopping the iteration (break, close()) cancels everything that has
+not started yet.
+"""
+
+import sys
+import random
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import get_settings
+from src.generation.cv_assembler import CVDocument, generate_complete_cv_batch
+
+# Age ranges of the age_group filter
+AGE_GROUP_RANGES = {"18-25": (18, 25), "26-40": (26, 40), "41-65": (41, 65)}
+
+
+def persona_matches(persona: Dict[str, Any], filters: Optional[Dict[str, Optional[str]]]) -> bool:
+    """
+    Check if persona matches filters.
+
+    Args:
+        persona: Persona dictionary.
+        filters: Any of industry, career_level, age_group ("18-25", "26-40",
+            "41-65") and language; None values are ignored.
+
+    Returns:
+        True if persona matches all filters.
+    """
+    filters = filters or {}
+    for key in ("industry", "career_level", "language"):
+        if filters.get(key) and persona.get(key) != filters[key]:
+            return False
+
+    age_range = AGE_GROUP_RANGES.get(filters.get("age_group") or "")
+    if age_range and not (age_range[0] <= persona.get("age", 0) <= age_range[1]):
+        return False
+    return True
+
+
+def iter_cvs(
+    count: int,
+    filters: Optional[Dict[str, Optional[str]]] = None,
+    seed: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    as_dict: bool = False,
+    min_quality: float = 75.0,
+    max_retries: int = 3,
+    max_attempts: Optional[int] = None
+) -> Iterator[Union[CVDocument, Dict[str, Any]]]:
+    """
+    Generate CVs and yield each as soon as it is finished.
+
+    CVs that fail the quality checks (after max_retries section retries)
+    are skipped; generation stops after `count` CVs or `max_attempts`
+    sampled personas.
+
+    Args:
+        count: Number of CVs to yield.
+        filters: Persona filters (see persona_matches).
+        seed: Seeds the module-level random used for sampling. Personas are
+            reproducible with concurrency=1; concurrent CVs draw from the
+            same random, so their order and content may vary.
+        concurrency: Maximum unfinished CVs (default: settings.cv_batch_workers).
+        as_dict: Yield CVDocument.to_dict() dictionaries instead of CVDocuments.
+        min_quality: Minimum quality score (see generate_complete_cv).
+        max_retries: Section retries per CV.
+        max_attempts: Personas to sample at most (default: 3 x count).
+
+    Yields:
+        CVDocuments (or dictionaries) in completion order.
+    """
+    from src.generation.sampling import SamplingEngine
+
+    if seed is not None:
+        random.seed(seed)
+    filters = filters or {}
+    concurrency = max(1, concurrency or get_settings().cv_batch_workers)
+    engine = SamplingEngine()
+    attempts_left = max_attempts if max_attempts is not None else 3 * count
+    produced = 0
+
+    def sample_personas(needed: int) -> Iterator[Dict[str, Any]]:
+        nonlocal attempts_left
+        while needed > 0 and attempts_left > 0:
+            attempts_left -= 1
+            persona = engine.sample_persona(preferred_industry=filters.get("industry"))
+            if persona_matches(persona, filters):
+                needed -= 1
+                yield persona
+
+    # Each round starts only as many CVs as are still missing; failed CVs get a next round
+    while produced < count and attempts_left > 0:
+        results = generate_complete_cv_batch(
+            sample_personas(count - produced),
+            min_quality=min_quality,
+            max_retries=max_retries,
+            workers=concurrency,
+            max_in_flight=concurrency
+        )
+        try:
+            for _, cv_doc, _ in results:
+                if cv_doc is None:
+                    continue
+                produced += 1
+                yield cv_doc.to_dict() if as_dict else cv_doc
+        finally:
+            results.close()
@@ -8,6 +8,10 @@ This module validates and fixes CV timeline consistency:
 - Remove "Verschiedene Positionen" entries
 - Current date awareness (CURRENT_DATE = 2024-11-28)
 
+Dates are "YYYY-MM" strings in CV entries only; checks and auto-fixes work on
+integer month indices (year * 12 + month - 1, see JobTimeline) and convert
+back to strings when writing entries.
+
 Run: Used by CV generation pipeline BEFORE job generation
 """
 import sys
@@ -25,6 +29,10 @@ sys.path.insert(0, str(project_root))
 CURRENT_DATE = date.today()
 CURRENT_YEAR = CURRENT_DATE.year
 CURRENT_MONTH = CURRENT_DATE.month
+CURRENT_MONTH_INDEX = CURRENT_YEAR * 12 + CURRENT_MONTH - 1
+
+# Sort position of jobs without a valid start date (as "2000-01")
+DEFAULT_START_INDEX = 2000 * 12
 
 
 @dataclass
@@ -141,21 +149,106 @@ def compare_dates(date1_str: str, date2_str: str) -> int:
     Returns:
         -1 if date1 < date2, 0 if equal, 1 if date1 > date2.
     """
-    year1, month1 = parse_date_string(date1_str)
-    year2, month2 = parse_date_string(date2_str)
+    index1 = date_to_month_index(date1_str)
+    index2 = date_to_month_index(date2_str)
     
-    if year1 is None or year2 is None:
+    if index1 is None or index2 is None:
         return 0
+    return (index1 > index2) - (index1 < index2)
+
+
+def month_index(year: int, month: int = 1) -> int:
+    """Month index of a year and month (year * 12 + month - 1)."""
+    return year * 12 + month - 1
+
+
+def date_to_month_index(date_str: Optional[str]) -> Optional[int]:
+    """
+    Parse date string (YYYY-MM) to a month index.
+    
+    Args:
+        date_str: Date string in format "YYYY-MM" or "YYYY".
+    
+    Returns:
+        Month index or None if invalid.
+    """
+    year, month = parse_date_string(date_str)
+    if year is None:
+        return None
+    return month_index(year, month)
+
+
+def month_index_to_date_string(index: int) -> str:
+    """Convert a month index back to "YYYY-MM"."""
+    year, month0 = divmod(index, 12)
+    return year_to_date_string(year, month0 + 1)
+
+
+def job_start_key(job: Dict[str, Any]) -> int:
+    """Sort key of a job entry: month index of its start date."""
+    index = date_to_month_index(job.get("start_date"))
+    return DEFAULT_START_INDEX if index is None else index
+
+
+@dataclass
+class JobTimeline:
+    """
+    Job periods as integer month indices, sorted by start (oldest first).
+    
+    Current jobs and jobs without end date end at CURRENT_MONTH_INDEX. Jobs
+    whose dates cannot be parsed are kept in `skipped`.
+    """
+    jobs: List[Dict[str, Any]]
+    starts: List[int]
+    ends: List[int]
+    skipped: List[Dict[str, Any]]
+    
+    @classmethod
+    def from_jobs(cls, job_history: List[Dict[str, Any]]) -> "JobTimeline":
+        """Parse the dates of job entries once."""
+        periods = []
+        skipped = []
+        for job in job_history:
+            start = date_to_month_index(job.get("start_date"))
+            if job.get("is_current") or not job.get("end_date"):
+                end = CURRENT_MONTH_INDEX
+            else:
+                end = date_to_month_index(job.get("end_date"))
+            if start is None or end is None:
+                skipped.append(job)
+            else:
+                periods.append((start, end, job))
+        periods.sort(key=lambda p: p[0])
+        return cls(
+            jobs=[p[2] for p in periods],
+            starts=[p[0] for p in periods],
+            ends=[p[1] for p in periods],
+            skipped=skipped
+        )
+    
+    def __len__(self) -> int:
+        return len(self.jobs)
     
-    if year1 < year2:
-        return -1
-    elif year1 > year2:
-        return 1
-    elif month1 < month2:
-        return -1
-    elif month1 > month2:
-        return 1
-    return 0
+    def total_months(self) -> int:
+        """Sum of the job durations in months."""
+        return sum(end - start for start, end in zip(self.starts, self.ends))
+    
+    def sweep(self) -> List[Tuple[int, int, int]]:
+        """
+        Compare each period with the latest end of all earlier ones (sort-and-sweep).
+        
+        Returns:
+            List of (covering_index, index, months) for every period after the
+            first: months < 0 is an overlap with the covering period, months
+            > 0 a gap after it.
+        """
+        result = []
+        covering = 0
+        for i in range(1, len(self.jobs)):
+            result.append((covering, i, self.starts[i] - self.ends[covering]))
+            if self.ends[i] > self.ends[covering]:
+                covering = i
+        return result
 
 
 def calculate_timeline_forward(
@@ -389,48 +482,7 @@ def calculate_total_job_years(job_history: List[Dict[str, Any]]) -> float:
     Returns:
         Total years as float.
     """
-    total_years = 0.0
-    current_year = CURRENT_YEAR
-    current_month = CURRENT_MONTH
-    
-    for job in job_history:
-        start_date = job.get("start_date")
-        end_date = job.get("end_date")
-        is_current = job.get("is_current", False)
-        
-        if not start_date:
-            continue
-        
-        start_year = parse_date_to_year(start_date)
-        if not start_year:
-            continue
-        
-        if is_current or not end_date:
-            # Current job: calculate to present
-            end_year = current_year
-            end_month = current_month
-        else:
-            end_year = parse_date_to_year(end_date)
-            if not end_year:
-                continue
-            # Estimate month from date string
-            try:
-                end_month = int(end_date.split("-")[1]) if "-" in end_date else 6
-            except:
-                end_month = 6
-        
-        # Estimate start month
-        try:
-            start_month = int(start_date.split("-")[1]) if "-" in start_date else 1
-        except:
-            start_month = 1
-        
-        # Calculate duration in years
-        years = end_year - start_year
-        months = end_month - start_month
-        total_years += years + (months / 12.0)
-    
-    return total_years
+    return JobTimeline.from_jobs(job_history).total_months() / 12.0
 
 
 def check_job_overlaps(job_history: List[Dict[str, Any]]) -> List[TimelineIssue]:
@@ -446,56 +498,45 @@ def check_job_overlaps(job_history: List[Dict[str, Any]]) -> List[TimelineIssue]
         List of overlap issues.
     """
     issues = []
-    
-    # Sort jobs by start date
-    sorted_jobs = sorted(
-        job_history,
-        key=lambda j: parse_date_to_year(j.get("start_date", "2000-01")) or 2000
-    )
-    
-    for i in range(len(sorted_jobs) - 1):
-        job1 = sorted_jobs[i]
-        job2 = sorted_jobs[i + 1]
-        
-        start1_year, start1_month = parse_date_string(job1.get("start_date", ""))
-        end1_year, end1_month = parse_date_string(job1.get("end_date", ""))
-        if job1.get("is_current") or not end1_year:
-            end1_year, end1_month = CURRENT_YEAR, CURRENT_MONTH
-        
-        start2_year, start2_month = parse_date_string(job2.get("start_date", ""))
-        
-        if not all([start1_year, start2_year]):
-            continue
-        
-        # STRICT VALIDATION: start_date < end_date (ALWAYS)
-        if end1_year and (end1_year < start1_year or (end1_year == start1_year and end1_month <= start1_month)):
+    timeline = JobTimeline.from_jobs(job_history)
+    
+    # Per-job rules; only valid periods take part in the overlap sweep
+    valid = []
+    for job, start, end in zip(timeline.jobs, timeline.starts, timeline.ends):
+        # STRICT VALIDATION: start_date < end_date (current jobs may start this month)
+        is_current = job.get("is_current") or not job.get("end_date")
+        if end < start or (end == start and not is_current):
             issues.append(TimelineIssue(
                 severity="error",
                 category="overlap",
-                message=f"Job {job1.get('company')}: start ({start1_year}-{start1_month:02d}) >= end ({end1_year}-{end1_month:02d})",
-                affected_periods=[(start1_year, end1_year)],
+                message=f"Job {job.get('company')}: start ({month_index_to_date_string(start)}) >= end ({month_index_to_date_string(end)})",
+                affected_periods=[(start // 12, end // 12)],
                 suggested_fix="REJECT timeline, regenerate"
             ))
-            continue
-        
         # STRICT VALIDATION: end_date ≤ CURRENT_DATE
-        if end1_year > CURRENT_YEAR or (end1_year == CURRENT_YEAR and end1_month > CURRENT_MONTH):
+        elif end > CURRENT_MONTH_INDEX:
             issues.append(TimelineIssue(
                 severity="error",
                 category="age",
-                message=f"Job {job1.get('company')}: end date ({end1_year}-{end1_month:02d}) is in the future",
+                message=f"Job {job.get('company')}: end date ({month_index_to_date_string(end)}) is in the future",
                 affected_periods=[],
                 suggested_fix="REJECT timeline, regenerate"
             ))
-            continue
-        
-        # STRICT VALIDATION: next_job_start ≥ previous_job_end (no overlaps)
-        if start2_year < end1_year or (start2_year == end1_year and start2_month < end1_month):
+        else:
+            valid.append(job)
+    
+    # STRICT VALIDATION: next_job_start ≥ previous_job_end (no overlaps)
+    if len(valid) < len(timeline):
+        timeline = JobTimeline.from_jobs(valid)
+    for covering, i, months in timeline.sweep():
+        if months < 0:
+            end1 = timeline.ends[covering]
+            start2 = timeline.starts[i]
             issues.append(TimelineIssue(
                 severity="error",
                 category="overlap",
-                message=f"Overlap: {job1.get('company')} ends ({end1_year}-{end1_month:02d}) > {job2.get('company')} starts ({start2_year}-{start2_month:02d})",
-                affected_periods=[(end1_year, start2_year)],
+                message=f"Overlap: {timeline.jobs[covering].get('company')} ends ({month_index_to_date_string(end1)}) > {timeline.jobs[i].get('company')} starts ({month_index_to_date_string(start2)})",
+                affected_periods=[(end1 // 12, start2 // 12)],
                 suggested_fix="REJECT timeline, regenerate"
             ))
     
@@ -519,61 +560,46 @@ def check_gaps(
         List of gap issues.
     """
     issues = []
-    current_year = CURRENT_YEAR
-    
-    # Get education end year
-    education_end = None
-    if education_history:
-        education_end = max([e.get("end_year", 0) for e in education_history])
-    
-    # Get first job start
-    first_job_start = None
-    if job_history:
-        sorted_jobs = sorted(
-            job_history,
-            key=lambda j: parse_date_to_year(j.get("start_date", "2000-01")) or 2000
-        )
-        first_job_start = parse_date_to_year(sorted_jobs[0].get("start_date"))
+    timeline = JobTimeline.from_jobs(job_history)
     
     # Check gap between education and first job
-    if education_end and first_job_start:
-        gap_years = first_job_start - education_end
-        if gap_years > 0 and gap_years * 12 > max_gap_months:
+    education_end = _education_end_index(education_history)
+    if education_end is not None and len(timeline):
+        gap_months = timeline.starts[0] - education_end
+        if gap_months > max_gap_months:
             issues.append(TimelineIssue(
                 severity="warning",
                 category="gap",
-                message=f"Large gap between education end ({education_end}) and first job ({first_job_start}): {gap_years} years",
-                affected_periods=[(education_end, first_job_start)],
+                message=f"Large gap between education end ({month_index_to_date_string(education_end)}) and first job ({month_index_to_date_string(timeline.starts[0])}): {gap_months} months",
+                affected_periods=[(education_end // 12, timeline.starts[0] // 12)],
                 suggested_fix="Insert gap filler: 'Sabbatical / Weiterbildung' or 'Freelance Projekte'"
             ))
     
     # Check gaps between jobs
-    sorted_jobs = sorted(
-        job_history,
-        key=lambda j: parse_date_to_year(j.get("start_date", "2000-01")) or 2000
-    )
-    
-    for i in range(len(sorted_jobs) - 1):
-        job1 = sorted_jobs[i]
-        job2 = sorted_jobs[i + 1]
-        
-        end1 = parse_date_to_year(job1.get("end_date")) if not job1.get("is_current") else current_year
-        start2 = parse_date_to_year(job2.get("start_date"))
-        
-        if end1 and start2:
-            gap_years = start2 - end1
-            if gap_years > 0 and gap_years * 12 > max_gap_months:
-                issues.append(TimelineIssue(
-                    severity="warning",
-                    category="gap",
-                    message=f"Gap between {job1.get('company')} ({end1}) and {job2.get('company')} ({start2}): {gap_years} years",
-                    affected_periods=[(end1, start2)],
-                    suggested_fix="Insert gap filler: 'Elternzeit', 'Sabbatical / Weiterbildung', or 'Freelance Projekte'"
-                ))
+    for covering, i, gap_months in timeline.sweep():
+        if gap_months > max_gap_months:
+            end1 = timeline.ends[covering]
+            start2 = timeline.starts[i]
+            issues.append(TimelineIssue(
+                severity="warning",
+                category="gap",
+                message=f"Gap between {timeline.jobs[covering].get('company')} ({month_index_to_date_string(end1)}) and {timeline.jobs[i].get('company')} ({month_index_to_date_string(start2)}): {gap_months} months",
+                affected_periods=[(end1 // 12, start2 // 12)],
+                suggested_fix="Insert gap filler: 'Elternzeit', 'Sabbatical / Weiterbildung', or 'Freelance Projekte'"
+            ))
     
     return issues
 
 
+def _education_end_index(education_history: List[Dict[str, Any]]) -> Optional[int]:
+    """Month index of the latest education end (end_month defaults to 6)."""
+    ends = [e for e in education_history or [] if e.get("end_year")]
+    if not ends:
+        return None
+    latest = max(ends, key=lambda e: e.get("end_year"))
+    return month_index(latest["end_year"], latest.get("end_month") or 6)
+
+
 def check_career_progression(job_history: List[Dict[str, Any]]) -> List[TimelineIssue]:
     """
     Check for logical career progression (no Senior → Junior regression).
@@ -595,10 +621,7 @@ def check_career_progression(job_history: List[Dict[str, Any]]) -> List[Timeline
     }
     
     # Sort jobs chronologically (oldest first)
-    sorted_jobs = sorted(
-        job_history,
-        key=lambda j: parse_date_to_year(j.get("start_date", "2000-01")) or 2000
-    )
+    sorted_jobs = sorted(job_history, key=job_start_key)
     
     previous_level = None
     
@@ -721,35 +744,17 @@ def check_job_durations(job_history: List[Dict[str, Any]]) -> List[TimelineIssue
         List of duration issues.
     """
     issues = []
-    current_year = CURRENT_YEAR
+    timeline = JobTimeline.from_jobs(job_history)
     
-    for job in job_history:
-        start_date = job.get("start_date")
-        end_date = job.get("end_date")
-        is_current = job.get("is_current", False)
-        
-        if not start_date:
-            continue
-        
-        start_year = parse_date_to_year(start_date)
-        if not start_year:
-            continue
-        
-        if is_current or not end_date:
-            end_year = current_year
-        else:
-            end_year = parse_date_to_year(end_date)
-            if not end_year:
-                continue
-        
-        duration = end_year - start_year
+    for job, start, end in zip(timeline.jobs, timeline.starts, timeline.ends):
+        duration = (end - start) / 12.0
         
         if duration < 0.5:
             issues.append(TimelineIssue(
                 severity="warning",
                 category="duration",
                 message=f"Job at {job.get('company')} too short: {duration:.1f} years (min: 0.5)",
-                affected_periods=[(start_year, end_year)],
+                affected_periods=[(start // 12, end // 12)],
                 suggested_fix="Extend job duration to at least 0.5 years"
             ))
         elif duration > 10:
@@ -757,7 +762,7 @@ def check_job_durations(job_history: List[Dict[str, Any]]) -> List[TimelineIssue
                 severity="info",
                 category="duration",
                 message=f"Job at {job.get('company')} very long: {duration:.1f} years (typical max: 10)",
-                affected_periods=[(start_year, end_year)],
+                affected_periods=[(start // 12, end // 12)],
                 suggested_fix="Consider splitting into multiple positions or adjusting dates"
             ))
     
@@ -768,45 +773,42 @@ def auto_fix_overlaps(job_history: List[Dict[str, Any]]) -> List[Dict[str, Any]]
     """
     Auto-fix overlapping job periods.
     
+    Each job is compared with the latest-ending earlier job (the same
+    sort-and-sweep as check_job_overlaps), not just its predecessor.
+    
     Args:
         job_history: List of job entries.
     
     Returns:
         Fixed job history.
     """
-    fixed = []
-    current_year = CURRENT_YEAR
+    timeline = JobTimeline.from_jobs(job_history)
+    starts, ends = timeline.starts, timeline.ends
     
-    # Sort jobs by start date
-    sorted_jobs = sorted(
-        job_history,
-        key=lambda j: parse_date_to_year(j.get("start_date", "2000-01")) or 2000
-    )
-    
-    for i, job in enumerate(sorted_jobs):
-        start = parse_date_to_year(job.get("start_date"))
-        end = parse_date_to_year(job.get("end_date")) if not job.get("is_current") else current_year
+    covering = 0
+    for i in range(1, len(timeline)):
+        prev_job, job = timeline.jobs[covering], timeline.jobs[i]
         
-        if i > 0:
-            # Check overlap with previous job
-            prev_job = sorted_jobs[i - 1]
-            prev_start = parse_date_to_year(prev_job.get("start_date"))
-            prev_end = parse_date_to_year(prev_job.get("end_date")) if not prev_job.get("is_current") else current_year
-            
-            if prev_end and start and prev_end >= start:
-                # Fix: adjust previous job end to 1 year before current start
-                fix_year = start - 1
-                if fix_year < prev_start:
-                    # Can't fix by adjusting previous, adjust current instead
-                    fix_year = prev_end + 1
-                    job["start_date"] = year_to_date_string(fix_year, 1)
-                else:
-                    prev_job["end_date"] = year_to_date_string(fix_year, 12)
-                    prev_job["is_current"] = False
+        # Overlap with the covering (latest-ending earlier) job
+        if ends[covering] > starts[i]:
+            if starts[i] > starts[covering]:
+                # Fix: covering job ends when the current one starts
+                ends[covering] = starts[i]
+                prev_job["end_date"] = month_index_to_date_string(ends[covering])
+                prev_job["is_current"] = False
+            else:
+                # Can't fix by adjusting previous, move current instead (same duration)
+                shift = ends[covering] - starts[i]
+                starts[i] += shift
+                job["start_date"] = month_index_to_date_string(starts[i])
+                if not job.get("is_current") and job.get("end_date"):
+                    ends[i] = min(ends[i] + shift, CURRENT_MONTH_INDEX)
+                    job["end_date"] = month_index_to_date_string(ends[i])
         
-        fixed.append(job)
+        if ends[i] >= ends[covering]:
+            covering = i
     
-    return fixed
+    return timeline.jobs + timeline.skipped
 
 
 def insert_gap_filler(
@@ -907,14 +909,6 @@ def auto_fix_gaps(
     fixed_jobs = []
     elternzeit_used = False
     
-    # Get education end
-    education_end_year = None
-    education_end_month = None
-    if education_history:
-        max_entry = max(education_history, key=lambda e: e.get("end_year", 0))
-        education_end_year = max_entry.get("end_year")
-        education_end_month = max_entry.get("end_month", 6)
-    
     # Sort jobs by start date (excluding gap fillers and "Verschiedene Positionen")
     real_jobs = [
         j for j in job_history 
@@ -922,80 +916,42 @@ def auto_fix_gaps(
         and "Verschiedene Positionen" not in j.get("company", "")
         and "Verschiedene Positionen" not in j.get("position", "")
     ]
-    sorted_jobs = sorted(
-        real_jobs,
-        key=lambda j: parse_date_to_year(j.get("start_date", "2000-01")) or 2000
-    )
-    
-    # Check gap between education and first job
-    if education_end_year and sorted_jobs:
-        first_job_start_year, first_job_start_month = parse_date_string(sorted_jobs[0].get("start_date", ""))
-        if first_job_start_year:
-            gap_months = (first_job_start_year - education_end_year) * 12 + (first_job_start_month - (education_end_month or 6))
-            if gap_months > 24:
-                # REJECT: gap too large
-                return education_history, []
-            elif gap_months > 12:
-                if not elternzeit_used:
-                    gap_type = "elternzeit"
-                    elternzeit_used = True
-                else:
-                    gap_type = "sabbatical"
-            elif gap_months > 6:
-                gap_type = random.choice(["weiterbildung", "freelance"])
+    timeline = JobTimeline.from_jobs(real_jobs)
+    
+    # Gaps as (end, start) month indices: education -> first job, then between jobs
+    gaps = []
+    education_end = _education_end_index(education_history)
+    if education_end is not None and len(timeline):
+        gaps.append((education_end, timeline.starts[0]))
+    gaps.extend((timeline.ends[covering], timeline.starts[i]) for covering, i, _ in timeline.sweep())
+    
+    for gap_end, gap_start in gaps:
+        gap_months = gap_start - gap_end
+        if gap_months > 24:
+            # REJECT: gap too large
+            return education_history, []
+        elif gap_months > 12:
+            if not elternzeit_used:
+                gap_type = "elternzeit"
+                elternzeit_used = True
             else:
-                gap_type = None
-            
-            if gap_type:
-                filler = insert_gap_filler(
-                    education_end_year, education_end_month or 6,
-                    first_job_start_year, first_job_start_month,
-                    gap_type
-                )
-                fixed_jobs.append(filler)
-    
-    # Check gaps between jobs
-    for i, job in enumerate(sorted_jobs):
-        fixed_jobs.append(job)
+                gap_type = "sabbatical"
+        elif gap_months > 6:
+            gap_type = random.choice(["weiterbildung", "freelance"])
+        else:
+            gap_type = None
         
-        if i < len(sorted_jobs) - 1:
-            next_job = sorted_jobs[i + 1]
-            
-            end_year, end_month = parse_date_string(job.get("end_date", ""))
-            if job.get("is_current") or not end_year:
-                end_year, end_month = CURRENT_YEAR, CURRENT_MONTH
-            
-            start_year, start_month = parse_date_string(next_job.get("start_date", ""))
-            
-            if end_year and start_year:
-                gap_months = (start_year - end_year) * 12 + (start_month - end_month)
-                if gap_months > 24:
-                    # REJECT: gap too large
-                    return education_history, []
-                elif gap_months > 12:
-                    if not elternzeit_used:
-                        gap_type = "elternzeit"
-                        elternzeit_used = True
-                    else:
-                        gap_type = "sabbatical"
-                elif gap_months > 6:
-                    gap_type = random.choice(["weiterbildung", "freelance"])
-                else:
-                    gap_type = None
-                
-                if gap_type:
-                    filler = insert_gap_filler(
-                        end_year, end_month,
-                        start_year, start_month,
-                        gap_type
-                    )
-                    fixed_jobs.append(filler)
+        if gap_type:
+            end_year, end_month0 = divmod(gap_end, 12)
+            start_year, start_month0 = divmod(gap_start, 12)
+            fixed_jobs.append(insert_gap_filler(
+                end_year, end_month0 + 1,
+                start_year, start_month0 + 1,
+                gap_type
+            ))
     
     # Re-sort all jobs (including gap fillers) by start date
-    fixed_jobs = sorted(
-        fixed_jobs,
-        key=lambda j: parse_date_to_year(j.get("start_date", "2000-01")) or 2000
-    )
+    fixed_jobs = sorted(fixed_jobs + timeline.jobs + timeline.skipped, key=job_start_key)
     
     return education_history, fixed_jobs
 
@@ -1025,7 +981,7 @@ def adjust_dates_minor(
     # Adjust education end to align with work start
     if education_history and job_history:
         education_end = max([e.get("end_year", 0) for e in education_history])
-        first_job_start = parse_date_to_year(sorted(job_history, key=lambda j: parse_date_to_year(j.get("start_date", "2000-01")) or 2000)[0].get("start_date"))
+        first_job_start = parse_date_to_year(min(job_history, key=job_start_key).get("start_date"))
         
         if education_end and first_job_start:
             discrepancy = first_job_start - education_end
@@ -1201,11 +1157,7 @@ def get_timeline_summary(
     
     first_job_start = None
     if job_history:
-        sorted_jobs = sorted(
-            job_history,
-            key=lambda j: parse_date_to_year(j.get("start_date", "2000-01")) or 2000
-        )
-        first_job_start = parse_date_to_year(sorted_jobs[0].get("start_date"))
+        first_job_start = parse_date_to_year(min(job_history, key=job_start_key).get("start_date"))
     
     return {
         "persona_age": persona_age,
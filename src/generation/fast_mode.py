@@ -0,0 +1,660 @@
+# src/generation/fast_mode.py
+"""
+Fast mode: fully offline, high-throughput CV generation.
+
+Fast mode trades prose quality for volume and distribution correctness
+(e.g. millions of synthetic CVs for ML training):
+ - ReferenceSnapshot: all reference data (cantons, occupations, names,
+   companies, skills, portraits, demographic weights) loaded once - from
+   MongoDB in one pass per collection, or from the files in data/ - and
+   saved as a single JSON file
+ - FastCVEngine: samples personas column-wise with numpy (same weights and
+   rules as SamplingEngine / queries.py) and fills sections from the bullet
+   and section banks, falling back to the deterministic generators
+   (generate_generic_responsibilities, generate_fallback_summary, ...)
+ - write_jsonl(): one CV per line (CVDocument.to_dict() layout)
+
+There is no network or database access in the generation loop.
+
+Run: python -m src.cli.main generate --mode fast --count 100000
+"""
+
+import sys
+import json
+import random
+from pathlib import Path
+from datetime import datetime
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import get_settings
+from src.database.queries import add_career_prefix, get_industry_weights, get_typical_years_for_age_group
+from src.generation.sampling import FALLBACK_CANTONS, FALLBACK_FIRST_NAMES
+from src.generation.company_validator import fallback_company_name
+from src.generation.cv_education_generator import calculate_education_timeline
+from src.generation.cv_timeline_validator import CURRENT_MONTH_INDEX, month_index, month_index_to_date_string
+from src.generation.cv_activities_transformer import generate_generic_responsibilities
+from src.generation.cv_assembler import (
+    CVDocument,
+    generate_city_for_canton,
+    generate_fallback_summary,
+    generate_personalized_hobbies,
+    get_languages_for_cv
+)
+from src.generation.bullet_bank import get_bullet_bank
+from src.generation.section_bank import get_section_bank
+from src.generation.portrait_store import make_asset_id
+
+DEFAULT_SNAPSHOT_PATH = "data/processed/reference_snapshot.json"
+
+AGE_GROUPS = ("18-25", "26-40", "41-65")
+CAREER_LEVELS = ("junior", "mid", "senior", "lead")
+# Career levels _career_levels can assign per age group
+CAREER_LEVELS_BY_AGE_GROUP = {
+    "18-25": ("junior", "mid"),
+    "26-40": ("junior", "mid", "senior"),
+    "41-65": ("mid", "senior", "lead")
+}
+# Filtered generation gives up after this many batches without a match
+MAX_EMPTY_BATCHES = 50
+LANGUAGES = ("de", "fr", "it")
+
+FALLBACK_LAST_NAMES: Dict[str, List[str]] = {
+    "de": ["Müller", "Meier", "Schmid", "Keller", "Weber", "Huber", "Schneider", "Meyer", "Steiner", "Fischer"],
+    "fr": ["Favre", "Rochat", "Blanc", "Morel", "Bonvin", "Perrin", "Chevalley", "Jaquet", "Mercier", "Girard"],
+    "it": ["Bianchi", "Rossi", "Ferrari", "Colombo", "Bernasconi", "Galli", "Fontana", "Moretti", "Pedrazzini", "Rezzonico"],
+}
+
+# Primary degree by Bildungstyp (degree, duration in years)
+_DEGREE_BY_BILDUNGSTYP: Dict[str, Tuple[str, int]] = {
+    "Grundbildung (Lehre)": ("Eidgenössisches Fähigkeitszeugnis (EFZ)", 3),
+    "Berufsfunktion / Spezialisierung": ("Eidgenössisches Fähigkeitszeugnis (EFZ)", 4),
+    "Weiterbildungsberuf": ("Höhere Fachschule (HF)", 3),
+    "Hochschulberuf": ("Fachhochschule (FH)", 3),
+}
+
+# Companies generated per (canton, industry) when the snapshot has no real ones
+_FALLBACK_COMPANIES_PER_KEY = 12
+
+
+@dataclass
+class ReferenceSnapshot:
+    """In-memory copy of all reference data needed to generate CVs offline."""
+    cantons: List[Dict[str, Any]] = field(default_factory=list)
+    occupations: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    first_names: Dict[str, Dict[str, Dict[str, List[Any]]]] = field(default_factory=dict)
+    last_names: Dict[str, Dict[str, List[Any]]] = field(default_factory=dict)
+    companies: Dict[str, List[str]] = field(default_factory=dict)
+    skills: Dict[str, Dict[str, List[str]]] = field(default_factory=dict)
+    portraits: Dict[str, Dict[str, List[str]]] = field(default_factory=dict)
+    age_groups: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    gender_distribution: Dict[str, float] = field(default_factory=dict)
+    industry_weights: Dict[str, float] = field(default_factory=dict)
+    source: str = ""
+    created_at: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ReferenceSnapshot":
+        return cls(**{name: data[name] for name in cls.__dataclass_fields__ if name in data})
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: Path) -> "ReferenceSnapshot":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def from_files(cls, data_dir: Optional[Path] = None) -> "ReferenceSnapshot":
+        """
+        Build a snapshot from the files in data/ (no database needed).
+
+        Uses the 26 fallback cantons, data/processed/occupations.json, the
+        fallback name lists, the portrait index and the demographic weights.
+        Companies are generated with the fallback company name patterns.
+        """
+        data_dir = Path(data_dir or project_root / "data")
+        snapshot = cls(source="files", created_at=datetime.now().isoformat())
+        snapshot.cantons = [_canton_record(c) for c in FALLBACK_CANTONS]
+
+        occupations_file = data_dir / "processed" / "occupations.json"
+        if occupations_file.exists():
+            with open(occupations_file, "r", encoding="utf-8-sig") as f:
+                for occ in json.load(f):
+                    snapshot._add_occupation(
+                        occ.get("industry") or "other",
+                        {"job_id": str(occ.get("id", "")), "title": occ.get("name_de", ""),
+                         "berufsfeld": occ.get("berufsfeld", ""), "bildungstyp": occ.get("bildungstyp", "")}
+                    )
+
+        snapshot.first_names = {
+            lang: {gender: {"names": names, "weights": [1] * len(names)} for gender, names in by_gender.items()}
+            for lang, by_gender in FALLBACK_FIRST_NAMES.items()
+        }
+        snapshot.last_names = {
+            lang: {"names": names, "weights": [1] * len(names)} for lang, names in FALLBACK_LAST_NAMES.items()
+        }
+        snapshot._load_weight_files(data_dir)
+        snapshot._fill_fallback_companies()
+        return snapshot
+
+    @classmethod
+    def from_mongo(cls) -> "ReferenceSnapshot":
+        """
+        Build a snapshot from MongoDB (one query per collection).
+
+        Reads the same collections the per-CV path queries: cantons,
+        first_names, last_names, companies, occupation_skills (target DB) and
+        the occupations with completeness >= 0.8 (source DB).
+        """
+        from src.database.mongodb_manager import get_db_manager
+
+        settings = get_settings()
+        db_manager = get_db_manager()
+        db_manager.connect()
+        snapshot = cls(source="mongodb", created_at=datetime.now().isoformat())
+
+        cantons = list(db_manager.get_target_collection("cantons").find({}, {"_id": 0}))
+        snapshot.cantons = [_canton_record(c) for c in (cantons or FALLBACK_CANTONS)]
+
+        mapping_file = project_root / "data" / "cv_data_mapping.json"
+        industry_mapping: Dict[str, str] = {}
+        if mapping_file.exists():
+            with open(mapping_file, "r", encoding="utf-8") as f:
+                industry_mapping = json.load(f).get("industry_mapping", {})
+        source_col = db_manager.get_source_collection(settings.mongodb_collection_occupations)
+        query = {"data_completeness.completeness_score": {"$gte": 0.8}}
+        for occ in source_col.find(query, {"job_id": 1, "title": 1, "categories": 1}):
+            categories = occ.get("categories", {}) or {}
+            berufsfelder = categories.get("berufsfelder", []) or []
+            bildungstypen = categories.get("bildungstypen", []) or []
+            record = {
+                "job_id": str(occ.get("job_id", "")),
+                "title": occ.get("title", ""),
+                "berufsfeld": berufsfelder[0] if berufsfelder else "",
+                "bildungstyp": bildungstypen[0] if bildungstypen else ""
+            }
+            industries = {industry_mapping[bf] for bf in berufsfelder if bf in industry_mapping} or {"other"}
+            for industry in industries:
+                snapshot._add_occupation(industry, record)
+
+        for doc in db_manager.get_target_collection("first_names").find({}, {"_id": 0, "name": 1, "language": 1, "gender": 1, "frequency": 1}):
+            entry = snapshot.first_names.setdefault(doc.get("language", "de"), {}).setdefault(
+                doc.get("gender", "male"), {"names": [], "weights": []}
+            )
+            entry["names"].append(doc.get("name", ""))
+            entry["weights"].append(doc.get("frequency", 1) or 1)
+        for doc in db_manager.get_target_collection("last_names").find({}, {"_id": 0, "name": 1, "language": 1, "frequency": 1}):
+            entry = snapshot.last_names.setdefault(doc.get("language", "de"), {"names": [], "weights": []})
+            entry["names"].append(doc.get("name", ""))
+            entry["weights"].append(doc.get("frequency", 1) or 1)
+        for lang, by_gender in FALLBACK_FIRST_NAMES.items():
+            for gender, names in by_gender.items():
+                snapshot.first_names.setdefault(lang, {}).setdefault(gender, {"names": names, "weights": [1] * len(names)})
+        for lang, names in FALLBACK_LAST_NAMES.items():
+            snapshot.last_names.setdefault(lang, {"names": names, "weights": [1] * len(names)})
+
+        for doc in db_manager.get_target_collection("companies").find({}, {"_id": 0, "name": 1, "canton_code": 1, "industry": 1}):
+            if doc.get("name"):
+                snapshot.companies.setdefault(f"{doc.get('canton_code')}|{doc.get('industry')}", []).append(doc["name"])
+
+        skills: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for doc in db_manager.get_target_collection("occupation_skills").find(
+            {}, {"_id": 0, "job_id": 1, "skill_name_de": 1, "skill_category": 1, "importance": 1}
+        ):
+            skills[str(doc.get("job_id"))].append(doc)
+        for job_id, docs in skills.items():
+            docs.sort(key=lambda d: d.get("importance", 0) or 0, reverse=True)
+            snapshot.skills[job_id] = {
+                "technical": [d["skill_name_de"] for d in docs if d.get("skill_category") in ("technical", "physical") and d.get("skill_name_de")][:10],
+                "soft": [d["skill_name_de"] for d in docs if d.get("skill_category") == "soft" and d.get("skill_name_de")][:8]
+            }
+
+        snapshot._load_weight_files(project_root / "data")
+        snapshot._fill_fallback_companies()
+        return snapshot
+
+    def _add_occupation(self, industry: str, record: Dict[str, Any]) -> None:
+        if record["job_id"] and record["title"]:
+            self.occupations.setdefault(industry, []).append(record)
+
+    def _load_weight_files(self, data_dir: Path) -> None:
+        """Demographic weights, industry weights and the portrait index."""
+        weights_file = data_dir / "sampling_weights.json"
+        weights: Dict[str, Any] = {}
+        if weights_file.exists():
+            with open(weights_file, "r", encoding="utf-8") as f:
+                weights = json.load(f)
+        self.age_groups = weights.get("age_groups") or {
+            "18-25": {"weight": 7.6}, "26-40": {"weight": 18.5}, "41-65": {"weight": 31.0}
+        }
+        gender = weights.get("gender_distribution", {})
+        self.gender_distribution = {
+            "male": gender.get("male", {}).get("percentage", 50.1),
+            "female": gender.get("female", {}).get("percentage", 49.9)
+        }
+        self.industry_weights = {
+            industry: weight for industry, weight in get_industry_weights().items() if industry in self.occupations
+        } or {industry: 1.0 for industry in self.occupations}
+
+        index_file = data_dir / "portraits" / "portrait_index.json"
+        if index_file.exists():
+            with open(index_file, "r", encoding="utf-8") as f:
+                self.portraits = json.load(f).get("portrait_index", {})
+
+    def _fill_fallback_companies(self) -> None:
+        """Generate company pools for (canton, industry) keys without real companies."""
+        rng = random.Random(0)
+        for canton in self.cantons:
+            for industry in self.industry_weights:
+                key = f"{canton['code']}|{industry}"
+                if not self.companies.get(key):
+                    self.companies[key] = sorted({
+                        fallback_company_name(industry, canton["code"], rng)
+                        for _ in range(_FALLBACK_COMPANIES_PER_KEY)
+                    })
+
+
+def _canton_record(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a canton document to the fields fast mode uses."""
+    return {
+        "code": doc.get("code", ""),
+        "name": doc.get("name_de", doc.get("name", "")),
+        "population": doc.get("population", 1) or 1,
+        "languages": {lang: float(doc.get(f"language_{lang}", 0) or 0) for lang in LANGUAGES}
+    }
+
+
+def load_reference_snapshot(path: Optional[str] = None, source: str = "auto") -> ReferenceSnapshot:
+    """
+    Load the reference snapshot, building and saving it on first use.
+
+    Args:
+        path: Snapshot file (default: data/processed/reference_snapshot.json).
+        source: "mongo", "files" or "auto" (MongoDB if reachable, else files)
+            when the snapshot has to be built.
+
+    Returns:
+        ReferenceSnapshot.
+    """
+    snapshot_path = Path(path or DEFAULT_SNAPSHOT_PATH)
+    if not snapshot_path.is_absolute():
+        snapshot_path = project_root / snapshot_path
+    if snapshot_path.exists():
+        return ReferenceSnapshot.load(snapshot_path)
+
+    snapshot = None
+    if source in ("mongo", "auto"):
+        try:
+            snapshot = ReferenceSnapshot.from_mongo()
+        except Exception as e:
+            if source == "mongo":
+                raise
+            print(f"Warning: MongoDB snapshot failed ({e}), using data files")
+    if snapshot is None:
+        snapshot = ReferenceSnapshot.from_files()
+    snapshot.save(snapshot_path)
+    return snapshot
+
+
+def _probabilities(weights: Iterable[float]) -> np.ndarray:
+    array = np.asarray(list(weights), dtype=float)
+    return array / array.sum()
+
+
+class FastCVEngine:
+    """
+    Offline CV engine over a ReferenceSnapshot.
+
+    Args:
+        snapshot: Reference data.
+        seed: Seed for reproducible output (the engine's own generators are
+            passed to the shared fallback generators; the module-level
+            random is left untouched).
+        use_banks: Use the bullet/section banks when they are built.
+    """
+
+    def __init__(self, snapshot: ReferenceSnapshot, seed: Optional[int] = None, use_banks: bool = True):
+        self.snapshot = snapshot
+        self.np_rng = np.random.default_rng(seed)
+        self.rng = random.Random(seed)
+        self.bullet_bank = get_bullet_bank() if use_banks else None
+        self.section_bank = get_section_bank() if use_banks else None
+        self.current_year = datetime.now().year
+
+        self._age_groups = [g for g in AGE_GROUPS if g in snapshot.age_groups] or list(AGE_GROUPS)
+        self._age_group_p = _probabilities(snapshot.age_groups.get(g, {}).get("weight", 1) for g in self._age_groups)
+        self._gender_p = _probabilities([snapshot.gender_distribution.get("male", 50.1), snapshot.gender_distribution.get("female", 49.9)])
+        self._cantons = snapshot.cantons
+        self._canton_p = _probabilities(c["population"] for c in self._cantons)
+        self._canton_language = np.array([
+            LANGUAGES.index(max(LANGUAGES, key=lambda lang: c["languages"].get(lang, 0))) for c in self._cantons
+        ])
+        self._industries = list(snapshot.industry_weights)
+        self._industry_p = _probabilities(snapshot.industry_weights.values())
+        self._name_pools = {
+            (lang, gender): (entry["names"], _probabilities(entry["weights"]))
+            for lang, by_gender in snapshot.first_names.items() for gender, entry in by_gender.items() if entry["names"]
+        }
+        self._last_name_pools = {
+            lang: (entry["names"], _probabilities(entry["weights"])) for lang, entry in snapshot.last_names.items() if entry["names"]
+        }
+
+    # ------------------------------------------------------------------
+    # Vectorized persona sampling
+    # ------------------------------------------------------------------
+
+    def _career_levels(self, age_group_idx: np.ndarray, years: np.ndarray) -> np.ndarray:
+        """Career level per persona (rules of determine_career_level_by_age)."""
+        n = len(years)
+        u = self.np_rng.random(n)
+        levels = np.zeros(n, dtype=int)
+        for gi, group in enumerate(self._age_groups):
+            mask = age_group_idx == gi
+            if not mask.any():
+                continue
+            dist = self.snapshot.age_groups.get(group, {}).get("career_level_distribution", {})
+            y, r = years[mask], u[mask]
+            if group == "18-25":
+                junior_p = dist.get("junior", 0.9) / ((dist.get("junior", 0.9) + dist.get("mid", 0.1)) or 1)
+                p_junior = np.where(y > 5, 0.7, junior_p)
+                levels[mask] = np.where(r < p_junior, 0, 1)
+            elif group == "26-40":
+                w = np.array([dist.get("junior", 0.2), dist.get("mid", 0.6), dist.get("senior", 0.2)])
+                cum = np.cumsum(w / w.sum())
+                regular = np.searchsorted(cum, r, side="right").clip(0, 2)
+                levels[mask] = np.select([y < 2, y > 10], [0, np.where(r < 0.3, 1, 2)], regular)
+            else:
+                w = np.array([dist.get("mid", 0.05), dist.get("senior", 0.60), dist.get("lead", 0.35)])
+                cum = np.cumsum(w / w.sum())
+                regular = np.searchsorted(cum, r, side="right").clip(0, 2) + 1
+                levels[mask] = np.select([y < 5, y > 20], [1, np.where(r < 0.4, 2, 3)], regular)
+        return levels
+
+    def sample_personas(self, count: int) -> List[Dict[str, Any]]:
+        """
+        Sample `count` personas column-wise.
+
+        Uses the same weights and rules as SamplingEngine.sample_persona():
+        age group and gender weights, age within group, experience from age,
+        career level by age group, population-weighted canton, canton
+        language (90% primary), employment-weighted industry and frequency
+        weighted names.
+
+        Returns:
+            List of persona dictionaries.
+        """
+        rng = self.np_rng
+        age_group_idx = rng.choice(len(self._age_groups), size=count, p=self._age_group_p)
+        bounds = np.array([[int(g.split("-")[0]), int(g.split("-")[1])] for g in self._age_groups])
+        ages = rng.integers(bounds[age_group_idx, 0], bounds[age_group_idx, 1] + 1)
+
+        year_ranges = np.array([get_typical_years_for_age_group(g) for g in self._age_groups])
+        years = np.trunc(np.maximum(0, ages - 22) + rng.normal(0, 1.5, count)).astype(int)
+        years = np.clip(years, year_ranges[age_group_idx, 0], year_ranges[age_group_idx, 1])
+        years = np.minimum(years, np.maximum(0, ages - 16))
+        levels = self._career_levels(age_group_idx, years)
+
+        genders = np.where(rng.random(count) < self._gender_p[0], "male", "female")
+        canton_idx = rng.choice(len(self._cantons), size=count, p=self._canton_p)
+        primary = self._canton_language[canton_idx]
+        other = (primary + rng.integers(1, 3, count)) % 3
+        language_idx = np.where(rng.random(count) < 0.9, primary, other)
+        industry_idx = rng.choice(len(self._industries), size=count, p=self._industry_p)
+        occupation_u = rng.random(count)
+
+        first_names = np.empty(count, dtype=object)
+        last_names = np.empty(count, dtype=object)
+        for li, lang in enumerate(LANGUAGES):
+            lang_mask = language_idx == li
+            names, p = self._last_name_pools.get(lang) or self._last_name_pools["de"]
+            last_names[lang_mask] = np.asarray(names, dtype=object)[rng.choice(len(names), size=int(lang_mask.sum()), p=p)]
+            for gender in ("male", "female"):
+                mask = lang_mask & (genders == gender)
+                names, p = self._name_pools.get((lang, gender)) or self._name_pools[("de", gender)]
+                first_names[mask] = np.asarray(names, dtype=object)[rng.choice(len(names), size=int(mask.sum()), p=p)]
+
+        personas = []
+        for i in range(count):
+            industry = self._industries[industry_idx[i]]
+            pool = self.snapshot.occupations.get(industry) or self.snapshot.occupations.get("other", [])
+            occupation = pool[int(occupation_u[i] * len(pool))] if pool else {"job_id": None, "title": "Fachperson"}
+            canton = self._cantons[canton_idx[i]]["code"]
+            age_group = self._age_groups[age_group_idx[i]]
+            gender = str(genders[i])
+            age = int(ages[i])
+            portraits = self.snapshot.portraits.get(gender, {}).get(age_group, [])
+            personas.append({
+                "first_name": first_names[i],
+                "last_name": last_names[i],
+                "full_name": f"{first_names[i]} {last_names[i]}",
+                "gender": gender,
+                "canton": canton,
+                "language": LANGUAGES[language_idx[i]],
+                "age": age,
+                "birth_year": self.current_year - age,
+                "age_group": age_group,
+                "years_experience": int(years[i]),
+                "career_level": CAREER_LEVELS[levels[i]],
+                "industry": industry,
+                "current_title": occupation["title"],
+                "job_id": occupation["job_id"],
+                "occupation": occupation["title"],
+                "bildungstyp": occupation.get("bildungstyp", ""),
+                "portrait_path": portraits[self.rng.randrange(len(portraits))] if portraits else None,
+            })
+        return personas
+
+    # ------------------------------------------------------------------
+    # Sections
+    # ------------------------------------------------------------------
+
+    def _company(self, canton: str, industry: str) -> str:
+        pool = self.snapshot.companies.get(f"{canton}|{industry}") or self.snapshot.companies.get(f"{canton}|other")
+        return self.rng.choice(pool) if pool else fallback_company_name(industry, canton, self.rng)
+
+    def _bullets(self, persona: Dict[str, Any], career_level: str, count: int) -> List[str]:
+        language = persona["language"]
+        if self.bullet_bank:
+            bullets = self.bullet_bank.draw(persona["job_id"], career_level, language, count, self.rng)
+            if bullets:
+                return bullets
+        return generate_generic_responsibilities(
+            career_level, count, language, persona["industry"], persona["occupation"], self.rng
+        )
+
+    def _education(self, persona: Dict[str, Any]) -> List[Dict[str, Any]]:
+        degree, duration = _DEGREE_BY_BILDUNGSTYP.get(persona.get("bildungstyp", ""), _DEGREE_BY_BILDUNGSTYP["Grundbildung (Lehre)"])
+        start_year, end_year = calculate_education_timeline(persona["age"], persona["years_experience"], duration)
+        canton = persona["canton"]
+        institution = f"Fachhochschule {canton}" if "FH" in degree else f"Berufsschule {canton}"
+        return [{
+            "degree": degree,
+            "institution": institution,
+            "location": canton,
+            "start_year": start_year,
+            "end_year": end_year,
+            "type": "primary"
+        }]
+
+    def _jobs(self, persona: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Job history over the persona's years of experience (oldest first, current last)."""
+        years = persona["years_experience"]
+        career_start = self.current_year - years
+        num_jobs = 1 if years < 3 else min(4, 1 + years // 5)
+        cuts = sorted(self.rng.sample(range(career_start + 1, self.current_year), num_jobs - 1)) if num_jobs > 1 else []
+        # A job ends in the month the next one starts
+        cut_dates = [f"{year}-{self.rng.randint(1, 12):02d}" for year in cuts]
+        # The first job starts no later than this month (years_experience 0 starts this year)
+        first_start = self.rng.randint(month_index(career_start), min(month_index(career_start, 12), CURRENT_MONTH_INDEX))
+        starts = [month_index_to_date_string(first_start)] + cut_dates
+        ends = cut_dates + [None]
+        level_idx = CAREER_LEVELS.index(persona["career_level"])
+
+        jobs = []
+        for i, (start, end) in enumerate(zip(starts, ends)):
+            is_current = end is None
+            level = CAREER_LEVELS[max(0, level_idx - (num_jobs - 1 - i))]
+            jobs.append({
+                "company": self._company(persona["canton"], persona["industry"]),
+                "position": add_career_prefix(persona["occupation"], level, self.rng),
+                "location": persona["canton"],
+                "start_date": start,
+                "end_date": end,
+                "is_current": is_current,
+                "responsibilities": self._bullets(persona, level, self.rng.randint(4, 5) if is_current else max(2, 4 - (num_jobs - 1 - i))),
+                "technologies": [],
+                "category": persona["industry"],
+                "company_match_quality": "fast_mode"
+            })
+        return jobs
+
+    def _summary(self, persona: Dict[str, Any], skills: List[str], occupation_type: str) -> str:
+        if self.section_bank:
+            summary = self.section_bank.draw_summary(
+                persona["language"], persona["industry"], persona["career_level"], occupation_type,
+                {
+                    "years": persona["years_experience"],
+                    "skills": " und ".join(skills[:2]) if persona["language"] == "de" else ", ".join(skills[:2]),
+                    "canton": generate_city_for_canton(persona["canton"]),
+                    "occupation": persona["occupation"]
+                }
+            )
+            if summary:
+                return summary
+        return generate_fallback_summary(persona, persona["language"])
+
+    def _hobbies(self, persona: Dict[str, Any], occupation_type: str) -> List[str]:
+        if self.section_bank:
+            hobbies = self.section_bank.draw_hobbies(
+                persona["language"], persona["industry"], persona["career_level"], occupation_type
+            )
+            if hobbies:
+                return hobbies
+        return generate_personalized_hobbies(
+            persona["canton"], persona["language"], persona["age_group"], occupation_type, self.rng
+        )
+
+    def build_cv(self, persona: Dict[str, Any]) -> CVDocument:
+        """Assemble one CV from a persona (no network, no database)."""
+        skills = self.snapshot.skills.get(str(persona["job_id"]), {})
+        occupation_type = "technical" if persona["industry"] == "technology" else "general"
+        city = generate_city_for_canton(persona["canton"])
+        first, last = persona["first_name"].lower(), persona["last_name"].lower()
+        return CVDocument(
+            first_name=persona["first_name"],
+            last_name=persona["last_name"],
+            full_name=persona["full_name"],
+            age=persona["age"],
+            gender=persona["gender"],
+            canton=persona["canton"],
+            city=city,
+            email=f"{first}.{last}@example.ch",
+            phone=f"07{self.rng.randint(60, 99)} {self.rng.randint(100, 999)} {self.rng.randint(10, 99)} {self.rng.randint(10, 99)}",
+            address=f"{city}, {persona['canton']}",
+            portrait_path=persona["portrait_path"],
+            portrait_asset_id=make_asset_id(persona["portrait_path"]),
+            current_title=persona["current_title"],
+            industry=persona["industry"],
+            career_level=persona["career_level"],
+            years_experience=persona["years_experience"],
+            summary=self._summary(persona, skills.get("technical", []), occupation_type),
+            education=self._education(persona),
+            jobs=self._jobs(persona),
+            skills={
+                "technical": list(skills.get("technical", [])),
+                "soft": list(skills.get("soft", [])),
+                "languages": get_languages_for_cv(persona["canton"], persona["language"], self.rng)
+            },
+            hobbies=self._hobbies(persona, occupation_type),
+            language=persona["language"],
+            created_at=datetime.now().isoformat()
+        )
+
+    def generate(
+        self,
+        count: int,
+        batch_size: int = 10_000,
+        filters: Optional[Dict[str, str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Generate `count` CVs as dictionaries (CVDocument.to_dict() layout).
+
+        Personas are sampled in batches of `batch_size`, so memory stays flat
+        for arbitrarily large counts.
+
+        Args:
+            count: Number of CVs.
+            batch_size: Personas sampled per batch.
+            filters: Persona field -> required value (e.g. {"industry": "finance"});
+                non-matching personas are skipped, so the other fields keep
+                their sampled distribution.
+
+        Raises:
+            ValueError: If the filters cannot be matched (unknown industry,
+                career level impossible for the age group, or no match in
+                MAX_EMPTY_BATCHES batches).
+        """
+        filters = {key: value for key, value in (filters or {}).items() if value}
+        if filters.get("industry") and filters["industry"] not in self._industries:
+            raise ValueError(f"Industry '{filters['industry']}' has no occupations in the snapshot")
+        allowed_levels = CAREER_LEVELS_BY_AGE_GROUP.get(filters.get("age_group"), CAREER_LEVELS)
+        if filters.get("career_level") and filters["career_level"] not in allowed_levels:
+            raise ValueError(
+                f"Career level '{filters['career_level']}' does not occur in age group '{filters['age_group']}' "
+                f"(expected one of {', '.join(allowed_levels)})"
+            )
+        remaining = count
+        empty_batches = 0
+        while remaining > 0:
+            matched = False
+            for persona in self.sample_personas(batch_size if filters else min(batch_size, remaining)):
+                if remaining <= 0:
+                    break
+                if any(persona.get(key) != value for key, value in filters.items()):
+                    continue
+                matched = True
+                data = self.build_cv(persona).to_dict()
+                data["metadata"]["mode"] = "fast"
+                data["metadata"]["job_id"] = persona["job_id"]
+                remaining -= 1
+                yield data
+            empty_batches = 0 if matched else empty_batches + 1
+            if empty_batches >= MAX_EMPTY_BATCHES:
+                raise ValueError(f"No persona matches the filters {filters} in {MAX_EMPTY_BATCHES} batches of {batch_size}")
+
+
+def write_jsonl(records: Iterable[Dict[str, Any]], path: Path) -> int:
+    """
+    Write records as JSON lines.
+
+    Args:
+        records: Iterable of dictionaries.
+        path: Output file (parent directories are created).
+
+    Returns:
+        Number of records written.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
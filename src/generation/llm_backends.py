@@ -0,0 +1,654 @@
+# src/generation/llm_backends.py
+"""
+Pluggable LLM backends for the centralized OpenAI client.
+
+`get_openai_client()` returns an object exposing the modern OpenAI surface
+(`client.chat.completions.create(...)`). Besides the real OpenAI client this
+module provides a deterministic local stub so the full generation pipeline
+(the same code paths that run against the API, not the offline fallbacks)
+can be benchmarked and profiled without network access or API keys.
+
+Stub features:
+ - language-appropriate responses per prompt type (summary, "JOB n:" bullet
+   batches, numbered bullets, single bullets, hobbies CSV, JSON)
+ - JSON mode (`response_format={"type": "json_object"}`): fills the schema
+   embedded in the system prompt (see llm_schemas.py) field by field
+ - configurable latency distributions (none, fixed, uniform, lognormal)
+ - error injection (429 rate limits, timeouts) using messages that the
+   retry logic in openai_client.py treats as transient
+ - deterministic output: identical prompts + seed yield identical content
+ - streaming (`stream=True`) in small chunks, with the sampled latency split
+   into time-to-first-token and per-chunk delays
+
+Select the backend with LLM_BACKEND=stub (see src/config.py).
+"""
+
+import sys
+import re
+import json
+import math
+import time
+import random
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+
+LATENCY_DISTRIBUTIONS = ("none", "fixed", "uniform", "lognormal")
+
+
+# =============================================================================
+# RESPONSE OBJECTS (mirror the attributes used from openai>=1.0 responses)
+# =============================================================================
+
+@dataclass
+class StubMessage:
+    """Assistant message of a stub completion."""
+    content: str
+    role: str = "assistant"
+
+
+@dataclass
+class StubChoice:
+    """Single choice of a stub completion."""
+    message: StubMessage
+    index: int = 0
+    finish_reason: str = "stop"
+
+
+@dataclass
+class StubUsage:
+    """Token usage of a stub completion."""
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+
+
+@dataclass
+class StubCompletion:
+    """Chat completion returned by the stub backend."""
+    id: str
+    model: str
+    choices: List[StubChoice] = field(default_factory=list)
+    usage: StubUsage = field(default_factory=StubUsage)
+    created: int = 0
+    object: str = "chat.completion"
+
+
+@dataclass
+class StubDelta:
+    """Content delta of a streamed chunk."""
+    content: Optional[str] = None
+    role: Optional[str] = None
+
+
+@dataclass
+class StubStreamChoice:
+    """Single choice of a streamed chunk."""
+    delta: StubDelta
+    index: int = 0
+    finish_reason: Optional[str] = None
+
+
+@dataclass
+class StubChunk:
+    """Chunk yielded by a streaming stub completion."""
+    id: str
+    model: str
+    choices: List[StubStreamChoice] = field(default_factory=list)
+    usage: Optional[StubUsage] = None
+    object: str = "chat.completion.chunk"
+
+
+class StubStream:
+    """
+    Iterator over the chunks of a streaming stub completion.
+
+    Mirrors the openai `Stream` object: iterate for chunks, `close()` to stop
+    early. `emitted_tokens` counts the content actually delivered.
+    """
+
+    def __init__(self, chunks: List[StubChunk], delays: List[float], sleep: Callable[[float], None]):
+        self._chunks = chunks
+        self._delays = delays
+        self._sleep = sleep
+        self._position = 0
+        self.closed = False
+        self.emitted_tokens = 0
+
+    def __iter__(self) -> "StubStream":
+        return self
+
+    def __next__(self) -> StubChunk:
+        if self.closed or self._position >= len(self._chunks):
+            raise StopIteration
+        delay = self._delays[self._position]
+        if delay:
+            self._sleep(delay)
+        chunk = self._chunks[self._position]
+        self._position += 1
+        if chunk.choices and chunk.choices[0].delta.content:
+            self.emitted_tokens += estimate_tokens(chunk.choices[0].delta.content)
+        return chunk
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class StubAPIError(Exception):
+    """Base class for errors injected by the stub backend."""
+    status_code: int = 500
+
+
+class StubRateLimitError(StubAPIError):
+    """Injected HTTP 429 rate limit error."""
+    status_code = 429
+
+
+class StubTimeoutError(StubAPIError):
+    """Injected request timeout."""
+    status_code = 408
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token, like OpenAI's rule of thumb)."""
+    if not text:
+        return 0
+    return max(1, int(math.ceil(len(text) / 4.0)))
+
+
+# =============================================================================
+# BACKEND INTERFACE
+# =============================================================================
+
+class LLMBackend(ABC):
+    """
+    Interface for chat completion backends.
+
+    Subclasses implement `create_chat_completion` and return an object with
+    `choices[0].message.content` and `usage.prompt_tokens/completion_tokens`.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def create_chat_completion(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+        **kwargs: Any
+    ) -> Any:
+        """Create a chat completion (same arguments as chat.completions.create)."""
+
+
+class _Completions:
+    def __init__(self, backend: LLMBackend):
+        self._backend = backend
+
+    def create(self, **kwargs: Any) -> Any:
+        return self._backend.create_chat_completion(**kwargs)
+
+
+class _Chat:
+    def __init__(self, backend: LLMBackend):
+        self.completions = _Completions(backend)
+
+
+class ChatClientAdapter:
+    """Expose an LLMBackend through the `client.chat.completions.create` surface."""
+
+    def __init__(self, backend: LLMBackend):
+        self.backend = backend
+        self.chat = _Chat(backend)
+
+    @property
+    def backend_name(self) -> str:
+        return self.backend.name
+
+
+# =============================================================================
+# STUB CONTENT
+# =============================================================================
+
+_STUB_VERBS = {
+    "de": ["Koordinierte", "Betreute", "Optimierte", "Plante", "Leitete", "Entwickelte",
+           "Organisierte", "Überwachte", "Realisierte", "Begleitete", "Analysierte", "Erstellte"],
+    "fr": ["Coordonné", "Géré", "Optimisé", "Planifié", "Dirigé", "Développé",
+           "Organisé", "Supervisé", "Réalisé", "Accompagné", "Analysé", "Élaboré"],
+    "it": ["Coordinato", "Gestito", "Ottimizzato", "Pianificato", "Diretto", "Sviluppato",
+           "Organizzato", "Supervisionato", "Realizzato", "Accompagnato", "Analizzato", "Elaborato"],
+}
+
+_STUB_METRICS = {
+    "de": ["für {n} Kunden", "in {n} Projekten", "mit einem Team von {n} Personen",
+           "bei {n} Aufträgen pro Monat", "mit Budget von CHF {k}'000", "an {n} Standorten"],
+    "fr": ["pour {n} clients", "dans {n} projets", "avec une équipe de {n} personnes",
+           "sur {n} mandats par mois", "avec un budget de CHF {k}'000", "sur {n} sites"],
+    "it": ["per {n} clienti", "in {n} progetti", "con un team di {n} persone",
+           "su {n} incarichi al mese", "con un budget di CHF {k}'000", "in {n} sedi"],
+}
+
+_STUB_OBJECTS = {
+    "de": ["die Qualitätskontrolle", "die Einsatzplanung", "die Kundenberatung",
+           "die Dokumentation der Abläufe", "die Materialbeschaffung", "die Einarbeitung neuer Mitarbeitender"],
+    "fr": ["le contrôle qualité", "la planification des interventions", "le conseil client",
+           "la documentation des processus", "l'approvisionnement", "l'intégration des nouveaux collaborateurs"],
+    "it": ["il controllo qualità", "la pianificazione degli interventi", "la consulenza clienti",
+           "la documentazione dei processi", "l'approvvigionamento", "l'inserimento dei nuovi collaboratori"],
+}
+
+_STUB_HOBBIES = {
+    "de": ["Wandern", "Skifahren", "Velofahren", "Kochen", "Fotografie", "Schwimmen",
+           "Lesen", "Gitarre spielen", "Jassen", "Langlauf", "Gärtnern", "Klettern"],
+    "fr": ["Randonnée", "Ski", "Vélo", "Cuisine", "Photographie", "Natation",
+           "Lecture", "Guitare", "Jass", "Ski de fond", "Jardinage", "Escalade"],
+    "it": ["Escursionismo", "Sci", "Ciclismo", "Cucina", "Fotografia", "Nuoto",
+           "Lettura", "Chitarra", "Jass", "Sci di fondo", "Giardinaggio", "Arrampicata"],
+}
+
+_STUB_SUMMARY_OPENERS = {
+    "de": ["{occ} mit {years} Jahren Berufserfahrung in der Branche {industry}.",
+           "Erfahrene Fachperson als {occ} mit {years} Jahren Praxis im Bereich {industry}.",
+           "Engagierte Fachkraft ({occ}) mit {years} Jahren Erfahrung in {industry}."],
+    "fr": ["{occ} avec {years} ans d'expérience professionnelle dans le secteur {industry}.",
+           "Professionnel expérimenté en tant que {occ}, {years} ans de pratique dans {industry}.",
+           "Spécialiste engagé ({occ}) avec {years} ans d'expérience en {industry}."],
+    "it": ["{occ} con {years} anni di esperienza professionale nel settore {industry}.",
+           "Professionista esperto come {occ} con {years} anni di pratica in {industry}.",
+           "Specialista motivato ({occ}) con {years} anni di esperienza in {industry}."],
+}
+
+_STUB_SUMMARY_FOLLOWUPS = {
+    "de": ["Fundierte Kenntnisse in {skills} und eine strukturierte, zuverlässige Arbeitsweise.",
+           "Schwerpunkte liegen bei {skills} sowie der engen Zusammenarbeit mit Kunden und Team.",
+           "Bringt Know-how in {skills} und Erfahrung aus Schweizer KMU und Grossunternehmen mit."],
+    "fr": ["Solides connaissances en {skills} et méthode de travail structurée et fiable.",
+           "Points forts: {skills} ainsi qu'une collaboration étroite avec clients et équipe.",
+           "Apporte un savoir-faire en {skills} et une expérience en PME et grandes entreprises suisses."],
+    "it": ["Solide conoscenze in {skills} e metodo di lavoro strutturato e affidabile.",
+           "Punti di forza: {skills} e stretta collaborazione con clienti e team.",
+           "Porta competenze in {skills} ed esperienza in PMI e grandi aziende svizzere."],
+}
+
+_STUB_DEFAULT_INDUSTRY = {"de": "Dienstleistungen", "fr": "services", "it": "servizi"}
+
+_LANGUAGE_MARKERS = {
+    "fr": ("créez", "génère", "retournez", "expérience", "virgules", "ans", "profession:", "secteur"),
+    "it": ("crea ", "genera ", "restituisci", "esperienza", "virgole", "anni", "professione:", "settore"),
+    "de": ("erstelle", "generiere", "berufserfahrung", "kommagetrennte", "jahre", "beruf:", "branche",
+           "schreibe", "tätigkeiten"),
+}
+
+
+def _detect_language(text: str) -> str:
+    """Detect prompt language (de/fr/it) from characteristic markers."""
+    lowered = text.lower()
+    explicit = re.search(r"language:\s*(de|fr|it)\b", lowered)
+    if explicit:
+        return explicit.group(1)
+    scores = {lang: sum(lowered.count(m) for m in markers) for lang, markers in _LANGUAGE_MARKERS.items()}
+    best = max(scores, key=lambda k: scores[k])
+    return best if scores[best] > 0 else "de"
+
+
+def _field(text: str, labels: List[str], default: str = "") -> str:
+    """Extract `Label: value` from a prompt (first matching label wins)."""
+    for label in labels:
+        match = re.search(rf"^\s*{re.escape(label)}\s*:\s*(.+)$", text, re.MULTILINE | re.IGNORECASE)
+        if match:
+            return match.group(1).strip()
+    return default
+
+
+def _first_int(text: str, default: int) -> int:
+    match = re.search(r"\d+", text or "")
+    return int(match.group(0)) if match else default
+
+
+class StubLLMBackend(LLMBackend):
+    """
+    Deterministic local chat completion backend.
+
+    Content is derived from a hash of (seed, model, messages), so the same
+    request always produces the same response regardless of call order or
+    threading. Latency and error injection draw from a separate seeded
+    generator shared across calls.
+
+    Args:
+        seed: Base seed for content, latency and error injection.
+        latency: Latency distribution ("none", "fixed", "uniform", "lognormal").
+        latency_ms: Fixed / mean / median latency in milliseconds.
+        latency_jitter: Spread (uniform: +/- fraction, lognormal: sigma).
+        error_rate_429: Probability that a call raises a 429 rate limit error.
+        error_rate_timeout: Probability that a call raises a timeout.
+        sleep: Sleep function (overridable for tests).
+    """
+
+    name = "stub"
+
+    def __init__(
+        self,
+        seed: int = 42,
+        latency: str = "none",
+        latency_ms: float = 0.0,
+        latency_jitter: float = 0.5,
+        error_rate_429: float = 0.0,
+        error_rate_timeout: float = 0.0,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        if latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{latency}', expected one of {LATENCY_DISTRIBUTIONS}")
+        self.seed = seed
+        self.latency = latency
+        self.latency_ms = max(0.0, latency_ms)
+        self.latency_jitter = max(0.0, latency_jitter)
+        self.error_rate_429 = max(0.0, min(1.0, error_rate_429))
+        self.error_rate_timeout = max(0.0, min(1.0, error_rate_timeout))
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._runtime_rng = random.Random(seed)
+        self.calls = 0
+
+    # ------------------------------------------------------------------
+    # Latency and error injection
+    # ------------------------------------------------------------------
+    def sample_latency(self) -> float:
+        """Sample one latency value in seconds from the configured distribution."""
+        if self.latency == "none" or self.latency_ms <= 0:
+            return 0.0
+        with self._lock:
+            if self.latency == "fixed":
+                ms = self.latency_ms
+            elif self.latency == "uniform":
+                spread = self.latency_ms * self.latency_jitter
+                ms = self._runtime_rng.uniform(self.latency_ms - spread, self.latency_ms + spread)
+            else:
+                ms = self._runtime_rng.lognormvariate(math.log(self.latency_ms), self.latency_jitter)
+        return max(0.0, ms) / 1000.0
+
+    def _roll_error(self) -> Optional[StubAPIError]:
+        with self._lock:
+            roll = self._runtime_rng.random()
+        if roll < self.error_rate_429:
+            return StubRateLimitError("Error code: 429 - Rate limit reached for requests (stub backend)")
+        if roll < self.error_rate_429 + self.error_rate_timeout:
+            return StubTimeoutError("Request timed out (stub backend)")
+        return None
+
+    # ------------------------------------------------------------------
+    # Completion
+    # ------------------------------------------------------------------
+    def create_chat_completion(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+        **kwargs: Any
+    ) -> StubCompletion:
+        with self._lock:
+            self.calls += 1
+            call_no = self.calls
+
+        delay = self.sample_latency()
+        error = self._roll_error()
+        if delay:
+            self._sleep(delay)
+        if error is not None:
+            raise error
+
+        system = "\n".join(m.get("content", "") for m in messages if m.get("role") == "system")
+        user = "\n".join(m.get("content", "") for m in messages if m.get("role") != "system")
+        digest = hashlib.sha256(f"{self.seed}|{model}|{system}|{user}".encode("utf-8")).hexdigest()
+        rng = random.Random(int(digest[:16], 16))
+
+        if (kwargs.get("response_format") or {}).get("type") == "json_object":
+            content = self.render_json_mode(system, user, rng)
+        else:
+            content = self.render(system, user, rng)
+        prompt_tokens = estimate_tokens(system) + estimate_tokens(user)
+        completion_tokens = estimate_tokens(content)
+        finish_reason = "stop"
+        if max_tokens is not None and completion_tokens > max_tokens:
+            content = content[: max_tokens * 4]
+            completion_tokens = max_tokens
+            finish_reason = "length"
+
+        completion_id = f"stub-{digest[:12]}-{call_no}"
+        usage = StubUsage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens
+        )
+        if kwargs.get("stream"):
+            include_usage = bool((kwargs.get("stream_options") or {}).get("include_usage"))
+            return self._stream(completion_id, model, content, finish_reason, usage if include_usage else None)
+
+        return StubCompletion(
+            id=completion_id,
+            model=model,
+            choices=[StubChoice(message=StubMessage(content=content), finish_reason=finish_reason)],
+            usage=usage,
+            created=int(time.time())
+        )
+
+    def _stream(
+        self,
+        completion_id: str,
+        model: str,
+        content: str,
+        finish_reason: str,
+        usage: Optional[StubUsage]
+    ) -> StubStream:
+        """Split content into ~4-token chunks; one more latency sample is spread over them."""
+        pieces = [content[i:i + 16] for i in range(0, len(content), 16)]
+        chunks = [StubChunk(id=completion_id, model=model,
+                            choices=[StubStreamChoice(delta=StubDelta(content=piece))])
+                  for piece in pieces]
+        chunks.append(StubChunk(id=completion_id, model=model,
+                                choices=[StubStreamChoice(delta=StubDelta(), finish_reason=finish_reason)]))
+        if usage is not None:
+            chunks.append(StubChunk(id=completion_id, model=model, choices=[], usage=usage))
+
+        generation_time = self.sample_latency()
+        per_chunk = generation_time / len(pieces) if pieces else 0.0
+        delays = [per_chunk if chunk.choices and chunk.choices[0].delta.content else 0.0 for chunk in chunks]
+        return StubStream(chunks, delays, self._sleep)
+
+    def render(self, system: str, user: str, rng: random.Random) -> str:
+        """Render a response for the detected prompt type."""
+        language = _detect_language(user)
+        lowered = (system + "\n" + user).lower()
+
+        if "respond only with valid json" in lowered:
+            return self._render_json(user, rng)
+        if re.search(r"^\s*JOB 1\s*:", user, re.MULTILINE):
+            return self._render_job_batch(user, language, rng)
+        if any(k in lowered for k in ("kommagetrennte", "virgules", "virgole", "comma-separated")):
+            return self._render_hobbies(language, rng)
+        if "transform this swiss occupation activity" in lowered:
+            return self._render_single_bullet(user, language, rng)
+        if "aufzählungspunkte" in lowered or "numbered bullets" in lowered:
+            match = re.search(r"(?:Schreibe|Genau|Write) (\d+)", user)
+            count = int(match.group(1)) if match else 3
+            return "\n".join(f"{i}. {self._bullet(language, rng)}" for i in range(1, count + 1))
+        return self._render_summary(user, language, rng)
+
+    def render_json_mode(self, system: str, user: str, rng: random.Random) -> str:
+        """Render a JSON-mode response filling the schema given in the system prompt."""
+        marker = system.find("JSON schema:")
+        if marker == -1:
+            return self._render_json(user, rng)
+        try:
+            schema, _ = json.JSONDecoder().raw_decode(system[marker + len("JSON schema:"):].strip())
+        except json.JSONDecodeError:
+            return self._render_json(user, rng)
+
+        language = _detect_language(user)
+        jobs = self._job_blocks(user)
+        data: Dict[str, Any] = {}
+        for name, spec in schema.get("properties", {}).items():
+            job_match = re.fullmatch(r"job_(\d+)", name)
+            if job_match:
+                _, activities = jobs.get(int(job_match.group(1)), (0, []))
+                data[name] = self._job_bullets(spec.get("minItems", 3), activities, language, rng)
+            elif name == "hobbies":
+                data[name] = self._render_hobbies(language, rng).split(", ")
+            elif name == "bullet":
+                data[name] = self._render_single_bullet(user, language, rng)
+            elif spec.get("type") == "array":
+                data[name] = [self._bullet(language, rng) for _ in range(spec.get("minItems", 3))]
+            else:
+                data[name] = self._render_summary(user, language, rng)
+        return json.dumps(data, ensure_ascii=False)
+
+    def _bullet(self, language: str, rng: random.Random, verb: Optional[str] = None, obj: Optional[str] = None) -> str:
+        lang = language if language in _STUB_VERBS else "de"
+        verb = verb or rng.choice(_STUB_VERBS[lang])
+        obj = obj or rng.choice(_STUB_OBJECTS[lang])
+        metric = rng.choice(_STUB_METRICS[lang]).format(n=rng.randint(3, 40), k=rng.randint(20, 900))
+        return f"{verb} {obj} {metric}"
+
+    def _job_blocks(self, user: str) -> Dict[int, Tuple[int, List[str]]]:
+        """Parse "JOB n:" blocks of a prompt into {n: (bullet count, activities)}."""
+        blocks = re.split(r"^\s*JOB (\d+)\s*:", user, flags=re.MULTILINE)
+        jobs = {}
+        # blocks: [preamble, num, body, num, body, ...]; the output-format example repeats "JOB 1:"
+        for i in range(1, len(blocks) - 1, 2):
+            num, body = int(blocks[i]), blocks[i + 1]
+            count = _first_int(_field(body, ["Anzahl Bullets", "Number of bullets", "Nombre de puces"]), 0)
+            if count <= 0:
+                continue
+            activities = [a.strip() for a in re.findall(r"^\s*-\s+(.+)$", body, re.MULTILINE)]
+            jobs[num] = (count, activities)
+        return jobs
+
+    def _job_bullets(self, count: int, activities: List[str], language: str, rng: random.Random) -> List[str]:
+        verbs = list(_STUB_VERBS.get(language, _STUB_VERBS["de"]))
+        rng.shuffle(verbs)
+        bullets = []
+        for b in range(count):
+            obj = activities[b % len(activities)].rstrip(".") if activities else None
+            if obj:
+                obj = obj[0].lower() + obj[1:]
+            bullets.append(self._bullet(language, rng, verb=verbs[b % len(verbs)], obj=obj))
+        return bullets
+
+    def _render_job_batch(self, user: str, language: str, rng: random.Random) -> str:
+        lines = []
+        for num, (count, activities) in self._job_blocks(user).items():
+            lines.append(f"JOB {num}:")
+            lines.extend(f"{b + 1}. {bullet}" for b, bullet in
+                         enumerate(self._job_bullets(count, activities, language, rng)))
+            lines.append("")
+        return "\n".join(lines).strip()
+
+    def _render_single_bullet(self, user: str, language: str, rng: random.Random) -> str:
+        verb = _field(user, ["Suggested verb"]) or None
+        activity = _field(user, ["Activity"]) or None
+        if activity:
+            activity = activity.rstrip(".")
+            activity = activity[0].lower() + activity[1:]
+        return self._bullet(language, rng, verb=verb, obj=activity)
+
+    def _render_hobbies(self, language: str, rng: random.Random) -> str:
+        pool = _STUB_HOBBIES.get(language, _STUB_HOBBIES["de"])
+        return ", ".join(rng.sample(pool, rng.randint(4, 5)))
+
+    def _render_summary(self, user: str, language: str, rng: random.Random) -> str:
+        lang = language if language in _STUB_SUMMARY_OPENERS else "de"
+        occupation = _field(user, ["Beruf", "Profession", "Professione"], "Fachperson")
+        industry = _field(user, ["Branche", "Secteur", "Settore"], _STUB_DEFAULT_INDUSTRY[lang])
+        years_raw = _field(user, ["Berufserfahrung", "Expérience", "Esperienza"], "")
+        skills = _field(user, ["Relevante Skills", "Compétences", "Competenze"], "")
+        if not skills or skills.lower() in ("verschiedene", "diverses", "varie"):
+            skills = rng.choice(_STUB_OBJECTS[lang])
+        years = _first_int(years_raw, rng.randint(2, 15))
+        sentences = [
+            rng.choice(_STUB_SUMMARY_OPENERS[lang]).format(occ=occupation, years=years, industry=industry),
+            rng.choice(_STUB_SUMMARY_FOLLOWUPS[lang]).format(skills=skills),
+        ]
+        if rng.random() < 0.5:
+            sentences.append(self._bullet(lang, rng) + ".")
+        return " ".join(sentences)
+
+    def _render_json(self, user: str, rng: random.Random) -> str:
+        """Echo the first JSON example found in the prompt, else a minimal object."""
+        start = user.find("{")
+        while start != -1:
+            depth = 0
+            for end in range(start, len(user)):
+                if user[end] == "{":
+                    depth += 1
+                elif user[end] == "}":
+                    depth -= 1
+                    if depth == 0:
+                        try:
+                            return json.dumps(json.loads(user[start:end + 1]), ensure_ascii=False)
+                        except json.JSONDecodeError:
+                            break
+            start = user.find("{", start + 1)
+        return json.dumps({"result": "ok", "value": rng.randint(1, 100)})
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+_BACKEND_FACTORIES: Dict[str, Callable[[Any], Any]] = {}
+
+
+def register_backend(name: str, factory: Callable[[Any], Any]) -> None:
+    """
+    Register a backend factory.
+
+    Args:
+        name: Backend name used in the LLM_BACKEND setting.
+        factory: Callable taking the Settings object and returning a client
+            exposing `chat.completions.create` (or an LLMBackend instance).
+    """
+    _BACKEND_FACTORIES[name.lower()] = factory
+
+
+def available_backends() -> List[str]:
+    """Names of all registered backends (plus the built-in 'openai')."""
+    return sorted(set(_BACKEND_FACTORIES) | {"openai"})
+
+
+def create_backend_client(name: str, settings: Any) -> Any:
+    """
+    Create a chat client for a registered (non-OpenAI) backend.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    factory = _BACKEND_FACTORIES.get((name or "").lower())
+    if factory is None:
+        raise ValueError(f"Unknown LLM backend '{name}'. Available: {', '.join(available_backends())}")
+    client = factory(settings)
+    if isinstance(client, LLMBackend):
+        client = ChatClientAdapter(client)
+    return client
+
+
+def _stub_from_settings(settings: Any) -> LLMBackend:
+    return StubLLMBackend(
+        seed=int(getattr(settings, "llm_stub_seed", 42)),
+        latency=getattr(settings, "llm_stub_latency", "none"),
+        latency_ms=float(getattr(settings, "llm_stub_latency_ms", 0.0)),
+        latency_jitter=float(getattr(settings, "llm_stub_latency_jitter", 0.5)),
+        error_rate_429=float(getattr(settings, "llm_stub_error_rate_429", 0.0)),
+        error_rate_timeout=float(getattr(settings, "llm_stub_error_rate_timeout", 0.0)),
+    )
+
+
+register_backend("stub", _stub_from_settings)
@@ -0,0 +1,320 @@
+# src/generation/llm_metrics.py
+"""
+Per-call-site LLM metrics.
+
+Every request that goes through openai_client.py is recorded under a
+call-site name (e.g. "summary.varied", "bullets.all_jobs", "hobbies"):
+ - latency histogram (fixed buckets, mergeable across processes)
+ - prompt / completion tokens
+ - estimated cost in USD and CHF
+ - retries, errors and fallback rate
+ - short circuits (calls skipped while the circuit breaker was open)
+ - truncations (responses cut off at max_tokens)
+
+Metrics are aggregated per run (module-level collector) and per CV
+(`cv_metrics_scope()`), and serialize to plain dicts so worker processes
+can ship them back to the batch report.
+"""
+
+import sys
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+
+# Upper bounds (seconds) of the latency histogram buckets; a final +inf bucket is implicit
+LATENCY_BUCKETS: Tuple[float, ...] = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0)
+
+# USD per 1K tokens (prompt, completion)
+MODEL_PRICING_USD_PER_1K: Dict[str, Tuple[float, float]] = {
+    "gpt-3.5-turbo": (0.0005, 0.0015),
+    "gpt-4o-mini": (0.00015, 0.0006),
+    "gpt-4o": (0.0025, 0.01),
+    "gpt-4-turbo": (0.01, 0.03),
+    "gpt-4": (0.03, 0.06),
+}
+DEFAULT_PRICING_USD_PER_1K: Tuple[float, float] = MODEL_PRICING_USD_PER_1K["gpt-3.5-turbo"]
+
+USD_TO_CHF = 0.88
+
+
+def estimate_cost_usd(model: Optional[str], prompt_tokens: int, completion_tokens: int) -> float:
+    """
+    Estimate request cost in USD from token counts.
+
+    Unknown models are matched by longest known prefix (e.g. "gpt-4-0613"
+    prices as "gpt-4"), falling back to gpt-3.5-turbo pricing.
+    """
+    pricing = DEFAULT_PRICING_USD_PER_1K
+    if model:
+        matches = [name for name in MODEL_PRICING_USD_PER_1K if model.startswith(name)]
+        if matches:
+            pricing = MODEL_PRICING_USD_PER_1K[max(matches, key=len)]
+    return (prompt_tokens * pricing[0] + completion_tokens * pricing[1]) / 1000.0
+
+
+@dataclass
+class CallSiteMetrics:
+    """Aggregated metrics for one call site."""
+    calls: int = 0
+    errors: int = 0
+    retries: int = 0
+    fallbacks: int = 0
+    short_circuits: int = 0
+    truncations: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float = 0.0
+    latency_sum: float = 0.0
+    latency_max: float = 0.0
+    latency_buckets: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    models: Dict[str, int] = field(default_factory=dict)
+
+    def observe_latency(self, seconds: float) -> None:
+        """Add one latency observation to the histogram."""
+        self.latency_sum += seconds
+        self.latency_max = max(self.latency_max, seconds)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.latency_buckets[i] += 1
+                return
+        self.latency_buckets[-1] += 1
+
+    def latency_percentile(self, q: float) -> float:
+        """Estimate a latency percentile (bucket upper bound, capped at the observed max)."""
+        total = sum(self.latency_buckets)
+        if total == 0:
+            return 0.0
+        rank = q / 100.0 * total
+        seen = 0
+        for i, count in enumerate(self.latency_buckets):
+            seen += count
+            if seen >= rank and count:
+                bound = LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else self.latency_max
+                return min(bound, self.latency_max)
+        return self.latency_max
+
+    @property
+    def fallback_rate(self) -> float:
+        """Share of section invocations that ended on the non-LLM fallback."""
+        invocations = (self.calls - self.errors) + self.fallbacks
+        return self.fallbacks / invocations if invocations else 0.0
+
+    def merge(self, other: "CallSiteMetrics") -> None:
+        """Merge another call site's metrics into this one."""
+        self.calls += other.calls
+        self.errors += other.errors
+        self.retries += other.retries
+        self.fallbacks += other.fallbacks
+        self.short_circuits += other.short_circuits
+        self.truncations += other.truncations
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.cost_usd += other.cost_usd
+        self.latency_sum += other.latency_sum
+        self.latency_max = max(self.latency_max, other.latency_max)
+        self.latency_buckets = [a + b for a, b in zip(self.latency_buckets, other.latency_buckets)]
+        for model, count in other.models.items():
+            self.models[model] = self.models.get(model, 0) + count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON export."""
+        bucket_labels = [f"<={b:g}s" for b in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]:g}s"]
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "fallbacks": self.fallbacks,
+            "fallback_rate": round(self.fallback_rate, 4),
+            "short_circuits": self.short_circuits,
+            "truncations": self.truncations,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+            "cost_chf": round(self.cost_usd * USD_TO_CHF, 6),
+            "latency": {
+                "avg_seconds": round(self.latency_sum / self.calls, 4) if self.calls else 0.0,
+                "p50_seconds": round(self.latency_percentile(50), 4),
+                "p95_seconds": round(self.latency_percentile(95), 4),
+                "max_seconds": round(self.latency_max, 4),
+                "sum_seconds": round(self.latency_sum, 4),
+                "histogram": dict(zip(bucket_labels, self.latency_buckets)),
+            },
+            "models": dict(self.models),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CallSiteMetrics":
+        """Rebuild from `to_dict()` output (e.g. sent back by a worker process)."""
+        latency = data.get("latency", {})
+        buckets = list(latency.get("histogram", {}).values()) or [0] * (len(LATENCY_BUCKETS) + 1)
+        return cls(
+            calls=data.get("calls", 0),
+            errors=data.get("errors", 0),
+            retries=data.get("retries", 0),
+            fallbacks=data.get("fallbacks", 0),
+            short_circuits=data.get("short_circuits", 0),
+            truncations=data.get("truncations", 0),
+            prompt_tokens=data.get("prompt_tokens", 0),
+            completion_tokens=data.get("completion_tokens", 0),
+            cost_usd=data.get("cost_usd", 0.0),
+            latency_sum=latency.get("sum_seconds", 0.0),
+            latency_max=latency.get("max_seconds", 0.0),
+            latency_buckets=buckets,
+            models=dict(data.get("models", {})),
+        )
+
+
+class LLMMetrics:
+    """Thread-safe collection of CallSiteMetrics keyed by call site."""
+
+    def __init__(self):
+        self._sites: Dict[str, CallSiteMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _site(self, call_site: str) -> CallSiteMetrics:
+        site = self._sites.get(call_site)
+        if site is None:
+            site = self._sites[call_site] = CallSiteMetrics()
+        return site
+
+    def record_call(
+        self,
+        call_site: str,
+        model: Optional[str],
+        latency: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        retries: int = 0,
+        error: bool = False
+    ) -> None:
+        """Record one logical LLM call (including its retries)."""
+        with self._lock:
+            site = self._site(call_site)
+            site.calls += 1
+            site.errors += int(error)
+            site.retries += retries
+            site.prompt_tokens += prompt_tokens
+            site.completion_tokens += completion_tokens
+            site.cost_usd += estimate_cost_usd(model, prompt_tokens, completion_tokens)
+            site.observe_latency(latency)
+            if model:
+                site.models[model] = site.models.get(model, 0) + 1
+
+    def record_fallback(self, call_site: str) -> None:
+        """Record that a call site used its non-LLM fallback."""
+        with self._lock:
+            self._site(call_site).fallbacks += 1
+
+    def record_short_circuit(self, call_site: str) -> None:
+        """Record that a call was skipped because the circuit breaker was open."""
+        with self._lock:
+            self._site(call_site).short_circuits += 1
+
+    def record_truncation(self, call_site: str) -> None:
+        """Record that a response was cut off at max_tokens."""
+        with self._lock:
+            self._site(call_site).truncations += 1
+
+    def merge(self, other: Union["LLMMetrics", Dict[str, Any], None]) -> None:
+        """Merge another collector or its `to_dict()` output."""
+        if not other:
+            return
+        if isinstance(other, LLMMetrics):
+            with other._lock:
+                sites = {name: CallSiteMetrics.from_dict(m.to_dict()) for name, m in other._sites.items()}
+        else:
+            sites = {name: CallSiteMetrics.from_dict(m) for name, m in other.get("call_sites", {}).items()}
+        with self._lock:
+            for name, metrics in sites.items():
+                self._site(name).merge(metrics)
+
+    def totals(self) -> CallSiteMetrics:
+        """Metrics summed over all call sites."""
+        total = CallSiteMetrics()
+        with self._lock:
+            for metrics in self._sites.values():
+                total.merge(metrics)
+        return total
+
+    def get(self, call_site: str) -> CallSiteMetrics:
+        """Copy of the metrics for one call site (empty if never seen)."""
+        with self._lock:
+            site = self._sites.get(call_site)
+            return CallSiteMetrics.from_dict(site.to_dict()) if site else CallSiteMetrics()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._sites.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON export."""
+        with self._lock:
+            sites = {name: m.to_dict() for name, m in sorted(self._sites.items())}
+        return {"call_sites": sites, "totals": self.totals().to_dict()}
+
+
+# Run-wide collector (per process) and stack of active per-CV scopes
+_RUN_METRICS = LLMMetrics()
+_ACTIVE_SCOPES: ContextVar[Tuple[LLMMetrics, ...]] = ContextVar("llm_metrics_scopes", default=())
+
+
+def get_run_metrics() -> LLMMetrics:
+    """Get the run-wide (per-process) metrics collector."""
+    return _RUN_METRICS
+
+
+@contextmanager
+def cv_metrics_scope() -> Iterator[LLMMetrics]:
+    """
+    Collect metrics for one CV.
+
+    Calls recorded inside the `with` block are added to the run collector and
+    to every active scope, so nested scopes (e.g. a batch worker around
+    generate_complete_cv) both see them.
+    """
+    metrics = LLMMetrics()
+    token = _ACTIVE_SCOPES.set(_ACTIVE_SCOPES.get() + (metrics,))
+    try:
+        yield metrics
+    finally:
+        _ACTIVE_SCOPES.reset(token)
+
+
+def record_llm_call(
+    call_site: str,
+    model: Optional[str],
+    latency: float,
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+    retries: int = 0,
+    error: bool = False
+) -> None:
+    """Record an LLM call in the run collector and all active CV scopes."""
+    for metrics in (_RUN_METRICS,) + _ACTIVE_SCOPES.get():
+        metrics.record_call(call_site, model, latency, prompt_tokens, completion_tokens, retries, error)
+
+
+def record_llm_fallback(call_site: str) -> None:
+    """Record a fallback in the run collector and all active CV scopes."""
+    for metrics in (_RUN_METRICS,) + _ACTIVE_SCOPES.get():
+        metrics.record_fallback(call_site)
+
+
+def record_llm_short_circuit(call_site: str) -> None:
+    """Record a short-circuited call in the run collector and all active CV scopes."""
+    for metrics in (_RUN_METRICS,) + _ACTIVE_SCOPES.get():
+        metrics.record_short_circuit(call_site)
+
+
+def record_llm_truncation(call_site: str) -> None:
+    """Record a truncated response in the run collector and all active CV scopes."""
+    for metrics in (_RUN_METRICS,) + _ACTIVE_SCOPES.get():
+        metrics.record_truncation(call_site)
@@ -0,0 +1,149 @@
+# src/generation/llm_schemas.py
+"""
+JSON schemas for the structured (JSON-mode) generation prompts.
+
+Every LLM prompt of the CV pipeline asks for a JSON object matching one of
+these schemas (see `call_openai_json(..., schema=...)`). Responses are
+validated in one pass with jsonschema; `invalid_fields()` reports the
+top-level fields to re-ask for when a response is incomplete.
+
+Schemas:
+ - SUMMARY_SCHEMA: {"summary": str}
+ - HOBBIES_SCHEMA: {"hobbies": [str, ...]}
+ - BULLET_SCHEMA: {"bullet": str}
+ - bullets_schema(n): {"bullets": [str, ...]} with at least n bullets
+ - job_bullets_schema([n1, n2, ...]): {"job_1": [...], "job_2": [...]}
+ - section_bank_schema(n, m): {"summaries": [str, ...], "hobbies": [str, ...]}
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+from jsonschema import Draft7Validator
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+
+# Bullets shorter than this are treated as parse garbage (same threshold as the text parsers)
+MIN_BULLET_LENGTH = 11
+
+_BULLET_ITEM: Dict[str, Any] = {"type": "string", "minLength": MIN_BULLET_LENGTH}
+
+SUMMARY_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string", "minLength": 40}
+    },
+    "required": ["summary"]
+}
+
+HOBBIES_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "hobbies": {
+            "type": "array",
+            "items": {"type": "string", "minLength": 2},
+            "minItems": 4,
+            "maxItems": 6
+        }
+    },
+    "required": ["hobbies"]
+}
+
+BULLET_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "bullet": dict(_BULLET_ITEM)
+    },
+    "required": ["bullet"]
+}
+
+
+def bullets_schema(count: int) -> Dict[str, Any]:
+    """Schema for a list of at least `count` bullets."""
+    return {
+        "type": "object",
+        "properties": {
+            "bullets": {"type": "array", "items": dict(_BULLET_ITEM), "minItems": count}
+        },
+        "required": ["bullets"]
+    }
+
+
+def job_bullets_schema(counts: List[int]) -> Dict[str, Any]:
+    """
+    Schema for the multi-job bullet batch.
+
+    One top-level field per job ("job_1", "job_2", ...) so that a repair
+    request only re-asks for the jobs that are missing or incomplete.
+
+    Args:
+        counts: Number of bullets per job, in job order.
+
+    Returns:
+        JSON schema dictionary.
+    """
+    properties = {
+        f"job_{i + 1}": {"type": "array", "items": dict(_BULLET_ITEM), "minItems": count}
+        for i, count in enumerate(counts)
+    }
+    return {"type": "object", "properties": properties, "required": list(properties)}
+
+
+def section_bank_schema(summaries: int, hobbies: int) -> Dict[str, Any]:
+    """Schema for one key of the summary/hobby template bank."""
+    return {
+        "type": "object",
+        "properties": {
+            "summaries": {"type": "array", "items": {"type": "string", "minLength": 40}, "minItems": summaries},
+            "hobbies": {"type": "array", "items": {"type": "string", "minLength": 2}, "minItems": hobbies}
+        },
+        "required": ["summaries", "hobbies"]
+    }
+
+
+def sub_schema(schema: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """Restrict an object schema to the given top-level fields (all required)."""
+    properties = schema.get("properties", {})
+    return {
+        "type": "object",
+        "properties": {name: properties[name] for name in fields if name in properties},
+        "required": [name for name in fields if name in properties]
+    }
+
+
+def schema_errors(data: Any, schema: Dict[str, Any]) -> List[str]:
+    """Validate in one pass and return all error messages (empty if valid)."""
+    return [
+        f"{'/'.join(str(p) for p in error.path) or '<root>'}: {error.message}"
+        for error in Draft7Validator(schema).iter_errors(data)
+    ]
+
+
+def invalid_fields(data: Any, schema: Dict[str, Any]) -> List[str]:
+    """
+    Top-level fields of `schema` that are missing or invalid in `data`.
+
+    Args:
+        data: Parsed JSON response.
+        schema: Object schema with top-level "properties".
+
+    Returns:
+        Field names in schema order (all required fields if data is not an object).
+    """
+    required = list(schema.get("required", []))
+    if not isinstance(data, dict):
+        return required
+
+    fields = set()
+    for error in Draft7Validator(schema).iter_errors(data):
+        if error.path:
+            fields.add(error.path[0])
+        elif error.validator == "required":
+            fields.update(name for name in error.validator_value if name not in error.instance)
+        else:
+            fields.update(required)
+    return [name for name in schema.get("properties", {}) if name in fields]
@@ -0,0 +1,275 @@
+# src/generation/model_routing.py
+"""
+Model routing policy per call site, with run budgets and automatic downgrade.
+
+Every LLM call site (see llm_metrics.py) is routed to a model through a
+policy that maps call-site prefixes to a tier ("mini" -> OPENAI_MODEL_MINI,
+"full" -> OPENAI_MODEL_FULL) or to an explicit model name. The longest
+matching dot-separated prefix wins, e.g. "bullets.all_jobs.repair" uses the
+route of "bullets.all_jobs" if set, else "bullets". LLM_MODEL_ROUTING (JSON
+object) overrides DEFAULT_ROUTES.
+
+Calls routed to a bigger model are downgraded to the mini model when
+ - the run has used LLM_BUDGET_DOWNGRADE_AT of LLM_RUN_TOKEN_BUDGET or
+   LLM_RUN_COST_BUDGET_USD, or
+ - the call site's p95 latency exceeds LLM_LATENCY_SLO_SECONDS.
+
+Budgets are checked against the run metrics of the current process; batch
+drivers with worker processes check the merged run metrics themselves
+(`check_budgets()`) and tell workers to downgrade (`force_downgrade()`).
+
+ModelQualityReport relates the models used per section to the CV quality
+score from validate_complete_cv, to see where the big model pays off.
+"""
+
+import sys
+import json
+import logging
+import threading
+from pathlib import Path
+from collections import defaultdict
+from typing import Any, Dict, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import get_settings
+from src.generation.llm_metrics import LLMMetrics, get_run_metrics
+
+LOGGER = logging.getLogger(__name__)
+
+MINI = "mini"
+FULL = "full"
+
+# Call-site prefix -> tier or model name
+DEFAULT_ROUTES: Dict[str, str] = {
+    "summary": MINI,
+    "bullets": MINI,
+    "hobbies": MINI,
+    "translation": MINI,
+    "bullet_bank": MINI,
+    "section_bank": MINI,
+    "data.cantons": FULL,
+    "data.first_names": MINI,
+    "data.last_names": MINI,
+    "data.companies": MINI,
+    "data.skills": MINI,
+}
+
+# Calls a call site needs before its latency is compared with the SLO
+MIN_LATENCY_SAMPLES = 5
+
+# Call-site section -> ValidationIssue.section it is judged by
+VALIDATION_SECTIONS: Dict[str, str] = {
+    "summary": "content",
+    "hobbies": "content",
+    "bullets": "jobs",
+}
+
+
+def parse_routes(value: str) -> Dict[str, str]:
+    """Parse LLM_MODEL_ROUTING (JSON object); invalid values are ignored with a warning."""
+    if not value:
+        return {}
+    try:
+        routes = json.loads(value)
+    except ValueError as e:
+        print(f"Warning: Invalid LLM_MODEL_ROUTING ({e}), using default routes")
+        return {}
+    if not isinstance(routes, dict):
+        print("Warning: LLM_MODEL_ROUTING must be a JSON object, using default routes")
+        return {}
+    return {str(site): str(model) for site, model in routes.items()}
+
+
+class ModelRouter:
+    """
+    Resolves the model for a call site.
+
+    Args:
+        routes: Call-site prefix -> "mini", "full" or a model name.
+        mini_model: Model of the "mini" tier (also the downgrade target).
+        full_model: Model of the "full" tier.
+        token_budget: Run token budget (0 = unlimited).
+        cost_budget_usd: Run cost budget in USD (0 = unlimited).
+        latency_slo_seconds: p95 latency SLO per call site (0 = off).
+        downgrade_at: Share of a budget at which bigger models are downgraded.
+        metrics: Metrics the budgets are checked against (default: run metrics).
+    """
+
+    def __init__(
+        self,
+        routes: Dict[str, str],
+        mini_model: str,
+        full_model: str,
+        token_budget: int = 0,
+        cost_budget_usd: float = 0.0,
+        latency_slo_seconds: float = 0.0,
+        downgrade_at: float = 0.8,
+        metrics: Optional[LLMMetrics] = None
+    ):
+        self.routes = dict(routes)
+        self.mini_model = mini_model
+        self.full_model = full_model
+        self.token_budget = token_budget
+        self.cost_budget_usd = cost_budget_usd
+        self.latency_slo_seconds = latency_slo_seconds
+        self.downgrade_at = downgrade_at
+        self.metrics = metrics
+        self._forced_reason: Optional[str] = None
+        self._downgrades: Dict[str, int] = defaultdict(int)
+        self._warned = set()
+        self._lock = threading.Lock()
+
+    def route_for(self, call_site: str) -> str:
+        """Configured model of a call site (before any downgrade)."""
+        parts = call_site.split(".")
+        for end in range(len(parts), 0, -1):
+            target = self.routes.get(".".join(parts[:end]))
+            if target:
+                return {MINI: self.mini_model, FULL: self.full_model}.get(target, target)
+        return self.mini_model
+
+    def check_budgets(self, metrics: Optional[LLMMetrics] = None) -> Optional[str]:
+        """Budget at risk ("tokens" or "cost") for the given (default: run) metrics, else None."""
+        if not (self.token_budget or self.cost_budget_usd):
+            return None
+        totals = (metrics or self.metrics or get_run_metrics()).totals()
+        if self.token_budget and totals.prompt_tokens + totals.completion_tokens >= self.downgrade_at * self.token_budget:
+            return "tokens"
+        if self.cost_budget_usd and totals.cost_usd >= self.downgrade_at * self.cost_budget_usd:
+            return "cost"
+        return None
+
+    def _latency_at_risk(self, call_site: str) -> bool:
+        if not self.latency_slo_seconds:
+            return False
+        site = (self.metrics or get_run_metrics()).get(call_site)
+        return site.calls >= MIN_LATENCY_SAMPLES and site.latency_percentile(95) > self.latency_slo_seconds
+
+    def force_downgrade(self, reason: Optional[str]) -> None:
+        """Downgrade all routes (e.g. told by a batch driver); None lifts it."""
+        self._forced_reason = reason
+
+    def route(self, call_site: str) -> str:
+        """
+        Model for a call site, downgraded to the mini model if a budget or SLO is at risk.
+
+        Args:
+            call_site: Metrics label of the call (e.g. "summary.varied").
+
+        Returns:
+            Model name.
+        """
+        model = self.route_for(call_site)
+        if model == self.mini_model:
+            return model
+        reason = self._forced_reason or self.check_budgets() or ("latency" if self._latency_at_risk(call_site) else None)
+        if reason is None:
+            return model
+        with self._lock:
+            self._downgrades[call_site] += 1
+            if (call_site, reason) not in self._warned:
+                self._warned.add((call_site, reason))
+                LOGGER.warning("Downgrading '%s' from %s to %s (%s budget/SLO at risk)",
+                               call_site, model, self.mini_model, reason)
+        return self.mini_model
+
+    def downgrades(self) -> Dict[str, int]:
+        """Downgraded calls per call site."""
+        with self._lock:
+            return dict(self._downgrades)
+
+
+_model_router: Optional[ModelRouter] = None
+_model_router_lock = threading.Lock()
+
+
+def get_model_router() -> ModelRouter:
+    """Get the process-wide model router (built from settings)."""
+    global _model_router
+    with _model_router_lock:
+        if _model_router is None:
+            settings = get_settings()
+            routes = dict(DEFAULT_ROUTES)
+            routes.update(parse_routes(settings.llm_model_routing))
+            _model_router = ModelRouter(
+                routes,
+                mini_model=settings.openai_model_mini,
+                full_model=settings.openai_model_full,
+                token_budget=settings.llm_run_token_budget,
+                cost_budget_usd=settings.llm_run_cost_budget_usd,
+                latency_slo_seconds=settings.llm_latency_slo_seconds,
+                downgrade_at=settings.llm_budget_downgrade_at
+            )
+    return _model_router
+
+
+def reset_model_router() -> None:
+    """Drop the process-wide router (e.g. after changing settings)."""
+    global _model_router
+    with _model_router_lock:
+        _model_router = None
+
+
+def route_model(call_site: str) -> str:
+    """Model for a call site under the current routing policy."""
+    return get_model_router().route(call_site)
+
+
+class ModelQualityReport:
+    """
+    Average CV quality per section and model.
+
+    For every accepted CV, each section (first part of the call site, e.g.
+    "summary") is attributed to the model(s) its calls used; the CV's
+    overall score and the penalty of the validation issues in that section
+    are averaged per (section, model).
+    """
+
+    def __init__(self):
+        self._totals: Dict[str, Dict[str, Dict[str, float]]] = defaultdict(
+            lambda: defaultdict(lambda: {"cvs": 0, "score_sum": 0.0, "penalty_sum": 0.0})
+        )
+
+    def add(self, llm_metrics: Optional[Dict[str, Any]], validation_report: Optional[Dict[str, Any]]) -> None:
+        """
+        Add one CV.
+
+        Args:
+            llm_metrics: LLMMetrics.to_dict() of the CV.
+            validation_report: ValidationReport.to_dict() of the CV.
+        """
+        if not llm_metrics or not validation_report:
+            return
+        score = validation_report.get("score", {}).get("overall", 0.0)
+        penalties: Dict[str, float] = defaultdict(float)
+        for issue in validation_report.get("issues", []):
+            penalties[issue.get("section", "")] += issue.get("score_impact", 0.0) or 0.0
+
+        section_models: Dict[str, set] = defaultdict(set)
+        for call_site, site in llm_metrics.get("call_sites", {}).items():
+            if site.get("calls", 0) > site.get("errors", 0):
+                section_models[call_site.split(".")[0]].update(site.get("models", {}))
+        for section, models in section_models.items():
+            penalty = penalties.get(VALIDATION_SECTIONS.get(section, section), 0.0)
+            for model in models:
+                entry = self._totals[section][model]
+                entry["cvs"] += 1
+                entry["score_sum"] += score
+                entry["penalty_sum"] += penalty
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """{section: {model: {"cvs", "avg_quality", "avg_section_penalty"}}}."""
+        return {
+            section: {
+                model: {
+                    "cvs": int(entry["cvs"]),
+                    "avg_quality": round(entry["score_sum"] / entry["cvs"], 2),
+                    "avg_section_penalty": round(entry["penalty_sum"] / entry["cvs"], 2)
+                }
+                for model, entry in sorted(models.items())
+            }
+            for section, models in sorted(self._totals.items())
+        }
@@ -6,49 +6,245 @@ Supports both:
  - modern openai >= 1.0.0 API (from openai import OpenAI; client.chat.completions.create(...))
  - legacy openai 0.28.x API (openai.ChatCompletion.create(...))
 
-Uses exponential backoff for transient errors.
+Uses exponential backoff for transient errors, and a circuit breaker that
+short-circuits calls (callers then use their non-LLM fallbacks) while the
+API is failing or slow.
+
+Calls without an explicit model are routed by call site (model_routing.py).
+max_tokens budgets adapt to the observed completion lengths per call site,
+language and model (token_budget.py); responses cut off at max_tokens are
+retried with a larger budget.
+
+The backend is selected with the LLM_BACKEND setting: "openai" (default) or
+any backend registered in llm_backends.py, e.g. "stub" for a deterministic
+local backend used for offline benchmarking.
 """
 
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Callable, Iterator
+from dataclasses import dataclass
+from collections import deque
+import re
+import json
 import time
 import random
 import logging
+import threading
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.config import get_settings
+from src.generation.llm_backends import create_backend_client
+from src.generation.llm_metrics import record_llm_call, record_llm_short_circuit, record_llm_truncation
+from src.generation.llm_schemas import invalid_fields, schema_errors, sub_schema
+from src.generation.token_budget import get_token_budget
+from src.generation.model_routing import route_model
 
 LOGGER = logging.getLogger(__name__)
 
 MAX_RETRIES = 4
 BASE_BACKOFF_SECONDS = 1.0
 
+# Retries of a truncated response, each with twice the budget
+MAX_TRUNCATION_RETRIES = 2
+
 # Singleton client instance
 _openai_client = None
 _openai_available = False
 _initialized = False
+_backend_name = "openai"
+_circuit_breaker = None
+# Sections of a CV call the LLM from several threads (see section_graph)
+_init_lock = threading.Lock()
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the API while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker over a sliding window of recent LLM calls.
+    
+    Trips (closed -> open) when the window holds `failure_threshold` failures
+    or its p95 latency exceeds `p95_latency_threshold` seconds. While open,
+    calls are rejected immediately. After `reset_timeout` seconds a single
+    probe call is let through (half-open); its outcome closes or re-opens
+    the circuit.
+    
+    Args:
+        failure_threshold: Failures in the window that trip the breaker.
+        window_size: Number of recent calls kept in the window.
+        p95_latency_threshold: p95 latency (seconds) that trips the breaker (0 = off).
+        min_latency_samples: Minimum window size before the latency rule applies.
+        reset_timeout: Seconds to stay open before half-opening.
+        clock: Monotonic clock (overridable for tests).
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        window_size: int = 20,
+        p95_latency_threshold: float = 20.0,
+        min_latency_samples: int = 10,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.p95_latency_threshold = p95_latency_threshold
+        self.min_latency_samples = max(1, min_latency_samples)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._window: deque = deque(maxlen=max(1, window_size))
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.trips = 0
+        self.rejected = 0
+    
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+    
+    def allow_request(self) -> bool:
+        """Return True if a call may go to the API now."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+    
+    def record_success(self, latency: float) -> None:
+        """Record a successful call and its latency."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                if self.p95_latency_threshold and latency > self.p95_latency_threshold:
+                    self._trip()
+                    return
+                self._state = self.CLOSED
+                self._window.clear()
+            self._window.append((True, latency))
+            self._evaluate()
+    
+    def record_failure(self, latency: float = 0.0) -> None:
+        """Record a failed call attempt."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._trip()
+                return
+            self._window.append((False, latency))
+            self._evaluate()
+    
+    def release_probe(self) -> None:
+        """End a half-open probe without an outcome (e.g. a non-transient error), allowing the next one."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._probe_in_flight = False
+    
+    def _p95_latency(self) -> float:
+        latencies = sorted(latency for _, latency in self._window)
+        return latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+    
+    def _evaluate(self) -> None:
+        if self._state != self.CLOSED:
+            return
+        failures = sum(1 for ok, _ in self._window if not ok)
+        if failures >= self.failure_threshold:
+            self._trip()
+        elif (self.p95_latency_threshold and len(self._window) >= self.min_latency_samples
+              and self._p95_latency() > self.p95_latency_threshold):
+            self._trip()
+    
+    def _trip(self) -> None:
+        if self._state != self.OPEN:
+            self.trips += 1
+            LOGGER.warning("LLM circuit breaker opened (trip #%d)", self.trips)
+        self._state = self.OPEN
+        self._opened_at = self._clock()
+        self._probe_in_flight = False
+        self._window.clear()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"state": self._state, "trips": self.trips, "rejected": self.rejected}
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get the process-wide circuit breaker (configured from settings)."""
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        with _init_lock:
+            if _circuit_breaker is None:
+                settings = get_settings()
+                _circuit_breaker = CircuitBreaker(
+                    failure_threshold=settings.llm_breaker_failure_threshold,
+                    window_size=settings.llm_breaker_window,
+                    p95_latency_threshold=settings.llm_breaker_p95_latency_seconds,
+                    reset_timeout=settings.llm_breaker_reset_seconds,
+                )
+    return _circuit_breaker
+
+
+def is_llm_degraded() -> bool:
+    """True while the circuit breaker is open (callers should use fallbacks)."""
+    return get_circuit_breaker().state == CircuitBreaker.OPEN
 
 
 def _initialize_client():
-    """Initialize OpenAI client (singleton pattern)."""
-    global _openai_client, _openai_available, _initialized
+    """Initialize OpenAI client (singleton pattern, thread-safe)."""
+    global _initialized
     
     if _initialized:
         return
     
-    _initialized = True
+    with _init_lock:
+        if not _initialized:
+            _create_client()
+            _initialized = True
+
+
+def _create_client():
+    """Create the client for the configured backend (called once, under _init_lock)."""
+    global _openai_client, _openai_available, _backend_name
+    
     settings = get_settings()
+    _backend_name = (getattr(settings, "llm_backend", "openai") or "openai").lower()
+    
+    if _backend_name != "openai":
+        try:
+            _openai_client = create_backend_client(_backend_name, settings)
+            _openai_available = True
+            LOGGER.debug("Initialized '%s' LLM backend", _backend_name)
+        except Exception as e:
+            LOGGER.warning(f"Failed to initialize LLM backend '{_backend_name}': {e}")
+        return
     
     try:
         # Try modern client first (openai >= 1.0.0)
         try:
             from openai import OpenAI
             if settings.openai_api_key:
-                _openai_client = OpenAI(api_key=settings.openai_api_key)
+                # Retries are handled here (backoff + circuit breaker), not by the SDK
+                _openai_client = OpenAI(
+                    api_key=settings.openai_api_key,
+                    timeout=settings.llm_request_timeout,
+                    max_retries=0
+                )
                 _openai_available = True
                 LOGGER.debug("Initialized modern OpenAI client (openai >= 1.0.0)")
         except ImportError:
@@ -77,6 +273,28 @@ def is_openai_available() -> bool:
     return _openai_available
 
 
+def get_llm_backend_name() -> str:
+    """Get the name of the active LLM backend ("openai", "stub", ...)."""
+    _initialize_client()
+    return _backend_name
+
+
+def reset_client() -> None:
+    """
+    Drop the singleton client and circuit breaker so the next call re-initializes them.
+    
+    Modules that captured availability at import time (cv_assembler,
+    cv_activities_transformer) keep their OPENAI_AVAILABLE flag; call this
+    before importing them.
+    """
+    global _openai_client, _openai_available, _initialized, _backend_name, _circuit_breaker
+    _openai_client = None
+    _openai_available = False
+    _initialized = False
+    _backend_name = "openai"
+    _circuit_breaker = None
+
+
 def _sleep_with_backoff(attempt: int) -> None:
     """Exponential backoff with jitter."""
     backoff = BASE_BACKOFF_SECONDS * (2 ** (attempt - 1))
@@ -92,12 +310,230 @@ def _is_transient_error(exc: Exception) -> bool:
     return any(k in msg for k in ("rate", "timeout", "temporar", "429", "timed out", "connection"))
 
 
+def _record_attempt_failure(breaker: CircuitBreaker, exc: Exception, call_site: str, attempt_started: float) -> None:
+    """
+    Feed a failed attempt to the breaker; stop retrying once it is open.
+    
+    Only transient errors (rate limits, timeouts, connection errors) count as
+    failures; other errors (e.g. invalid requests) say nothing about the
+    API's health and only end a half-open probe.
+    """
+    if not _is_transient_error(exc):
+        breaker.release_probe()
+        return
+    breaker.record_failure(time.perf_counter() - attempt_started)
+    if breaker.state != CircuitBreaker.CLOSED:
+        raise CircuitOpenError(f"LLM circuit breaker opened during '{call_site}': {exc}") from exc
+
+
+@dataclass
+class ChatResult:
+    """Content and usage of a completed chat call."""
+    content: str
+    model: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    finish_reason: Optional[str] = None
+    attempts: int = 1
+
+
+def _usage_from_response(response: Any) -> Tuple[int, int]:
+    """Extract (prompt_tokens, completion_tokens) from modern or legacy responses."""
+    usage = getattr(response, "usage", None)
+    if usage is None and isinstance(response, dict):
+        usage = response.get("usage")
+    return _usage_tokens(usage)
+
+
+def _usage_tokens(usage: Any) -> Tuple[int, int]:
+    """Extract (prompt_tokens, completion_tokens) from a usage object or dict."""
+    if usage is None:
+        return 0, 0
+    if isinstance(usage, dict):
+        return int(usage.get("prompt_tokens") or 0), int(usage.get("completion_tokens") or 0)
+    return int(getattr(usage, "prompt_tokens", 0) or 0), int(getattr(usage, "completion_tokens", 0) or 0)
+
+
+def _call_chat_once(
+    system_prompt: str,
+    user_prompt: str,
+    model: str,
+    max_tokens: int,
+    temperature: float,
+    call_site: str,
+    response_format: Optional[Dict[str, Any]]
+) -> ChatResult:
+    """One chat completion (with transient-error retries) at a fixed budget."""
+    _initialize_client()
+    
+    breaker = get_circuit_breaker()
+    if not breaker.allow_request():
+        record_llm_short_circuit(call_site)
+        raise CircuitOpenError(f"LLM circuit breaker open, skipping '{call_site}'")
+    
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt}
+    ]
+    extra = {"response_format": response_format} if response_format else {}
+    
+    started = time.perf_counter()
+    attempt_started = started
+    attempts = 0
+    # Set once the breaker saw the outcome; every other exit is recorded as a failure
+    outcome_recorded = False
+    
+    def _failed(e: Exception) -> None:
+        nonlocal outcome_recorded
+        outcome_recorded = True
+        _record_attempt_failure(breaker, e, call_site, attempt_started)
+    
+    def _done(content: str, response: Any, finish_reason: Optional[str]) -> ChatResult:
+        nonlocal outcome_recorded
+        outcome_recorded = True
+        breaker.record_success(time.perf_counter() - attempt_started)
+        prompt_tokens, completion_tokens = _usage_from_response(response)
+        record_llm_call(call_site, model, time.perf_counter() - started,
+                        prompt_tokens, completion_tokens, retries=attempts - 1)
+        return ChatResult(content or "", model, prompt_tokens, completion_tokens, finish_reason, attempts)
+    
+    try:
+        # Try modern client first
+        if _openai_client and hasattr(_openai_client, 'chat'):
+            for attempt in range(1, MAX_RETRIES + 1):
+                attempts += 1
+                attempt_started = time.perf_counter()
+                outcome_recorded = False
+                try:
+                    response = _openai_client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        **extra
+                    )
+                    choice = response.choices[0]
+                    return _done(choice.message.content, response, getattr(choice, "finish_reason", None))
+                except Exception as e:
+                    LOGGER.warning("OpenAI modern client attempt %d failed: %s", attempt, e)
+                    _failed(e)
+                    if attempt == MAX_RETRIES or not _is_transient_error(e):
+                        raise
+                    _sleep_with_backoff(attempt)
+        
+        # Fallback to legacy client
+        try:
+            import openai
+            for attempt in range(1, MAX_RETRIES + 1):
+                attempts += 1
+                attempt_started = time.perf_counter()
+                outcome_recorded = False
+                try:
+                    response = openai.ChatCompletion.create(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        **extra
+                    )
+                    c = response.choices[0]
+                    finish_reason = getattr(c, "finish_reason", None)
+                    if hasattr(c, "message"):
+                        content = c.message["content"] if isinstance(c.message, dict) else c.message.content
+                        return _done(content, response, finish_reason)
+                    if hasattr(c, "text"):
+                        return _done(c.text, response, finish_reason)
+                    return _done(response["choices"][0].get("message", {}).get("content", ""), response, finish_reason)
+                except Exception as e:
+                    LOGGER.warning("OpenAI legacy client attempt %d failed: %s", attempt, e)
+                    _failed(e)
+                    if attempt == MAX_RETRIES or not _is_transient_error(e):
+                        raise
+                    _sleep_with_backoff(attempt)
+        except ImportError:
+            pass
+        
+        raise RuntimeError("OpenAI call failed: no working client available or all retries exhausted")
+    except Exception:
+        record_llm_call(call_site, model, time.perf_counter() - started, retries=max(0, attempts - 1), error=True)
+        raise
+    finally:
+        if not outcome_recorded:
+            breaker.record_failure(time.perf_counter() - attempt_started)
+
+
+def call_openai_chat_result(
+    system_prompt: str,
+    user_prompt: str,
+    model: Optional[str] = None,
+    max_tokens: int = 400,
+    temperature: float = 0.7,
+    call_site: str = "generic",
+    response_format: Optional[Dict[str, Any]] = None,
+    language: Optional[str] = None,
+    units: int = 1
+) -> ChatResult:
+    """
+    Call the OpenAI chat completion API and return content plus usage.
+    
+    Supports both modern (>= 1.0.0) and legacy (0.28.x) clients. Every call
+    (successful or not) is recorded in llm_metrics under `call_site`. While
+    the circuit breaker is open the API is not called at all.
+    
+    With adaptive budgets enabled, `max_tokens` is only the starting budget:
+    once (call_site, language, model) has enough samples, the observed
+    percentile is requested instead. A truncated response (finish_reason
+    "length") is retried up to MAX_TRUNCATION_RETRIES times with twice the
+    budget (at least `max_tokens`).
+    
+    Args:
+        system_prompt: System message content.
+        user_prompt: User message content.
+        model: Model name (default: routed by call site).
+        max_tokens: Maximum tokens in response (default budget).
+        temperature: Sampling temperature.
+        call_site: Metrics label of the calling section (e.g. "summary.varied").
+        response_format: Optional response format, e.g. {"type": "json_object"}.
+        language: CV language (budgets are tracked per language).
+        units: Size of the request, e.g. number of bullets (budgets scale with it).
+    
+    Returns:
+        ChatResult with content, token usage and finish reason.
+    
+    Raises:
+        CircuitOpenError: If the circuit breaker is open (no API call made).
+        RuntimeError: If OpenAI call fails after all retries.
+    """
+    if model is None:
+        model = route_model(call_site)
+    
+    budget = get_token_budget()
+    budget_tokens = budget.max_tokens(call_site, max_tokens, model, language, units) if budget else max_tokens
+    
+    for truncation_retry in range(MAX_TRUNCATION_RETRIES + 1):
+        result = _call_chat_once(
+            system_prompt, user_prompt, model, budget_tokens, temperature, call_site, response_format
+        )
+        if result.finish_reason != "length":
+            if budget:
+                budget.observe(call_site, result.completion_tokens, model, language, units)
+            return result
+        record_llm_truncation(call_site)
+        LOGGER.info("Response for '%s' truncated at %d tokens (retry %d)", call_site, budget_tokens, truncation_retry)
+        budget_tokens = max(max_tokens, budget_tokens * 2)
+    return result
+
+
 def call_openai_chat(
     system_prompt: str,
     user_prompt: str,
     model: Optional[str] = None,
     max_tokens: int = 400,
-    temperature: float = 0.7
+    temperature: float = 0.7,
+    call_site: str = "generic",
+    response_format: Optional[Dict[str, Any]] = None,
+    language: Optional[str] = None,
+    units: int = 1
 ) -> str:
     """
     Call the OpenAI chat completion API.
@@ -107,9 +543,13 @@ def call_openai_chat(
     Args:
         system_prompt: System message content.
         user_prompt: User message content.
-        model: Model name (default: from settings).
+        model: Model name (default: routed by call site).
         max_tokens: Maximum tokens in response.
         temperature: Sampling temperature.
+        call_site: Metrics label of the calling section (e.g. "summary.varied").
+        response_format: Optional response format, e.g. {"type": "json_object"}.
+        language: CV language (budgets are tracked per language).
+        units: Size of the request, e.g. number of bullets (budgets scale with it).
     
     Returns:
         Assistant's response content.
@@ -117,60 +557,200 @@ def call_openai_chat(
     Raises:
         RuntimeError: If OpenAI call fails after all retries.
     """
+    return call_openai_chat_result(
+        system_prompt, user_prompt, model=model, max_tokens=max_tokens,
+        temperature=temperature, call_site=call_site, response_format=response_format,
+        language=language, units=units
+    ).content
+
+
+def _chunk_parts(chunk: Any) -> Tuple[str, Optional[str], Any]:
+    """Extract (content delta, finish_reason, usage) from a modern or legacy stream chunk."""
+    if isinstance(chunk, dict):
+        choices = chunk.get("choices") or []
+        choice = choices[0] if choices else {}
+        text = (choice.get("delta") or {}).get("content") or ""
+        return text, choice.get("finish_reason"), chunk.get("usage")
+    choices = getattr(chunk, "choices", None) or []
+    if not choices:
+        return "", None, getattr(chunk, "usage", None)
+    delta = getattr(choices[0], "delta", None)
+    text = getattr(delta, "content", None) or ""
+    return text, getattr(choices[0], "finish_reason", None), getattr(chunk, "usage", None)
+
+
+def stream_openai_chat(
+    system_prompt: str,
+    user_prompt: str,
+    model: Optional[str] = None,
+    max_tokens: int = 400,
+    temperature: float = 0.7,
+    call_site: str = "generic",
+    response_format: Optional[Dict[str, Any]] = None,
+    language: Optional[str] = None,
+    units: int = 1
+) -> Iterator[str]:
+    """
+    Stream a chat completion, yielding content deltas as they arrive.
+    
+    Retries (with backoff and the circuit breaker) only apply to opening the
+    stream; errors after the first chunk are raised to the caller. Closing the
+    generator early (e.g. `break` in the consuming loop) closes the HTTP
+    stream, so the model stops generating. The call is recorded in
+    llm_metrics when the generator finishes; for cancelled streams the
+    completion tokens are estimated from the content actually received.
+    
+    The budget adapts like in call_openai_chat_result(), but truncated
+    streams are not retried (content was already yielded); they are counted
+    as truncations and the caller repairs what is missing.
+    
+    Args:
+        system_prompt: System message content.
+        user_prompt: User message content.
+        model: Model name (default: routed by call site).
+        max_tokens: Maximum tokens in response.
+        temperature: Sampling temperature.
+        call_site: Metrics label of the calling section (e.g. "bullets.all_jobs").
+        response_format: Optional response format, e.g. {"type": "json_object"}.
+        language: CV language (budgets are tracked per language).
+        units: Size of the request, e.g. number of bullets (budgets scale with it).
+    
+    Yields:
+        Content deltas (str).
+    
+    Raises:
+        CircuitOpenError: If the circuit breaker is open (no API call made).
+        RuntimeError: If the stream cannot be opened after all retries.
+    """
+    from src.generation.llm_backends import estimate_tokens
+    
     _initialize_client()
     
-    settings = get_settings()
     if model is None:
-        model = settings.openai_model_mini
+        model = route_model(call_site)
+    
+    breaker = get_circuit_breaker()
+    if not breaker.allow_request():
+        record_llm_short_circuit(call_site)
+        raise CircuitOpenError(f"LLM circuit breaker open, skipping '{call_site}'")
+    
+    budget = get_token_budget()
+    if budget:
+        max_tokens = budget.max_tokens(call_site, max_tokens, model, language, units)
     
     messages = [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": user_prompt}
     ]
+    extra = {"response_format": response_format} if response_format else {}
     
-    # Try modern client first
-    if _openai_client and hasattr(_openai_client, 'chat'):
-        for attempt in range(1, MAX_RETRIES + 1):
-            try:
-                response = _openai_client.chat.completions.create(
-                    model=model,
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    temperature=temperature
-                )
-                return response.choices[0].message.content
-            except Exception as e:
-                LOGGER.warning("OpenAI modern client attempt %d failed: %s", attempt, e)
-                if attempt == MAX_RETRIES or not _is_transient_error(e):
-                    raise
-                _sleep_with_backoff(attempt)
+    started = time.perf_counter()
+    attempt_started = started
+    attempts = 0
+    stream = None
+    # Set once the breaker saw the outcome of opening the stream; every other exit is recorded as a failure
+    outcome_recorded = False
     
-    # Fallback to legacy client
     try:
-        import openai
         for attempt in range(1, MAX_RETRIES + 1):
+            attempts += 1
+            attempt_started = time.perf_counter()
+            outcome_recorded = False
             try:
-                response = openai.ChatCompletion.create(
-                    model=model,
-                    messages=messages,
-                    max_tokens=max_tokens,
-                    temperature=temperature
-                )
-                c = response.choices[0]
-                if hasattr(c, "message"):
-                    return c.message["content"] if isinstance(c.message, dict) else c.message.content
-                if hasattr(c, "text"):
-                    return c.text
-                return response["choices"][0].get("message", {}).get("content", "")
+                if _openai_client and hasattr(_openai_client, 'chat'):
+                    stream = _openai_client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        stream=True,
+                        stream_options={"include_usage": True},
+                        **extra
+                    )
+                else:
+                    import openai
+                    stream = openai.ChatCompletion.create(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        stream=True,
+                        **extra
+                    )
+                # The stream's outcome is recorded after it is consumed
+                outcome_recorded = True
+                break
+            except ImportError:
+                raise RuntimeError("OpenAI call failed: no working client available")
             except Exception as e:
-                LOGGER.warning("OpenAI legacy client attempt %d failed: %s", attempt, e)
+                LOGGER.warning("OpenAI stream attempt %d failed: %s", attempt, e)
+                outcome_recorded = True
+                _record_attempt_failure(breaker, e, call_site, attempt_started)
                 if attempt == MAX_RETRIES or not _is_transient_error(e):
                     raise
                 _sleep_with_backoff(attempt)
-    except ImportError:
-        pass
+    except Exception:
+        record_llm_call(call_site, model, time.perf_counter() - started, retries=max(0, attempts - 1), error=True)
+        raise
+    finally:
+        if not outcome_recorded:
+            breaker.record_failure(time.perf_counter() - attempt_started)
     
-    raise RuntimeError("OpenAI call failed: no working client available or all retries exhausted")
+    received = []
+    usage = None
+    finish_reason = None
+    failed = False
+    try:
+        for chunk in stream:
+            text, chunk_finish_reason, chunk_usage = _chunk_parts(chunk)
+            if chunk_usage is not None:
+                usage = chunk_usage
+            if chunk_finish_reason:
+                finish_reason = chunk_finish_reason
+            if text:
+                received.append(text)
+                yield text
+    except Exception:
+        failed = True
+        breaker.record_failure(time.perf_counter() - started)
+        raise
+    finally:
+        if hasattr(stream, "close"):
+            try:
+                stream.close()
+            except Exception:
+                pass
+        latency = time.perf_counter() - started
+        if usage is not None:
+            prompt_tokens, completion_tokens = _usage_tokens(usage)
+        else:
+            prompt_tokens = estimate_tokens(system_prompt) + estimate_tokens(user_prompt)
+            completion_tokens = estimate_tokens("".join(received))
+        if not failed:
+            breaker.record_success(latency)
+        record_llm_call(call_site, model, latency, prompt_tokens, completion_tokens,
+                        retries=attempts - 1, error=failed)
+        if finish_reason == "length":
+            record_llm_truncation(call_site)
+        elif finish_reason and budget:
+            budget.observe(call_site, completion_tokens, model, language, units)
+
+
+def build_json_system_prompt(system_prompt: str, schema: Optional[Dict[str, Any]] = None) -> str:
+    """Append the JSON-mode instruction (and the expected schema) to a system prompt."""
+    prompt = system_prompt + "\n\nRespond ONLY with valid JSON, no markdown."
+    if schema:
+        prompt += "\nThe JSON object must match this JSON schema:\n" + json.dumps(schema, ensure_ascii=False)
+    return prompt
+
+
+def _parse_json_content(content: str) -> Any:
+    """Parse a JSON response, tolerating markdown fences from backends without JSON mode."""
+    cleaned = content.strip()
+    if cleaned.startswith("```"):
+        cleaned = re.sub(r'^```(?:json)?\s*', '', cleaned)
+        cleaned = re.sub(r'\s*```$', '', cleaned)
+    return json.loads(cleaned)
 
 
 def call_openai_json(
@@ -178,44 +758,91 @@ def call_openai_json(
     user_prompt: str,
     model: Optional[str] = None,
     max_tokens: int = 1000,
-    temperature: float = 0.7
+    temperature: float = 0.7,
+    call_site: str = "json",
+    schema: Optional[Dict[str, Any]] = None,
+    max_repairs: int = 1,
+    language: Optional[str] = None,
+    units: int = 1
 ) -> Dict[str, Any]:
     """
-    Call OpenAI and parse JSON response.
+    Call OpenAI in JSON mode and parse (and optionally validate) the response.
+    
+    With a schema, the response is validated in one pass (all errors at
+    once). Missing or invalid top-level fields are re-requested in a repair
+    call that asks only for those fields (recorded as "<call_site>.repair");
+    valid fields of the first response are kept.
     
     Args:
         system_prompt: System message content.
         user_prompt: User message content.
-        model: Model name (default: from settings).
+        model: Model name (default: routed by call site).
         max_tokens: Maximum tokens in response.
         temperature: Sampling temperature.
+        call_site: Metrics label of the calling section.
+        schema: Optional JSON schema (object with top-level properties, see llm_schemas.py).
+        max_repairs: Maximum repair calls for missing/invalid fields.
+        language: CV language (budgets are tracked per language).
+        units: Size of the request, e.g. number of bullets (budgets scale with it).
     
     Returns:
         Parsed JSON dictionary.
     
     Raises:
-        ValueError: If response is not valid JSON.
+        ValueError: If response is not valid JSON or does not match the schema after repairs.
         RuntimeError: If OpenAI call fails.
     """
-    import json
-    import re
-    
     response = call_openai_chat(
-        system_prompt=system_prompt + "\n\nRespond ONLY with valid JSON, no markdown.",
+        system_prompt=build_json_system_prompt(system_prompt, schema),
         user_prompt=user_prompt,
         model=model,
         max_tokens=max_tokens,
-        temperature=temperature
+        temperature=temperature,
+        call_site=call_site,
+        response_format={"type": "json_object"},
+        language=language,
+        units=units
     )
     
-    # Clean response (remove markdown if present)
-    cleaned = response.strip()
-    if cleaned.startswith("```"):
-        # Remove markdown code blocks
-        cleaned = re.sub(r'^```(?:json)?\s*', '', cleaned)
-        cleaned = re.sub(r'\s*```$', '', cleaned)
-    
     try:
-        return json.loads(cleaned)
+        data = _parse_json_content(response)
     except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON response: {e}\nResponse: {response[:200]}")
+        if schema is None:
+            raise ValueError(f"Invalid JSON response: {e}\nResponse: {response[:200]}")
+        data = {}
+    if schema is None:
+        return data
+    if not isinstance(data, dict):
+        data = {}
+    
+    for _ in range(max_repairs):
+        fields = invalid_fields(data, schema)
+        if not fields:
+            break
+        LOGGER.debug("Repairing JSON fields %s for '%s'", fields, call_site)
+        repair_prompt = (
+            f"{user_prompt}\n\n"
+            f"Your previous answer was missing or had invalid values for: {', '.join(fields)}. "
+            f"Return ONLY these fields as JSON."
+        )
+        try:
+            repaired = _parse_json_content(call_openai_chat(
+                system_prompt=build_json_system_prompt(system_prompt, sub_schema(schema, fields)),
+                user_prompt=repair_prompt,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                call_site=f"{call_site}.repair",
+                response_format={"type": "json_object"},
+                language=language,
+                units=units
+            ))
+        except json.JSONDecodeError:
+            continue
+        if isinstance(repaired, dict):
+            data.update({name: repaired[name] for name in fields if name in repaired})
+    
+    errors = schema_errors(data, schema)
+    if errors:
+        raise ValueError(f"JSON response does not match schema: {'; '.join(errors[:3])}")
+    return data
@@ -0,0 +1,208 @@
+# src/generation/portrait_store.py
+"""
+In-memory store of preprocessed portraits.
+
+The originals in data/portraits are large PNGs. Every CV used to open one,
+resize it, apply the circular mask, re-encode it to PNG and base64-encode
+it, and every PDF template decoded that base64 again into a temp file.
+
+PortraitStore does the image work once per (portrait, size, circular)
+variant and keeps the encoded PNG and its data URI in memory. Renderers
+look the PNG up by data URI (see png_for_data_uri), so the base64 round
+trip only happens for portraits that did not come from the store.
+
+CV documents carry a portrait asset id (`make_asset_id()`, e.g.
+"female/26-40/img.png@150x150c") instead of the base64 PNG; renderers
+resolve it with `resolve_png()`, and base64 is only inlined on request.
+"""
+
+import sys
+import io
+import base64
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+PORTRAIT_DIR = project_root / "data" / "portraits"
+
+# Variant used on CVs
+DEFAULT_SIZE: Tuple[int, int] = (150, 150)
+
+
+def make_asset_id(portrait_path: Optional[str], size: Tuple[int, int] = DEFAULT_SIZE, circular: bool = True) -> Optional[str]:
+    """Asset id of a portrait variant ("<path>@<w>x<h>[c]"), None without portrait."""
+    if not portrait_path:
+        return None
+    return f"{portrait_path}@{size[0]}x{size[1]}{'c' if circular else ''}"
+
+
+def parse_asset_id(asset_id: str) -> Optional[Tuple[str, Tuple[int, int], bool]]:
+    """
+    Split an asset id into (portrait_path, size, circular).
+
+    Returns:
+        Tuple or None if asset_id is not an asset id (e.g. a data URI).
+    """
+    if not asset_id or asset_id.startswith("data:") or "@" not in asset_id:
+        return None
+    path, variant = asset_id.rsplit("@", 1)
+    circular = variant.endswith("c")
+    try:
+        width, height = (int(v) for v in variant.rstrip("c").split("x"))
+    except ValueError:
+        return None
+    return path, (width, height), circular
+
+
+class PortraitStore:
+    """
+    Preprocessed portrait variants keyed by (portrait_path, size, circular).
+
+    Thread-safe; a variant is computed on first use and kept for the life of
+    the process.
+    """
+
+    def __init__(self, portrait_dir: Path = PORTRAIT_DIR):
+        self.portrait_dir = Path(portrait_dir)
+        self._png: Dict[Tuple[str, Tuple[int, int], bool], Optional[bytes]] = {}
+        self._uris: Dict[Tuple[str, Tuple[int, int], bool], str] = {}
+        self._png_by_uri: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def get_png(self, portrait_path: Optional[str], size: Tuple[int, int] = DEFAULT_SIZE, circular: bool = False) -> Optional[bytes]:
+        """
+        PNG bytes of a portrait variant.
+
+        Args:
+            portrait_path: Path relative to data/portraits.
+            size: Target size (width, height).
+            circular: Whether to apply circular crop.
+
+        Returns:
+            PNG bytes or None if the portrait is missing or unreadable.
+        """
+        if not portrait_path:
+            return None
+        key = (portrait_path, tuple(size), circular)
+        with self._lock:
+            if key in self._png:
+                return self._png[key]
+        png = self._render(portrait_path, tuple(size), circular)
+        with self._lock:
+            self._png[key] = png
+        return png
+
+    def get_data_uri(self, portrait_path: Optional[str], size: Tuple[int, int] = DEFAULT_SIZE, circular: bool = False) -> Optional[str]:
+        """Base64 data URI of a portrait variant (encoded once per variant)."""
+        if not portrait_path:
+            return None
+        key = (portrait_path, tuple(size), circular)
+        with self._lock:
+            if key in self._uris:
+                return self._uris[key]
+        png = self.get_png(portrait_path, size, circular)
+        if png is None:
+            return None
+        uri = f"data:image/png;base64,{base64.b64encode(png).decode('utf-8')}"
+        with self._lock:
+            self._uris[key] = uri
+            self._png_by_uri[uri] = png
+        return uri
+
+    def png_for_data_uri(self, data_uri: Optional[str]) -> Optional[bytes]:
+        """
+        PNG bytes behind a data URI (or plain base64 string).
+
+        URIs handed out by get_data_uri are looked up without decoding;
+        others are base64-decoded.
+        """
+        if not data_uri:
+            return None
+        with self._lock:
+            png = self._png_by_uri.get(data_uri)
+        if png is not None:
+            return png
+        try:
+            return base64.b64decode(data_uri.split(",")[1] if "," in data_uri else data_uri)
+        except (ValueError, TypeError):
+            return None
+
+    def resolve_png(self, reference: Optional[str]) -> Optional[bytes]:
+        """PNG bytes of an asset id or data URI."""
+        asset = parse_asset_id(reference) if reference else None
+        if asset is not None:
+            return self.get_png(*asset)
+        return self.png_for_data_uri(reference)
+
+    def resolve_data_uri(self, reference: Optional[str]) -> Optional[str]:
+        """Data URI of an asset id (data URIs are returned unchanged)."""
+        asset = parse_asset_id(reference) if reference else None
+        if asset is not None:
+            return self.get_data_uri(*asset)
+        return reference
+
+    def warm(self, portrait_paths: Iterable[str], size: Tuple[int, int] = DEFAULT_SIZE, circular: bool = True) -> int:
+        """
+        Precompute variants (e.g. before a batch).
+
+        Returns:
+            Number of portraits available.
+        """
+        return sum(1 for path in portrait_paths if self.get_data_uri(path, size, circular))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._png)
+
+    def _render(self, portrait_path: str, size: Tuple[int, int], circular: bool) -> Optional[bytes]:
+        full_path = self.portrait_dir / portrait_path
+        if not full_path.exists():
+            return None
+
+        try:
+            from PIL import Image, ImageDraw
+
+            with Image.open(full_path) as original:
+                # Convert to RGB if necessary
+                img = original.convert("RGB") if original.mode != "RGB" else original
+                img = img.resize(size, Image.Resampling.LANCZOS)
+
+            # Circular crop if requested
+            if circular:
+                mask = Image.new("L", size, 0)
+                ImageDraw.Draw(mask).ellipse([0, 0, size[0], size[1]], fill=255)
+                output = Image.new("RGB", size, (255, 255, 255))
+                output.paste(img, (0, 0), mask)
+                img = output
+
+            buffer = io.BytesIO()
+            img.save(buffer, format="PNG")
+            return buffer.getvalue()
+
+        except Exception as e:
+            print(f"Warning: Could not load portrait: {e}")
+            return None
+
+
+_portrait_store: Optional[PortraitStore] = None
+_portrait_store_lock = threading.Lock()
+
+
+def get_portrait_store() -> PortraitStore:
+    """Get the process-wide portrait store."""
+    global _portrait_store
+    with _portrait_store_lock:
+        if _portrait_store is None:
+            _portrait_store = PortraitStore()
+        return _portrait_store
+
+
+def reset_portrait_store() -> None:
+    """Drop all cached variants (e.g. after portraits changed on disk)."""
+    global _portrait_store
+    with _portrait_store_lock:
+        _portrait_store = None
@@ -58,7 +58,7 @@ def load_name_csv(path):
     return names, weights
 
 
-_FALLBACK_FIRST_NAMES: Dict[str, Dict[str, List[str]]] = {
+FALLBACK_FIRST_NAMES: Dict[str, Dict[str, List[str]]] = {
     "de": {
         "male": ["Luca", "Noah", "Leon", "Liam", "Matteo", "Jan", "David", "Simon", "Samuel", "Nico"],
         "female": ["Sophie", "Mia", "Lena", "Lea", "Emma", "Laura", "Nina", "Alina", "Anna", "Sara"],
@@ -72,6 +72,65 @@ _FALLBACK_FIRST_NAMES: Dict[str, Dict[str, List[str]]] = {
         "female": ["Giulia", "Sofia", "Martina", "Chiara", "Francesca", "Alice", "Elisa", "Sara", "Giorgia", "Valentina"],
     },
 }
+# Former private name, kept for existing imports
+_FALLBACK_FIRST_NAMES = FALLBACK_FIRST_NAMES
+
+
+# All 26 Swiss cantons with accurate data
+FALLBACK_CANTONS: List[Dict[str, Any]] = [
+    {"code": "ZH", "name_de": "Zürich", "name_fr": "Zurich", "name_it": "Zurigo", "population": 1553423, "workforce": 820000,
+        "language_de": 0.83, "language_fr": 0.05, "language_it": 0.03, "language_en": 0.09, "major_city": "Zürich"},
+    {"code": "BE", "name_de": "Bern", "name_fr": "Berne", "name_it": "Berna", "population": 1043132, "workforce": 550000,
+        "language_de": 0.84, "language_fr": 0.08, "language_it": 0.02, "language_en": 0.06, "major_city": "Bern"},
+    {"code": "LU", "name_de": "Luzern", "name_fr": "Lucerne", "name_it": "Lucerna", "population": 416347, "workforce": 230000,
+        "language_de": 0.89, "language_fr": 0.03, "language_it": 0.02, "language_en": 0.06, "major_city": "Luzern"},
+    {"code": "UR", "name_de": "Uri", "name_fr": "Uri", "name_it": "Uri", "population": 36819, "workforce": 20000,
+        "language_de": 0.92, "language_fr": 0.02, "language_it": 0.02, "language_en": 0.04, "major_city": "Altdorf"},
+    {"code": "SZ", "name_de": "Schwyz", "name_fr": "Schwytz", "name_it": "Svitto", "population": 162157, "workforce": 90000,
+        "language_de": 0.89, "language_fr": 0.03, "language_it": 0.02, "language_en": 0.06, "major_city": "Schwyz"},
+    {"code": "OW", "name_de": "Obwalden", "name_fr": "Obwald", "name_it": "Obvaldo", "population": 38108, "workforce": 21000,
+        "language_de": 0.91, "language_fr": 0.02, "language_it": 0.02, "language_en": 0.05, "major_city": "Sarnen"},
+    {"code": "NW", "name_de": "Nidwalden", "name_fr": "Nidwald", "name_it": "Nidvaldo", "population": 43520, "workforce": 24000,
+        "language_de": 0.90, "language_fr": 0.02, "language_it": 0.02, "language_en": 0.06, "major_city": "Stans"},
+    {"code": "GL", "name_de": "Glarus", "name_fr": "Glaris", "name_it": "Glarona", "population": 40851, "workforce": 22000,
+        "language_de": 0.88, "language_fr": 0.03, "language_it": 0.02, "language_en": 0.07, "major_city": "Glarus"},
+    {"code": "ZG", "name_de": "Zug", "name_fr": "Zoug", "name_it": "Zugo", "population": 130183, "workforce": 75000,
+        "language_de": 0.82, "language_fr": 0.04, "language_it": 0.03, "language_en": 0.11, "major_city": "Zug"},
+    {"code": "FR", "name_de": "Freiburg", "name_fr": "Fribourg", "name_it": "Friburgo", "population": 326302, "workforce": 170000,
+        "language_de": 0.29, "language_fr": 0.67, "language_it": 0.01, "language_en": 0.03, "major_city": "Fribourg"},
+    {"code": "SO", "name_de": "Solothurn", "name_fr": "Soleure", "name_it": "Soletta", "population": 278907, "workforce": 150000,
+        "language_de": 0.88, "language_fr": 0.04, "language_it": 0.02, "language_en": 0.06, "major_city": "Solothurn"},
+    {"code": "BS", "name_de": "Basel-Stadt", "name_fr": "Bâle-Ville", "name_it": "Basilea Città", "population": 195845,
+        "workforce": 110000, "language_de": 0.75, "language_fr": 0.06, "language_it": 0.04, "language_en": 0.15, "major_city": "Basel"},
+    {"code": "BL", "name_de": "Basel-Landschaft", "name_fr": "Bâle-Campagne", "name_it": "Basilea Campagna", "population": 291201,
+        "workforce": 160000, "language_de": 0.86, "language_fr": 0.04, "language_it": 0.03, "language_en": 0.07, "major_city": "Liestal"},
+    {"code": "SH", "name_de": "Schaffhausen", "name_fr": "Schaffhouse", "name_it": "Sciaffusa", "population": 83485, "workforce": 46000,
+        "language_de": 0.89, "language_fr": 0.03, "language_it": 0.02, "language_en": 0.06, "major_city": "Schaffhausen"},
+    {"code": "AR", "name_de": "Appenzell Ausserrhoden", "name_fr": "Appenzell Rhodes-Extérieures", "name_it": "Appenzello Esterno",
+        "population": 79236, "workforce": 42000, "language_de": 0.90, "language_fr": 0.02, "language_it": 0.02, "language_en": 0.06, "major_city": "Herisau"},
+    {"code": "AI", "name_de": "Appenzell Innerrhoden", "name_fr": "Appenzell Rhodes-Intérieures", "name_it": "Appenzello Interno",
+        "population": 16746, "workforce": 9000, "language_de": 0.91, "language_fr": 0.02, "language_it": 0.01, "language_en": 0.06, "major_city": "Appenzell"},
+    {"code": "SG", "name_de": "St. Gallen", "name_fr": "Saint-Gall", "name_it": "San Gallo", "population": 519166, "workforce": 280000,
+        "language_de": 0.89, "language_fr": 0.02, "language_it": 0.02, "language_en": 0.07, "major_city": "St. Gallen"},
+    {"code": "GR", "name_de": "Graubünden", "name_fr": "Grisons", "name_it": "Grigioni", "population": 199021, "workforce": 110000,
+        "language_de": 0.70, "language_fr": 0.08, "language_it": 0.13, "language_en": 0.09, "major_city": "Chur"},
+    {"code": "AG", "name_de": "Aargau", "name_fr": "Argovie", "name_it": "Argovia", "population": 695667, "workforce": 380000,
+        "language_de": 0.87, "language_fr": 0.04, "language_it": 0.03, "language_en": 0.06, "major_city": "Aarau"},
+    {"code": "TG", "name_de": "Thurgau", "name_fr": "Thurgovie", "name_it": "Turgovia", "population": 290285, "workforce": 155000,
+        "language_de": 0.89, "language_fr": 0.03, "language_it": 0.02, "language_en": 0.06, "major_city": "Frauenfeld"},
+    {"code": "TI", "name_de": "Tessin", "name_fr": "Tessin", "name_it": "Ticino", "population": 368046, "workforce": 190000,
+        "language_de": 0.04, "language_fr": 0.03, "language_it": 0.86, "language_en": 0.07, "major_city": "Lugano"},
+    {"code": "VD", "name_de": "Waadt", "name_fr": "Vaud", "name_it": "Valdo", "population": 866239, "workforce": 460000,
+        "language_de": 0.02, "language_fr": 0.90, "language_it": 0.01, "language_en": 0.07, "major_city": "Lausanne"},
+    {"code": "VS", "name_de": "Wallis", "name_fr": "Valais", "name_it": "Vallese", "population": 349373, "workforce": 180000,
+        "language_de": 0.62, "language_fr": 0.37, "language_it": 0.01, "language_en": 0.00, "major_city": "Sion"},
+    {"code": "NE", "name_de": "Neuenburg", "name_fr": "Neuchâtel", "name_it": "Neuchâtel", "population": 178548, "workforce": 95000,
+        "language_de": 0.05, "language_fr": 0.90, "language_it": 0.01, "language_en": 0.04, "major_city": "Neuchâtel"},
+    {"code": "JU", "name_de": "Jura", "name_fr": "Jura", "name_it": "Giura", "population": 73894, "workforce": 39000,
+        "language_de": 0.05, "language_fr": 0.91, "language_it": 0.01, "language_en": 0.03, "major_city": "Delémont"},
+    {"code": "GE", "name_de": "Genf", "name_fr": "Genève", "name_it": "Ginevra", "population": 523101, "workforce": 300000,
+        "language_de": 0.02, "language_fr": 0.85, "language_it": 0.01, "language_en": 0.12, "major_city": "Genève"},
+]
 
 
 def ensure_cantons_loaded() -> None:
@@ -98,67 +157,11 @@ def _load_fallback_cantons(db_manager) -> None:
     """Load Swiss cantons fallback data into MongoDB."""
     cantons_collection = db_manager.get_target_collection("cantons")
 
-    # All 26 Swiss cantons with accurate data
-    CANTONS_DATA = [
-        {"code": "ZH", "name_de": "Zürich", "name_fr": "Zurich", "name_it": "Zurigo", "population": 1553423, "workforce": 820000,
-            "language_de": 0.83, "language_fr": 0.05, "language_it": 0.03, "language_en": 0.09, "major_city": "Zürich"},
-        {"code": "BE", "name_de": "Bern", "name_fr": "Berne", "name_it": "Berna", "population": 1043132, "workforce": 550000,
-            "language_de": 0.84, "language_fr": 0.08, "language_it": 0.02, "language_en": 0.06, "major_city": "Bern"},
-        {"code": "LU", "name_de": "Luzern", "name_fr": "Lucerne", "name_it": "Lucerna", "population": 416347, "workforce": 230000,
-            "language_de": 0.89, "language_fr": 0.03, "language_it": 0.02, "language_en": 0.06, "major_city": "Luzern"},
-        {"code": "UR", "name_de": "Uri", "name_fr": "Uri", "name_it": "Uri", "population": 36819, "workforce": 20000,
-            "language_de": 0.92, "language_fr": 0.02, "language_it": 0.02, "language_en": 0.04, "major_city": "Altdorf"},
-        {"code": "SZ", "name_de": "Schwyz", "name_fr": "Schwytz", "name_it": "Svitto", "population": 162157, "workforce": 90000,
-            "language_de": 0.89, "language_fr": 0.03, "language_it": 0.02, "language_en": 0.06, "major_city": "Schwyz"},
-        {"code": "OW", "name_de": "Obwalden", "name_fr": "Obwald", "name_it": "Obvaldo", "population": 38108, "workforce": 21000,
-            "language_de": 0.91, "language_fr": 0.02, "language_it": 0.02, "language_en": 0.05, "major_city": "Sarnen"},
-        {"code": "NW", "name_de": "Nidwalden", "name_fr": "Nidwald", "name_it": "Nidvaldo", "population": 43520, "workforce": 24000,
-            "language_de": 0.90, "language_fr": 0.02, "language_it": 0.02, "language_en": 0.06, "major_city": "Stans"},
-        {"code": "GL", "name_de": "Glarus", "name_fr": "Glaris", "name_it": "Glarona", "population": 40851, "workforce": 22000,
-            "language_de": 0.88, "language_fr": 0.03, "language_it": 0.02, "language_en": 0.07, "major_city": "Glarus"},
-        {"code": "ZG", "name_de": "Zug", "name_fr": "Zoug", "name_it": "Zugo", "population": 130183, "workforce": 75000,
-            "language_de": 0.82, "language_fr": 0.04, "language_it": 0.03, "language_en": 0.11, "major_city": "Zug"},
-        {"code": "FR", "name_de": "Freiburg", "name_fr": "Fribourg", "name_it": "Friburgo", "population": 326302, "workforce": 170000,
-            "language_de": 0.29, "language_fr": 0.67, "language_it": 0.01, "language_en": 0.03, "major_city": "Fribourg"},
-        {"code": "SO", "name_de": "Solothurn", "name_fr": "Soleure", "name_it": "Soletta", "population": 278907, "workforce": 150000,
-            "language_de": 0.88, "language_fr": 0.04, "language_it": 0.02, "language_en": 0.06, "major_city": "Solothurn"},
-        {"code": "BS", "name_de": "Basel-Stadt", "name_fr": "Bâle-Ville", "name_it": "Basilea Città", "population": 195845,
-            "workforce": 110000, "language_de": 0.75, "language_fr": 0.06, "language_it": 0.04, "language_en": 0.15, "major_city": "Basel"},
-        {"code": "BL", "name_de": "Basel-Landschaft", "name_fr": "Bâle-Campagne", "name_it": "Basilea Campagna", "population": 291201,
-            "workforce": 160000, "language_de": 0.86, "language_fr": 0.04, "language_it": 0.03, "language_en": 0.07, "major_city": "Liestal"},
-        {"code": "SH", "name_de": "Schaffhausen", "name_fr": "Schaffhouse", "name_it": "Sciaffusa", "population": 83485, "workforce": 46000,
-            "language_de": 0.89, "language_fr": 0.03, "language_it": 0.02, "language_en": 0.06, "major_city": "Schaffhausen"},
-        {"code": "AR", "name_de": "Appenzell Ausserrhoden", "name_fr": "Appenzell Rhodes-Extérieures", "name_it": "Appenzello Esterno",
-            "population": 79236, "workforce": 42000, "language_de": 0.90, "language_fr": 0.02, "language_it": 0.02, "language_en": 0.06, "major_city": "Herisau"},
-        {"code": "AI", "name_de": "Appenzell Innerrhoden", "name_fr": "Appenzell Rhodes-Intérieures", "name_it": "Appenzello Interno",
-            "population": 16746, "workforce": 9000, "language_de": 0.91, "language_fr": 0.02, "language_it": 0.01, "language_en": 0.06, "major_city": "Appenzell"},
-        {"code": "SG", "name_de": "St. Gallen", "name_fr": "Saint-Gall", "name_it": "San Gallo", "population": 519166, "workforce": 280000,
-            "language_de": 0.89, "language_fr": 0.02, "language_it": 0.02, "language_en": 0.07, "major_city": "St. Gallen"},
-        {"code": "GR", "name_de": "Graubünden", "name_fr": "Grisons", "name_it": "Grigioni", "population": 199021, "workforce": 110000,
-            "language_de": 0.70, "language_fr": 0.08, "language_it": 0.13, "language_en": 0.09, "major_city": "Chur"},
-        {"code": "AG", "name_de": "Aargau", "name_fr": "Argovie", "name_it": "Argovia", "population": 695667, "workforce": 380000,
-            "language_de": 0.87, "language_fr": 0.04, "language_it": 0.03, "language_en": 0.06, "major_city": "Aarau"},
-        {"code": "TG", "name_de": "Thurgau", "name_fr": "Thurgovie", "name_it": "Turgovia", "population": 290285, "workforce": 155000,
-            "language_de": 0.89, "language_fr": 0.03, "language_it": 0.02, "language_en": 0.06, "major_city": "Frauenfeld"},
-        {"code": "TI", "name_de": "Tessin", "name_fr": "Tessin", "name_it": "Ticino", "population": 368046, "workforce": 190000,
-            "language_de": 0.04, "language_fr": 0.03, "language_it": 0.86, "language_en": 0.07, "major_city": "Lugano"},
-        {"code": "VD", "name_de": "Waadt", "name_fr": "Vaud", "name_it": "Valdo", "population": 866239, "workforce": 460000,
-            "language_de": 0.02, "language_fr": 0.90, "language_it": 0.01, "language_en": 0.07, "major_city": "Lausanne"},
-        {"code": "VS", "name_de": "Wallis", "name_fr": "Valais", "name_it": "Vallese", "population": 349373, "workforce": 180000,
-            "language_de": 0.62, "language_fr": 0.37, "language_it": 0.01, "language_en": 0.00, "major_city": "Sion"},
-        {"code": "NE", "name_de": "Neuenburg", "name_fr": "Neuchâtel", "name_it": "Neuchâtel", "population": 178548, "workforce": 95000,
-            "language_de": 0.05, "language_fr": 0.90, "language_it": 0.01, "language_en": 0.04, "major_city": "Neuchâtel"},
-        {"code": "JU", "name_de": "Jura", "name_fr": "Jura", "name_it": "Giura", "population": 73894, "workforce": 39000,
-            "language_de": 0.05, "language_fr": 0.91, "language_it": 0.01, "language_en": 0.03, "major_city": "Delémont"},
-        {"code": "GE", "name_de": "Genf", "name_fr": "Genève", "name_it": "Ginevra", "population": 523101, "workforce": 300000,
-            "language_de": 0.02, "language_fr": 0.85, "language_it": 0.01, "language_en": 0.12, "major_city": "Genève"},
-    ]
-
     try:
         # Clear existing data if any
         cantons_collection.delete_many({})
         # Insert all cantons
-        cantons_collection.insert_many(CANTONS_DATA)
+        cantons_collection.insert_many([dict(canton) for canton in FALLBACK_CANTONS])
     except Exception:
         pass  # Ignore errors, will use defaults
 
@@ -415,13 +418,13 @@ class SamplingEngine:
         if g not in ("male", "female"):
             g = "male"
 
-        by_lang = _FALLBACK_FIRST_NAMES.get(lang)
+        by_lang = FALLBACK_FIRST_NAMES.get(lang)
         if by_lang and by_lang.get(g):
             return random.choice(by_lang[g])
 
         # Final fallback: pick from any language list for the requested gender.
         pool: List[str] = []
-        for _lang, by_gender in _FALLBACK_FIRST_NAMES.items():
+        for _lang, by_gender in FALLBACK_FIRST_NAMES.items():
             pool.extend(by_gender.get(g, []))
         return random.choice(pool) if pool else "Alex"
 
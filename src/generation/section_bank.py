@@ -0,0 +1,319 @@
+# src/generation/section_bank.py
+"""
+Precomputed template bank for the short CV sections (summary, hobbies).
+
+The bank is built offline once (scripts/build_section_bank.py) and stored as
+a JSON file keyed by (language, industry, career_level, occupation_type).
+Each key holds:
+ - summary templates with the slots {years}, {skills}, {canton} and {occupation}
+ - a hobby pool
+
+Diversity guarantee:
+ - at build time near-duplicate templates are dropped, and a key only serves
+   summaries if it has at least MIN_SUMMARY_TEMPLATES distinct templates
+ - at draw time every key cycles through its templates / hobbies in a
+   shuffled order, so nothing repeats until the whole pool has been used
+
+The assembler only calls the LLM when the bank misses or when the quality
+tier is "premium" (CV_QUALITY_TIER or persona["quality_tier"]).
+"""
+
+import sys
+import json
+import random
+import string
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import get_settings
+
+INDUSTRIES = (
+    "technology", "healthcare", "finance", "construction", "manufacturing",
+    "education", "retail", "hospitality", "other"
+)
+CAREER_LEVELS = ("junior", "mid", "senior", "lead")
+OCCUPATION_TYPES = ("technical", "creative", "social", "general")
+LANGUAGES = ("de", "fr", "it")
+SUMMARY_SLOTS = ("years", "skills", "canton", "occupation")
+
+PREMIUM_TIER = "premium"
+MIN_SUMMARY_TEMPLATES = 4
+MIN_HOBBIES = 8
+
+# Word overlap above which two templates count as near-duplicates
+_MAX_TEMPLATE_OVERLAP = 0.6
+
+# Slot value when the occupation has no known skills
+_DEFAULT_SKILLS = {
+    "de": "verschiedenen Fachgebieten",
+    "fr": "divers domaines",
+    "it": "diversi ambiti"
+}
+
+
+def template_slots(template: str) -> List[str]:
+    """Slot names used in a template (raises ValueError on malformed braces)."""
+    return [name for _, name, _, _ in string.Formatter().parse(template) if name is not None]
+
+
+def _word_overlap(a: str, b: str) -> float:
+    words_a, words_b = set(a.lower().split()), set(b.lower().split())
+    if not words_a or not words_b:
+        return 0.0
+    return len(words_a & words_b) / max(len(words_a), len(words_b))
+
+
+def clean_summary_templates(templates: List[str]) -> List[str]:
+    """
+    Keep valid, mutually distinct summary templates.
+
+    A template is valid if it only uses known slots and contains {occupation}.
+    Templates overlapping an already kept one by more than 60% of their words
+    are dropped.
+
+    Args:
+        templates: Raw templates from the LLM.
+
+    Returns:
+        Cleaned templates in input order.
+    """
+    kept: List[str] = []
+    for template in templates:
+        template = " ".join(template.replace("**", "").split())
+        try:
+            slots = template_slots(template)
+        except ValueError:
+            continue
+        if "occupation" not in slots or any(slot not in SUMMARY_SLOTS for slot in slots):
+            continue
+        if all(_word_overlap(template, other) <= _MAX_TEMPLATE_OVERLAP for other in kept):
+            kept.append(template)
+    return kept
+
+
+def clean_hobbies(hobbies: List[str]) -> List[str]:
+    """Strip and de-duplicate hobbies (case-insensitive), keeping order."""
+    seen = set()
+    cleaned = []
+    for hobby in hobbies:
+        hobby = hobby.strip().strip("-•").strip()
+        if hobby and "{" not in hobby and hobby.lower() not in seen:
+            seen.add(hobby.lower())
+            cleaned.append(hobby)
+    return cleaned
+
+
+class _Cycle:
+    """Shuffled cycle over a pool: no item repeats until all were drawn."""
+
+    def __init__(self, items: List[str], rng: random.Random):
+        self._items = list(dict.fromkeys(items))
+        self._rng = rng
+        self._queue: List[str] = []
+
+    def take(self, count: int) -> List[str]:
+        taken: List[str] = []
+        while len(taken) < min(count, len(self._items)):
+            if not self._queue:
+                self._queue = list(self._items)
+                self._rng.shuffle(self._queue)
+            item = self._queue.pop()
+            if item not in taken:
+                taken.append(item)
+        return taken
+
+
+class SectionBank:
+    """
+    Summary templates and hobby pools per (language, industry, career_level, occupation_type).
+
+    Args:
+        entries: Mapping "language|industry|career_level|occupation_type" ->
+            {"summaries": [...], "hobbies": [...]}.
+        seed: Seed for the draw order (None = random).
+    """
+
+    def __init__(self, entries: Optional[Dict[str, Dict[str, List[str]]]] = None, seed: Optional[int] = None):
+        self.entries: Dict[str, Dict[str, List[str]]] = dict(entries or {})
+        self._rng = random.Random(seed)
+        self._cycles: Dict[str, _Cycle] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(language: str, industry: str, career_level: str, occupation_type: str) -> str:
+        return "|".join([language, industry or "other", career_level, occupation_type or "general"])
+
+    @classmethod
+    def load(cls, path: Path) -> "SectionBank":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data.get("entries", {}))
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {"version": 1, "slots": list(SUMMARY_SLOTS), "entries": dict(sorted(self.entries.items()))}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def set(
+        self,
+        language: str,
+        industry: str,
+        career_level: str,
+        occupation_type: str,
+        summaries: List[str],
+        hobbies: List[str]
+    ) -> None:
+        """Store (replace) the templates of one key."""
+        key = self.key(language, industry, career_level, occupation_type)
+        with self._lock:
+            self.entries[key] = {"summaries": list(summaries), "hobbies": list(hobbies)}
+            self._cycles.pop(f"summaries:{key}", None)
+            self._cycles.pop(f"hobbies:{key}", None)
+
+    def _pool(self, kind: str, minimum: int, language: str, industry: str, career_level: str, occupation_type: str):
+        """Cycle for the exact key, falling back to industry "other"; None on a miss."""
+        for candidate in (industry, "other"):
+            key = self.key(language, candidate, career_level, occupation_type)
+            items = self.entries.get(key, {}).get(kind, [])
+            if len(items) >= minimum:
+                cycle_key = f"{kind}:{key}"
+                if cycle_key not in self._cycles:
+                    self._cycles[cycle_key] = _Cycle(items, self._rng)
+                return self._cycles[cycle_key]
+        return None
+
+    def draw_summary(
+        self,
+        language: str,
+        industry: str,
+        career_level: str,
+        occupation_type: str,
+        slots: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Draw the next summary template of a key and fill its slots.
+
+        Args:
+            language: Language (de, fr, it).
+            industry: Persona industry.
+            career_level: Career level.
+            occupation_type: technical, creative, social or general.
+            slots: Values for years, skills, canton and occupation.
+
+        Returns:
+            Summary text, or None if the bank cannot serve the key.
+        """
+        with self._lock:
+            cycle = self._pool("summaries", MIN_SUMMARY_TEMPLATES, language, industry, career_level, occupation_type)
+            if cycle is None:
+                return None
+            template = cycle.take(1)[0]
+        values = {slot: slots.get(slot, "") for slot in SUMMARY_SLOTS}
+        if not values["skills"]:
+            values["skills"] = _DEFAULT_SKILLS.get(language, _DEFAULT_SKILLS["de"])
+        return template.format_map(values)
+
+    def draw_hobbies(
+        self,
+        language: str,
+        industry: str,
+        career_level: str,
+        occupation_type: str,
+        count: int = 5
+    ) -> List[str]:
+        """Draw `count` distinct hobbies of a key (empty list on a miss)."""
+        with self._lock:
+            cycle = self._pool("hobbies", MIN_HOBBIES, language, industry, career_level, occupation_type)
+            return cycle.take(count) if cycle else []
+
+    def stats(self) -> Dict[str, int]:
+        """Number of keys, summary templates and hobbies in the bank."""
+        with self._lock:
+            return {
+                "keys": len(self.entries),
+                "summaries": sum(len(e.get("summaries", [])) for e in self.entries.values()),
+                "hobbies": sum(len(e.get("hobbies", [])) for e in self.entries.values())
+            }
+
+
+_section_bank: Optional[SectionBank] = None
+_section_bank_loaded = False
+_section_bank_lock = threading.Lock()
+
+
+def resolve_section_bank_path(path: Optional[str] = None) -> Path:
+    """Bank path from the argument or settings (relative paths are relative to the project root)."""
+    bank_path = Path(path or get_settings().section_bank_path)
+    return bank_path if bank_path.is_absolute() else project_root / bank_path
+
+
+def get_section_bank() -> Optional[SectionBank]:
+    """
+    Get the process-wide section bank.
+
+    Returns:
+        SectionBank, or None if disabled (USE_SECTION_BANK=false) or not built yet.
+    """
+    global _section_bank, _section_bank_loaded
+    with _section_bank_lock:
+        if not _section_bank_loaded:
+            _section_bank_loaded = True
+            bank_path = resolve_section_bank_path()
+            if get_settings().use_section_bank and bank_path.exists():
+                try:
+                    _section_bank = SectionBank.load(bank_path)
+                except (OSError, ValueError) as e:
+                    print(f"Warning: Could not load section bank {bank_path}: {e}")
+    return _section_bank
+
+
+def reset_section_bank() -> None:
+    """Drop the cached bank so the next call reloads it (e.g. after a rebuild)."""
+    global _section_bank, _section_bank_loaded
+    with _section_bank_lock:
+        _section_bank = None
+        _section_bank_loaded = False
+
+
+def is_premium_tier(persona: Optional[Dict[str, Any]] = None) -> bool:
+    """Whether the CV should skip the banks and always use the LLM."""
+    tier = (persona or {}).get("quality_tier") or get_settings().cv_quality_tier
+    return str(tier).lower() == PREMIUM_TIER
+
+
+def build_section_bank_prompt(
+    language: str,
+    industry: str,
+    career_level: str,
+    occupation_type: str,
+    summaries: int,
+    hobbies: int
+) -> str:
+    """Prompt asking for the summary templates and hobby pool of one bank key."""
+    language_names = {"de": "Schweizer Hochdeutsch", "fr": "Französisch (Schweiz)", "it": "Italienisch (Schweiz)"}
+    return f"""Du bist ein erfahrener Schweizer Lebenslauf-Autor.
+
+BRANCHE: {industry}
+KARRIERESTUFE: {career_level}
+BERUFSTYP: {occupation_type}
+SPRACHE: {language_names.get(language, language_names["de"])}
+
+1. Schreibe {summaries} VERSCHIEDENE Vorlagen für die CV-Zusammenfassung (je 2-3 Sätze).
+   Verwende diese Platzhalter genau so geschrieben (mit geschweiften Klammern):
+   - {{occupation}}: Berufsbezeichnung (PFLICHT in jeder Vorlage)
+   - {{years}}: exakte Anzahl Jahre Berufserfahrung (nur die Zahl)
+   - {{skills}}: 1-2 konkrete Fachkenntnisse
+   - {{canton}}: Region/Stadt in der Schweiz
+   Jede Vorlage mit anderem Satzbau und anderem Einstieg, keine AI-Buzzwords,
+   keine Namen, keine weiteren Platzhalter.
+2. Nenne {hobbies} realistische, unterschiedliche Hobbys für diese Personengruppe in der Schweiz.
+
+Gib die Vorlagen im Feld "summaries" und die Hobbys im Feld "hobbies" zurück."""
@@ -0,0 +1,105 @@
+# src/generation/section_graph.py
+"""
+Concurrent generation of CV sections as a small dependency graph.
+
+generate_complete_cv used to build its sections one after another although
+most of them are independent (e.g. summary, bullets and hobbies are
+separate LLM calls). Each section is a SectionNode naming the sections it
+needs; run_section_graph() runs every node as soon as its dependencies are
+done, independent nodes concurrently on a thread pool, so a CV takes about
+as long as its longest chain.
+
+Nodes run in a copy of the caller's context, so per-CV scopes
+(cv_metrics_scope, section_memo_scope, ...) apply inside them.
+"""
+
+import sys
+import contextvars
+from pathlib import Path
+from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import get_settings
+
+
+@dataclass(frozen=True)
+class SectionNode:
+    """One CV section: `run` gets the results of `deps` by name."""
+    name: str
+    run: Callable[[Dict[str, Any]], Any]
+    deps: Tuple[str, ...] = ()
+
+
+def run_section_graph(nodes: Iterable[SectionNode], max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Run section nodes in dependency order, independent ones concurrently.
+
+    Args:
+        nodes: Section nodes (dependencies must be nodes of the graph).
+        max_workers: Threads (default: settings.cv_section_workers);
+            1 runs the nodes sequentially in the calling thread.
+
+    Returns:
+        Dictionary of node name -> result.
+
+    Raises:
+        ValueError: If a dependency is unknown or the graph has a cycle.
+        Exception: The first exception raised by a node (pending nodes are cancelled).
+    """
+    nodes = {node.name: node for node in nodes}
+    order = _topological_order(nodes)
+    workers = max_workers if max_workers is not None else get_settings().cv_section_workers
+
+    results: Dict[str, Any] = {}
+    if workers <= 1 or len(nodes) <= 1:
+        for name in order:
+            results[name] = nodes[name].run({dep: results[dep] for dep in nodes[name].deps})
+        return results
+
+    pending = list(order)
+    running: Dict[Future, str] = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cv-section") as executor:
+        while pending or running:
+            for name in [n for n in pending if all(dep in results for dep in nodes[n].deps)]:
+                pending.remove(name)
+                inputs = {dep: results[dep] for dep in nodes[name].deps}
+                context = contextvars.copy_context()
+                running[executor.submit(context.run, nodes[name].run, inputs)] = name
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                error = future.exception()
+                if error is not None:
+                    for other in running:
+                        other.cancel()
+                    raise error
+                results[name] = future.result()
+    return results
+
+
+def _topological_order(nodes: Dict[str, SectionNode]) -> Tuple[str, ...]:
+    order = []
+    state: Dict[str, str] = {}
+
+    def visit(name: str) -> None:
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError(f"Cycle in section graph at '{name}'")
+        state[name] = "visiting"
+        for dep in nodes[name].deps:
+            if dep not in nodes:
+                raise ValueError(f"Section '{name}' depends on unknown section '{dep}'")
+            visit(dep)
+        state[name] = "done"
+        order.append(name)
+
+    for name in nodes:
+        visit(name)
+    return tuple(order)
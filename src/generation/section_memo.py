@@ -0,0 +1,191 @@
+# src/generation/section_memo.py
+"""
+Section-level memoization so CV retries reuse completed work.
+
+generate_complete_cv builds a CV from sections (persona fixes, personal
+info, education, job skeleton, skills, additional education, summary,
+bullets, hobbies). Inside `section_memo_scope(cv_seed)` every section
+result is stored under (cv_seed, section, inputs hash). A retry of the same
+CV then only recomputes
+
+ - the sections dropped with `invalidate()` (the ones validation complained
+   about, see `sections_for_issues()`), and
+ - sections whose inputs changed because of them (e.g. bullets after a new
+   job skeleton).
+
+So a CV with a bad summary costs one more summary call instead of a whole
+new CV. Outside a scope, sections are computed as before.
+"""
+
+import sys
+import copy
+import json
+import random
+import hashlib
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# Sections of generate_complete_cv (in build order)
+SECTIONS: Tuple[str, ...] = (
+    "persona", "personal", "education", "jobs", "skills",
+    "additional_education", "summary", "bullets", "hobbies"
+)
+
+# Deterministic sections scored by the skeleton gate (no LLM calls)
+SKELETON_SECTIONS = {"personal", "education", "jobs", "skills", "additional_education"}
+
+# ValidationIssue.field of section "content" -> CV section
+CONTENT_FIELD_SECTIONS: Dict[str, str] = {
+    "summary": "summary",
+    "hobbies": "hobbies",
+    "education": "education",
+    "jobs": "jobs",
+    "skills": "skills",
+}
+
+# ValidationIssue.category of section "jobs" that concern the skeleton (else: bullets)
+JOB_SKELETON_CATEGORIES = {"timeline", "company"}
+
+
+def inputs_hash(inputs: Any) -> str:
+    """Stable hash of JSON-like section inputs."""
+    payload = json.dumps(inputs, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def new_cv_seed() -> str:
+    """Random identifier of one CV (kept across its retries)."""
+    return f"{random.getrandbits(64):016x}"
+
+
+class SectionMemo:
+    """
+    Section results keyed by (cv_seed, section, inputs hash).
+
+    Values are deep-copied in and out, so callers may mutate what they get
+    (e.g. auto-fixes of the validator) without changing the stored result.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str, str], Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, cv_seed: str, section: str, inputs: Any) -> Tuple[bool, Any]:
+        """Return (found, value) for a section of a CV."""
+        key = (cv_seed, section, inputs_hash(inputs))
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            value = self._entries[key]
+        return True, copy.deepcopy(value)
+
+    def put(self, cv_seed: str, section: str, inputs: Any, value: Any) -> None:
+        """Store a section result (replaces results of the section with other inputs)."""
+        stored = copy.deepcopy(value)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == cv_seed and k[1] == section]:
+                del self._entries[key]
+            self._entries[(cv_seed, section, inputs_hash(inputs))] = stored
+
+    def invalidate(self, cv_seed: str, sections: Optional[Iterable[str]] = None) -> None:
+        """Drop sections of a CV (all sections if None) so they are recomputed."""
+        sections = None if sections is None else set(sections)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == cv_seed and (sections is None or k[1] in sections)]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_ACTIVE_SCOPE: ContextVar[Optional[Tuple[SectionMemo, str]]] = ContextVar("section_memo_scope", default=None)
+
+
+@contextmanager
+def section_memo_scope(cv_seed: str, memo: Optional[SectionMemo] = None) -> Iterator[SectionMemo]:
+    """
+    Memoize the sections of one CV inside the `with` block.
+
+    The entries of the CV are dropped when the block ends, so retries must
+    happen inside it.
+
+    Args:
+        cv_seed: Identifier of the CV (see new_cv_seed()).
+        memo: Store to use (default: a new one).
+    """
+    memo = memo if memo is not None else SectionMemo()
+    token = _ACTIVE_SCOPE.set((memo, cv_seed))
+    try:
+        yield memo
+    finally:
+        _ACTIVE_SCOPE.reset(token)
+        memo.invalidate(cv_seed)
+
+
+def memoize_section(section: str, inputs: Any, compute: Callable[[], Any]) -> Any:
+    """
+    Result of a CV section, reused from the active scope if its inputs are unchanged.
+
+    Args:
+        section: Section name (see SECTIONS).
+        inputs: JSON-like inputs the result depends on.
+        compute: Computes the section.
+
+    Returns:
+        Section result.
+    """
+    scope = _ACTIVE_SCOPE.get()
+    if scope is None:
+        return compute()
+    memo, cv_seed = scope
+    found, value = memo.get(cv_seed, section, inputs)
+    if found:
+        return value
+    value = compute()
+    memo.put(cv_seed, section, inputs, value)
+    return value
+
+
+def sections_for_issues(issues: Iterable[Any]) -> Set[str]:
+    """
+    CV sections to regenerate for validation issues.
+
+    Args:
+        issues: ValidationIssue objects (or their dicts) from validate_complete_cv;
+            "info" issues are ignored.
+
+    Returns:
+        Section names (see SECTIONS).
+    """
+    sections: Set[str] = set()
+    for issue in issues:
+        if _issue_field(issue, "severity") not in ("critical", "warning"):
+            continue
+        section = _issue_field(issue, "section")
+        if section == "personal":
+            sections.add("personal")
+        elif section == "timeline":
+            sections.update(("education", "jobs"))
+        elif section == "jobs":
+            sections.add("jobs" if _issue_field(issue, "category") in JOB_SKELETON_CATEGORIES else "bullets")
+        elif section == "skills":
+            sections.add("skills")
+        elif section == "content" and _issue_field(issue, "field") in CONTENT_FIELD_SECTIONS:
+            sections.add(CONTENT_FIELD_SECTIONS[_issue_field(issue, "field")])
+    return sections
+
+
+def _issue_field(issue: Any, name: str) -> Any:
+    return issue.get(name) if isinstance(issue, dict) else getattr(issue, name, None)
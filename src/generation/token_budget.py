@@ -0,0 +1,215 @@
+# src/generation/token_budget.py
+"""
+Adaptive max_tokens budgets from observed completion lengths.
+
+Hard-coded budgets (e.g. 1200 tokens for a multi-job bullet request that
+usually needs 400) make rate limiters reserve far more of the TPM quota than
+a request uses. Instead, openai_client.py records the completion tokens of
+every successful call under (call_site, language, model) and requests
+
+    max_tokens = percentile(observed tokens per unit) * units * (1 + margin)
+
+once a key has enough samples; until then the caller's budget is used.
+`units` scales requests whose length grows with their size (e.g. the number
+of bullets asked for). Truncated responses (finish_reason "length") are not
+sampled; the client retries them with a larger budget instead.
+
+Samples are kept in a sliding window per key and, if TOKEN_BUDGET_PATH is
+set, persisted so new (worker) processes start with warm budgets.
+"""
+
+import os
+import sys
+import json
+import math
+import atexit
+import threading
+from pathlib import Path
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config import get_settings
+
+# Samples kept per key
+WINDOW_SIZE = 500
+
+# Never request fewer tokens than this
+MIN_MAX_TOKENS = 32
+
+# Persist after this many new samples (worker processes are not shut down cleanly)
+AUTOSAVE_EVERY = 50
+
+
+class TokenBudget:
+    """
+    Sliding-window completion token samples and the budgets derived from them.
+
+    Args:
+        percentile: Percentile of tokens per unit used as the budget.
+        margin: Relative head room added on top of the percentile.
+        min_samples: Samples a key needs before its budget is used.
+        path: JSON file for persistence (None = in-memory only).
+    """
+
+    def __init__(
+        self,
+        percentile: float = 99.0,
+        margin: float = 0.15,
+        min_samples: int = 20,
+        path: Optional[Path] = None
+    ):
+        self.percentile = percentile
+        self.margin = margin
+        self.min_samples = min_samples
+        self.path = Path(path) if path else None
+        self._samples: Dict[str, Deque[float]] = {}
+        self._unsaved = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(call_site: str, language: Optional[str], model: Optional[str]) -> str:
+        return "|".join([call_site, language or "-", model or "-"])
+
+    def observe(
+        self,
+        call_site: str,
+        completion_tokens: int,
+        model: Optional[str] = None,
+        language: Optional[str] = None,
+        units: int = 1
+    ) -> None:
+        """Record the completion length of a call that finished normally."""
+        if completion_tokens <= 0:
+            return
+        key = self.key(call_site, language, model)
+        with self._lock:
+            if key not in self._samples:
+                self._samples[key] = deque(maxlen=WINDOW_SIZE)
+            self._samples[key].append(completion_tokens / max(1, units))
+            self._unsaved += 1
+            autosave = self.path is not None and self._unsaved >= AUTOSAVE_EVERY
+        if autosave:
+            self.save()
+
+    def max_tokens(
+        self,
+        call_site: str,
+        default: int,
+        model: Optional[str] = None,
+        language: Optional[str] = None,
+        units: int = 1
+    ) -> int:
+        """
+        Budget for a call.
+
+        Args:
+            call_site: Metrics label of the call.
+            default: Caller's budget, used while the key has too few samples.
+            model: Model name.
+            language: CV language.
+            units: Size of the request (e.g. number of bullets).
+
+        Returns:
+            max_tokens to request.
+        """
+        with self._lock:
+            samples = self._samples.get(self.key(call_site, language, model))
+            if samples is None or len(samples) < self.min_samples:
+                return default
+            ordered = sorted(samples)
+        rank = min(len(ordered) - 1, max(0, math.ceil(self.percentile / 100.0 * len(ordered)) - 1))
+        return max(MIN_MAX_TOKENS, math.ceil(round(ordered[rank] * max(1, units) * (1 + self.margin), 6)))
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Sample count and current per-unit budget per key."""
+        with self._lock:
+            keys = list(self._samples)
+            counts = {key: len(self._samples[key]) for key in keys}
+        result = {}
+        for key in keys:
+            call_site, language, model = key.split("|")
+            result[key] = {
+                "samples": counts[key],
+                "per_unit_budget": self.max_tokens(call_site, 0, model, language)
+            }
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"version": 1, "samples": {key: list(values) for key, values in self._samples.items()}}
+
+    def merge(self, data: Dict[str, Any]) -> None:
+        """Add samples from `to_dict()` output (kept before the local samples)."""
+        with self._lock:
+            for key, values in data.get("samples", {}).items():
+                merged = deque(values, maxlen=WINDOW_SIZE)
+                merged.extend(self._samples.get(key, ()))
+                self._samples[key] = merged
+
+    def load(self) -> None:
+        """Load persisted samples (no-op if the file does not exist)."""
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.merge(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not load token budgets {self.path}: {e}")
+
+    def save(self, force: bool = True) -> None:
+        """Persist the samples (atomic replace; concurrent writers may drop samples)."""
+        if self.path is None or not (force or self._unsaved):
+            return
+        data = self.to_dict()
+        with self._lock:
+            self._unsaved = 0
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: Could not save token budgets {self.path}: {e}")
+
+
+_token_budget: Optional[TokenBudget] = None
+_token_budget_lock = threading.Lock()
+
+
+def get_token_budget() -> Optional[TokenBudget]:
+    """
+    Get the process-wide token budget.
+
+    Returns:
+        TokenBudget, or None if adaptive budgets are disabled (ADAPTIVE_MAX_TOKENS=false).
+    """
+    global _token_budget
+    settings = get_settings()
+    if not settings.adaptive_max_tokens:
+        return None
+    with _token_budget_lock:
+        if _token_budget is None:
+            path = Path(settings.token_budget_path) if settings.token_budget_path else None
+            if path is not None and not path.is_absolute():
+                path = project_root / path
+            _token_budget = TokenBudget(
+                percentile=settings.max_tokens_percentile,
+                margin=settings.max_tokens_margin,
+                min_samples=settings.max_tokens_min_samples,
+                path=path
+            )
+            _token_budget.load()
+            atexit.register(_token_budget.save, force=False)
+    return _token_budget
+
+
+def reset_token_budget() -> None:
+    """Drop the process-wide budget (e.g. in tests or after changing settings)."""
+    global _token_budget
+    with _token_budget_lock:
+        _token_budget = None
@@ -0,0 +1,91 @@
+"""
+Tests for the precomputed bullet bank.
+
+Tests cover:
+- Turning generated bullets into metric templates
+- Drawing bullets with re-randomised metric values
+- Misses for keys the bank cannot serve
+- Job histories draw by each job's own occupation
+
+Run: pytest tests/test_bullet_bank.py -v
+"""
+import re
+import sys
+import random
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.generation.bullet_bank import BankEntry, BulletBank, bullet_to_entry
+from src.generation.metrics_validator import METRIC_RANGES, MetricType
+
+
+class TestBulletTemplates:
+    """Test template extraction."""
+
+    def test_single_metric_is_templatized(self):
+        entry = bullet_to_entry("Betreute 12 Kunden im Bereich Haustechnik", "mid")
+        assert entry == BankEntry("Betreute {value} Kunden im Bereich Haustechnik", "customers")
+
+    def test_out_of_range_or_multiple_metrics_rejected(self):
+        assert bullet_to_entry("Betreute 400 Kunden im Bereich Haustechnik", "junior") is None
+        assert bullet_to_entry("Leitete 3 Projekte mit 12 Kunden", "mid") is None
+        assert bullet_to_entry("Wartete Heizungsanlagen in Wohnbauten", "mid") is None
+
+
+class TestBulletBank:
+    """Test drawing from a SQLite bank."""
+
+    def test_draw_rerandomizes_within_level_range(self, tmp_path):
+        bank = BulletBank(tmp_path / "bank.sqlite", writable=True)
+        entries = [
+            BankEntry("Betreute {value} Kunden in der Region Zürich", "customers"),
+            BankEntry("Koordinierte {value} Projekte im Gebäudeunterhalt", "projects"),
+            BankEntry("Schulte {value} Personen in neuen Arbeitsabläufen", "team_size"),
+        ]
+        assert bank.add("1234", "senior", "de", entries) == 3
+        assert bank.add("1234", "senior", "de", entries[:1]) == 0
+
+        bullets = bank.draw("1234", "senior", "de", 2, rng=random.Random(7))
+        assert len(bullets) == 2
+        assert len({b.split()[0] for b in bullets}) == 2
+        for bullet in bullets:
+            value = int(re.search(r"\d+", bullet).group(0))
+            metric_type = MetricType.CUSTOMERS if "Kunden" in bullet else (
+                MetricType.PROJECTS if "Projekte" in bullet else MetricType.TEAM_SIZE
+            )
+            level_range = METRIC_RANGES[metric_type]["senior"]
+            assert level_range.min_val <= value <= level_range.max_val
+        bank.close()
+
+    def test_miss_returns_empty(self, tmp_path):
+        bank = BulletBank(tmp_path / "bank.sqlite", writable=True)
+        bank.add("1234", "mid", "de", [BankEntry("Betreute {value} Kunden im Verkauf", "customers")])
+        assert bank.draw("1234", "mid", "de", 2) == []
+        assert bank.draw("1234", "mid", "fr", 1) == []
+        assert bank.draw(None, "mid", "de", 1) == []
+        bank.close()
+
+
+def test_fill_job_bullets_uses_each_jobs_occupation(tmp_path, monkeypatch):
+    from src.generation import cv_job_history_generator
+
+    bank = BulletBank(tmp_path / "bank.sqlite", writable=True)
+    bank.add("1234", "mid", "de", [BankEntry("Betreute {value} Kunden im Verkauf", "customers")])
+    bank.add("5678", "mid", "de", [BankEntry("Koordinierte {value} Projekte im Einkauf", "projects")])
+    monkeypatch.setattr(cv_job_history_generator, "get_bullet_bank", lambda: bank)
+
+    jobs = [{"responsibilities": []} for _ in range(3)]
+    requests = [
+        {"job": jobs[0], "job_id": "1234", "career_level": "mid", "num_bullets": 1},
+        {"job": jobs[1], "job_id": "5678", "career_level": "mid", "num_bullets": 1},
+        {"job": jobs[2], "job_id": None, "career_level": "mid", "num_bullets": 1},
+    ]
+    cv_job_history_generator.fill_job_bullets(requests, {"job_id": "5678", "language": "de"})
+
+    assert "Kunden" in jobs[0]["responsibilities"][0]
+    assert "Projekte" in jobs[1]["responsibilities"][0]
+    assert "Projekte" in jobs[2]["responsibilities"][0]  # persona's occupation as fallback
+    bank.close()
@@ -0,0 +1,100 @@
+"""
+Tests for the batch assembly engine.
+
+Tests cover:
+- Results are yielded in completion order with bounded in-flight work
+- Occupations are prefetched once per chunk and passed to each CV
+- Section retries and per-CV error reports
+
+Run: pytest tests/test_cv_batch.py -v
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.generation import cv_assembler
+from src.generation.cv_assembler import CVDocument, generate_complete_cv_batch, generate_cv_with_section_retries
+
+
+def _cv(first_name="Anna"):
+    return CVDocument(first_name=first_name, last_name="Meier", full_name=f"{first_name} Meier",
+                      age=38, gender="female", canton="ZH")
+
+
+def _personas(n):
+    return [{"job_id": f"job{i % 2}", "first_name": f"P{i}", "delay": 0.01 * (n - i)} for i in range(n)]
+
+
+class TestGenerateCompleteCvBatch:
+    """Test scheduling and prefetching of the batch engine."""
+
+    def test_yields_every_cv_in_completion_order(self, monkeypatch):
+        prefetched = []
+        occupations_seen = []
+        in_flight = []
+        lock = threading.Lock()
+        active = [0]
+
+        def fake_generate(persona, min_quality, min_validation_score, occupation_doc=None):
+            with lock:
+                active[0] += 1
+                in_flight.append(active[0])
+            occupations_seen.append(occupation_doc)
+            time.sleep(persona["delay"])
+            with lock:
+                active[0] -= 1
+            return _cv(persona["first_name"]), {"scores": {"overall": 90}, "passed": True}
+
+        monkeypatch.setattr(cv_assembler, "generate_complete_cv", fake_generate)
+        monkeypatch.setattr(cv_assembler, "get_occupations_by_ids",
+                            lambda ids: prefetched.append(sorted(set(ids))) or {i: {"job_id": i} for i in ids})
+
+        results = list(generate_complete_cv_batch(iter(_personas(6)), workers=3))
+
+        assert sorted(cv.first_name for _, cv, _ in results) == [f"P{i}" for i in range(6)]
+        assert results[0][1].first_name != "P0"  # slowest CV is not first
+        assert all(persona["first_name"] == cv.first_name for persona, cv, _ in results)
+        assert max(in_flight) <= 3
+        assert prefetched[0] == ["job0", "job1"] and len(prefetched) == 1
+        assert all(occupation is not None for occupation in occupations_seen)
+
+    def test_errors_are_reported_per_cv(self, monkeypatch):
+        def fake_generate(persona, min_quality, min_validation_score, occupation_doc=None):
+            if persona["first_name"] == "P1":
+                raise RuntimeError("database down")
+            return _cv(persona["first_name"]), {"scores": {"overall": 90}, "passed": True}
+
+        monkeypatch.setattr(cv_assembler, "generate_complete_cv", fake_generate)
+        monkeypatch.setattr(cv_assembler, "get_occupations_by_ids", lambda ids: {})
+
+        reports = {p["first_name"]: (cv, report) for p, cv, report in generate_complete_cv_batch(_personas(3), workers=2)}
+        assert reports["P1"][0] is None
+        assert reports["P1"][1]["stage"] == "error"
+        assert reports["P1"][1]["issues"] == ["Error: database down"]
+        assert reports["P0"][0] is not None
+
+
+def test_section_retries_regenerate_until_passed(monkeypatch):
+    attempts = []
+
+    def fake_generate(persona, min_quality, min_validation_score, occupation_doc=None):
+        attempts.append(persona)
+        if len(attempts) < 3:
+            return None, {"scores": {"overall": 50}, "passed": False, "sections": ["summary"]}
+        return _cv(), {"scores": {"overall": 90}, "passed": True}
+
+    monkeypatch.setattr(cv_assembler, "generate_complete_cv", fake_generate)
+
+    cv_doc, report = generate_cv_with_section_retries({"age": 30}, max_retries=3)
+    assert cv_doc is not None
+    assert report["section_retries"] == 2
+    assert "llm_metrics" in report
+
+    attempts.clear()
+    cv_doc, report = generate_cv_with_section_retries({"age": 30}, max_retries=1)
+    assert cv_doc is None and report["section_retries"] == 1
@@ -0,0 +1,56 @@
+"""
+Tests for the single-pass CV validation.
+
+Tests cover:
+- CVFacts parses dates once into integers
+- validate_complete_cv attaches the score_cv_quality report of the same pass
+
+Run: pytest tests/test_cv_facts.py -v
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.generation.cv_assembler import CVDocument, score_cv_quality
+from src.generation.cv_facts import CVFacts, parse_date
+from src.generation.cv_quality_validator import validate_complete_cv
+
+
+def _cv():
+    return CVDocument(
+        first_name="Anna", last_name="Meier", full_name="Anna Meier", age=38, gender="female",
+        canton="ZH", career_level="senior", years_experience=15,
+        summary="Erfahrene Analystin mit langjähriger Praxis.",
+        education=[{"institution": "ETH Zürich", "start_year": 2005, "end_year": 2009}],
+        jobs=[
+            {"company": "Novartis AG", "position": "Senior Analyst", "start_date": "2016-03",
+             "end_date": None, "is_current": True, "responsibilities": ["Optimierte 12 Berichte"]},
+            {"company": "Roche AG", "position": "Analyst", "start_date": "2010-01",
+             "end_date": "2015-12", "is_current": False, "responsibilities": ["Leitete Projekte"]},
+        ]
+    )
+
+
+class TestCVFacts:
+    """Test the parsed view of a CV."""
+
+    def test_dates_are_parsed_once_into_integers(self):
+        assert parse_date("2016-03") == (2016, 2016 * 12 + 2)
+        assert parse_date("2016") == (2016, 2016 * 12)
+        assert parse_date("2016-13") == (2016, None)
+        assert parse_date("n/a") == (None, None)
+
+        facts = CVFacts.from_cv(_cv())
+        assert [j.job["company"] for j in facts.jobs_by_start] == ["Roche AG", "Novartis AG"]
+        assert facts.education_end_year == 2009
+        assert facts.total_bullets == 2 and facts.bullets_with_metrics == 1
+        assert facts.current_job.position == "senior analyst"
+
+
+def test_validation_carries_quick_score_of_same_pass():
+    report = validate_complete_cv(_cv(), auto_fix=False)
+    assert report.quick == score_cv_quality(_cv())
+    assert "quick" not in report.to_dict()
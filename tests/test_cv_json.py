@@ -0,0 +1,55 @@
+"""
+Tests for the slotted CVDocument and streaming JSON serializer.
+
+Tests cover:
+- Pretty output identical to json.dump(to_dict()), minified output parses back
+- Round trip through to_dict()/from_dict()
+- Slotted document without per-instance __dict__
+
+Run: pytest tests/test_cv_json.py -v
+"""
+import sys
+import json
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.export.cv_json import cv_to_json, get_fast_encoder
+from src.generation.cv_assembler import CVDocument
+
+
+def _cv():
+    return CVDocument(
+        first_name="Zoë", last_name="Müller", full_name="Zoë Müller", age=38, gender="female", canton="ZH",
+        portrait_asset_id="female/26-40/x.png@150x150c", summary="Analystin.",
+        jobs=[{"company": "Roche AG", "position": "Analystin", "start_date": "2012-01", "end_date": None,
+               "is_current": True, "responsibilities": ["Optimierte 12 Berichte"]}],
+        skills={"technical": ["Python"], "languages": []}
+    )
+
+
+class TestStreamingSerializer:
+    """Test write_cv_json output."""
+
+    def test_pretty_output_matches_json_dump(self):
+        cv_doc = _cv()
+        expected = cv_doc.to_dict()
+        expected["metadata"]["exported_at"] = "2026-01-01T00:00:00"
+        assert cv_to_json(cv_doc, indent=2, metadata={"exported_at": "2026-01-01T00:00:00"}) == \
+            json.dumps(expected, indent=2, ensure_ascii=False)
+
+    def test_minified_output(self):
+        cv_doc = _cv()
+        for encoder in (None, get_fast_encoder()):
+            text = cv_to_json(cv_doc, encoder=encoder)
+            assert "\n" not in text and ", " not in text.replace("Optimierte 12 Berichte", "")
+            assert json.loads(text) == cv_doc.to_dict()
+
+
+def test_slotted_document_round_trip():
+    cv_doc = _cv()
+    assert not hasattr(cv_doc, "__dict__")
+    assert CVDocument.from_dict(cv_doc.to_dict()) == cv_doc
+    assert CVDocument.from_dict({"personal": {"first_name": "Anna"}}).first_name == "Anna"
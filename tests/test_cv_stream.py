@@ -0,0 +1,96 @@
+"""
+Tests for the streaming generator API.
+
+Tests cover:
+- iter_cvs yields `count` CVs, starting only as many CVs as are missing
+- Bounded in-flight work and stopping when the consumer stops
+- Persona filters
+
+Run: pytest tests/test_cv_stream.py -v
+"""
+import sys
+import threading
+import time
+from itertools import islice
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.generation import cv_assembler, sampling
+from src.generation.cv_assembler import CVDocument
+from src.generation.cv_stream import iter_cvs, persona_matches
+
+
+class FakeSamplingEngine:
+    def __init__(self):
+        self.sampled = 0
+
+    def sample_persona(self, preferred_canton=None, preferred_industry=None):
+        self.sampled += 1
+        return {"first_name": f"P{self.sampled}", "age": 20 + self.sampled % 40,
+                "industry": preferred_industry or "finance", "career_level": "mid", "language": "de"}
+
+
+@pytest.fixture
+def fake_generation(monkeypatch):
+    """Fake CV generation: every third persona fails; records concurrency."""
+    state = {"started": 0, "active": 0, "max_active": 0}
+    lock = threading.Lock()
+
+    def generate(persona, min_quality=75.0, min_validation_score=None, max_retries=0, occupation_doc=None):
+        with lock:
+            state["started"] += 1
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+        time.sleep(0.01)
+        with lock:
+            state["active"] -= 1
+        if int(persona["first_name"][1:]) % 3 == 0:
+            return None, {"scores": {"overall": 50}, "passed": False}
+        cv_doc = CVDocument(first_name=persona["first_name"], last_name="Meier", full_name="Meier",
+                            age=persona["age"], gender="female", canton="ZH")
+        return cv_doc, {"scores": {"overall": 90}, "passed": True}
+
+    monkeypatch.setattr(sampling, "SamplingEngine", FakeSamplingEngine)
+    monkeypatch.setattr(cv_assembler, "generate_cv_with_section_retries", generate)
+    monkeypatch.setattr(cv_assembler, "get_occupations_by_ids", lambda ids: {})
+    return state
+
+
+class TestIterCvs:
+    """Test iter_cvs."""
+
+    def test_yields_count_cvs_without_wasted_work(self, fake_generation):
+        cvs = list(iter_cvs(10, concurrency=3))
+
+        assert len(cvs) == 10
+        assert all(isinstance(cv, CVDocument) for cv in cvs)
+        # Failed CVs are replaced in a next round, nothing beyond that is started
+        failed = fake_generation["started"] - 10
+        assert failed == sum(1 for i in range(1, fake_generation["started"] + 1) if i % 3 == 0)
+        assert fake_generation["max_active"] <= 3
+
+    def test_stops_when_consumer_stops(self, fake_generation):
+        stream = iter_cvs(1000, concurrency=2, as_dict=True)
+        first = list(islice(stream, 3))
+        stream.close()
+        time.sleep(0.05)
+
+        assert all(isinstance(cv, dict) and "personal" in cv for cv in first)
+        assert fake_generation["started"] <= 3 + 2 + 2  # results + failures + in flight
+
+    def test_max_attempts_bounds_sampling(self, fake_generation):
+        assert len(list(iter_cvs(10, filters={"industry": "finance", "age_group": "18-25"}, max_attempts=4))) <= 4
+
+
+def test_persona_matches():
+    persona = {"industry": "finance", "career_level": "senior", "age": 30, "language": "fr"}
+    assert persona_matches(persona, None)
+    assert persona_matches(persona, {"industry": "finance", "age_group": "26-40", "language": None})
+    assert not persona_matches(persona, {"age_group": "41-65"})
+    assert not persona_matches(persona, {"career_level": "junior"})
+    assert not persona_matches(persona, {"language": "de"})
@@ -0,0 +1,49 @@
+"""
+Tests for fast-fail CV validation.
+
+Tests cover:
+- Early exit on critical issues and on an unreachable minimum score
+- Same verdict as the full validation
+
+Run: pytest tests/test_fast_fail_validation.py -v
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.generation.cv_assembler import CVDocument
+from src.generation.cv_quality_validator import validate_complete_cv
+
+
+def _cv(**kwargs):
+    fields = dict(
+        first_name="Anna", last_name="Meier", full_name="Anna Meier", age=38, gender="female",
+        canton="ZH", career_level="senior", years_experience=15,
+        summary="Erfahrene Analystin mit langjähriger Praxis in Pharma und Finanzen.",
+        jobs=[{"company": "Roche AG", "position": "Analystin", "start_date": "2012-01", "end_date": None,
+               "is_current": True, "responsibilities": ["Optimierte 12 Berichte", "Leitete 3 Projekte"]}]
+    )
+    fields.update(kwargs)
+    return CVDocument(**fields)
+
+
+class TestFastFail:
+    """Test early exits of validate_complete_cv."""
+
+    def test_stops_at_first_critical_issue(self):
+        fast = validate_complete_cv(_cv(), min_score=75.0, auto_fix=False, fast_fail=True)
+        full = validate_complete_cv(_cv(), min_score=75.0, auto_fix=False)
+
+        assert fast.early_exit == "timeline" and full.early_exit is None
+        assert fast.passed is full.passed is False
+        assert all(issue.category == "timeline" for issue in fast.issues)
+        assert len(fast.issues) < len(full.issues)
+        assert fast.score.overall >= full.score.overall
+
+    def test_stops_when_min_score_is_unreachable(self):
+        report = validate_complete_cv(_cv(jobs=[]), min_score=101.0, auto_fix=False, fast_fail=True)
+        assert report.early_exit == "timeline"
+        assert report.to_dict()["summary"]["early_exit"] == "timeline"
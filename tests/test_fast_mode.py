@@ -0,0 +1,77 @@
+"""
+Tests for the offline fast mode.
+
+Tests cover:
+- Reference snapshot built from the data files
+- Record layout and job timeline of generated CVs
+- Sampled distributions and filters
+
+Run: pytest tests/test_fast_mode.py -v
+"""
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.generation.cv_timeline_validator import check_job_overlaps
+from src.generation.fast_mode import FastCVEngine, ReferenceSnapshot
+
+
+@pytest.fixture(scope="module")
+def snapshot():
+    return ReferenceSnapshot.from_files()
+
+
+class TestFastMode:
+    """Test fast mode generation from a file snapshot."""
+
+    def test_snapshot_roundtrip(self, snapshot, tmp_path):
+        assert len(snapshot.cantons) == 26
+        assert snapshot.occupations and snapshot.industry_weights
+        snapshot.save(tmp_path / "snapshot.json")
+        assert ReferenceSnapshot.load(tmp_path / "snapshot.json").to_dict() == snapshot.to_dict()
+
+    def test_records_are_complete_and_consistent(self, snapshot):
+        records = list(FastCVEngine(snapshot, seed=1, use_banks=False).generate(200))
+        assert len(records) == 200
+        for record in records:
+            assert record["metadata"]["mode"] == "fast"
+            assert record["content"]["summary"] and record["content"]["education"]
+            jobs = record["content"]["jobs"]
+            assert jobs[-1]["is_current"] and all(job["responsibilities"] for job in jobs)
+            for previous, job in zip(jobs, jobs[1:]):
+                assert previous["end_date"] == job["start_date"]
+            assert check_job_overlaps(jobs) == []  # no job starts after the current month
+
+    def test_distribution_and_filters(self, snapshot):
+        engine = FastCVEngine(snapshot, seed=2, use_banks=False)
+        personas = engine.sample_personas(20000)
+        genders = Counter(p["gender"] for p in personas)
+        assert abs(genders["male"] / len(personas) - 0.501) < 0.02
+        assert all(p["years_experience"] <= max(0, p["age"] - 16) for p in personas)
+
+        records = list(engine.generate(50, filters={"industry": "finance", "career_level": "junior"}))
+        assert len(records) == 50
+        assert {r["professional"]["industry"] for r in records} == {"finance"}
+        assert {r["professional"]["career_level"] for r in records} == {"junior"}
+
+    def test_unsatisfiable_filters_raise(self, snapshot):
+        engine = FastCVEngine(snapshot, seed=3, use_banks=False)
+        with pytest.raises(ValueError, match="does not occur in age group"):
+            next(engine.generate(1, filters={"age_group": "18-25", "career_level": "lead"}))
+        with pytest.raises(ValueError, match="No persona matches"):
+            next(engine.generate(1, batch_size=10, filters={"canton": "XX"}))
+
+    def test_seed_leaves_module_random_alone(self, snapshot):
+        random.seed(7)
+        expected = random.random()
+        random.seed(7)
+        first = [r["content"] for r in FastCVEngine(snapshot, seed=4, use_banks=False).generate(5)]
+        assert random.random() == expected
+        assert [r["content"] for r in FastCVEngine(snapshot, seed=4, use_banks=False).generate(5)] == first
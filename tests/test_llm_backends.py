@@ -0,0 +1,241 @@
+"""
+Tests for the pluggable LLM backends (deterministic local stub).
+
+Tests cover:
+- Deterministic responses per prompt
+- Prompt-type specific formats (JOB n bullets, hobbies CSV, JSON, summary)
+- Latency distributions and error injection
+- Backend selection through openai_client
+- Streaming responses and incremental JSON bullet parsing with early cancel
+- JSON-mode responses filling per-prompt schemas
+
+Run: pytest tests/test_llm_backends.py -v
+"""
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.generation import openai_client
+from src.generation.cv_activities_transformer import _stream_all_jobs_bullets
+from src.generation.llm_schemas import HOBBIES_SCHEMA, job_bullets_schema, schema_errors
+from src.generation.llm_backends import (
+    ChatClientAdapter,
+    StubLLMBackend,
+    StubRateLimitError,
+    StubTimeoutError,
+    create_backend_client,
+)
+
+
+def _create(client, user, system="You are a professional CV writer.", max_tokens=400):
+    response = client.chat.completions.create(
+        model="gpt-3.5-turbo",
+        messages=[{"role": "system", "content": system}, {"role": "user", "content": user}],
+        max_tokens=max_tokens,
+        temperature=0.7,
+    )
+    return response
+
+
+class TestStubResponses:
+    """Test prompt-type specific stub responses."""
+
+    def setup_method(self):
+        self.client = ChatClientAdapter(StubLLMBackend(seed=7))
+
+    def test_deterministic_for_same_prompt(self):
+        """Same seed and prompt yield identical content."""
+        other = ChatClientAdapter(StubLLMBackend(seed=7))
+        prompt = "Erstelle einen professionellen CV-Zusammenfassungstext (2-3 Sätze) für:\n\nBeruf: Informatiker/in EFZ"
+        assert _create(self.client, prompt).choices[0].message.content == \
+            _create(other, prompt).choices[0].message.content
+
+    def test_job_batch_format(self):
+        """JOB n prompts produce numbered bullets per job with the requested counts."""
+        prompt = (
+            "Generiere Lebenslauf-Bullets für diese 2 Stellen:\n"
+            "JOB 1: Elektriker bei ABB\nKarrierestufe: junior\nAnzahl Bullets: 2\nTätigkeiten:\n  - Installationen prüfen\n"
+            "JOB 2: Projektleiter bei BKW\nKarrierestufe: senior\nAnzahl Bullets: 3\nTätigkeiten:\n  - Projekte leiten\n"
+            "AUSGABEFORMAT (WICHTIG - genau so!):\nJOB 1:\n1. [Bullet]\n"
+        )
+        content = _create(self.client, prompt).choices[0].message.content
+        sections = re.split(r"^JOB (\d+):", content, flags=re.MULTILINE)
+        bullets = {int(sections[i]): re.findall(r"^\d+\. .+$", sections[i + 1], re.MULTILINE)
+                   for i in range(1, len(sections), 2)}
+        assert {k: len(v) for k, v in bullets.items()} == {1: 2, 2: 3}
+
+    def test_hobbies_csv_in_language(self):
+        """Hobby prompts return 4-5 comma-separated items in the prompt language."""
+        prompt = "Génère 4-5 loisirs suisses réalistes pour un CV. Retourne uniquement une liste séparée par des virgules."
+        hobbies = [h.strip() for h in _create(self.client, prompt).choices[0].message.content.split(",")]
+        assert 4 <= len(hobbies) <= 5
+        assert "Wandern" not in hobbies
+
+    def test_json_prompt_returns_valid_json(self):
+        """JSON prompts return parseable JSON."""
+        content = _create(
+            self.client,
+            'Return the canton as {"code": "ZH", "name": "Zürich"}',
+            system="Generate data.\n\nRespond ONLY with valid JSON, no markdown.",
+        ).choices[0].message.content
+        assert json.loads(content) == {"code": "ZH", "name": "Zürich"}
+
+    def test_usage_and_truncation(self):
+        """Usage is reported and tight budgets truncate with finish_reason=length."""
+        response = _create(self.client, "Erstelle einen Text. Beruf: Koch/Köchin EFZ", max_tokens=5)
+        assert response.usage.completion_tokens == 5
+        assert response.choices[0].finish_reason == "length"
+
+
+class TestStubRuntimeBehaviour:
+    """Test latency and error injection."""
+
+    def test_fixed_latency_uses_sleep(self):
+        slept = []
+        backend = StubLLMBackend(latency="fixed", latency_ms=250, sleep=slept.append)
+        _create(ChatClientAdapter(backend), "Beruf: Koch")
+        assert slept == [0.25]
+
+    def test_error_injection_is_transient(self):
+        """Injected errors are classified as transient by the client retry logic."""
+        client = ChatClientAdapter(StubLLMBackend(error_rate_429=1.0))
+        with pytest.raises(StubRateLimitError) as exc:
+            _create(client, "Beruf: Koch")
+        assert openai_client._is_transient_error(exc.value)
+
+        client = ChatClientAdapter(StubLLMBackend(error_rate_timeout=1.0))
+        with pytest.raises(StubTimeoutError) as exc:
+            _create(client, "Beruf: Koch")
+        assert openai_client._is_transient_error(exc.value)
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError):
+            create_backend_client("does-not-exist", None)
+
+
+def test_openai_client_uses_stub_backend(monkeypatch):
+    """LLM_BACKEND=stub makes call_openai_chat work without an API key."""
+    settings = openai_client.get_settings()
+    monkeypatch.setattr(settings, "llm_backend", "stub", raising=False)
+    openai_client.reset_client()
+    try:
+        assert openai_client.is_openai_available()
+        assert openai_client.get_llm_backend_name() == "stub"
+        text = openai_client.call_openai_chat("You are a CV writer.", "Erstelle einen Text.\nBeruf: Koch/Köchin EFZ")
+        assert "Koch/Köchin EFZ" in text
+    finally:
+        openai_client.reset_client()
+
+
+class TestStreaming:
+    """Test streamed completions and incremental bullet parsing."""
+
+    def test_stub_stream_matches_completion(self):
+        client = ChatClientAdapter(StubLLMBackend(seed=7))
+        prompt = "Erstelle einen Text.\nBeruf: Koch/Köchin EFZ"
+        full = _create(client, prompt).choices[0].message.content
+        stream = client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "system", "content": "You are a professional CV writer."},
+                      {"role": "user", "content": prompt}],
+            max_tokens=400, stream=True, stream_options={"include_usage": True},
+        )
+        chunks = list(stream)
+        assert "".join(c.choices[0].delta.content or "" for c in chunks if c.choices) == full
+        assert chunks[-1].usage.completion_tokens > 0
+
+    def test_stream_cancelled_once_all_jobs_complete(self):
+        """Parsing stops (and closes the stream) as soon as every job has its valid bullets."""
+        consumed = []
+        text = json.dumps({
+            "job_1": ["Installierte Anlagen für 15 Kunden", "Koordinierte 5 Projekte im Team"],
+            "job_2": ["Leitete 4 Projekte gleichzeitig", "Betreute 20 Kunden in der Region",
+                      "Over-generated bullet with 5 items"],
+        }, ensure_ascii=False)
+
+        def chunks():
+            for i in range(0, len(text), 7):
+                consumed.append(i)
+                yield text[i:i + 7]
+
+        jobs = [{"career_level": "mid", "num_bullets": 2}, {"career_level": "mid", "num_bullets": 1}]
+        stream = chunks()
+        bullets = _stream_all_jobs_bullets(stream, jobs)
+
+        assert {k: len(v) for k, v in bullets.items()} == {0: 2, 1: 1}
+        assert bullets[1] == ["Leitete 4 Projekte gleichzeitig"]
+        assert stream.gi_frame is None  # generator closed before the over-generated tail
+        assert consumed[-1] < text.index("Betreute 20 Kunden")
+
+
+def test_stream_openai_chat_records_usage(monkeypatch):
+    """stream_openai_chat yields the stub content and records the call."""
+    from src.generation.llm_metrics import cv_metrics_scope
+
+    settings = openai_client.get_settings()
+    monkeypatch.setattr(settings, "llm_backend", "stub", raising=False)
+    openai_client.reset_client()
+    try:
+        with cv_metrics_scope() as metrics:
+            text = "".join(openai_client.stream_openai_chat(
+                "You are a CV writer.", "Erstelle einen Text.\nBeruf: Koch/Köchin EFZ", call_site="summary.varied"))
+        assert "Koch/Köchin EFZ" in text
+        site = metrics.get("summary.varied")
+        assert site.calls == 1 and site.completion_tokens > 0
+    finally:
+        openai_client.reset_client()
+
+
+class TestJsonMode:
+    """Test JSON-mode responses, schema validation and field repair."""
+
+    def test_stub_fills_schema(self):
+        client = ChatClientAdapter(StubLLMBackend(seed=3))
+        for schema, user in (
+            (job_bullets_schema([2, 3]), "JOB 1: Koch bei Hotel Adler\nJOB 2: Chefkoch bei Hotel Krone\n"),
+            (HOBBIES_SCHEMA, "Génère 4-5 loisirs suisses réalistes pour un CV."),
+        ):
+            response = client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[{"role": "system", "content": openai_client.build_json_system_prompt("CV", schema)},
+                          {"role": "user", "content": user}],
+                max_tokens=800, response_format={"type": "json_object"},
+            )
+            assert schema_errors(json.loads(response.choices[0].message.content), schema) == []
+
+    def test_repair_asks_only_for_invalid_fields(self, monkeypatch):
+        """A response missing one job triggers one repair call for that job only."""
+        requests = []
+        replies = iter([
+            '{"job_1": ["Koordinierte 5 Projekte im Team", "Betreute 20 Kunden in der Region"]}',
+            '{"job_2": ["Leitete 4 Projekte gleichzeitig"], "job_1": []}',
+        ])
+
+        class FakeCompletions:
+            def create(self, **kwargs):
+                requests.append(kwargs)
+                content = next(replies)
+                return type("R", (), {"choices": [type("C", (), {
+                    "message": type("M", (), {"content": content})(), "finish_reason": "stop"})()],
+                    "usage": None})()
+
+        fake = type("Client", (), {"chat": type("Chat", (), {"completions": FakeCompletions()})()})()
+        monkeypatch.setattr(openai_client, "_initialized", True)
+        monkeypatch.setattr(openai_client, "_openai_client", fake)
+        monkeypatch.setattr(openai_client, "_circuit_breaker", openai_client.CircuitBreaker())
+
+        data = openai_client.call_openai_json("CV", "JOB 1: ...\nJOB 2: ...", schema=job_bullets_schema([2, 1]))
+
+        assert data == {"job_1": ["Koordinierte 5 Projekte im Team", "Betreute 20 Kunden in der Region"],
+                        "job_2": ["Leitete 4 Projekte gleichzeitig"]}
+        assert len(requests) == 2
+        repair_system = requests[1]["messages"][0]["content"]
+        assert '"job_2"' in repair_system and '"job_1"' not in repair_system
+        assert requests[1]["response_format"] == {"type": "json_object"}
@@ -0,0 +1,177 @@
+"""
+Tests for per-call-site LLM metrics.
+
+Tests cover:
+- Recording calls, retries and fallbacks per call site
+- Per-CV scopes and merging worker results into a run collector
+- call_openai_chat instrumentation (stub backend)
+- Circuit breaker trips, half-open probes and short circuits
+
+Run: pytest tests/test_llm_metrics.py -v
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.generation import openai_client
+from src.generation.llm_metrics import (
+    LLMMetrics,
+    cv_metrics_scope,
+    estimate_cost_usd,
+    record_llm_call,
+    record_llm_fallback,
+)
+
+
+class TestLLMMetrics:
+    """Test metric aggregation."""
+
+    def test_cost_uses_model_prefix(self):
+        assert estimate_cost_usd("gpt-4-0613", 1000, 1000) == estimate_cost_usd("gpt-4", 1000, 1000)
+        assert estimate_cost_usd("gpt-4o-mini", 1000, 0) < estimate_cost_usd("gpt-4o", 1000, 0)
+
+    def test_scope_collects_calls_and_fallbacks(self):
+        with cv_metrics_scope() as outer:
+            with cv_metrics_scope() as inner:
+                record_llm_call("summary.varied", "gpt-3.5-turbo", 0.3, 100, 50, retries=1)
+                record_llm_fallback("hobbies")
+            record_llm_call("bullets.all_jobs", "gpt-3.5-turbo", 3.0, 400, 300)
+
+        assert inner.totals().calls == 1
+        assert outer.totals().calls == 2
+        summary = outer.get("summary.varied")
+        assert (summary.prompt_tokens, summary.completion_tokens, summary.retries) == (100, 50, 1)
+        assert outer.get("hobbies").fallback_rate == 1.0
+
+    def test_merge_from_dict_roundtrip(self):
+        """Worker results (dicts) merge into a run collector without losing histogram data."""
+        worker = LLMMetrics()
+        for latency in (0.1, 0.7, 5.0):
+            worker.record_call("summary.varied", "gpt-3.5-turbo", latency, 10, 10)
+
+        run = LLMMetrics()
+        run.merge(worker.to_dict())
+        run.merge(worker.to_dict())
+
+        site = run.get("summary.varied")
+        assert site.calls == 6
+        assert sum(site.latency_buckets) == 6
+        assert site.latency_percentile(95) == 5.0
+        assert abs(site.cost_usd - 2 * worker.get("summary.varied").cost_usd) < 1e-12
+
+
+def test_call_openai_chat_records_usage(monkeypatch):
+    """call_openai_chat records tokens and latency under its call site."""
+    settings = openai_client.get_settings()
+    monkeypatch.setattr(settings, "llm_backend", "stub", raising=False)
+    openai_client.reset_client()
+    try:
+        with cv_metrics_scope() as metrics:
+            openai_client.call_openai_chat("You are a CV writer.", "Beruf: Koch", call_site="summary.varied")
+        site = metrics.get("summary.varied")
+        assert site.calls == 1
+        assert site.errors == 0
+        assert site.prompt_tokens > 0 and site.completion_tokens > 0
+    finally:
+        openai_client.reset_client()
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions."""
+
+    def setup_method(self):
+        self.now = 0.0
+        self.breaker = openai_client.CircuitBreaker(
+            failure_threshold=3, window_size=10, p95_latency_threshold=5.0,
+            min_latency_samples=4, reset_timeout=30.0, clock=lambda: self.now
+        )
+
+    def test_trips_on_failures_and_half_opens(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+        assert self.breaker.state == "open"
+        assert not self.breaker.allow_request()
+
+        self.now = 31.0
+        assert self.breaker.allow_request()      # single probe
+        assert not self.breaker.allow_request()
+        self.breaker.record_success(0.5)
+        assert self.breaker.state == "closed"
+
+    def test_trips_on_p95_latency(self):
+        for _ in range(4):
+            self.breaker.record_success(8.0)
+        assert self.breaker.state == "open"
+
+        self.now = 31.0
+        assert self.breaker.allow_request()
+        self.breaker.record_failure()
+        assert self.breaker.state == "open"
+        assert self.breaker.trips == 2
+
+
+def test_open_circuit_short_circuits_calls(monkeypatch):
+    """Once the stub keeps failing, later calls fail fast and are counted as short circuits."""
+    settings = openai_client.get_settings()
+    monkeypatch.setattr(settings, "llm_backend", "stub", raising=False)
+    monkeypatch.setattr(settings, "llm_stub_error_rate_429", 1.0, raising=False)
+    monkeypatch.setattr(settings, "llm_breaker_failure_threshold", 2, raising=False)
+    monkeypatch.setattr(openai_client, "_sleep_with_backoff", lambda attempt: None)
+    openai_client.reset_client()
+    try:
+        with cv_metrics_scope() as metrics:
+            with pytest.raises(openai_client.CircuitOpenError):
+                openai_client.call_openai_chat("You are a CV writer.", "Beruf: Koch", call_site="hobbies")
+            assert openai_client.is_llm_degraded()
+            with pytest.raises(openai_client.CircuitOpenError):
+                openai_client.call_openai_chat("You are a CV writer.", "Beruf: Koch", call_site="hobbies")
+        site = metrics.get("hobbies")
+        assert (site.calls, site.retries, site.short_circuits) == (1, 1, 1)
+    finally:
+        openai_client.reset_client()
+
+
+class TestHalfOpenProbe:
+    """Test that every exit path of a half-open probe reaches the breaker."""
+
+    def _half_open(self, monkeypatch, client):
+        now = [0.0]
+        breaker = openai_client.CircuitBreaker(failure_threshold=1, reset_timeout=30.0, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 31.0
+        monkeypatch.setattr(openai_client, "_initialized", True)
+        monkeypatch.setattr(openai_client, "_openai_client", client)
+        monkeypatch.setattr(openai_client, "_circuit_breaker", breaker)
+        monkeypatch.setattr(openai_client, "_sleep_with_backoff", lambda attempt: None)
+        return breaker
+
+    def test_no_client_fails_the_probe(self, monkeypatch):
+        breaker = self._half_open(monkeypatch, None)
+        monkeypatch.setitem(sys.modules, "openai", None)  # import openai raises ImportError
+
+        with pytest.raises(RuntimeError):
+            openai_client.call_openai_chat("CV", "Beruf: Koch", call_site="hobbies")
+        assert breaker.state == "open" and breaker.trips == 2
+
+        breaker._opened_at = -100.0
+        with pytest.raises(RuntimeError):
+            list(openai_client.stream_openai_chat("CV", "Beruf: Koch", call_site="hobbies"))
+        assert breaker.state == "open" and breaker.trips == 3
+
+    def test_non_transient_error_releases_the_probe(self, monkeypatch):
+        class BadRequest:
+            def create(self, **kwargs):
+                raise ValueError("invalid request: unknown parameter")
+
+        client = type("Client", (), {"chat": type("Chat", (), {"completions": BadRequest()})()})()
+        breaker = self._half_open(monkeypatch, client)
+
+        with pytest.raises(ValueError):
+            openai_client.call_openai_chat("CV", "Beruf: Koch", call_site="hobbies")
+        assert breaker.state == "half_open" and breaker.trips == 1
+        assert breaker.allow_request()  # the next probe is let through
@@ -0,0 +1,71 @@
+"""
+Tests for the model routing policy.
+
+Tests cover:
+- Longest-prefix routes, tiers and LLM_MODEL_ROUTING parsing
+- Downgrade on run budgets and latency SLOs
+- Quality per model and section
+
+Run: pytest tests/test_model_routing.py -v
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.generation.llm_metrics import LLMMetrics
+from src.generation.model_routing import ModelQualityReport, ModelRouter, parse_routes
+
+
+def _router(metrics, **kwargs):
+    routes = {"summary": "full", "summary.basic": "mini", "bullets": "gpt-4o"}
+    return ModelRouter(routes, "gpt-4o-mini", "gpt-4", metrics=metrics, **kwargs)
+
+
+class TestModelRouter:
+    """Test route resolution and downgrades."""
+
+    def test_longest_prefix_wins(self):
+        router = _router(LLMMetrics())
+        assert router.route("summary.varied") == "gpt-4"
+        assert router.route("summary.basic") == "gpt-4o-mini"
+        assert router.route("bullets.all_jobs.repair") == "gpt-4o"
+        assert router.route("hobbies") == "gpt-4o-mini"
+        assert parse_routes('{"hobbies": "full"}') == {"hobbies": "full"}
+        assert parse_routes("[1, 2]") == {}
+
+    def test_downgrade_on_budget_and_latency(self):
+        metrics = LLMMetrics()
+        router = _router(metrics, token_budget=1000, latency_slo_seconds=5.0)
+        metrics.record_call("summary.varied", "gpt-4", 1.0, 500, 250)
+        assert router.route("summary.varied") == "gpt-4"
+
+        metrics.record_call("summary.varied", "gpt-4", 1.0, 50, 50)
+        assert router.check_budgets() == "tokens"
+        assert router.route("summary.varied") == "gpt-4o-mini"
+        assert router.downgrades() == {"summary.varied": 1}
+
+        slow = _router(LLMMetrics(), latency_slo_seconds=5.0)
+        for _ in range(5):
+            slow.metrics.record_call("bullets.all_jobs", "gpt-4o", 10.0)
+        assert slow.route("bullets.all_jobs") == "gpt-4o-mini"
+        assert slow.route("summary.varied") == "gpt-4"
+
+
+def test_quality_report_per_section_and_model():
+    report = ModelQualityReport()
+    for model, score, penalty in (("gpt-4", 90.0, 0.0), ("gpt-4o-mini", 80.0, 5.0)):
+        metrics = LLMMetrics()
+        metrics.record_call("summary.varied", model, 1.0, 10, 10)
+        metrics.record_call("bullets.all_jobs", "gpt-4o-mini", 1.0, 10, 10)
+        report.add(metrics.to_dict(), {
+            "score": {"overall": score},
+            "issues": [{"section": "content", "score_impact": penalty}]
+        })
+
+    result = report.to_dict()
+    assert result["summary"]["gpt-4"] == {"cvs": 1, "avg_quality": 90.0, "avg_section_penalty": 0.0}
+    assert result["summary"]["gpt-4o-mini"]["avg_section_penalty"] == 5.0
+    assert result["bullets"]["gpt-4o-mini"] == {"cvs": 2, "avg_quality": 85.0, "avg_section_penalty": 0.0}
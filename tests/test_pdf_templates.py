@@ -0,0 +1,65 @@
+"""
+Tests for the compiled PDF template styles.
+
+Tests cover:
+- Styles and labels compiled once per (template, language) and read-only
+- Renders with shared styles are identical, also from several threads
+
+Run: pytest tests/test_pdf_templates.py -v
+"""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from reportlab import rl_config
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.export.pdf_templates import RENDER_FUNCTIONS, get_template_style, warm_template_styles
+
+CV = {
+    "full_name": "Anna Meier", "current_title": "Analystin", "summary": "Erfahrene Analystin.",
+    "email": "anna@example.ch", "phone": "079 123 45 67", "city": "Zürich", "canton": "ZH", "language": "fr",
+    "jobs": [{"position": "Analyst", "company": "UBS AG", "start_date": "2020-01", "end_date": None,
+              "responsibilities": ["Berichte erstellt", "Prozesse optimiert"]}],
+    "education": [{"degree": "BSc", "institution": "ETH Zürich", "start_year": 2015, "end_year": 2019}],
+    "skills": {"technical": ["Python", "SQL"], "languages": ["Deutsch", "Englisch"]},
+    "hobbies": ["Wandern"],
+}
+
+
+class TestTemplateStyles:
+    """Test the style/label bundles."""
+
+    def test_bundles_are_cached_and_read_only(self):
+        bundle = get_template_style("classic", "fr")
+        assert get_template_style("classic", "FR-ch") is bundle
+        assert get_template_style("classic", "fr").styles is get_template_style("classic", "de").styles
+        assert bundle.labels["experience"] == "Expérience"
+        assert get_template_style("timeline", "en").labels["experience"] == "Berufserfahrung"
+        with pytest.raises(TypeError):
+            bundle.styles["name"] = None
+        with pytest.raises(TypeError):
+            bundle.labels["profile"] = "Profile"
+
+    def test_warm_compiles_all_templates(self):
+        assert warm_template_styles() == len(RENDER_FUNCTIONS) * 3
+
+
+@pytest.mark.parametrize("template", sorted(RENDER_FUNCTIONS))
+def test_renders_are_identical_across_threads(template, tmp_path, monkeypatch):
+    monkeypatch.setattr(rl_config, "invariant", 1)
+    render = RENDER_FUNCTIONS[template]
+
+    def run(i):
+        path = tmp_path / f"{template}_{i}.pdf"
+        render(CV, str(path))
+        return path.read_bytes()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        outputs = list(pool.map(run, range(4)))
+    assert outputs[0].startswith(b"%PDF")
+    assert all(output == outputs[0] for output in outputs)
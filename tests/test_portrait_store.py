@@ -0,0 +1,78 @@
+"""
+Tests for the preprocessed portrait store.
+
+Tests cover:
+- Each (portrait, size, circular) variant is processed and encoded once
+- Renderers get the PNG behind a data URI without decoding it
+- CV documents and JSON exports reference portraits by asset id
+
+Run: pytest tests/test_portrait_store.py -v
+"""
+import sys
+import base64
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PIL import Image
+
+from src.cli.main import export_cv_json
+from src.generation.cv_assembler import CVDocument
+from src.generation.portrait_store import PortraitStore, make_asset_id, parse_asset_id
+
+
+def _store(tmp_path):
+    Image.new("RGB", (400, 500), (200, 10, 10)).save(tmp_path / "p.png")
+    return PortraitStore(portrait_dir=tmp_path)
+
+
+class TestPortraitStore:
+    """Test variant caching of the store."""
+
+    def test_variant_is_processed_once(self, tmp_path, monkeypatch):
+        store = _store(tmp_path)
+        renders = []
+        original = store._render
+        monkeypatch.setattr(store, "_render", lambda *args: renders.append(args) or original(*args))
+
+        uri = store.get_data_uri("p.png", (150, 150), circular=True)
+        assert store.get_data_uri("p.png", (150, 150), circular=True) is uri
+        assert store.get_data_uri("p.png", (80, 80), circular=True) != uri
+        assert len(renders) == 2
+        assert store.get_data_uri("missing.png") is None
+
+    def test_png_for_data_uri(self, tmp_path):
+        store = _store(tmp_path)
+        uri = store.get_data_uri("p.png", (150, 150), circular=True)
+        png = store.png_for_data_uri(uri)
+        assert png is store.get_png("p.png", (150, 150), circular=True)
+        assert png.startswith(b"\x89PNG")
+
+        foreign = "data:image/png;base64," + base64.b64encode(png).decode("utf-8")
+        assert store.png_for_data_uri(foreign) == png
+
+
+class TestPortraitReferences:
+    """Test portrait-by-reference documents and exports."""
+
+    def test_asset_id_round_trip(self, tmp_path):
+        store = _store(tmp_path)
+        asset_id = make_asset_id("p.png", (150, 150), circular=True)
+        assert asset_id == "p.png@150x150c"
+        assert parse_asset_id(asset_id) == ("p.png", (150, 150), True)
+        assert parse_asset_id("data:image/png;base64,AAAA") is None
+        assert store.resolve_png(asset_id) is store.get_png("p.png", (150, 150), True)
+
+    def test_export_references_portrait_unless_inlined(self, tmp_path):
+        cv_doc = CVDocument(
+            first_name="Anna", last_name="Meier", full_name="Anna Meier", age=38, gender="female", canton="ZH",
+            portrait_path="female/26-40/x.png", portrait_asset_id="female/26-40/x.png@150x150c"
+        )
+        personal = cv_doc.to_dict()["personal"]
+        assert personal["portrait_asset_id"] == "female/26-40/x.png@150x150c"
+        assert personal["portrait_base64"] is None
+
+        export_cv_json(cv_doc, tmp_path / "cv.json")
+        assert len((tmp_path / "cv.json").read_bytes()) < 5000
@@ -0,0 +1,105 @@
+"""
+Tests for the PDF render farm.
+
+Tests cover:
+- Serialized CVs are rendered in worker processes
+- Failed renders are written to the error sidecar instead of raising
+- The queue of unrendered CVs is bounded
+- Re-rendering a JSON corpus from a directory or manifest, skipping
+  up-to-date PDFs by mtime or content hash
+
+Run: pytest tests/test_render_farm.py -v
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.cli.main import export_cv_json
+from src.export.render_farm import RenderFarm, find_cv_files, render_corpus, render_cv_data
+from src.generation.cv_assembler import CVDocument
+
+
+def _cv(first_name="Anna"):
+    return CVDocument(first_name=first_name, last_name="Meier", full_name=f"{first_name} Meier",
+                      age=38, gender="female", canton="ZH", current_title="Analystin",
+                      jobs=[{"position": "Analyst", "company": "UBS AG", "start_date": "2020-01",
+                             "end_date": None, "responsibilities": ["Berichte erstellt"]}])
+
+
+def test_render_cv_data_from_dict(tmp_path):
+    out = tmp_path / "cv" / "anna.pdf"
+    result = render_cv_data(_cv().to_dict(), str(out), "unknown")
+
+    assert result["error"] is None
+    assert result["template"] == "classic"
+    assert result["pages"] >= 1
+    assert out.read_bytes().startswith(b"%PDF")
+
+
+class TestRenderFarm:
+    """Test rendering in the process pool."""
+
+    def test_renders_and_records_failures(self, tmp_path):
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("x")
+        errors = tmp_path / "render_errors.jsonl"
+
+        with RenderFarm(workers=2, max_pending=1, errors_path=errors) as farm:
+            futures = [farm.submit(_cv(f"P{i}"), tmp_path / f"P{i}.pdf", "random") for i in range(3)]
+            futures.append(farm.submit(_cv().to_dict(), blocker / "fail.pdf", "modern"))
+
+        assert farm.stats == {"submitted": 4, "rendered": 3, "failed": 1, "pages": 3}
+        assert all((tmp_path / f"P{i}.pdf").read_bytes().startswith(b"%PDF") for i in range(3))
+        assert futures[0].result()["template"] != "random"
+
+        records = [json.loads(line) for line in errors.read_text(encoding="utf-8").splitlines()]
+        assert len(records) == 1
+        assert records[0]["output"] == str(blocker / "fail.pdf")
+        assert records[0]["template"] == "modern"
+        assert "traceback" in records[0] and "time" in records[0]
+
+
+class TestRenderCorpus:
+    """Test re-rendering exported CV JSON files."""
+
+    def _corpus(self, root):
+        for i in range(3):
+            export_cv_json(_cv(f"P{i}"), root / "de" / "finance" / f"P{i}.json")
+        (root / "de" / "report.json").write_text(json.dumps({"scores": {}}), encoding="utf-8")
+        (root / "generation_report.json").write_text(json.dumps({"summary": {}}), encoding="utf-8")
+        (root / "failed_cvs.json").write_text("[]", encoding="utf-8")
+
+    def test_renders_directory_and_skips_by_mtime(self, tmp_path):
+        self._corpus(tmp_path)
+
+        stats = render_corpus(tmp_path, template="minimal", workers=2)
+        assert (stats["found"], stats["rendered"], stats["failed"], stats["skipped"]) == (4, 3, 1, 0)
+        assert stats["pages"] >= 3 and stats["pages_per_sec"] > 0
+        assert (tmp_path / "de" / "finance" / "P0.pdf").read_bytes().startswith(b"%PDF")
+        assert "not a CV JSON export" in Path(stats["errors_path"]).read_text(encoding="utf-8")
+
+        # Only the changed JSON (and the failed one) are rendered again
+        json_path = tmp_path / "de" / "finance" / "P1.json"
+        pdf_mtime = (tmp_path / "de" / "finance" / "P1.pdf").stat().st_mtime
+        os.utime(json_path, (pdf_mtime + 10, pdf_mtime + 10))
+        stats = render_corpus(tmp_path, template="minimal", workers=2)
+        assert (stats["rendered"], stats["failed"], stats["skipped"]) == (1, 1, 2)
+
+    def test_manifest_and_hash_skip(self, tmp_path):
+        self._corpus(tmp_path)
+        manifest = tmp_path / "cvs.txt"
+        manifest.write_text("de/finance/P0.json\n\n# comment\nde/finance/P2.json\n", encoding="utf-8")
+        out = tmp_path / "pdf"
+
+        assert [rel.as_posix() for _, rel in find_cv_files(manifest)] == ["de/finance/P0.json", "de/finance/P2.json"]
+        assert render_corpus(manifest, output_dir=out, template="classic", skip="hash", workers=1)["rendered"] == 2
+        assert (out / "de" / "finance" / "P2.pdf").exists()
+
+        # Same content and template: skipped; another template: rendered again
+        assert render_corpus(manifest, output_dir=out, template="classic", skip="hash", workers=1)["skipped"] == 2
+        assert render_corpus(manifest, output_dir=out, template="modern", skip="hash", workers=1)["rendered"] == 2
@@ -0,0 +1,69 @@
+"""
+Tests for the summary/hobby template bank.
+
+Tests cover:
+- Template cleaning (slots, near-duplicates)
+- Slot filling and the no-repeat diversity guarantee
+- Fallback to industry "other", misses and the premium tier
+
+Run: pytest tests/test_section_bank.py -v
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.generation.section_bank import SectionBank, clean_summary_templates, is_premium_tier
+
+TEMPLATES = [
+    "{occupation} mit {years} Jahren Erfahrung im Raum {canton}, spezialisiert auf {skills}.",
+    "Seit {years} Jahren als {occupation} tätig; Schwerpunkte sind {skills}.",
+    "Engagierte Fachperson ({occupation}) aus {canton} mit Know-how in {skills}.",
+    "Als {occupation} verbinde ich {skills} mit {years} Jahren Praxis in Betrieben der Region.",
+]
+HOBBIES = ["Wandern", "Klettern", "Kochen", "Lesen", "Fotografie", "Velofahren", "Schach", "Jazz"]
+
+
+class TestTemplateCleaning:
+    """Test build-time validation of templates."""
+
+    def test_rejects_unknown_slots_and_near_duplicates(self):
+        cleaned = clean_summary_templates(TEMPLATES + [
+            "{occupation} mit {years} Jahren Erfahrung im Raum {canton}, spezialisiert auf {skills} und mehr.",
+            "{name} arbeitet als {occupation}.",
+            "Erfahrene Fachperson mit {years} Jahren Praxis.",
+            "{occupation} mit {years Jahren",
+        ])
+        assert cleaned == TEMPLATES
+
+
+class TestSectionBank:
+    """Test drawing from the bank."""
+
+    def setup_method(self):
+        self.bank = SectionBank(seed=3)
+        self.bank.set("de", "other", "mid", "general", TEMPLATES, HOBBIES)
+
+    def test_summaries_do_not_repeat_until_pool_exhausted(self):
+        slots = {"years": 6, "skills": "SAP", "canton": "Bern", "occupation": "Kaufmann"}
+        drawn = [self.bank.draw_summary("de", "finance", "mid", "general", slots) for _ in range(len(TEMPLATES))]
+        assert len(set(drawn)) == len(TEMPLATES)
+        assert all("{" not in summary and "Kaufmann" in summary for summary in drawn)
+
+    def test_hobbies_are_distinct_and_cycle(self):
+        first = self.bank.draw_hobbies("de", "other", "mid", "general", count=4)
+        second = self.bank.draw_hobbies("de", "other", "mid", "general", count=4)
+        assert len(set(first)) == 4
+        assert set(first).isdisjoint(second)
+
+    def test_miss_and_default_skills(self):
+        assert self.bank.draw_summary("fr", "other", "mid", "general", {}) is None
+        assert self.bank.draw_hobbies("de", "other", "lead", "general") == []
+        summary = self.bank.draw_summary("de", "other", "mid", "general", {"years": 2, "occupation": "Koch"})
+        assert "verschiedenen Fachgebieten" in summary
+
+    def test_premium_tier_from_persona(self):
+        assert is_premium_tier({"quality_tier": "premium"})
+        assert not is_premium_tier({"quality_tier": "standard"})
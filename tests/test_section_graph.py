@@ -0,0 +1,82 @@
+"""
+Tests for concurrent CV section generation.
+
+Tests cover:
+- Independent sections run concurrently, dependents after their inputs
+- Per-CV scopes (metrics, section memo) apply inside section threads
+- Sequential mode, errors and invalid graphs
+
+Run: pytest tests/test_section_graph.py -v
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.generation.llm_metrics import cv_metrics_scope, record_llm_call
+from src.generation.section_graph import SectionNode, run_section_graph
+from src.generation.section_memo import memoize_section, section_memo_scope
+
+
+def _slow(value, delay=0.2):
+    def run(done):
+        time.sleep(delay)
+        return value
+    return run
+
+
+class TestRunSectionGraph:
+    """Test scheduling of section nodes."""
+
+    def test_latency_is_longest_chain(self):
+        nodes = [
+            SectionNode("summary", _slow("s")),
+            SectionNode("education", _slow(["edu"])),
+            SectionNode("jobs", lambda done: done["education"] + ["job"], deps=("education",)),
+            SectionNode("hobbies", _slow(["Wandern"])),
+        ]
+        started = time.perf_counter()
+        results = run_section_graph(nodes, max_workers=3)
+        elapsed = time.perf_counter() - started
+
+        assert results == {"summary": "s", "education": ["edu"], "jobs": ["edu", "job"], "hobbies": ["Wandern"]}
+        assert elapsed < 0.5
+
+    def test_sequential_mode_runs_in_calling_thread(self):
+        threads = []
+        nodes = [SectionNode(name, lambda done: threads.append(threading.get_ident())) for name in ("a", "b", "c")]
+        run_section_graph(nodes, max_workers=1)
+        assert threads == [threading.get_ident()] * 3
+
+    def test_scopes_apply_in_section_threads(self):
+        calls = []
+
+        def summary(done):
+            record_llm_call("summary", "gpt-4o-mini", 0.1)
+            return memoize_section("summary", {"age": 30}, lambda: calls.append("summary") or "text")
+
+        with cv_metrics_scope() as metrics, section_memo_scope("cv1"):
+            for _ in range(2):
+                run_section_graph([SectionNode("summary", summary), SectionNode("other", _slow(None, 0))], max_workers=2)
+
+        assert metrics.get("summary").calls == 2
+        assert calls == ["summary"]
+
+    def test_errors_propagate(self):
+        def fail(done):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            run_section_graph([SectionNode("a", fail), SectionNode("b", _slow(1, 0.05))], max_workers=2)
+
+    def test_invalid_graphs_are_rejected(self):
+        with pytest.raises(ValueError, match="unknown"):
+            run_section_graph([SectionNode("jobs", _slow(1, 0), deps=("education",))])
+        with pytest.raises(ValueError, match="Cycle"):
+            run_section_graph([SectionNode("a", _slow(1, 0), deps=("b",)), SectionNode("b", _slow(1, 0), deps=("a",))])
@@ -0,0 +1,67 @@
+"""
+Tests for section-level memoization of CV retries.
+
+Tests cover:
+- Store keyed by (cv seed, section, inputs hash) with copy-on-read
+- Retries recompute only invalidated sections and their dependents
+- Mapping of validation issues to sections
+
+Run: pytest tests/test_section_memo.py -v
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.generation.cv_quality_validator import ValidationIssue
+from src.generation.section_memo import SectionMemo, memoize_section, section_memo_scope, sections_for_issues
+
+
+class TestSectionMemo:
+    """Test the section store and scopes."""
+
+    def test_store_is_keyed_by_inputs_and_copies_values(self):
+        memo = SectionMemo()
+        memo.put("cv1", "hobbies", {"age": 30}, ["Wandern"])
+        found, value = memo.get("cv1", "hobbies", {"age": 30})
+        assert found and value == ["Wandern"]
+        value.append("Kochen")
+        assert memo.get("cv1", "hobbies", {"age": 30})[1] == ["Wandern"]
+        assert memo.get("cv1", "hobbies", {"age": 31}) == (False, None)
+        assert memo.get("cv2", "hobbies", {"age": 30}) == (False, None)
+
+    def test_retry_recomputes_invalidated_sections_and_dependents(self):
+        calls = []
+
+        def build(persona):
+            summary = memoize_section("summary", persona, lambda: calls.append("summary") or f"v{len(calls)}")
+            jobs = memoize_section("jobs", persona, lambda: calls.append("jobs") or ["AG"])
+            bullets = memoize_section("bullets", jobs, lambda: calls.append("bullets") or ["x"])
+            return summary, jobs, bullets
+
+        with section_memo_scope("cv1") as memo:
+            build({"age": 30})
+            memo.invalidate("cv1", {"summary"})
+            build({"age": 30})
+            assert calls == ["summary", "jobs", "bullets", "summary"]
+
+            memo.invalidate("cv1", {"jobs"})
+            build({"age": 30})
+            assert calls[4:] == ["jobs"]
+        assert len(memo) == 0
+
+        build({"age": 30})
+        assert calls[5:] == ["summary", "jobs", "bullets"]
+
+
+def test_sections_for_issues():
+    issues = [
+        ValidationIssue(category="completeness", severity="warning", section="content", field="summary"),
+        ValidationIssue(category="achievement", severity="warning", section="jobs"),
+        ValidationIssue(category="company", severity="critical", section="jobs"),
+        ValidationIssue(category="personalization", severity="info", section="content", field="hobbies"),
+    ]
+    assert sections_for_issues(issues) == {"summary", "bullets", "jobs"}
+    assert sections_for_issues([{"severity": "critical", "section": "timeline"}]) == {"education", "jobs"}
@@ -0,0 +1,100 @@
+"""
+Tests for the output sinks.
+
+Tests cover:
+- Files, sharded tar/zip archives and (gzip) JSON lines
+- manifest.jsonl locates every stored file
+- PDFs rendered by the render farm into a sink
+
+Run: pytest tests/test_sinks.py -v
+"""
+import gzip
+import json
+import sys
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.export.render_farm import RenderFarm, find_cv_files
+from src.export.sinks import MANIFEST_FILE, open_sink
+from src.generation.cv_assembler import CVDocument
+
+
+def _cv(first_name="Anna"):
+    return CVDocument(first_name=first_name, last_name="Meier", full_name=f"{first_name} Meier",
+                      age=38, gender="female", canton="ZH", current_title="Analystin")
+
+
+def _manifest(root):
+    return [json.loads(line) for line in (root / MANIFEST_FILE).read_text(encoding="utf-8").splitlines()]
+
+
+class TestSinks:
+    """Test storing and indexing files."""
+
+    def test_files_sink(self, tmp_path):
+        with open_sink("files", tmp_path) as sink:
+            size = sink.write_cv_json("tier_A/P0.json", _cv("P0"))
+            sink.export("tier_A/P0.txt", lambda path: path.write_text("cv"))
+
+        assert json.loads((tmp_path / "tier_A" / "P0.json").read_text(encoding="utf-8"))["personal"]["first_name"] == "P0"
+        assert _manifest(tmp_path) == [
+            {"name": "tier_A/P0.json", "path": "tier_A/P0.json", "bytes": size},
+            {"name": "tier_A/P0.txt", "path": "tier_A/P0.txt", "bytes": 2},
+        ]
+        assert [rel.as_posix() for _, rel in find_cv_files(tmp_path / MANIFEST_FILE)] == ["tier_A/P0.json"]
+
+    @pytest.mark.parametrize("kind", ["tar", "zip"])
+    def test_archives_are_sharded(self, tmp_path, kind):
+        with open_sink(kind, tmp_path, shard_size=2) as sink:
+            for i in range(5):
+                sink.write_cv_json(f"P{i}.json", _cv(f"P{i}"))
+            sink.export("P0.pdf", lambda path: path.write_bytes(b"%PDF-1.4"))
+
+        entries = _manifest(tmp_path)
+        shards = sorted({entry["path"] for entry in entries})
+        assert len(shards) == 3 and sink.shards == 3 and sink.files == 6
+        last = entries[-1]
+        if kind == "tar":
+            with tarfile.open(tmp_path / last["path"]) as archive:
+                assert archive.extractfile(last["member"]).read() == b"%PDF-1.4"
+        else:
+            with zipfile.ZipFile(tmp_path / last["path"]) as archive:
+                assert archive.read(last["member"]) == b"%PDF-1.4"
+                assert archive.getinfo(last["member"]).compress_type == zipfile.ZIP_STORED
+
+    def test_jsonl_gz_sink(self, tmp_path):
+        with open_sink("jsonl.gz", tmp_path) as sink:
+            sink.write_cv_json("P0.json", _cv("P0"))
+            sink.write("P1.json", json.dumps(_cv("P1").to_dict(), indent=2).encode("utf-8"))
+            sink.write("P1.pdf", b"%PDF-1.4")
+
+        entries = _manifest(tmp_path)
+        with gzip.open(tmp_path / entries[0]["path"], "rt", encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+        assert [entry.get("line") for entry in entries] == [0, 1, None]
+        assert lines[entries[1]["line"]]["personal"]["first_name"] == "P1"
+        assert (tmp_path / "P1.pdf").read_bytes() == b"%PDF-1.4"
+
+    def test_unknown_sink(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown sink"):
+            open_sink("s3", tmp_path)
+
+
+def test_render_farm_writes_pdfs_to_sink(tmp_path):
+    with open_sink("tar", tmp_path) as sink:
+        with RenderFarm(workers=1, sink=sink) as farm:
+            for i in range(2):
+                farm.submit(_cv(f"P{i}"), f"P{i}.pdf", "classic")
+
+    assert farm.stats["rendered"] == 2
+    entries = _manifest(tmp_path)
+    assert sorted(entry["member"] for entry in entries) == ["P0.pdf", "P1.pdf"]
+    with tarfile.open(tmp_path / entries[0]["path"]) as archive:
+        assert archive.extractfile(entries[0]["member"]).read().startswith(b"%PDF")
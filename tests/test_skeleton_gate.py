@@ -0,0 +1,87 @@
+"""
+Tests for the cheap-first CV pipeline.
+
+Tests cover:
+- Skeleton scores as an upper bound of the final score_cv_quality score
+- Rejection of weak skeletons before any LLM section is generated
+- Section retries of rejected skeletons
+
+Run: pytest tests/test_skeleton_gate.py -v
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.generation import cv_assembler
+from src.generation.cv_assembler import CVDocument, score_cv_quality
+
+
+def _skeleton(**kwargs):
+    fields = dict(
+        first_name="Anna", last_name="Meier", full_name="Anna Meier", age=38, gender="female",
+        canton="ZH", career_level="senior", years_experience=15,
+        education=[{"institution": "ETH Zürich", "start_year": 2005, "end_year": 2009}],
+        jobs=[
+            {"company": "Novartis AG", "position": "Senior Analyst", "start_date": "2016-01",
+             "end_date": None, "is_current": True, "responsibilities": []},
+            {"company": "Roche AG", "position": "Analyst", "start_date": "2010-01",
+             "end_date": "2015-12", "is_current": False, "responsibilities": []},
+        ],
+        skills={"technical": ["Python", "SQL", "R", "Excel", "Tableau"], "languages": ["Deutsch"]}
+    )
+    fields.update(kwargs)
+    return CVDocument(**fields)
+
+
+def _weak_skeleton():
+    return _skeleton(age=24, career_level="lead", years_experience=10, education=[], jobs=[], skills={})
+
+
+class TestSkeletonScore:
+    """Test the upper-bound score of a skeleton."""
+
+    def test_skeleton_score_bounds_final_score(self):
+        cv_doc = _skeleton()
+        skeleton_score = score_cv_quality(cv_doc, skeleton=True)["scores"]["overall"]
+        assert skeleton_score == 100
+
+        cv_doc.summary = "Analystin mit 15 Jahren Erfahrung."
+        cv_doc.jobs[0]["responsibilities"] = ["Optimierte Berichte", "Leitete Projekte"]
+        assert score_cv_quality(cv_doc)["scores"]["overall"] < skeleton_score
+
+    def test_deterministic_issues_still_count(self):
+        cv_doc = _weak_skeleton()
+        report = score_cv_quality(cv_doc, skeleton=True)
+        assert report["scores"]["overall"] < 75
+        assert "Completeness: Missing education" in report["issues"]
+
+
+def test_weak_skeleton_is_rejected_before_llm_sections(monkeypatch):
+    filled = []
+    monkeypatch.setattr(cv_assembler, "_build_cv_skeleton", lambda persona, occupation_doc: (_weak_skeleton(), []))
+    monkeypatch.setattr(cv_assembler, "_fill_llm_sections", lambda *args: filled.append(args))
+
+    cv_doc, report = cv_assembler.generate_complete_cv({"age": 24, "years_experience": 6})
+    assert cv_doc is None
+    assert report["stage"] == "skeleton" and report["passed"] is False
+    assert report["llm_metrics"]["totals"]["calls"] == 0
+    assert filled == []
+
+
+def test_rejected_skeleton_is_retried(monkeypatch):
+    built = []
+
+    def build(persona, occupation_doc):
+        built.append(persona)
+        return _weak_skeleton(), []
+
+    monkeypatch.setattr(cv_assembler, "_build_cv_skeleton", build)
+    monkeypatch.setattr(cv_assembler, "_fill_llm_sections", lambda *args: None)
+
+    cv_doc, report = cv_assembler.generate_cv_with_section_retries({"age": 24, "years_experience": 6}, max_retries=2)
+    assert cv_doc is None
+    assert report["stage"] == "skeleton" and report["sections"] == ["education", "jobs"]
+    assert report["section_retries"] == 2 and len(built) == 3
@@ -0,0 +1,91 @@
+"""
+Tests for the month-index timeline of the timeline validator.
+
+Tests cover:
+- Conversion between "YYYY-MM" strings and month indices
+- Sort-and-sweep overlap and gap detection
+- Gap fillers computed on month indices
+- Current jobs starting this month and overlap fixes against the covering job
+
+Run: pytest tests/test_timeline_months.py -v
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.generation.cv_timeline_validator import (
+    CURRENT_MONTH_INDEX,
+    JobTimeline,
+    auto_fix_gaps,
+    auto_fix_overlaps,
+    check_gaps,
+    check_job_overlaps,
+    date_to_month_index,
+    month_index_to_date_string
+)
+
+
+def _job(company, start, end):
+    return {"company": company, "position": "Analyst", "start_date": start, "end_date": end, "is_current": False}
+
+
+class TestJobTimeline:
+    """Test the integer timeline."""
+
+    def test_month_index_round_trip(self):
+        assert date_to_month_index("2015-03") == 2015 * 12 + 2
+        assert date_to_month_index("2015-13") is None
+        assert month_index_to_date_string(date_to_month_index("2015-12")) == "2015-12"
+
+    def test_sweep_finds_nested_overlap_and_gaps(self):
+        jobs = [
+            _job("C", "2016-01", "2017-06"),
+            _job("A", "2010-01", "2015-12"),
+            _job("B", "2012-01", "2013-01"),  # inside A
+            _job("D", "2019-01", "2020-01"),
+        ]
+        timeline = JobTimeline.from_jobs(jobs + [_job("X", "bad", None)])
+        assert [j["company"] for j in timeline.jobs] == ["A", "B", "C", "D"]
+        assert [j["company"] for j in timeline.skipped] == ["X"]
+        # C is compared with A (latest end so far), not with B
+        assert timeline.sweep() == [(0, 1, -47), (0, 2, 1), (2, 3, 19)]
+
+        overlaps = check_job_overlaps(jobs)
+        assert len(overlaps) == 1 and "A ends (2015-12) > B starts (2012-01)" in overlaps[0].message
+        gaps = check_gaps([], jobs)
+        assert len(gaps) == 1 and "19 months" in gaps[0].message
+
+
+def test_auto_fix_gaps_inserts_filler_in_months():
+    education = [{"institution": "ETH", "start_year": 2005, "end_year": 2009}]
+    jobs = [_job("A", "2009-08", "2012-03"), _job("B", "2013-09", "2016-01")]
+    _, fixed = auto_fix_gaps(education, jobs)
+    filler = fixed[1]
+    assert filler["category"] == "gap_filler" and filler["company"] == "Elternzeit"
+    assert (filler["start_date"], filler["end_date"]) == ("2012-03", "2013-09")
+    assert [j["company"] for j in fixed] == ["A", "Elternzeit", "B"]
+
+
+def test_current_job_may_start_this_month():
+    this_month = month_index_to_date_string(CURRENT_MONTH_INDEX)
+    current = {"company": "B", "position": "Analyst", "start_date": this_month, "end_date": None, "is_current": True}
+    assert check_job_overlaps([_job("A", "2020-01", this_month), current]) == []
+
+    issues = check_job_overlaps([_job("A", this_month, this_month)])
+    assert len(issues) == 1 and "start" in issues[0].message
+
+
+def test_auto_fix_overlaps_uses_covering_job():
+    jobs = [
+        _job("A", "2010-01", "2015-12"),
+        _job("B", "2012-01", "2013-01"),  # inside A
+        _job("C", "2014-01", "2016-06"),
+    ]
+    fixed = auto_fix_overlaps(jobs)
+    assert check_job_overlaps(fixed) == []
+    assert [(j["company"], j["start_date"], j["end_date"]) for j in fixed] == [
+        ("A", "2010-01", "2012-01"), ("B", "2012-01", "2013-01"), ("C", "2014-01", "2016-06")
+    ]
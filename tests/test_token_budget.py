@@ -0,0 +1,66 @@
+"""
+Tests for adaptive max_tokens budgets.
+
+Tests cover:
+- Percentile budgets per call site, language and model, scaled by units
+- Persistence of samples
+- Truncation retry in call_openai_chat_result (stub backend)
+
+Run: pytest tests/test_token_budget.py -v
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.generation import openai_client, token_budget
+from src.generation.llm_metrics import cv_metrics_scope
+from src.generation.token_budget import TokenBudget
+
+
+class TestTokenBudget:
+    """Test budgets derived from samples."""
+
+    def test_default_until_enough_samples(self):
+        budget = TokenBudget(percentile=90, margin=0.1, min_samples=10)
+        for tokens in range(1, 10):
+            budget.observe("summary.varied", tokens * 10, "gpt-4o-mini", "de")
+        assert budget.max_tokens("summary.varied", 250, "gpt-4o-mini", "de") == 250
+
+        budget.observe("summary.varied", 100, "gpt-4o-mini", "de")
+        assert budget.max_tokens("summary.varied", 250, "gpt-4o-mini", "de") == 99
+        assert budget.max_tokens("summary.varied", 250, "gpt-4o-mini", "fr") == 250
+
+    def test_budget_scales_with_units_and_persists(self, tmp_path):
+        budget = TokenBudget(percentile=100, margin=0.0, min_samples=1, path=tmp_path / "budget.json")
+        budget.observe("bullets.all_jobs", 400, "gpt-4o-mini", "de", units=10)
+        budget.save()
+
+        restored = TokenBudget(percentile=100, margin=0.0, min_samples=1, path=tmp_path / "budget.json")
+        restored.load()
+        assert restored.max_tokens("bullets.all_jobs", 1200, "gpt-4o-mini", "de", units=6) == 240
+
+
+def test_truncated_response_is_retried_with_larger_budget(monkeypatch):
+    """A budget that is too tight truncates once, then the retry completes."""
+    settings = openai_client.get_settings()
+    monkeypatch.setattr(settings, "llm_backend", "stub", raising=False)
+    budget = TokenBudget(percentile=100, margin=0.0, min_samples=1)
+    budget.observe("summary.varied", 1, settings.openai_model_mini, "de")
+    monkeypatch.setattr(token_budget, "_token_budget", budget)
+    monkeypatch.setattr(settings, "adaptive_max_tokens", True, raising=False)
+    openai_client.reset_client()
+    try:
+        with cv_metrics_scope() as metrics:
+            result = openai_client.call_openai_chat_result(
+                "You are a CV writer.", "Beruf: Koch", max_tokens=400,
+                call_site="summary.varied", language="de"
+            )
+        assert result.finish_reason == "stop"
+        site = metrics.get("summary.varied")
+        assert site.truncations == 1 and site.calls == 2
+        assert budget.max_tokens("summary.varied", 400, settings.openai_model_mini, "de") == result.completion_tokens
+    finally:
+        openai_client.reset_client()